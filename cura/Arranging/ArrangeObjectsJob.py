@@ -1,6 +1,6 @@
 # Copyright (c) 2019 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
-from typing import List
+from typing import Dict, List, Optional
 
 from UM.Application import Application
 from UM.Job import Job
@@ -8,7 +8,9 @@ from UM.Logger import Logger
 from UM.Message import Message
 from UM.Scene.SceneNode import SceneNode
 from UM.i18n import i18nCatalog
+from cura.Arranging.ArrangeState import ArrangeState
 from cura.Arranging.GridArrange import GridArrange
+from cura.Arranging.MultiPlateArrange import MultiPlateArrange
 from cura.Arranging.Nest2DArrange import Nest2DArrange
 
 i18n_catalog = i18nCatalog("cura")
@@ -16,12 +18,26 @@ i18n_catalog = i18nCatalog("cura")
 
 class ArrangeObjectsJob(Job):
     def __init__(self, nodes: List[SceneNode], fixed_nodes: List[SceneNode], min_offset = 8,
-                *, grid_arrange: bool = False) -> None:
+                *, grid_arrange: bool = False, multi_plate: bool = False,
+                fixed_nodes_per_plate: Optional[Dict[int, List[SceneNode]]] = None,
+                arrange_state: Optional[ArrangeState] = None, incremental: bool = False) -> None:
+        """
+        :param multi_plate: Distribute the nodes over as many build plates as needed, instead of the active one.
+        :param fixed_nodes_per_plate: When distributing over build plates, the nodes that stay where they are, by the
+                                      build plate they are on. This replaces fixed_nodes.
+        :param arrange_state: Where previous arrangements placed nodes, and the obstacles they converted.
+        :param incremental: Only arrange the nodes that are new or were moved since the previous arrangement, around
+                            the nodes that are still where it placed them. This needs the arrange state.
+        """
         super().__init__()
         self._nodes = nodes
         self._fixed_nodes = fixed_nodes
         self._min_offset = min_offset
         self._grid_arrange = grid_arrange
+        self._multi_plate = multi_plate
+        self._fixed_nodes_per_plate = fixed_nodes_per_plate
+        self._arrange_state = arrange_state
+        self._incremental = incremental
 
     def run(self):
         found_solution_for_all = False
@@ -32,21 +48,53 @@ class ArrangeObjectsJob(Job):
                                  title = i18n_catalog.i18nc("@info:title", "Finding Location"))
         status_message.show()
 
-        if self._grid_arrange:
-            arranger = GridArrange(self._nodes, Application.getInstance().getBuildVolume(), self._fixed_nodes)
+        nodes = self._nodes
+        fixed_nodes = self._fixed_nodes
+        if self._incremental and self._arrange_state is not None and not self._multi_plate:
+            nodes, placed_nodes = self._arrange_state.splitNodes(nodes)
+            fixed_nodes = fixed_nodes + placed_nodes
+            Logger.log("d", "Arranging {changed} new or moved objects around {placed} objects that were arranged before.".format(
+                changed = len(nodes), placed = len(placed_nodes)))
+
+        preferences = Application.getInstance().getPreferences()
+        nest_arguments = {"factor": 1000,
+                          "parallel": preferences.getValue("arrange/parallel_search"),
+                          "time_budget": float(preferences.getValue("arrange/time_budget")),
+                          "arrange_state": self._arrange_state}
+        if not nodes:
+            arranger = None
+        elif self._multi_plate:
+            arranger = MultiPlateArrange(nodes, Application.getInstance().getBuildVolume(), self._fixed_nodes_per_plate,
+                                         grid_arrange = self._grid_arrange,
+                                         target_density = float(preferences.getValue("arrange/target_density")),
+                                         nest_arguments = nest_arguments)
+        elif self._grid_arrange:
+            arranger = GridArrange(nodes, Application.getInstance().getBuildVolume(), fixed_nodes)
         else:
-            arranger = Nest2DArrange(self._nodes, Application.getInstance().getBuildVolume(), self._fixed_nodes,
-                                     factor=1000)
+            arranger = Nest2DArrange(nodes, Application.getInstance().getBuildVolume(), fixed_nodes,
+                                     **nest_arguments)
 
-        found_solution_for_all = False
+        found_solution_for_all = arranger is None  # Nothing changed since the previous arrangement.
         try:
-            found_solution_for_all = arranger.arrange(only_if_full_success = True)
+            if arranger is not None:
+                found_solution_for_all = arranger.arrange(only_if_full_success = True)
+            if found_solution_for_all and self._arrange_state is not None:
+                self._arrange_state.recordPlacements(self._nodes)
         except:  # If the thread crashes, the message should still close
             Logger.logException("e",
                                 "Unable to arrange the objects on the buildplate. The arrange algorithm has crashed.")
 
         status_message.hide()
 
+        if isinstance(arranger, MultiPlateArrange) and arranger.getPlateUtilisation():
+            plate_lines = [i18n_catalog.i18nc("@info:status", "Build plate {plate}: {count} objects, {area}% of the area used, {time}% of the print time.").format(
+                plate = utilisation.build_plate_number + 1, count = utilisation.node_count,
+                area = round(utilisation.area_utilisation * 100), time = round(utilisation.print_time_share * 100))
+                           for utilisation in arranger.getPlateUtilisation()]
+            Message("\n".join(plate_lines),
+                    title = i18n_catalog.i18nc("@info:title", "Objects Distributed over Build Plates"),
+                    message_type = Message.MessageType.POSITIVE).show()
+
         if not found_solution_for_all:
             no_full_solution_message = Message(
                     i18n_catalog.i18nc("@info:status",
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import weakref
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from UM.Scene.SceneNode import SceneNode
+
+
+class ArrangeState:
+    """Remembers where the previous arrangements placed nodes, so that the next one only has to place what changed.
+
+    A node counts as placed as long as its convex hull is the same as right after it was arranged. Moving, rotating or
+    scaling a node, or changing a setting that changes the size of its hull, makes it count as moved again.
+
+    Arrangers can also keep the obstacles they converted here (the disallowed areas and the hulls of fixed nodes), to
+    reuse them the next time if they didn't change.
+    """
+
+    def __init__(self) -> None:
+        self._placed_hulls = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[SceneNode, bytes]
+        self._converted_hulls = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[SceneNode, Tuple[bytes, Tuple, Any]]
+        self._disallowed_areas_key = None  # type: Optional[Tuple]
+        self._converted_disallowed_areas = []  # type: List[Any]
+
+    @staticmethod
+    def _getHullKey(node: "SceneNode") -> Optional[bytes]:
+        hull = node.callDecoration("getConvexHull")
+        if hull is None:
+            return None
+        points = hull.getPoints()
+        if points is None:
+            return None
+        return points.tobytes()
+
+    def recordPlacements(self, nodes: List["SceneNode"]) -> None:
+        """Remember where nodes are now, after they were arranged."""
+
+        for node in nodes:
+            hull_key = self._getHullKey(node)
+            if hull_key is None:
+                self._placed_hulls.pop(node, None)
+            else:
+                self._placed_hulls[node] = hull_key
+
+    def splitNodes(self, nodes: List["SceneNode"]) -> Tuple[List["SceneNode"], List["SceneNode"]]:
+        """Find out which nodes need to be arranged.
+
+        :return: The nodes that are new or were moved since they were arranged, and the nodes that are still where the
+            previous arrangement placed them.
+        """
+
+        changed_nodes = []
+        placed_nodes = []
+        for node in nodes:
+            hull_key = self._getHullKey(node)
+            if hull_key is not None and self._placed_hulls.get(node) == hull_key:
+                placed_nodes.append(node)
+            else:
+                changed_nodes.append(node)
+        return changed_nodes, placed_nodes
+
+    def clear(self) -> None:
+        self._placed_hulls.clear()
+
+    def getConvertedHull(self, node: "SceneNode", parameters: Tuple, convert: Callable[["SceneNode"], Any]) -> Any:
+        """Get the hull of a node converted for an arranger, converting it only if the hull changed since last time.
+
+        :param node: The node to get the hull of.
+        :param parameters: Everything else the conversion depends on, like the precision.
+        :param convert: The function that converts the hull of the node.
+        """
+
+        hull_key = self._getHullKey(node)
+        if hull_key is None:
+            return convert(node)
+        cached = self._converted_hulls.get(node)
+        if cached is not None and cached[0] == hull_key and cached[1] == parameters:
+            return cached[2]
+        converted = convert(node)
+        self._converted_hulls[node] = (hull_key, parameters, converted)
+        return converted
+
+    def getConvertedDisallowedAreas(self, key: Tuple, convert: Callable[[], List[Any]]) -> List[Any]:
+        """Get the disallowed areas converted for an arranger, converting them only if they changed since last time.
+
+        :param key: Everything the converted areas depend on, like the areas themselves and the size of the build plate.
+        :param convert: The function that converts the disallowed areas.
+        """
+
+        if key != self._disallowed_areas_key:
+            self._converted_disallowed_areas = convert()
+            self._disallowed_areas_key = key
+        return self._converted_disallowed_areas
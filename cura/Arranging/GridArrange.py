@@ -1,5 +1,7 @@
 import math
-from typing import List, TYPE_CHECKING, Tuple, Set, Union
+from typing import Dict, List, TYPE_CHECKING, Tuple, Union
+
+import numpy
 
 if TYPE_CHECKING:
     from UM.Scene.SceneNode import SceneNode
@@ -60,25 +62,63 @@ class GridArrange(Arranger):
         self._initial_leftover_grid_x = math.floor(self._initial_leftover_grid_x)
         self._initial_leftover_grid_y = math.floor(self._initial_leftover_grid_y)
 
-        # Find grid indexes that intersect with fixed objects
-        self._fixed_nodes_grid_ids = set()
-        for node in self._fixed_nodes:
-            self._fixed_nodes_grid_ids = self._fixed_nodes_grid_ids.union(
-                self._intersectingGridIdxInclusive(node.getBoundingBox()))
+        # Rasterise the fixed objects and disallowed areas in one go into a grid of occupied cells
+        fixed_bounds = [self._getGridCornerPoints(node.getBoundingBox(), **self._inclusiveMargins()) for node in self._fixed_nodes]
+        fixed_bounds += [self._getGridCornerPoints(polygon, **self._inclusiveMargins()) for polygon in self._build_volume.getDisallowedAreas()]
+        fixed_ranges = numpy.array(fixed_bounds, dtype = numpy.float64).reshape((-1, 4))
+        fixed_ranges = fixed_ranges[numpy.isfinite(fixed_ranges).all(axis = 1)]
+        fixed_ranges = numpy.column_stack((numpy.floor(fixed_ranges[:, 0:2]), numpy.ceil(fixed_ranges[:, 2:4]))).astype(numpy.int64)
 
-        # grid indexes that are in disallowed area
-        for polygon in self._build_volume.getDisallowedAreas():
-            self._fixed_nodes_grid_ids = self._fixed_nodes_grid_ids.union(self._intersectingGridIdxInclusive(polygon))
+        plate_x1, plate_y1, plate_x2, plate_y2 = self._getGridCornerPoints(self._build_volume_bounding_box, **self._exclusiveMargins())
+        plate_range = numpy.array([math.ceil(plate_x1), math.ceil(plate_y1), math.floor(plate_x2), math.floor(plate_y2)], dtype = numpy.int64)
 
-        self._build_plate_grid_ids = self._intersectingGridIdxExclusive(self._build_volume_bounding_box)
+        # The raster covers the build plate and all fixed objects, also the ones next to the build plate.
+        all_ranges = numpy.vstack((fixed_ranges, plate_range))
+        self._raster_origin = all_ranges[:, 0:2].min(axis = 0)
+        raster_size = numpy.maximum(all_ranges[:, 2:4].max(axis = 0) - self._raster_origin, 0)
+        self._fixed_grid = self._rasteriseRanges(fixed_ranges, raster_size)
 
+        build_plate_grid = self._rasteriseRanges(plate_range.reshape((1, 4)), raster_size)
         # Filter out the corner grid squares if the build plate shape is elliptic
         if self._build_volume.getShape() == "elliptic":
-            self._build_plate_grid_ids = set(
-                filter(lambda grid_id: self._checkGridUnderDiscSpace(grid_id[0], grid_id[1]),
-                       self._build_plate_grid_ids))
+            build_plate_grid &= self._gridUnderDiscSpace(raster_size)
+
+        self._allowed_grid = build_plate_grid & ~self._fixed_grid
+
+    def _inclusiveMargins(self) -> Dict[str, float]:
+        return {"margin_x": -(self._margin_x + self._grid_round_margin_x) * 0.5,
+                "margin_y": -(self._margin_y + self._grid_round_margin_y) * 0.5}
+
+    def _exclusiveMargins(self) -> Dict[str, float]:
+        return {"margin_x": (self._margin_x + self._grid_round_margin_x) * 0.5,
+                "margin_y": (self._margin_y + self._grid_round_margin_y) * 0.5}
+
+    def _rasteriseRanges(self, ranges: numpy.ndarray, raster_size: numpy.ndarray) -> numpy.ndarray:
+        """Mark the grid cells in ranges of grid indices.
 
-        self._allowed_grid_idx = self._build_plate_grid_ids.difference(self._fixed_nodes_grid_ids)
+        :param ranges: Rows of the first x and y grid index in each range, and the x and y grid index after it.
+        :param raster_size: The number of grid cells of the raster in x and y, starting at the raster origin.
+        :return: A boolean array with the cells that are in any of the ranges.
+        """
+
+        ranges = ranges - numpy.tile(self._raster_origin, 2)
+        ranges = ranges[(ranges[:, 0] < ranges[:, 2]) & (ranges[:, 1] < ranges[:, 3])]
+
+        # Add one at the first corner of each range and subtract it again past its edges, such that the cumulative sum
+        # counts the ranges that cover each cell.
+        counts = numpy.zeros((raster_size[0] + 1, raster_size[1] + 1), dtype = numpy.int32)
+        numpy.add.at(counts, (ranges[:, 0], ranges[:, 1]), 1)
+        numpy.add.at(counts, (ranges[:, 2], ranges[:, 1]), -1)
+        numpy.add.at(counts, (ranges[:, 0], ranges[:, 3]), -1)
+        numpy.add.at(counts, (ranges[:, 2], ranges[:, 3]), 1)
+        return counts.cumsum(axis = 0).cumsum(axis = 1)[:raster_size[0], :raster_size[1]] > 0
+
+    def _isFixedGridIdx(self, grid_x: int, grid_y: int) -> bool:
+        raster_x = grid_x - self._raster_origin[0]
+        raster_y = grid_y - self._raster_origin[1]
+        if raster_x < 0 or raster_y < 0 or raster_x >= self._fixed_grid.shape[0] or raster_y >= self._fixed_grid.shape[1]:
+            return False
+        return bool(self._fixed_grid[raster_x, raster_y])
 
     def createGroupOperationForArrange(self, add_new_nodes_in_scene: bool = False) -> Tuple[GroupedOperation, int]:
         # Find the sequence in which items are placed
@@ -87,9 +127,12 @@ class GridArrange(Arranger):
         grid_build_plate_center_x, grid_build_plate_center_y = self._coordSpaceToGridSpace(coord_build_plate_center_x,
                                                                                            coord_build_plate_center_y)
 
-        sequence: List[Tuple[int, int]] = list(self._allowed_grid_idx)
-        sequence.sort(key=lambda grid_id: (grid_build_plate_center_x - grid_id[0]) ** 2 + (
-                    grid_build_plate_center_y - grid_id[1]) ** 2)
+        allowed_x, allowed_y = numpy.nonzero(self._allowed_grid)
+        allowed_x = allowed_x + self._raster_origin[0]
+        allowed_y = allowed_y + self._raster_origin[1]
+        distances = (grid_build_plate_center_x - allowed_x) ** 2 + (grid_build_plate_center_y - allowed_y) ** 2
+        order = numpy.argsort(distances, kind = "stable")
+        sequence: List[Tuple[int, int]] = list(zip(allowed_x[order].tolist(), allowed_y[order].tolist()))
         scene_root = Application.getInstance().getController().getScene().getRoot()
         grouped_operation = GroupedOperation()
 
@@ -107,7 +150,7 @@ class GridArrange(Arranger):
             if add_new_nodes_in_scene:
                 grouped_operation.addOperation(AddSceneNodeOperation(node, scene_root))
             # find the first next grid position that isn't occupied by a fixed node
-            while (self._initial_leftover_grid_x, left_over_grid_y) in self._fixed_nodes_grid_ids:
+            while self._isFixedGridIdx(self._initial_leftover_grid_x, left_over_grid_y):
                 left_over_grid_y = left_over_grid_y - 1
 
             operation = self._moveNodeOnGrid(node, self._initial_leftover_grid_x, left_over_grid_y)
@@ -164,74 +207,44 @@ class GridArrange(Arranger):
         #      left before it crosses a grid line
         # - the change: either +1 or -1, indicating whether crossing the grid line
         #      would result in a minimal footprint node becoming a maximal footprint
-        class Event:
-            def __init__(self, coord: float, change: float):
-                self.coord = coord
-                self.change = change
+        bounds = numpy.array([[bounding_box.left, bounding_box.right, bounding_box.back, bounding_box.front]
+                              for bounding_box in (node.getBoundingBox() for node in self._fixed_nodes)], dtype = numpy.float64)
+        left = bounds[:, 0] - self._build_volume_bounding_box.left
+        right = bounds[:, 1] - self._build_volume_bounding_box.left
+        back = bounds[:, 2] - self._build_volume_bounding_box.back
+        front = bounds[:, 3] - self._build_volume_bounding_box.back
+
+        # give nodes a weight according to their size. This
+        # weight is heuristically chosen to be proportional to
+        # the number of grid squares the node-boundary occupies
+        weight = (right - left) + (front - back)
 
         # create events for both the horizontal and vertical axis
-        events_horizontal: List[Event] = []
-        events_vertical: List[Event] = []
-
-        for node in self._fixed_nodes:
-            bounding_box = node.getBoundingBox()
-
-            left = bounding_box.left - self._build_volume_bounding_box.left
-            right = bounding_box.right - self._build_volume_bounding_box.left
-            back = bounding_box.back - self._build_volume_bounding_box.back
-            front = bounding_box.front - self._build_volume_bounding_box.back
-
-            value_left = math.ceil(left / self._grid_width) * self._grid_width - left
-            value_right = math.ceil(right / self._grid_width) * self._grid_width - right
-            value_back = math.ceil(back / self._grid_height) * self._grid_height - back
-            value_front = math.ceil(front / self._grid_height) * self._grid_height - front
-
-            # give nodes a weight according to their size. This
-            # weight is heuristically chosen to be proportional to
-            # the number of grid squares the node-boundary occupies
-            weight = bounding_box.width + bounding_box.depth
-
-            events_horizontal.append(Event(value_left, weight))
-            events_horizontal.append(Event(value_right, -weight))
-            events_vertical.append(Event(value_back, weight))
-            events_vertical.append(Event(value_front, -weight))
-
-        events_horizontal.sort(key=lambda event: event.coord)
-        events_vertical.sort(key=lambda event: event.coord)
-
-        def findOptimalShiftAxis(events: List[Event], interval: float) -> float:
-            # executing the actual scanline algorithm
-            # iteratively go through events (left to right) and keep track of the
-            # current footprint. The optimal location is the one with the minimal
+        def createEvents(start: numpy.ndarray, end: numpy.ndarray, interval: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+            coords = numpy.column_stack((numpy.ceil(start / interval) * interval - start, numpy.ceil(end / interval) * interval - end)).ravel()
+            changes = numpy.column_stack((weight, -weight)).ravel()
+            order = numpy.argsort(coords, kind = "stable")
+            return coords[order], changes[order]
+
+        def findOptimalShiftAxis(coords: numpy.ndarray, changes: numpy.ndarray, interval: float) -> float:
+            # go through the events (left to right) and keep track of the current
+            # footprint. The optimal location is the one with the minimal
             # footprint. If there are multiple locations with the same minimal
             # footprint, the optimal location is the one with the largest range
             # between the left and right endpoint of the footprint.
-            prev_offset = events[-1].coord - interval
-            current_minimal_footprint_count = 0
-
-            best_minimal_footprint_count = float('inf')
-            best_offset_span = float('-inf')
-            best_offset = 0.0
-
-            for event in events:
-                offset_span = event.coord - prev_offset
+            previous_coords = numpy.concatenate(([coords[-1] - interval], coords[:-1]))
+            offset_spans = coords - previous_coords
+            # The footprint before each event is the sum of the changes of all events before it.
+            footprint_counts = numpy.concatenate(([0.0], numpy.cumsum(changes)[:-1]))
 
-                if current_minimal_footprint_count < best_minimal_footprint_count or (
-                        current_minimal_footprint_count == best_minimal_footprint_count and offset_span > best_offset_span):
-                    best_minimal_footprint_count = current_minimal_footprint_count
-                    best_offset_span = offset_span
-                    best_offset = event.coord
-
-                current_minimal_footprint_count += event.change
-                prev_offset = event.coord
-
-            return best_offset - best_offset_span * 0.5
+            best = numpy.lexsort((numpy.arange(len(coords)), -offset_spans, footprint_counts))[0]
+            return coords[best] - offset_spans[best] * 0.5
 
         center_grid_x = 0.5 * self._grid_width
         center_grid_y = 0.5 * self._grid_height
 
-        optimal_center_x = self._grid_width - findOptimalShiftAxis(events_horizontal, self._grid_width)
-        optimal_center_y = self._grid_height - findOptimalShiftAxis(events_vertical, self._grid_height)
+        optimal_center_x = self._grid_width - findOptimalShiftAxis(*createEvents(left, right, self._grid_width), self._grid_width)
+        optimal_center_y = self._grid_height - findOptimalShiftAxis(*createEvents(back, front, self._grid_height), self._grid_height)
 
         self._offset_x = optimal_center_x - center_grid_x
         self._offset_y = optimal_center_y - center_grid_y
@@ -257,15 +270,13 @@ class GridArrange(Arranger):
             coord_y1 = bounds.back - margin_y
             coord_y2 = bounds.front + margin_y
         elif isinstance(bounds, Polygon):
-            coord_x1 = float('inf')
-            coord_y1 = float('inf')
-            coord_x2 = float('-inf')
-            coord_y2 = float('-inf')
-            for x, y in bounds.getPoints():
-                coord_x1 = min(coord_x1, x)
-                coord_y1 = min(coord_y1, y)
-                coord_x2 = max(coord_x2, x)
-                coord_y2 = max(coord_y2, y)
+            points = bounds.getPoints()
+            if len(points) == 0:
+                coord_x1 = coord_y1 = float('inf')
+                coord_x2 = coord_y2 = float('-inf')
+            else:
+                coord_x1, coord_y1 = points.min(axis = 0)
+                coord_x2, coord_y2 = points.max(axis = 0)
         else:
             raise TypeError("bounds must be either an AxisAlignedBox or a Polygon")
 
@@ -278,30 +289,6 @@ class GridArrange(Arranger):
         grid_x2, grid_y2 = self._coordSpaceToGridSpace(coord_x2, coord_y2)
         return grid_x1, grid_y1, grid_x2, grid_y2
 
-    def _intersectingGridIdxInclusive(self, bounds: Union[AxisAlignedBox, Polygon]) -> Set[Tuple[int, int]]:
-        grid_x1, grid_y1, grid_x2, grid_y2 = self._getGridCornerPoints(
-            bounds,
-            margin_x=-(self._margin_x + self._grid_round_margin_x) * 0.5,
-            margin_y=-(self._margin_y + self._grid_round_margin_y) * 0.5,
-        )
-        grid_idx = set()
-        for grid_x in range(math.floor(grid_x1), math.ceil(grid_x2)):
-            for grid_y in range(math.floor(grid_y1), math.ceil(grid_y2)):
-                grid_idx.add((grid_x, grid_y))
-        return grid_idx
-
-    def _intersectingGridIdxExclusive(self, bounds: Union[AxisAlignedBox, Polygon]) -> Set[Tuple[int, int]]:
-        grid_x1, grid_y1, grid_x2, grid_y2 = self._getGridCornerPoints(
-            bounds,
-            margin_x=(self._margin_x + self._grid_round_margin_x) * 0.5,
-            margin_y=(self._margin_y + self._grid_round_margin_y) * 0.5,
-        )
-        grid_idx = set()
-        for grid_x in range(math.ceil(grid_x1), math.floor(grid_x2)):
-            for grid_y in range(math.ceil(grid_y1), math.floor(grid_y2)):
-                grid_idx.add((grid_x, grid_y))
-        return grid_idx
-
     def _gridSpaceToCoordSpace(self, x: float, y: float) -> Tuple[float, float]:
         grid_x = x * self._grid_width + self._build_volume_bounding_box.left + self._offset_x
         grid_y = y * self._grid_height + self._build_volume_bounding_box.back + self._offset_y
@@ -312,11 +299,15 @@ class GridArrange(Arranger):
         coord_y = (grid_y - self._build_volume_bounding_box.back - self._offset_y) / self._grid_height
         return coord_x, coord_y
 
-    def _checkGridUnderDiscSpace(self, grid_x: int, grid_y: int) -> bool:
+    def _gridUnderDiscSpace(self, raster_size: numpy.ndarray) -> numpy.ndarray:
+        """Get which cells of the raster are entirely on an elliptic build plate."""
+
+        grid_x = numpy.arange(raster_size[0])[:, numpy.newaxis] + self._raster_origin[0]
+        grid_y = numpy.arange(raster_size[1])[numpy.newaxis, :] + self._raster_origin[1]
         left, back = self._gridSpaceToCoordSpace(grid_x, grid_y)
         right, front = self._gridSpaceToCoordSpace(grid_x + 1, grid_y + 1)
-        corners = [(left, back), (right, back), (right, front), (left, front)]
-        return all([self._checkPointUnderDiscSpace(x, y) for x, y in corners])
+        return (self._checkPointUnderDiscSpace(left, back) & self._checkPointUnderDiscSpace(right, back)
+                & self._checkPointUnderDiscSpace(right, front) & self._checkPointUnderDiscSpace(left, front))
 
     def _checkPointUnderDiscSpace(self, x: float, y: float) -> bool:
         disc_x, disc_y = self._coordSpaceToDiscSpace(x, y)
@@ -0,0 +1,202 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import math
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy
+
+from UM.Logger import Logger
+from UM.Operations.GroupedOperation import GroupedOperation
+from UM.Scene.Iterator.BreadthFirstIterator import BreadthFirstIterator
+from cura.Arranging.Arranger import Arranger
+from cura.Arranging.GridArrange import GridArrange
+from cura.Arranging.Nest2DArrange import Nest2DArrange
+from cura.Operations.SetBuildPlateNumberOperation import SetBuildPlateNumberOperation
+
+if TYPE_CHECKING:
+    from UM.Scene.SceneNode import SceneNode
+    from cura.BuildVolume import BuildVolume
+
+
+class PlateUtilisation:
+    """How full a build plate is after arranging it."""
+
+    def __init__(self, build_plate_number: int, node_count: int, area_utilisation: float, print_time_share: float) -> None:
+        self.build_plate_number = build_plate_number
+        self.node_count = node_count
+        self.area_utilisation = area_utilisation  # The part of the build plate covered by convex hulls, from 0 to 1.
+        self.print_time_share = print_time_share  # The estimated part of the total print time, from 0 to 1.
+
+
+class MultiPlateArrange(Arranger):
+    """Distribute nodes over as many build plates as needed, and arrange each plate with the grid or nest arranger.
+
+    Nodes are assigned to plates until the plate is filled to the target density, spreading the nodes such that the
+    estimated print time of every plate is about the same. The print time of a node is estimated from the volume under
+    its convex hull. If the arranger can't fit all nodes of a plate, the remaining nodes move to the next plate.
+    """
+
+    def __init__(self,
+                 nodes_to_arrange: List["SceneNode"],
+                 build_volume: "BuildVolume",
+                 fixed_nodes: Optional[Dict[int, List["SceneNode"]]] = None,
+                 *,
+                 grid_arrange: bool = False,
+                 target_density: float = 0.5,
+                 first_build_plate: int = 0,
+                 nest_arguments: Optional[Dict] = None) -> None:
+        """
+        :param nodes_to_arrange: The nodes to distribute over the build plates.
+        :param build_volume: The build volume, to get the size and the disallowed areas of the build plates from.
+        :param fixed_nodes: The nodes that stay where they are, by the build plate they are on.
+        :param grid_arrange: Whether to arrange the plates in a grid, instead of nesting them.
+        :param target_density: How much of the area of the build plates to fill with convex hulls, from 0 to 1.
+        :param first_build_plate: The number of the first build plate to use.
+        :param nest_arguments: Extra keyword arguments for the nest arranger.
+        """
+        super().__init__()
+        self._nodes_to_arrange = nodes_to_arrange
+        self._build_volume = build_volume
+        self._fixed_nodes = fixed_nodes if fixed_nodes is not None else {}
+        self._grid_arrange = grid_arrange
+        self._target_density = min(max(target_density, 0.05), 1.0)
+        self._first_build_plate = first_build_plate
+        self._nest_arguments = nest_arguments if nest_arguments is not None else {}
+
+        self._plate_utilisation = []  # type: List[PlateUtilisation]
+
+    def getPlateUtilisation(self) -> List[PlateUtilisation]:
+        """Get how full each build plate is, after createGroupOperationForArrange."""
+
+        return self._plate_utilisation
+
+    def createGroupOperationForArrange(self, add_new_nodes_in_scene: bool = False) -> Tuple[GroupedOperation, int]:
+        plate_area = self._getPlateArea()
+        hull_areas = {}  # type: Dict[SceneNode, float]
+        print_times = {}  # type: Dict[SceneNode, float]
+        for node in self._nodes_to_arrange:
+            hull_areas[node], print_times[node] = self._estimateNode(node)
+        fixed_areas = {build_plate: sum(self._estimateNode(node)[0] for node in nodes) for build_plate, nodes in self._fixed_nodes.items()}
+
+        plates = self._distribute(plate_area, hull_areas, print_times, fixed_areas)
+
+        grouped_operation = GroupedOperation()
+        not_fit_count = 0
+        self._plate_utilisation = []
+        total_print_time = sum(print_times.values())
+        index = 0
+        while index < len(plates):
+            build_plate = self._first_build_plate + index
+            nodes = plates[index]
+            fixed_nodes = self._fixed_nodes.get(build_plate, [])
+            if not nodes:
+                index += 1
+                continue
+            is_retry = False
+            while True:
+                arranger = self._createArranger(nodes, fixed_nodes, is_retry = is_retry)
+                plate_operation, plate_not_fit_count = arranger.createGroupOperationForArrange(add_new_nodes_in_scene)
+                if plate_not_fit_count == 0 or len(nodes) <= 1:
+                    break
+                # The arrangers don't tell which nodes didn't fit. The nodes are sorted by estimated print time, so move
+                # the ones that print quickest to the next plate, which keeps the print times of the plates balanced.
+                overflow = nodes[len(nodes) - plate_not_fit_count:] if plate_not_fit_count < len(nodes) else nodes[1:]
+                nodes = nodes[:len(nodes) - len(overflow)]
+                if index + 1 == len(plates):
+                    plates.append([])
+                plates[index + 1] = overflow + plates[index + 1]
+                is_retry = True
+            not_fit_count += plate_not_fit_count  # Only nodes that don't fit on an empty plate by themselves.
+
+            for node in nodes:
+                for single_node in BreadthFirstIterator(node):  # type: ignore
+                    grouped_operation.addOperation(SetBuildPlateNumberOperation(single_node, build_plate))
+            grouped_operation.addOperation(plate_operation)
+
+            used_area = sum(hull_areas[node] for node in nodes) + fixed_areas.get(build_plate, 0.0)
+            self._plate_utilisation.append(PlateUtilisation(
+                build_plate_number = build_plate,
+                node_count = len(nodes),
+                area_utilisation = min(used_area / plate_area, 1.0) if plate_area > 0 else 0.0,
+                print_time_share = sum(print_times[node] for node in nodes) / total_print_time if total_print_time > 0 else 0.0
+            ))
+            index += 1
+
+        for utilisation in self._plate_utilisation:
+            Logger.log("d", "Build plate {plate}: {count} objects, {area:.0%} of the area, {time:.0%} of the print time.".format(
+                plate = utilisation.build_plate_number, count = utilisation.node_count,
+                area = utilisation.area_utilisation, time = utilisation.print_time_share))
+        return grouped_operation, not_fit_count
+
+    def _distribute(self, plate_area: float, hull_areas: Dict["SceneNode", float], print_times: Dict["SceneNode", float],
+                    fixed_areas: Dict[int, float]) -> List[List["SceneNode"]]:
+        """Assign the nodes to build plates, such that each plate is filled to about the target density.
+
+        Starting with the longest prints, each node goes on the plate with the lowest print time that still has room.
+        :return: The nodes for each plate, longest prints first. Plates can be empty if their fixed nodes fill them.
+        """
+
+        capacity = plate_area * self._target_density
+        total_area = sum(hull_areas.values()) + sum(fixed_areas.values())
+        plate_count = max(1, math.ceil(total_area / capacity)) if capacity > 0 else 1
+        plates = [[] for _ in range(plate_count)]  # type: List[List[SceneNode]]
+        plate_areas = [fixed_areas.get(self._first_build_plate + index, 0.0) for index in range(plate_count)]
+        plate_times = [0.0] * plate_count
+
+        for node in sorted(self._nodes_to_arrange, key = lambda n: print_times[n], reverse = True):
+            # A node that is too big for the target density still gets a plate of its own.
+            candidates = [index for index in range(len(plates)) if plate_areas[index] + hull_areas[node] <= capacity or plate_areas[index] == 0]
+            if candidates:
+                index = min(candidates, key = lambda i: plate_times[i])
+            else:
+                index = len(plates)
+                plates.append([])
+                plate_areas.append(fixed_areas.get(self._first_build_plate + index, 0.0))
+                plate_times.append(0.0)
+            plates[index].append(node)
+            plate_areas[index] += hull_areas[node]
+            plate_times[index] += print_times[node]
+        while len(plates) > 1 and not plates[-1]:
+            plates.pop()
+        return plates
+
+    def _createArranger(self, nodes: List["SceneNode"], fixed_nodes: List["SceneNode"], is_retry: bool = False) -> Arranger:
+        """Create the arranger for one build plate.
+
+        :param is_retry: Whether the plate is arranged again because not all of its nodes fit. A plate can be arranged
+            many times over, so then the nest arranger doesn't use worker processes.
+        """
+
+        if self._grid_arrange:
+            return GridArrange(nodes, self._build_volume, fixed_nodes)
+        nest_arguments = dict(self._nest_arguments)
+        if is_retry:
+            nest_arguments["parallel"] = False
+        return Nest2DArrange(nodes, self._build_volume, fixed_nodes, **nest_arguments)
+
+    def _getPlateArea(self) -> float:
+        edge_disallowed_size = self._build_volume.getEdgeDisallowedSize()
+        width = self._build_volume.getWidth() - edge_disallowed_size * 2
+        depth = self._build_volume.getDepth() - edge_disallowed_size * 2
+        area = max(width, 0) * max(depth, 0)
+        if self._build_volume.getShape() == "elliptic":
+            area *= math.pi / 4
+        return area
+
+    @staticmethod
+    def _estimateNode(node: "SceneNode") -> Tuple[float, float]:
+        """Estimate the area a node takes on the build plate and how long it takes to print.
+
+        :return: The area of the convex hull, and the volume under it as a measure for the print time.
+        """
+
+        hull = node.callDecoration("getConvexHull")
+        points = hull.getPoints() if hull is not None else None
+        if points is None or len(points) < 3:
+            return 0.0, 0.0
+        x, y = points[:, 0], points[:, 1]
+        area = 0.5 * abs(float(numpy.dot(x, numpy.roll(y, 1)) - numpy.dot(y, numpy.roll(x, 1))))
+        bounding_box = node.getBoundingBox()
+        height = bounding_box.height if bounding_box is not None else 0.0
+        return area, area * height
@@ -2,8 +2,9 @@
 # Cura is released under the terms of the LGPLv3 or higher.
 
 import numpy
-from pynest2d import Point, Box, Item, NfpConfig, nest
-from typing import List, TYPE_CHECKING, Optional, Tuple
+from typing import List, TYPE_CHECKING, Optional, Tuple, Union, cast
+
+from pynest2d import Item
 
 from UM.Application import Application
 from UM.Decorators import deprecated
@@ -17,6 +18,9 @@ from UM.Operations.GroupedOperation import GroupedOperation
 from UM.Operations.RotateOperation import RotateOperation
 from UM.Operations.TranslateOperation import TranslateOperation
 from cura.Arranging.Arranger import Arranger
+from cura.Arranging.ArrangeState import ArrangeState
+from cura.Arranging.Nest2DSearch import ItemPlacement, getPackingScore, searchInParallel
+from cura.Arranging.Nest2DWorker import IntPolygon, STARTING_POINTS, getPlacement, nestItems
 
 if TYPE_CHECKING:
     from UM.Scene.SceneNode import SceneNode
@@ -24,13 +28,20 @@ if TYPE_CHECKING:
 
 
 class Nest2DArrange(Arranger):
+    # Starting worker processes and sending them the polygons takes longer than nesting a few objects one by one.
+    ParallelMinimumNodes = 10
+
     def __init__(self,
                  nodes_to_arrange: List["SceneNode"],
                  build_volume: "BuildVolume",
                  fixed_nodes: Optional[List["SceneNode"]] = None,
                  *,
                  factor: int = 10000,
-                 lock_rotation: bool = False):
+                 lock_rotation: bool = False,
+                 parallel: bool = False,
+                 time_budget: Optional[float] = None,
+                 rotation_sets: Optional[List[List[float]]] = None,
+                 arrange_state: Optional[ArrangeState] = None):
         """
         :param nodes_to_arrange: The list of nodes that need to be moved.
         :param build_volume: The build volume that we want to place the nodes in. It gets size & disallowed areas from this.
@@ -38,6 +49,13 @@ class Nest2DArrange(Arranger):
                             are placed.
         :param factor: The library that we use is int based. This factor defines how accuracte we want it to be.
         :param lock_rotation: If set to true the orientation of the object will remain the same
+        :param parallel: Try all starting points (and sets of rotations) at the same time in worker processes, and use
+                         the attempt that packs the objects best, instead of trying them one by one until one fits.
+                         Only used when arranging at least ParallelMinimumNodes objects.
+        :param time_budget: How many seconds to spend on the parallel search. When it runs out, the best attempt so far
+                            is used. Trying the starting points one by one is not limited.
+        :param rotation_sets: The sets of rotations (in radians) to try. If not given, the nesting decides.
+        :param arrange_state: Where to keep the converted disallowed areas and hulls of fixed nodes between arrangements.
         """
         super().__init__()
         self._nodes_to_arrange = nodes_to_arrange
@@ -45,14 +63,29 @@ class Nest2DArrange(Arranger):
         self._fixed_nodes = fixed_nodes
         self._factor = factor
         self._lock_rotation = lock_rotation
+        self._parallel = parallel
+        self._time_budget = time_budget
+        self._rotation_sets = rotation_sets
+        self._arrange_state = arrange_state
 
-    def findNodePlacement(self) -> Tuple[bool, List[Item]]:
-        spacing = int(1.5 * self._factor)  # 1.5mm spacing.
+        # The polygons to nest, converted to integer coordinates once, since every attempt needs them.
+        self._polygons_cache = None  # type: Optional[Tuple[List[IntPolygon], List[IntPolygon], List[IntPolygon]]]
+
+    def _convertPoints(self, points: Optional[numpy.ndarray]) -> Optional[IntPolygon]:
+        if points is None or len(points) <= 2:  # numpy array has to be explicitly checked against None
+            return None
+        converted = (numpy.asarray(points, dtype = numpy.float64) * self._factor).astype(numpy.int64)
+        return [(int(x), int(y)) for x, y in converted]
+
+    def _getPolygons(self) -> Tuple[List[IntPolygon], List[IntPolygon], List[IntPolygon]]:
+        """Get the polygons of the nodes to arrange, of the disallowed areas and of the fixed nodes."""
+
+        if self._polygons_cache is not None:
+            return self._polygons_cache
 
         edge_disallowed_size = self._build_volume.getEdgeDisallowedSize()
         machine_width = self._build_volume.getWidth() - (edge_disallowed_size * 2)
         machine_depth = self._build_volume.getDepth() - (edge_disallowed_size * 2)
-        build_plate_bounding_box = Box(int(machine_width * self._factor), int(machine_depth * self._factor))
 
         # Use a tiny margin for the build_plate_polygon (the nesting doesn't like overlapping disallowed areas)
         half_machine_width = 0.5 * machine_width - 1
@@ -64,80 +97,92 @@ class Nest2DArrange(Arranger):
             [half_machine_width, half_machine_depth]
         ], numpy.float32))
 
-        def _convert_points(points):
-            if points is not None and len(points) > 2:  # numpy array has to be explicitly checked against None
-                converted_points = []
-                for point in points:
-                    converted_points.append(Point(int(point[0] * self._factor), int(point[1] * self._factor)))
-                return [converted_points]
-            else:
-                return []
-
         polygons_nodes_to_arrange = []
         for node in self._nodes_to_arrange:
             hull_polygon = node.callDecoration("getConvexHull")
-            if not hull_polygon or hull_polygon.getPoints is None:
+            polygon = self._convertPoints(hull_polygon.getPoints()) if hull_polygon else None
+            if polygon is None:
                 Logger.log("w", "Object {} cannot be arranged because it has no convex hull.".format(node.getName()))
                 continue
+            polygons_nodes_to_arrange.append(polygon)
+
+        def convert_disallowed_areas() -> List[IntPolygon]:
+            polygons = []
+            for area in self._build_volume.getDisallowedAreas():
+                # Clip the disallowed areas so that they don't overlap the bounding box (The arranger chokes otherwise)
+                clipped_area = area.intersectionConvexHulls(build_plate_polygon)
+                polygon = self._convertPoints(clipped_area.getPoints())
+                if polygon is not None:
+                    polygons.append(polygon)
+            return polygons
+
+        def convert_hull(node: "SceneNode") -> Optional[IntPolygon]:
+            hull_polygon = node.callDecoration("getConvexHull")
+            return self._convertPoints(hull_polygon.getPoints()) if hull_polygon is not None else None
 
-            polygons_nodes_to_arrange += _convert_points(hull_polygon.getPoints())
-
-        polygons_disallowed_areas = []
-        for area in self._build_volume.getDisallowedAreas():
-            # Clip the disallowed areas so that they don't overlap the bounding box (The arranger chokes otherwise)
-            clipped_area = area.intersectionConvexHulls(build_plate_polygon)
-
-            polygons_disallowed_areas += _convert_points(clipped_area.getPoints())
+        if self._arrange_state is not None:
+            disallowed_areas_key = (self._factor, machine_width, machine_depth,
+                                    tuple(area.getPoints().tobytes() for area in self._build_volume.getDisallowedAreas()))
+            polygons_disallowed_areas = self._arrange_state.getConvertedDisallowedAreas(disallowed_areas_key, convert_disallowed_areas)
+        else:
+            polygons_disallowed_areas = convert_disallowed_areas()
 
         polygons_fixed_nodes = []
         if self._fixed_nodes is None:
             self._fixed_nodes = []
         for node in self._fixed_nodes:
-            hull_polygon = node.callDecoration("getConvexHull")
-
-            if hull_polygon is not None:
-                polygons_fixed_nodes += _convert_points(hull_polygon.getPoints())
-
-        strategies = [NfpConfig.Alignment.CENTER,
-                      NfpConfig.Alignment.BOTTOM_LEFT,
-                      NfpConfig.Alignment.BOTTOM_RIGHT,
-                      NfpConfig.Alignment.TOP_LEFT,
-                      NfpConfig.Alignment.TOP_RIGHT]
-        found_solution_for_all = False
-        while not found_solution_for_all and len(strategies) > 0:
-
-            # Add all the items we want to arrange
-            node_items = []
-            for polygon in polygons_nodes_to_arrange:
-                node_items.append(Item(polygon))
-
-            for polygon in polygons_disallowed_areas:
-                disallowed_area = Item(polygon)
-                disallowed_area.markAsDisallowedAreaInBin(0)
-                node_items.append(disallowed_area)
-
-            for polygon in polygons_fixed_nodes:
-                item = Item(polygon)
-                item.markAsFixedInBin(0)
-                node_items.append(item)
-
-            config = NfpConfig()
-            config.accuracy = 1.0
-            config.alignment = NfpConfig.Alignment.DONT_ALIGN
-            config.starting_point = strategies[0]
-            strategies = strategies[1:]
+            if self._arrange_state is not None:
+                polygon = self._arrange_state.getConvertedHull(node, (self._factor, ), convert_hull)
+            else:
+                polygon = convert_hull(node)
+            if polygon is not None:
+                polygons_fixed_nodes.append(polygon)
 
-            if self._lock_rotation:
-                config.rotations = [0.0]
+        self._polygons_cache = (polygons_nodes_to_arrange, polygons_disallowed_areas, polygons_fixed_nodes)
+        return self._polygons_cache
 
-            num_bins = nest(node_items, build_plate_bounding_box, spacing, config)
+    def findNodePlacement(self) -> Tuple[bool, List[Union[Item, ItemPlacement]]]:
+        """Find where to place the nodes.
 
-            # Strip the fixed items (previously placed) and the disallowed areas from the results again.
-            node_items = list(filter(lambda item: not item.isFixed(), node_items))
+        :return: Whether all nodes fit on the build plate, and the nested item of each node. If the nesting ran in
+            worker processes, those are placements with the same interface as an item instead.
+        """
 
-            found_solution_for_all = num_bins == 1
+        spacing = int(1.5 * self._factor)  # 1.5mm spacing.
 
-        return found_solution_for_all, node_items
+        edge_disallowed_size = self._build_volume.getEdgeDisallowedSize()
+        machine_width = self._build_volume.getWidth() - (edge_disallowed_size * 2)
+        machine_depth = self._build_volume.getDepth() - (edge_disallowed_size * 2)
+        bin_size = (int(machine_width * self._factor), int(machine_depth * self._factor))
+
+        polygons, disallowed_areas, fixed_polygons = self._getPolygons()
+        if self._lock_rotation:
+            rotation_sets = [[0.0]]  # type: List[Optional[List[float]]]
+        elif self._rotation_sets:
+            rotation_sets = list(self._rotation_sets)
+        else:
+            rotation_sets = [None]
+
+        if self._parallel and len(polygons) >= self.ParallelMinimumNodes:
+            result = searchInParallel(polygons, disallowed_areas, fixed_polygons, bin_size, spacing, rotation_sets, self._time_budget)
+            if result is not None:
+                num_bins, placements = result
+                return num_bins == 1, [ItemPlacement(placement) for placement in placements]
+            Logger.log("w", "Unable to arrange in worker processes. Trying the arrangements one by one instead.")
+
+        # Try the starting points one after another, until one of them fits everything.
+        best_items = []  # type: List[Item]
+        best_score = (-1, 0.0)
+        for rotations in rotation_sets:
+            for starting_point in range(len(STARTING_POINTS)):
+                num_bins, items = nestItems(polygons, disallowed_areas, fixed_polygons, bin_size, spacing, starting_point, rotations)
+                if num_bins == 1:
+                    return True, list(items)
+                score = getPackingScore(polygons, [getPlacement(item) for item in items])
+                if score > best_score:
+                    best_items, best_score = items, score
+
+        return False, list(best_items)
 
     def createGroupOperationForArrange(self, add_new_nodes_in_scene: bool = False) -> Tuple[GroupedOperation, int]:
         scene_root = Application.getInstance().getController().getScene().getRoot()
@@ -169,8 +214,10 @@ class Nest2DArrange(Arranger):
 @deprecated("Use the Nest2DArrange class instead")
 def findNodePlacement(nodes_to_arrange: List["SceneNode"], build_volume: "BuildVolume",
                       fixed_nodes: Optional[List["SceneNode"]] = None, factor=10000) -> Tuple[bool, List[Item]]:
+    # Without parallel search, the nesting runs in this process and gives the pynest2d items.
     arranger = Nest2DArrange(nodes_to_arrange, build_volume, fixed_nodes, factor=factor)
-    return arranger.findNodePlacement()
+    found_solution_for_all, node_items = arranger.findNodePlacement()
+    return found_solution_for_all, cast(List[Item], node_items)
 
 
 @deprecated("Use the Nest2DArrange class instead")
@@ -0,0 +1,129 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy
+from pynest2d import Point
+
+from cura.Arranging.Nest2DWorker import IntPolygon, Placement, STARTING_POINTS, nestPolygons
+
+# Every process of the pool imports pynest2d and the modules it needs once, so the pool is kept between arrangements.
+_process_pool = None  # type: Optional[ProcessPoolExecutor]
+
+
+def _stopProcessPool() -> None:
+    """Stop using the worker processes. Attempts that didn't start yet are cancelled.
+
+    Attempts that already started can't be interrupted, so their processes exit once they finish. The next arrangement
+    starts a new pool meanwhile.
+    """
+
+    global _process_pool
+    if _process_pool is None:
+        return
+    _process_pool.shutdown(wait = False, cancel_futures = True)
+    _process_pool = None
+
+
+class ItemPlacement:
+    """Where an item was placed by the nesting, with the same interface as a nested pynest2d Item.
+
+    Unlike Items, placements can be sent between processes.
+    """
+
+    def __init__(self, placement: Placement) -> None:
+        self._bin_id, self._rotation, self._x, self._y = placement
+
+    def binId(self) -> int:
+        return self._bin_id
+
+    def rotation(self) -> float:
+        return self._rotation
+
+    def translation(self) -> Point:
+        return Point(self._x, self._y)
+
+    def isFixed(self) -> bool:
+        return False
+
+
+def getPackingScore(polygons: Sequence[IntPolygon], placements: Sequence[Placement]) -> Tuple[int, float]:
+    """Rate how well polygons were placed.
+
+    :return: The number of polygons that were placed on the build plate, and the fill ratio: the area of those polygons
+        divided by the area of their bounding box. Higher is better for both.
+    """
+
+    placed_area = 0.0
+    min_corner = numpy.array([numpy.inf, numpy.inf])
+    max_corner = -min_corner
+    placed_count = 0
+    for polygon, (bin_id, rotation, x, y) in zip(polygons, placements):
+        if bin_id != 0:
+            continue
+        placed_count += 1
+        points = numpy.array(polygon, dtype = numpy.float64)
+        cos, sin = numpy.cos(rotation), numpy.sin(rotation)
+        points = points.dot(numpy.array([[cos, sin], [-sin, cos]])) + (x, y)
+        placed_area += 0.5 * abs(numpy.dot(points[:, 0], numpy.roll(points[:, 1], 1)) - numpy.dot(points[:, 1], numpy.roll(points[:, 0], 1)))
+        min_corner = numpy.minimum(min_corner, points.min(axis = 0))
+        max_corner = numpy.maximum(max_corner, points.max(axis = 0))
+    if placed_count == 0:
+        return 0, 0.0
+    bounding_box_area = float(numpy.prod(max_corner - min_corner))
+    return placed_count, float(placed_area / bounding_box_area) if bounding_box_area > 0 else 0.0
+
+
+def searchInParallel(polygons: Sequence[IntPolygon],
+                     disallowed_areas: Sequence[IntPolygon],
+                     fixed_polygons: Sequence[IntPolygon],
+                     bin_size: Tuple[int, int],
+                     spacing: int,
+                     rotation_sets: Sequence[Optional[Sequence[float]]],
+                     time_budget: Optional[float] = None) -> Optional[Tuple[int, List[Placement]]]:
+    """Try all starting points with all sets of rotations at the same time, in worker processes.
+
+    :param rotation_sets: The sets of rotations to try, where None lets the nesting decide.
+    :param time_budget: How many seconds to wait for attempts. After that, the best attempt that finished so far is
+        used, or the first one to finish within another time budget if none have finished yet. If not given, all
+        attempts are waited for.
+    :return: The number of bins needed and the placements of the attempt that placed the most polygons and filled
+        its bounding box best, or None if the worker processes could not be used or no attempt finished in time.
+    """
+
+    global _process_pool
+    try:
+        if _process_pool is None:
+            # Spawn the processes, since forking a process that runs Qt threads is not safe.
+            _process_pool = ProcessPoolExecutor(max_workers = max(1, min((os.cpu_count() or 2) - 1, 8)),
+                                                mp_context = multiprocessing.get_context("spawn"))
+        futures = {}  # type: Dict[Future, Tuple[int, Optional[Sequence[float]]]]
+        for rotations in rotation_sets:
+            for starting_point in range(len(STARTING_POINTS)):
+                future = _process_pool.submit(nestPolygons, polygons, disallowed_areas, fixed_polygons, bin_size, spacing, starting_point, rotations)
+                futures[future] = (starting_point, rotations)
+
+        done, not_done = wait(futures, timeout = time_budget)
+        if not done:
+            done, not_done = wait(futures, timeout = time_budget, return_when = FIRST_COMPLETED)
+        for future in not_done:
+            future.cancel()
+        if any(future.running() for future in not_done):
+            _stopProcessPool()
+
+        best_result = None  # type: Optional[Tuple[int, List[Placement]]]
+        best_score = (-1, 0.0)
+        for future in done:
+            result = future.result()
+            score = getPackingScore(polygons, result[1])
+            if score > best_score:
+                best_result, best_score = result, score
+        return best_result
+    except (BrokenProcessPool, OSError, RuntimeError):
+        _stopProcessPool()
+        return None
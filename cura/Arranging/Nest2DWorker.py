@@ -0,0 +1,85 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+"""The nesting that worker processes run for the parallel arrange search.
+
+Worker processes import this module to run nestPolygons, so it must stay light: only pynest2d, no Qt or Uranium.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from pynest2d import Point, Box, Item, NfpConfig, nest
+
+IntPolygon = List[Tuple[int, int]]
+Placement = Tuple[int, float, int, int]  # The bin ID, rotation (in radians) and translation of a nested item.
+
+# The starting points to try, in order of preference.
+STARTING_POINTS = [NfpConfig.Alignment.CENTER,
+                   NfpConfig.Alignment.BOTTOM_LEFT,
+                   NfpConfig.Alignment.BOTTOM_RIGHT,
+                   NfpConfig.Alignment.TOP_LEFT,
+                   NfpConfig.Alignment.TOP_RIGHT]
+
+
+def nestItems(polygons: Sequence[IntPolygon],
+              disallowed_areas: Sequence[IntPolygon],
+              fixed_polygons: Sequence[IntPolygon],
+              bin_size: Tuple[int, int],
+              spacing: int,
+              starting_point: int,
+              rotations: Optional[Sequence[float]] = None) -> Tuple[int, List[Item]]:
+    """Nest polygons on a build plate.
+
+    :param polygons: The polygons to place.
+    :param disallowed_areas: The areas of the build plate where nothing may be placed.
+    :param fixed_polygons: The polygons of objects that stay where they are.
+    :param bin_size: The width and depth of the build plate.
+    :param spacing: The minimum distance between polygons.
+    :param starting_point: The index in STARTING_POINTS of where to start placing polygons.
+    :param rotations: The rotations to try for each polygon, or None to let the nesting decide.
+    :return: The number of bins needed, and the nested item of each polygon.
+    """
+
+    items = [Item([Point(x, y) for x, y in polygon]) for polygon in polygons]
+    obstacles = []
+    for polygon in disallowed_areas:
+        disallowed_area = Item([Point(x, y) for x, y in polygon])
+        disallowed_area.markAsDisallowedAreaInBin(0)
+        obstacles.append(disallowed_area)
+    for polygon in fixed_polygons:
+        item = Item([Point(x, y) for x, y in polygon])
+        item.markAsFixedInBin(0)
+        obstacles.append(item)
+
+    config = NfpConfig()
+    config.accuracy = 1.0
+    config.alignment = NfpConfig.Alignment.DONT_ALIGN
+    config.starting_point = STARTING_POINTS[starting_point]
+    if rotations is not None:
+        config.rotations = list(rotations)
+
+    num_bins = nest(items + obstacles, Box(bin_size[0], bin_size[1]), spacing, config)
+    return num_bins, items
+
+
+def getPlacement(item: Item) -> Placement:
+    """Get where a nested item was placed, as data that can be pickled."""
+
+    return item.binId(), item.rotation(), item.translation().x(), item.translation().y()
+
+
+def nestPolygons(polygons: Sequence[IntPolygon],
+                 disallowed_areas: Sequence[IntPolygon],
+                 fixed_polygons: Sequence[IntPolygon],
+                 bin_size: Tuple[int, int],
+                 spacing: int,
+                 starting_point: int,
+                 rotations: Optional[Sequence[float]] = None) -> Tuple[int, List[Placement]]:
+    """Nest polygons on a build plate, in a worker process.
+
+    This takes the same arguments as nestItems, but returns the placement of each polygon instead of its item, so that
+    the result can be sent back to the main process.
+    """
+
+    num_bins, items = nestItems(polygons, disallowed_areas, fixed_polygons, bin_size, spacing, starting_point, rotations)
+    return num_bins, [getPlacement(item) for item in items]
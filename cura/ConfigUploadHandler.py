@@ -7,12 +7,13 @@ import tempfile
 from typing import Optional, Dict, Any, Callable
 
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QUrl, QUrlQuery, QTimer, Qt
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtNetwork import QNetworkReply
 
 from UM.Logger import Logger
 from UM.Application import Application
 from UM.Message import Message
 from cura.GCodeUploadByToken import GCodeUploadByToken
+from cura.Network.HttpClient import HttpClient
 from cura.config import OBS_TOKEN_URL, CONFIG_ADD_URL, DEVICE_SLICE_TYPE_URL
 
 
@@ -99,11 +100,6 @@ class ConfigUploadHandler(QObject):
         # 调试模式开关（生产环境可设为 False）
         self._debug_mode = True  # 设为 False 可减少日志输出
         
-        # 初始化网络管理器
-        self.network_manager = QNetworkAccessManager(self)
-        self.reply_obs_token = None
-        self.reply_save_config = None
-        self.reply_fetch_configs = None
         self._token_callback = None
         
         # 初始化上传器
@@ -118,7 +114,6 @@ class ConfigUploadHandler(QObject):
         
         # 云端配置导入相关
         self._current_import_config_name = ""
-        self.reply_download_config = None
         self._importing_message = None  # 导入中的加载提示
         self._import_state = None  # 批处理导入状态
         
@@ -447,21 +442,11 @@ class ConfigUploadHandler(QObject):
             
             Logger.log("d", f"保存配置到服务器: {request_data}")
             
-            # 构建请求
-            url = QUrl(CONFIG_ADD_URL)
-            request = QNetworkRequest(url)
-            
-            # 设置 Header
-            auth_token = self._application.get_auth_token()
-            if auth_token:
-                request.setRawHeader(b"Authorization", auth_token.encode('utf-8'))
-            request.setRawHeader(b"Biz", b"ZXBMan")
-            request.setRawHeader(b"Content-Type", b"application/json")
-            
             # 发送请求
-            json_data = json.dumps(request_data).encode('utf-8')
-            self.reply_save_config = self.network_manager.post(request, json_data)
-            self.reply_save_config.finished.connect(self._onSaveConfigResponse)
+            HttpClient.getInstance().postJson(CONFIG_ADD_URL, request_data,
+                                              headers_dict = self._getAuthHeaders(),
+                                              callback = self._onSaveConfigResponse,
+                                              error_callback = self._onSaveConfigResponse)
             
         except Exception as e:
             Logger.logException("e", f"保存配置到服务器失败: {str(e)}")
@@ -470,15 +455,11 @@ class ConfigUploadHandler(QObject):
             # 显示警告（文件已上传但保存信息失败）
             self._showMessage("上传完成", f"配置 '{self._current_config_name}' 文件已上传，但保存信息异常")
     
-    def _onSaveConfigResponse(self):
+    def _onSaveConfigResponse(self, reply: QNetworkReply, error: Optional["QNetworkReply.NetworkError"] = None):
         """处理保存配置到服务器的响应"""
-        if not self.reply_save_config:
-            return
-        
         try:
-            if self.reply_save_config.error() == QNetworkReply.NetworkError.NoError:
-                data = self.reply_save_config.readAll()
-                response_data = json.loads(data.data().decode('utf-8'))
+            if error is None:
+                response_data = json.loads(bytes(reply.readAll()).decode('utf-8'))
                 Logger.log("d", f"保存配置响应: {response_data}")
                 
                 if response_data.get("msg") == "success" or response_data.get("code") == 0:
@@ -494,7 +475,7 @@ class ConfigUploadHandler(QObject):
                     # 显示警告（文件已上传但保存信息失败）
                     self._showMessage("上传完成", f"配置 '{self._current_config_name}' 文件已上传，但保存信息失败")
             else:
-                err_str = self.reply_save_config.errorString()
+                err_str = reply.errorString()
                 Logger.log("e", f"保存配置到服务器网络错误: {err_str}")
                 # 即使保存失败，也认为上传成功（文件已上传）
                 self.uploadSuccess.emit()
@@ -505,9 +486,14 @@ class ConfigUploadHandler(QObject):
             self.uploadSuccess.emit()
             # 显示警告（文件已上传但处理响应异常）
             self._showMessage("上传完成", f"配置 '{self._current_config_name}' 文件已上传，但处理响应异常")
-        finally:
-            self.reply_save_config.deleteLater()
-            self.reply_save_config = None
+    
+    def _getAuthHeaders(self) -> Dict[str, str]:
+        """云端接口的认证 Header"""
+        headers = {"Biz": "ZXBMan"}
+        auth_token = self._application.get_auth_token()
+        if auth_token:
+            headers["Authorization"] = auth_token
+        return headers
     
     def _getUploadToken(self, callback: Callable[[Dict[str, Any]], None] = None):
         """
@@ -530,15 +516,10 @@ class ConfigUploadHandler(QObject):
             query.addQueryItem("suffix", suffix)
         
         url.setQuery(query)
-        request = QNetworkRequest(url)
         
         # 获取认证token
-        biz = "ZXBMan"
         try:
-            from cura.CuraApplication import CuraApplication
-            auth_token = CuraApplication.getInstance().get_auth_token()
-            request.setRawHeader(b"Authorization", auth_token.encode('utf-8'))
-            request.setRawHeader(b"Biz", biz.encode("utf-8"))
+            headers = self._getAuthHeaders()
         except Exception as e:
             Logger.logException("e", f"获取认证token失败: {str(e)}")
             if callback:
@@ -546,15 +527,15 @@ class ConfigUploadHandler(QObject):
             return
         
         Logger.log("d", f"请求OBS令牌: {url.toString()}")
-        self.reply_obs_token = self.network_manager.get(request)
-        self.reply_obs_token.finished.connect(self._onObsTokenResponse)
+        HttpClient.getInstance().get(url.toString(), headers_dict = headers,
+                                     callback = self._onObsTokenResponse,
+                                     error_callback = self._onObsTokenResponse)
     
-    def _onObsTokenResponse(self):
+    def _onObsTokenResponse(self, reply: QNetworkReply, error: Optional["QNetworkReply.NetworkError"] = None):
         """处理OBS令牌响应"""
         try:
-            if self.reply_obs_token.error() == QNetworkReply.NetworkError.NoError:
-                data = self.reply_obs_token.readAll()      
-                response_data = json.loads(data.data().decode('utf-8'))
+            if error is None:
+                response_data = json.loads(bytes(reply.readAll()).decode('utf-8'))
                 Logger.log("d", f"OBS令牌响应: {response_data}")
                 
                 if response_data.get("msg") == "success":
@@ -578,7 +559,7 @@ class ConfigUploadHandler(QObject):
                     if self._token_callback:
                         self._token_callback(None)
             else:
-                err_str = self.reply_obs_token.errorString()
+                err_str = reply.errorString()
                 Logger.log("e", f"OBS令牌请求错误: {err_str}")
                 if self._token_callback:
                     self._token_callback(None)
@@ -587,10 +568,6 @@ class ConfigUploadHandler(QObject):
             Logger.logException("e", f"处理OBS令牌响应时出错: {str(e)}")
             if self._token_callback:
                 self._token_callback(None)
-        finally:
-            if self.reply_obs_token:
-                self.reply_obs_token.deleteLater()
-                self.reply_obs_token = None
     
     @pyqtSlot(str, str)
     def uploadConfig(self, config_name: str, remarks: str):
@@ -1140,33 +1117,21 @@ class ConfigUploadHandler(QObject):
     def fetchCloudConfigs(self):
         """获取云端配置列表"""
         try:
-            url = QUrl(DEVICE_SLICE_TYPE_URL)
-            request = QNetworkRequest(url)
-            
-            # 设置 Header
-            auth_token = self._application.get_auth_token()
-            if auth_token:
-                request.setRawHeader(b"Authorization", auth_token.encode('utf-8'))
-            request.setRawHeader(b"Biz", b"ZXBMan")
-            
-            Logger.log("d", f"请求云端配置列表: {url.toString()}")
+            Logger.log("d", f"请求云端配置列表: {DEVICE_SLICE_TYPE_URL}")
             
-            self.reply_fetch_configs = self.network_manager.get(request)
-            self.reply_fetch_configs.finished.connect(self._onFetchConfigsResponse)
+            HttpClient.getInstance().get(DEVICE_SLICE_TYPE_URL, headers_dict = self._getAuthHeaders(),
+                                         callback = self._onFetchConfigsResponse,
+                                         error_callback = self._onFetchConfigsResponse)
             
         except Exception as e:
             Logger.logException("e", f"获取云端配置列表失败: {str(e)}")
             self.cloudConfigsFetchFailed.emit(str(e))
     
-    def _onFetchConfigsResponse(self):
+    def _onFetchConfigsResponse(self, reply: QNetworkReply, error: Optional["QNetworkReply.NetworkError"] = None):
         """处理获取配置列表的响应"""
-        if not self.reply_fetch_configs:
-            return
-        
         try:
-            if self.reply_fetch_configs.error() == QNetworkReply.NetworkError.NoError:
-                data = self.reply_fetch_configs.readAll()
-                response_data = json.loads(data.data().decode('utf-8'))
+            if error is None:
+                response_data = json.loads(bytes(reply.readAll()).decode('utf-8'))
                 Logger.log("d", f"配置列表响应: {response_data}")
                 
                 if response_data.get("msg") == "success" or response_data.get("code") == 0:
@@ -1203,15 +1168,12 @@ class ConfigUploadHandler(QObject):
                     Logger.log("e", f"获取配置列表失败: {error_msg}")
                     self.cloudConfigsFetchFailed.emit(error_msg)
             else:
-                err_str = self.reply_fetch_configs.errorString()
+                err_str = reply.errorString()
                 Logger.log("e", f"获取配置列表网络错误: {err_str}")
                 self.cloudConfigsFetchFailed.emit(err_str)
         except Exception as e:
             Logger.logException("e", f"处理配置列表响应时出错: {str(e)}")
             self.cloudConfigsFetchFailed.emit(str(e))
-        finally:
-            self.reply_fetch_configs.deleteLater()
-            self.reply_fetch_configs = None
     
     @pyqtSlot(str, str)
     def importCloudConfig(self, config_url: str, config_name: str):
@@ -1230,30 +1192,19 @@ class ConfigUploadHandler(QObject):
         # 保存当前配置信息，用于下载完成后处理
         self._current_import_config_name = config_name
         
-        # 发起下载请求
-        url = QUrl(config_url)
-        request = QNetworkRequest(url)
-        
-        # 添加认证头
-        auth_token = Application.getInstance().get_auth_token()
-        if auth_token:
-            request.setRawHeader(b"Authorization", auth_token.encode('utf-8'))
-        request.setRawHeader(b"Biz", "ZXBMan".encode("utf-8"))
-        
-        self.reply_download_config = self.network_manager.get(request)
-        self.reply_download_config.finished.connect(self._onConfigDownloaded)
+        # 发起下载请求（带认证头）
+        HttpClient.getInstance().get(config_url, headers_dict = self._getAuthHeaders(),
+                                     callback = self._onConfigDownloaded,
+                                     error_callback = self._onConfigDownloaded)
         
         Logger.log("d", f"正在下载配置文件: {config_url}")
     
-    def _onConfigDownloaded(self):
+    def _onConfigDownloaded(self, reply: QNetworkReply, error: Optional["QNetworkReply.NetworkError"] = None):
         """配置文件下载完成的回调"""
-        if not self.reply_download_config:
-            return
-        
         try:
-            if self.reply_download_config.error() == QNetworkReply.NetworkError.NoError:
+            if error is None:
                 # 读取配置文件内容
-                config_content = bytes(self.reply_download_config.readAll()).decode('utf-8')
+                config_content = bytes(reply.readAll()).decode('utf-8')
                 Logger.log("d", f"配置文件下载成功，内容长度: {len(config_content)}")
                 
                 #  显示"正在导入配置..."加载提示
@@ -1266,7 +1217,7 @@ class ConfigUploadHandler(QObject):
                 # 虽然导入操作本身需要 500ms，但至少用户能看到"正在处理"的反馈
                 QTimer.singleShot(300, lambda: self._applyConfigSettings(config_content, self._current_import_config_name))
             else:
-                error_string = self.reply_download_config.errorString()
+                error_string = reply.errorString()
                 Logger.log("e", f"配置文件下载失败: {error_string}")
                 self._showMessage("配置导入失败", f"下载配置文件失败: {error_string}")
         
@@ -1275,10 +1226,6 @@ class ConfigUploadHandler(QObject):
             import traceback
             Logger.log("e", traceback.format_exc())
             self._showMessage("配置导入失败", f"处理配置文件时出错: {str(e)}")
-        
-        finally:
-            self.reply_download_config.deleteLater()
-            self.reply_download_config = None
     
     def _applyConfigSettings(self, config_content: str, config_name: str):
         """
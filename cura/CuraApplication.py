@@ -7,14 +7,13 @@ import sys
 import tempfile
 import time
 import platform
-import json
 from pathlib import Path
-from typing import cast, TYPE_CHECKING, Optional, Callable, List, Any, Dict, Mapping
+from typing import cast, TYPE_CHECKING, Optional, Callable, List, Any, Dict, Mapping, Union
 
 import numpy
 from PyQt6.QtCore import QObject, QTimer, QUrl, QUrlQuery, pyqtSignal, pyqtProperty, QEvent, pyqtEnum, QCoreApplication, \
-    QByteArray
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+    QByteArray, QEventLoop
+from PyQt6.QtNetwork import QNetworkReply
 from PyQt6.QtCore import Qt, pyqtSlot, QUrl, QByteArray
 from PyQt6.QtGui import QColor, QIcon
 from PyQt6.QtQml import qmlRegisterUncreatableMetaObject, qmlRegisterSingletonType, qmlRegisterType
@@ -86,6 +85,7 @@ from cura.Machines.Models.QualityProfilesDropDownMenuModel import QualityProfile
 from cura.Machines.Models.QualitySettingsModel import QualitySettingsModel
 from cura.Machines.Models.SettingVisibilityPresetsModel import SettingVisibilityPresetsModel
 from cura.Machines.Models.UserChangesModel import UserChangesModel
+from cura.Network.HttpClient import HttpClient
 from cura.Operations.SetParentOperation import SetParentOperation
 from cura.PrinterOutput.NetworkMJPGImage import NetworkMJPGImage
 from cura.PrinterOutput.PrinterOutputDevice import PrinterOutputDevice
@@ -103,12 +103,16 @@ from cura.Settings.ExtruderManager import ExtruderManager
 from cura.Settings.ExtruderStack import ExtruderStack
 from cura.Settings.GlobalStack import GlobalStack
 from cura.Settings.IntentManager import IntentManager
+from cura.Settings.LoadAllMetadataJob import LoadAllMetadataJob
 from cura.Settings.MachineManager import MachineManager
 from cura.Settings.MachineNameValidator import MachineNameValidator
 from cura.Settings.MaterialSettingsVisibilityHandler import MaterialSettingsVisibilityHandler
 from cura.Settings.SettingInheritanceManager import SettingInheritanceManager
 from cura.Settings.SidebarCustomMenuItemsModel import SidebarCustomMenuItemsModel
 from cura.Settings.SimpleModeSettingsManager import SimpleModeSettingsManager
+from cura.Slicing.SliceBatch import SliceBatch
+from cura.Slicing.SliceService import SliceService
+from cura.Slicing.SliceServiceServer import SliceServiceServer
 from cura.TaskManagement.OnExitCallbackManager import OnExitCallbackManager
 from cura.UI import CuraSplashScreen, PrintInformation
 from cura.UI.MachineActionManager import MachineActionManager
@@ -127,6 +131,7 @@ from . import CameraAnimation
 from . import CuraActions
 from . import PlatformPhysics
 from . import PrintJobPreviewImageProvider
+from .Arranging.ArrangeState import ArrangeState
 from .Arranging.Nest2DArrange import Nest2DArrange
 from .AutoSave import AutoSave
 from .Machines.Models.CompatibleMachineModel import CompatibleMachineModel
@@ -135,7 +140,7 @@ from .Machines.Models.ActiveIntentQualitiesModel import ActiveIntentQualitiesMod
 from .Machines.Models.IntentSelectionModel import IntentSelectionModel
 from .PrintOrderManager import PrintOrderManager
 from .SingleInstance import SingleInstance
-from .LoginWindow import LoginWindow
+from .LoginWindow import LoginWindow, TokenLogin
 from .MachineSelectionDlg import MachineSelectionDlg
 from plugins.LocalFileOutputDevice.LocalFileOutputDevice import LocalFileOutputDevice
 from .GcodeUploader import GCodeUploader
@@ -157,7 +162,6 @@ class PythonHandler(QObject):
     upload_success_signal = pyqtSignal(str)
     def __init__(self, parent: QObject = None) -> None:
         super().__init__(parent)
-        self.network_manager = QNetworkAccessManager()
         self._callback = None
         self._select_data = None
         self.upload_success_signal.connect(self.showMsgTip)
@@ -200,28 +204,24 @@ class PythonHandler(QObject):
         if suffix:
             query.addQueryItem("suffix", suffix)
         url.setQuery(query)
-        request = QNetworkRequest(url)
         # Logger.debug("auth_token:%s", self._auth_token)
         biz = "ZXBMan"
-        request.setRawHeader(b"Authorization", CuraApplication.getInstance().get_auth_token().encode('utf-8'))
-        request.setRawHeader(b"Biz", biz.encode("utf-8"))
-        self.reply_obs = self.network_manager.get(request)
-        self.reply_obs.finished.connect(self.on_query_obs_response)
-
-    def on_query_obs_response(self):
-        if self.reply_obs.error() == QNetworkReply.NetworkError.NoError:
-            data = self.reply_obs.readAll()      
-            response_data = json.loads(data.data().decode('utf-8'))
+        headers = {"Authorization": CuraApplication.getInstance().get_auth_token(), "Biz": biz}
+        HttpClient.getInstance().get(url.toString(), headers_dict = headers,
+                                     callback = self.on_query_obs_response,
+                                     error_callback = lambda reply, error: Logger.log("w", "Unable to get the upload token: %s", reply.errorString()))
+
+    def on_query_obs_response(self, reply: QNetworkReply):
+        response_data = HttpClient.readJSON(reply)
+        if response_data is not None:
             Logger.debug("query_obs_response:%s ", response_data)
-            if response_data["msg"] == "success":
+            if response_data.get("msg") == "success":
                 # self._obs_token = response_data["data"]["policy"]
                 # self._download_url = response_data["data"]["host"] + "/" + response_data["data"]["key"]
                 # Logger.debug("obs_token:%s", self._obs_token)
                 self._header_data = response_data["data"]
                 if self._callback:
                     self._callback(self._header_data)
-        else:
-            print("obs resp error")
 
     def show_machine_selection_dialog(self):
         dialog = MachineSelectionDlg()
@@ -251,7 +251,6 @@ class PythonHandler(QObject):
             self.query_obs_token(on_token_received)         
     
     def import_url_to_device(self, url, device_sn, download_url, device_id):
-        request = QNetworkRequest(QUrl(url))
         request_json = {
             "url":download_url,
             "deviceId":device_id,
@@ -259,19 +258,14 @@ class PythonHandler(QObject):
             "requestId":device_sn,
             "fileType":"gcode"
         }
-        json_data = json.dumps(request_json, ensure_ascii=False)
-        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
-        self.reply_send = self.network_manager.post(request, QByteArray(json_data.encode('utf-8')))
-        self.reply_send.finished.connect(self.on_import_response)
-               
-
-    def on_import_response(self):
-        if self.reply_send.error() == QNetworkReply.NetworkError.NoError:
-            data = self.reply_send.readAll()      
-            response_data = json.loads(data.data().decode('utf-8'))
-            print(f"resp------{response_data}")
-            if response_data["msg"] == "success":
-                print("--------------send success-------------")
+        HttpClient.getInstance().postJson(url, request_json, callback = self.on_import_response)
+
+    def on_import_response(self, reply: QNetworkReply):
+        response_data = HttpClient.readJSON(reply)
+        if response_data is not None:
+            Logger.log("d", "Print command response: %s", response_data)
+            if response_data.get("msg") == "success":
+                Logger.log("d", "Sent the print command to the device.")
                 tip = catalog.i18nc("@info:title", "上传打印设备成功")
                 self.upload_success_signal.emit(tip)
     
@@ -421,6 +415,7 @@ class CuraApplication(QtApplication):
 
         self._physics = None
         self._volume = None
+        self._arrange_state = ArrangeState()
         self._output_devices = {}
         self._print_information = None
         self._previous_active_tool = None
@@ -468,6 +463,11 @@ class CuraApplication(QtApplication):
 
         self._supported_url_schemes: List[str] = ["cura", "slicer"]
         self._auth_token = ""
+        self._login_window = None  # type: Optional[Union[LoginWindow, TokenLogin]]
+
+        self._slice_service = None  # type: Optional[SliceService]
+        self._slice_service_server = None  # type: Optional[SliceServiceServer]
+        self._slice_batch = None  # type: Optional[SliceBatch]
 
     @pyqtProperty(str, constant=True)
     def ultimakerCloudApiRootUrl(self) -> str:
@@ -503,6 +503,43 @@ class CuraApplication(QtApplication):
                                       action = "store_true",
                                       default = False,
                                       help = "FOR TESTING ONLY. Trigger an early crash to show the crash dialog.")
+        self._cli_parser.add_argument("--slice-service",
+                                      dest = "slice_service",
+                                      action = "store_true",
+                                      default = False,
+                                      help = "Run without interface as a service that slices the requests it receives on a local socket. Implies --headless.")
+        self._cli_parser.add_argument("--slice-service-name",
+                                      dest = "slice_service_name",
+                                      default = None,
+                                      help = "The name of the local socket that the slice service listens on.")
+        self._cli_parser.add_argument("--slice-service-output",
+                                      dest = "slice_service_output",
+                                      default = None,
+                                      help = "Where the slice service writes g-code to if a request doesn't say where. Defaults to the working directory.")
+        self._cli_parser.add_argument("--slice-batch",
+                                      dest = "slice_batch",
+                                      default = None,
+                                      metavar = "MANIFEST",
+                                      help = "Run without interface, slice all jobs in the manifest and quit. Implies --headless.")
+        self._cli_parser.add_argument("--slice-batch-summary",
+                                      dest = "slice_batch_summary",
+                                      default = None,
+                                      metavar = "FILE",
+                                      help = "Where to write the JSON summary of the batch to. By default it's printed.")
+        self._cli_parser.add_argument("--auth-token",
+                                      dest = "auth_token",
+                                      default = None,
+                                      help = "The token to log in with when running without interface. Defaults to the CURA_AUTH_TOKEN environment variable, or else the token of the last login that was remembered.")
+        self._cli_parser.add_argument("--slice-processes",
+                                      dest = "slice_processes",
+                                      type = int,
+                                      default = None,
+                                      help = "The number of engine processes to slice with at the same time, instead of the backend/max_engine_processes preference.")
+        self._cli_parser.add_argument("--no-persistent-engine",
+                                      dest = "persistent_engine",
+                                      action = "store_false",
+                                      default = None,
+                                      help = "When slicing multiple build plates in parallel, start a new engine process for every build plate instead of keeping engines running between slices, regardless of the backend/persistent_engine preference.")
         self._cli_parser.add_argument("file", nargs = "*", help = "Files to load after starting the application.")
 
     def getContainerRegistry(self) -> "CuraContainerRegistry":
@@ -516,6 +553,8 @@ class CuraApplication(QtApplication):
             sys.exit(0)
 
         self._use_single_instance = self._cli_args.single_instance
+        if self._cli_args.slice_service or self._cli_args.slice_batch:
+            self._is_headless = True
         # FOR TESTING ONLY
         if self._cli_args.trigger_early_crash:
             assert not "This crash is triggered by the trigger_early_crash command line argument."
@@ -714,25 +753,81 @@ class CuraApplication(QtApplication):
             }
         )
     
-    def loginWindow(self) -> bool:
-        login = LoginWindow()
-        if not login.exec_login():
-           print("exit ...")
-           sys.exit(0) 
+    def _startLogin(self) -> None:
+        """Show the login dialog, without waiting for the user to log in.
+
+        The plug-ins, the container metadata and the rest of the application are loaded while the dialog is open. If
+        the account was remembered, the login round-trip runs at the same time too. The container metadata is loaded
+        on a worker thread, so the dialog keeps responding during the longest part of the loading.
+
+        Without interface, a token is checked instead of showing the dialog. Cura refuses to start without one.
+        """
+
+        if self._is_headless:
+            # Nobody can answer the login dialog, so log in with a token instead.
+            token = self._cli_args.auth_token or os.environ.get("CURA_AUTH_TOKEN") or TokenLogin.cached_token()
+            if not token:
+                self._exitWithError("Not logged in. Log in with the interface first while remembering the account, or give a token with --auth-token.")
+            self._login_window = TokenLogin(token, parent = self)
         else:
-           print("login ...")
-           self._auth_token = login.auth_token()
-           Logger.debug("auth_token:---  %s", self._auth_token)
-           return True
-        return False
+            self._login_window = LoginWindow()
+        self._login_window.start_login()
+
+    def _finishLogin(self) -> None:
+        """Wait for the user to log in, if they haven't already. Exits if the user didn't log in, or the token was
+        refused."""
+
+        if self._login_window is None:
+            return
+        if self._is_headless:
+            if not self._login_window.wait_login():
+                self._exitWithError("Unable to log in with the token. It may have expired, so log in with the interface again or give a new one with --auth-token.")
+        else:
+            self._setLoadingHint(self._i18n_catalog.i18nc("@info:progress", "Waiting for login..."))
+            self._login_window.raise_()
+            self._login_window.activateWindow()
+            if not self._login_window.wait_login():
+                Logger.log("i", "Exiting, since the user didn't log in.")
+                sys.exit(0)
+        self._auth_token = self._login_window.auth_token()
+        Logger.debug("auth_token:---  %s", self._auth_token)
+        self._login_window.deleteLater()
+        self._login_window = None
     
+    def _loadAllMetadataInBackground(self) -> None:
+        """Load the metadata of all containers in a job, and process events until it is done.
+
+        This keeps the login dialog responding. The rest of the start-up creates Qt objects, so that stays on this
+        thread.
+        """
+
+        job = LoadAllMetadataJob(self._container_registry)
+        loop = QEventLoop()
+        job.finished.connect(lambda _: loop.quit())  # Emitted on this thread, so the loop is running if it wasn't done yet.
+        job.start()
+        if not job.isFinished():
+            loop.exec()
+        error = job.getError()
+        if error is not None:
+            raise error
+
+    def _exitWithError(self, message: str, exit_code: int = 1) -> None:
+        """Exit with an error that is reported on the standard error output as well, for when running without interface.
+
+        :param message: What went wrong.
+        :param exit_code: The exit code of the process. Must not be 0.
+        """
+
+        Logger.log("e", message)
+        print(message, file = sys.stderr)
+        sys.exit(exit_code)
+
     def get_auth_token(self) -> str:
         return self._auth_token
 
     def startSplashWindowPhase(self) -> None:
         """Runs preparations that needs to be done before the starting process."""
-        if not self.loginWindow():
-            return
+        self._startLogin()
         self.setRequiredPlugins([
             # Misc.:
             "ConsoleLogger",  # You want to be able to read the log if something goes wrong.
@@ -764,6 +859,10 @@ class CuraApplication(QtApplication):
         # Plugins need to be set here, since in the super the check is done if they are actually loaded.
 
         super().startSplashWindowPhase()
+        if not self._is_headless:
+            # The splash screen is shown now, so bring the login dialog back to the front.
+            self._login_window.raise_()
+            self._login_window.activateWindow()
 
         if not self.getIsHeadLess():
             try:
@@ -789,7 +888,7 @@ class CuraApplication(QtApplication):
         self._container_registry.allMetadataLoaded.connect(ContainerRegistry.getInstance)
 
         with self._container_registry.lockFile():
-            self._container_registry.loadAllMetadata()
+            self._loadAllMetadataInBackground()
 
         self._setLoadingHint(self._i18n_catalog.i18nc("@info:progress", "Setting up preferences..."))
         # Set the setting version for Preferences
@@ -810,6 +909,10 @@ class CuraApplication(QtApplication):
         preferences.addPreference("cura/choice_on_profile_override", "always_ask")
         preferences.addPreference("cura/choice_on_open_project", "always_ask")
         preferences.addPreference("cura/use_multi_build_plate", False)
+        preferences.addPreference("arrange/parallel_search", False)
+        preferences.addPreference("arrange/time_budget", 10.0)  # In seconds.
+        preferences.addPreference("arrange/target_density", 0.5)  # Part of the build plate to fill when distributing over build plates.
+        preferences.addPreference("arrange/incremental", False)  # Only arrange objects that are new or moved since the previous arrangement.
         preferences.addPreference("cura/show_list_of_objects", False)
         preferences.addPreference("view/settings_list_height", 400)
         preferences.addPreference("view/settings_visible", False)
@@ -845,6 +948,7 @@ class CuraApplication(QtApplication):
         preferences.setDefault("local_file/last_used_type", "text/x-gcode")
 
         self.applicationShuttingDown.connect(self.saveSettings)
+        self.applicationShuttingDown.connect(lambda: self.getHttpClient().logMetrics())
         self.engineCreatedSignal.connect(self._onEngineCreated)
 
         self.getCuraSceneController().setActiveBuildPlate(0)  # Initialize
@@ -1133,6 +1237,9 @@ class CuraApplication(QtApplication):
         # Initialize the FileProviderModel
         self._file_provider_model.initialize(self._onFileProviderEnabledChanged)
 
+        # Everything up to here could be loaded while the user was logging in, but not the interface.
+        self._finishLogin()
+
         # Detect in which mode to run and execute that mode
         if self._is_headless:
             self.runWithoutGUI()
@@ -1187,6 +1294,29 @@ class CuraApplication(QtApplication):
 
         self.closeSplash()
 
+        if self._cli_args.slice_processes is not None:
+            self.getBackend().setMaxEngineProcesses(self._cli_args.slice_processes)
+        if self._cli_args.persistent_engine is not None:
+            self.getBackend().setPersistentEngine(self._cli_args.persistent_engine)
+
+        if self._cli_args.slice_batch:
+            try:
+                requests = SliceBatch.loadManifest(self._cli_args.slice_batch)
+            except (OSError, ValueError) as e:
+                self._exitWithError("Unable to load the manifest {manifest}: {err}".format(manifest = self._cli_args.slice_batch, err = str(e)), exit_code = 2)
+            self._slice_service = SliceService(self, parent = self)
+            # Read the next batch of jobs while the engines slice the current one.
+            max_jobs_in_flight = max(SliceBatch.DefaultMaxJobsInFlight, 2 * self.getBackend().getMaxEngineProcesses())
+            self._slice_batch = SliceBatch(self._slice_service, requests, self._cli_args.slice_batch_summary, max_jobs_in_flight)
+            self._slice_batch.addFinishedCallback(lambda succeeded: self.callLater(self.exit, 0 if succeeded else 1))
+            self._slice_batch.start()
+
+        elif self._cli_args.slice_service:
+            self._slice_service = SliceService(self, parent = self)
+            self._slice_service_server = SliceServiceServer(self._slice_service, self._cli_args.slice_service_name, self._cli_args.slice_service_output)
+            if not self._slice_service_server.start():
+                self._exitWithError("Unable to start the slice service. The log says why.")
+
     def runWithGUI(self):
         """Run Cura with GUI (desktop mode)."""
 
@@ -1300,6 +1430,9 @@ class CuraApplication(QtApplication):
     def getMachineErrorChecker(self, *args) -> MachineErrorChecker:
         return self._machine_error_checker
 
+    def getHttpClient(self, *args) -> HttpClient:
+        return HttpClient.getInstance()
+
     def getMachineManager(self, *args) -> MachineManager:
         if self._machine_manager is None:
             self._machine_manager = MachineManager(self, parent = self)
@@ -1767,10 +1900,17 @@ class CuraApplication(QtApplication):
     def arrangeAllInGrid(self) -> None:
         self._arrangeAll(grid_arrangement = True)
 
-    def _arrangeAll(self, *, grid_arrangement: bool) -> None:
+    @pyqtSlot()
+    def arrangeAllOnBuildPlates(self) -> None:
+        """Distribute all models over as many build plates as needed, and arrange each plate."""
+
+        self._arrangeAll(grid_arrangement = False, all_build_plates = True)
+
+    def _arrangeAll(self, *, grid_arrangement: bool, all_build_plates: bool = False) -> None:
         nodes_to_arrange = []
         active_build_plate = self.getMultiBuildPlateModel().activeBuildPlate
         locked_nodes = []
+        locked_nodes_per_plate = {}  # type: Dict[int, List[SceneNode]]
         for node in DepthFirstIterator(self.getController().getScene().getRoot()):
             if not isinstance(node, SceneNode):
                 continue
@@ -1788,15 +1928,23 @@ class CuraApplication(QtApplication):
             if not node.callDecoration("isSliceable") and not node.callDecoration("isGroup"):
                 continue  # i.e. node with layer data
 
-            if node.callDecoration("getBuildPlateNumber") == active_build_plate:
+            if all_build_plates or node.callDecoration("getBuildPlateNumber") == active_build_plate:
                 # Skip nodes that are too big
                 bounding_box = node.getBoundingBox()
                 if bounding_box is None or bounding_box.width < self._volume.getBoundingBox().width or bounding_box.depth < self._volume.getBoundingBox().depth:
                     # Arrange only the unlocked nodes and keep the locked ones in place
                     if node.getSetting(SceneNodeSettings.LockPosition):
                         locked_nodes.append(node)
+                        locked_nodes_per_plate.setdefault(node.callDecoration("getBuildPlateNumber"), []).append(node)
                     else:
                         nodes_to_arrange.append(node)
+        if all_build_plates:
+            min_offset = self.getBuildVolume().getEdgeDisallowedSize() + 2  # Allow for some rounding errors
+            job = ArrangeObjectsJob(nodes_to_arrange, locked_nodes, min_offset = max(min_offset, 8), grid_arrange = grid_arrangement,
+                                    multi_plate = True, fixed_nodes_per_plate = locked_nodes_per_plate,
+                                    arrange_state = self._arrange_state)
+            job.start()
+            return
         self.arrange(nodes_to_arrange, locked_nodes, grid_arrangement = grid_arrangement)
 
     def arrange(self, nodes: List[SceneNode], fixed_nodes: List[SceneNode], *,  grid_arrangement: bool = False) -> None:
@@ -1807,7 +1955,9 @@ class CuraApplication(QtApplication):
         :param grid_arrangement: If set to true if objects are to be placed in a grid
         """
         min_offset = self.getBuildVolume().getEdgeDisallowedSize() + 2  # Allow for some rounding errors
-        job = ArrangeObjectsJob(nodes, fixed_nodes, min_offset = max(min_offset, 8), grid_arrange = grid_arrangement)
+        job = ArrangeObjectsJob(nodes, fixed_nodes, min_offset = max(min_offset, 8), grid_arrange = grid_arrangement,
+                                arrange_state = self._arrange_state,
+                                incremental = self.getPreferences().getValue("arrange/incremental"))
         job.start()
 
     @pyqtSlot()
@@ -2117,6 +2267,11 @@ class CuraApplication(QtApplication):
     def getBuildVolume(self):
         return self._volume
 
+    def getArrangeState(self) -> ArrangeState:
+        """Get where the previous arrangements placed objects, to arrange only what changed since."""
+
+        return self._arrange_state
+
     additionalComponentsChanged = pyqtSignal(str, arguments = ["areaId"])
 
     @pyqtProperty("QVariantMap", notify = additionalComponentsChanged)
@@ -2344,8 +2499,12 @@ class CuraApplication(QtApplication):
             if select_models_on_load:
                 Selection.add(node)
         try:
-            arranger = Nest2DArrange(nodes_to_arrange, self.getBuildVolume(), fixed_nodes)
-            arranger.arrange()
+            arranger = Nest2DArrange(nodes_to_arrange, self.getBuildVolume(), fixed_nodes,
+                                     parallel = self.getPreferences().getValue("arrange/parallel_search"),
+                                     time_budget = float(self.getPreferences().getValue("arrange/time_budget")),
+                                     arrange_state = self._arrange_state)
+            if arranger.arrange():
+                self._arrange_state.recordPlacements(nodes_to_arrange)
         except:
             Logger.logException("e", "Failed to arrange the models")
 
@@ -0,0 +1,169 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QNetworkReply
+
+from UM.Logger import Logger
+
+from cura.config import DEVICE_QUERY_URL
+from cura.Network.FleetStatusService import FleetStatusService
+from cura.Network.HttpClient import HttpClient
+
+
+class DeviceFleet(QObject):
+    """The devices of the account and their status, kept up to date for every dialog that shows them.
+
+    The list is fetched from DEVICE_QUERY_URL by the fleet status service while anyone watches it, and kept when nobody
+    does, so that it can be shown right away the next time. When a new list comes in, it's compared to the previous one
+    per device, and only the devices that were added, changed or removed are announced.
+
+    Large fleets are fetched in pages of PageSize devices, so that no single reply has to hold all of them.
+    """
+
+    SourceKey = "device_fleet"
+    PageSize = 500
+
+    devicesChanged = pyqtSignal(list, list, list)  # The devices that were added, that changed and that were removed.
+
+    __instance = None  # type: Optional[DeviceFleet]
+
+    @classmethod
+    def getInstance(cls) -> "DeviceFleet":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, status_service: Optional[FleetStatusService] = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._status_service = status_service if status_service is not None else FleetStatusService.getInstance()
+        self._auth_token = ""
+        self._devices = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]  # By device key, in the order of the server.
+        self._watchers = 0
+
+    def setAuthToken(self, auth_token: str) -> None:
+        if auth_token != self._auth_token:
+            self._auth_token = auth_token
+            self.refresh()
+
+    def getDevices(self) -> List[Dict[str, Any]]:
+        return list(self._devices.values())
+
+    def getDevice(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._devices.get(key)
+
+    def getDeviceTypes(self) -> List[str]:
+        """Get the types of the devices in the fleet, in the order in which they first appear."""
+
+        return list(OrderedDict.fromkeys(device["device_type"] for device in self._devices.values() if device["device_type"]))
+
+    def watch(self) -> None:
+        """Keep the devices up to date, until unwatch is called as often as this."""
+
+        self._watchers += 1
+        if self._watchers == 1:
+            self._status_service.addListener(self.SourceKey, self._fetch, self._onDevicesReceived)
+
+    def unwatch(self) -> None:
+        if self._watchers == 0:
+            return
+        self._watchers -= 1
+        if self._watchers == 0:
+            self._status_service.removeListener(self.SourceKey, self._onDevicesReceived)
+
+    def refresh(self) -> None:
+        """Get the devices again soon, for instance because the user asked for it."""
+
+        self._status_service.requestUpdate(self.SourceKey)
+
+    @staticmethod
+    def getDeviceKey(device: Dict[str, Any]) -> str:
+        return str(device.get("device_id") or device.get("device_sn") or device.get("mac"))
+
+    @staticmethod
+    def parseDevices(response_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert the devices in a reply of DEVICE_QUERY_URL to the dictionaries that the dialogs use."""
+
+        device_list = []
+        for device in DeviceFleet._getPageItems(response_data):
+            device_list.append({
+                "mac": device.get("mac", None),
+                "operator": device.get("operator", None),
+                "device_type": device.get("deviceType", None),
+                "device_status": device.get("deviceStatus", None),
+                "last_version": device.get("lastVersionFormat", None),
+                "device_sn": device.get("sn", None),
+                "device_id": device.get("deviceId", None),
+                "status_title": device.get("deviceStatusTitle", None)
+            })
+        return device_list
+
+    @staticmethod
+    def _getPageItems(response_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get the devices in a reply, which is either a plain list or a page with the list and the total count."""
+
+        data = response_data.get("data")
+        if isinstance(data, dict):
+            return data.get("list") or data.get("records") or []
+        return data or []
+
+    @staticmethod
+    def _getTotal(response_data: Dict[str, Any]) -> Optional[int]:
+        data = response_data.get("data")
+        if isinstance(data, dict) and isinstance(data.get("total"), int):
+            return data["total"]
+        return None
+
+    def _fetch(self, on_finished: Callable[[List[Dict[str, Any]]], None], on_failed: Callable[..., None]) -> None:
+        """Fetch all pages of devices one after the other, and pass them on together once the last one is in."""
+
+        devices = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+
+        def fetch_page(page: int) -> None:
+            url = "{}?{}".format(DEVICE_QUERY_URL, urlencode({"pageNum": page, "pageSize": self.PageSize}))
+            HttpClient.getInstance().get(url,
+                                         headers_dict = {"Authorization": self._auth_token, "Biz": "ZXBMan"},
+                                         callback = lambda reply: on_reply(page, reply),
+                                         error_callback = on_failed,
+                                         revalidate = True)
+
+        def on_reply(page: int, reply: QNetworkReply) -> None:
+            response_data = HttpClient.readJSON(reply)
+            if response_data is None or response_data.get("msg") != "success":
+                Logger.log("w", "Unable to get page %s of the devices: %s", page, response_data)
+                on_failed()
+                return
+
+            page_devices = self.parseDevices(response_data)
+            new_count = 0
+            for device in page_devices:
+                key = self.getDeviceKey(device)
+                if key not in devices:
+                    new_count += 1
+                devices[key] = device
+
+            total = self._getTotal(response_data)
+            # Servers that don't page return everything at once, or the same devices again for the next page.
+            is_last_page = len(page_devices) != self.PageSize or new_count == 0 or (total is not None and len(devices) >= total)
+            if is_last_page:
+                on_finished(list(devices.values()))
+            else:
+                fetch_page(page + 1)
+
+        fetch_page(1)
+
+    def _onDevicesReceived(self, devices: List[Dict[str, Any]], changed: bool) -> None:
+        if not changed:
+            return
+
+        new_devices = OrderedDict((self.getDeviceKey(device), device) for device in devices)  # type: OrderedDict[str, Dict[str, Any]]
+        added = [device for key, device in new_devices.items() if key not in self._devices]
+        updated = [device for key, device in new_devices.items() if key in self._devices and self._devices[key] != device]
+        removed = [device for key, device in self._devices.items() if key not in new_devices]
+        self._devices = new_devices
+        if added or updated or removed:
+            self.devicesChanged.emit(added, updated, removed)
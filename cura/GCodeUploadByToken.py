@@ -1,7 +1,9 @@
 import json
 import os
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QHttpMultiPart, QHttpPart
-from PyQt6.QtCore import QUrl, QByteArray, QObject, pyqtSignal
+import uuid
+from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
+from PyQt6.QtCore import QObject, pyqtSignal
+from cura.Network.HttpClient import HttpClient
 class GCodeUploadByToken(QObject):
     uploadFinished = pyqtSignal(bool, dict) 
     uploadError = pyqtSignal(str)
@@ -9,14 +11,11 @@ class GCodeUploadByToken(QObject):
     def __init__(self, parent=None):
         super().__init__(parent) 
         self._download_url = ""
-        self.network_manager = QNetworkAccessManager(self)
         self.reply_upload = None
         self.header_data = None
         self._current_file_path = None
         self._tried_cdn = False  # 是否已尝试过 CDN
 
-        self.network_manager.finished.connect(self.on_upload_finished)
-
     def upload_gcode(self, file_path, header_data):
         self.header_data = header_data
         if not os.path.exists(file_path):
@@ -34,17 +33,15 @@ class GCodeUploadByToken(QObject):
         file_name = os.path.basename(file_path)
         print(f"file name={file_name}")
 
-        multi_part = QHttpMultiPart(QHttpMultiPart.ContentType.FormDataType)
-        multi_part.setParent(self)
+        boundary = uuid.uuid4().hex
+        body = bytearray()
 
         def add_form_field(field_name, field_value):
             if not isinstance(field_value, str):
                 field_value = str(field_value)
-            part = QHttpPart()
-            disposition = f'form-data; name="{field_name}"'.encode('utf-8')
-            part.setRawHeader(b'Content-Disposition', disposition)
-            part.setBody(field_value.encode('utf-8'))
-            multi_part.append(part)
+            body.extend(f'--{boundary}\r\nContent-Disposition: form-data; name="{field_name}"\r\n\r\n'.encode('utf-8'))
+            body.extend(field_value.encode('utf-8'))
+            body.extend(b'\r\n')
 
 
         add_form_field('key', header_data.get('key', ''))
@@ -54,61 +51,46 @@ class GCodeUploadByToken(QObject):
         add_form_field('success_action_status', '200')
 
 
-        file_part = QHttpPart()
-        disposition = f'form-data; name="file"; filename="{file_name}"'.encode('utf-8')
-        file_part.setRawHeader(b'Content-Disposition', disposition)
-        file_part.setRawHeader(b'Content-Type', b'application/octet-stream')
         try:
             with open(file_path, 'rb') as f:
-                file_data = QByteArray(f.read())
+                file_data = f.read()
         except Exception as e:
             err = f"Read file error: {str(e)}"
             self.uploadError.emit(err)
             print(err)
-            multi_part.deleteLater()
             return
 
-        # 直接使用 setBody，避免 QBuffer 生命周期问题
-        file_part.setBody(file_data)
-        multi_part.append(file_part)
+        body.extend(f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{file_name}"\r\n'.encode('utf-8'))
+        body.extend(b'Content-Type: application/octet-stream\r\n\r\n')
+        body.extend(file_data)
+        body.extend(f'\r\n--{boundary}--\r\n'.encode('utf-8'))
 
         upload_url = f"{header_data.get('obs_url')}"
         print(f"url={upload_url}")
-        request = QNetworkRequest(QUrl(upload_url))
-        request.setTransferTimeout(60000)  # 60秒超时 
 
-        self.reply_upload = self.network_manager.post(request, multi_part)
-        multi_part.setParent(self.reply_upload)
-        self.reply_upload.errorOccurred.connect(self.on_upload_error)
+        # 走共享的 HttpClient，复用到 OBS 的连接
+        self.reply_upload = HttpClient.getInstance().post(
+            upload_url,
+            headers_dict = {"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            data = bytes(body),
+            callback = self.on_upload_finished,
+            error_callback = self.on_upload_finished,
+            timeout = 60)  # 60秒超时
 
-    def on_upload_error(self, error: QNetworkReply.NetworkError):
-        if not self.reply_upload:
-            return
-        err_str = self.reply_upload.errorString()
-        err = f"upload error [{error}]: {err_str}"
-        self.uploadError.emit(err)
-        print(err)
-        # Note: reply会在on_upload_finished中deleteLater，这里不需要再调用
-    
     def cancel_upload(self):
         """取消当前上传"""
         if self.reply_upload:
             print("Cancelling upload...")
-            self.reply_upload.abort()
-            # abort会触发finished信号，在那里清理
+            HttpClient.getInstance().abortRequest(self.reply_upload)
+            self.reply_upload = None
 
-    def on_upload_finished(self, reply: QNetworkReply):
-        # 确保是我们的上传请求
-        if reply != self.reply_upload:
-            reply.deleteLater()
-            return
-        
+    def on_upload_finished(self, reply: QNetworkReply, error: QNetworkReply.NetworkError = None):
         print(f"reply operation: {reply.operation()}")
         status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
         print(f"status_code: {status_code}")
 
         try:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
+            if error is None:
                 data = reply.readAll()
                 response_str = data.data().decode('utf-8', errors='ignore')
                 print(f"upload_response (raw): {response_str}")
@@ -155,12 +137,11 @@ class GCodeUploadByToken(QObject):
                 }
                 print(f"upload_error: {response_data}")
                 print(f"OBS 错误响应体: {error_response}")
+                self.uploadError.emit(f"upload error [{error}]: {err_str}")
                 self.uploadFinished.emit(False, response_data)
-                self.uploadError.emit(f"upload error: {err_str}")
         except Exception as e:
             print(f"Exception in on_upload_finished: {str(e)}")
             self.uploadError.emit(f"处理上传响应时出错: {str(e)}")
             self.uploadFinished.emit(False, {"error": str(e)})
         finally:
-            reply.deleteLater()
             self.reply_upload = None
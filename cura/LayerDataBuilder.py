@@ -5,6 +5,7 @@ from .Layer import Layer
 from .LayerPolygon import LayerPolygon
 from UM.Mesh.MeshBuilder import MeshBuilder
 from .LayerData import LayerData
+from .Utils.SliceSessionTracer import SliceSessionTracer
 
 import numpy
 from typing import Dict, Optional
@@ -50,6 +51,24 @@ class LayerDataBuilder(MeshBuilder):
         :param line_type_brightness: compatibility layer view uses line type brightness of 0.5
         """
 
+        with SliceSessionTracer.getInstance().span("layer_data_builder.build", num_layers = len(self._layers)):
+            return self._build(material_color_map, line_type_brightness)
+
+    def buildPreview(self, max_layer: int, material_color_map, line_type_brightness = 1.0) -> LayerData:
+        """Return the layer data of the layers below max_layer, while more layers are still being added.
+
+        This builder itself is left untouched, so it can still be built with all layers afterwards.
+
+        :param max_layer: The first layer that is not complete yet.
+        :param material_color_map: [r, g, b, a] for each extruder row.
+        :param line_type_brightness: compatibility layer view uses line type brightness of 0.5
+        """
+
+        preview_builder = LayerDataBuilder()
+        preview_builder._layers = {number: layer for number, layer in self._layers.items() if number < max_layer}
+        return preview_builder.build(material_color_map, line_type_brightness)
+
+    def _build(self, material_color_map, line_type_brightness):
         vertex_count = 0
         index_count = 0
         for layer, data in self._layers.items():
@@ -13,6 +13,7 @@ class LayerDataDecorator(SceneNodeDecorator):
     def __init__(self) -> None:
         super().__init__()
         self._layer_data = None  # type: Optional[LayerData]
+        self._is_partial = False
 
     def getLayerData(self) -> Optional["LayerData"]:
         return self._layer_data
@@ -20,7 +21,16 @@ class LayerDataDecorator(SceneNodeDecorator):
     def setLayerData(self, layer_data: LayerData) -> None:
         self._layer_data = layer_data
 
+    def isPartialLayerData(self) -> bool:
+        """Whether the layer data is a preview of the layers loaded so far, while more layers are still being loaded."""
+
+        return self._is_partial
+
+    def setIsPartialLayerData(self, is_partial: bool) -> None:
+        self._is_partial = is_partial
+
     def __deepcopy__(self, memo) -> "LayerDataDecorator":
         copied_decorator = LayerDataDecorator()
         copied_decorator._layer_data = self._layer_data
+        copied_decorator._is_partial = self._is_partial
         return copied_decorator
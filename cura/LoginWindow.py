@@ -1,14 +1,15 @@
 import json
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QWidget, QCheckBox
-from PyQt6.QtCore import Qt, pyqtSignal, QUrl, QByteArray, QSettings
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtCore import Qt, pyqtSignal, QSettings, QEventLoop, QObject, QUrl, QUrlQuery
+from PyQt6.QtNetwork import QNetworkReply
 from UM.Logger import Logger
 from UM.i18n import i18nCatalog
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_v1_5 as Cipher_pkcs1_v1_5
 from Crypto import Cipher
 import base64
-from cura.config import VERIFY_URL, LOGIN_URL, PUBLIC_KEY_URL
+from cura.config import VERIFY_URL, LOGIN_URL, PUBLIC_KEY_URL, OBS_TOKEN_URL
+from cura.Network.HttpClient import HttpClient
 
 i18n_catalog = i18nCatalog("uranium")
 class VerificationDialog(QDialog):
@@ -16,19 +17,17 @@ class VerificationDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle(i18n_catalog.i18n("验证码"))
-        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | Qt.WindowType.WindowTitleHint)
+        # Stay above the splash screen, since Cura keeps loading while the user logs in.
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | Qt.WindowType.WindowTitleHint | Qt.WindowType.WindowStaysOnTopHint)
         self.setFixedSize(300, 150)
-        self.network_manager = QNetworkAccessManager()
-        self.network_manager.finished.connect(self.verify_response)
         self.verify_success = False
         self.uuid = ""
         self.token= ""
         self.init_ui()
 
-    def verify_response(self, reply: QNetworkReply) :
+    def verify_response(self, reply: QNetworkReply, error: QNetworkReply.NetworkError = None) :
         self.confirm_btn.setEnabled(True)
-        error = reply.error()
-        if error == QNetworkReply.NetworkError.NoError:
+        if error is None:
             data = reply.readAll()      
             response_data = json.loads(data.data().decode('utf-8'))
             Logger.debug("verify_response:%s ", response_data)
@@ -114,17 +113,19 @@ class VerificationDialog(QDialog):
             "uuid": self.uuid,
             "tfaCode": code
         }
-        json_data = json.dumps(verify_data, ensure_ascii=False)
-        request = QNetworkRequest(QUrl(VERIFY_URL))
-        request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
         self.confirm_btn.setEnabled(False)
 
-        self.network_manager.post(request, QByteArray(json_data.encode('utf-8')))
+        HttpClient.getInstance().postJson(VERIFY_URL, verify_data, callback=self.verify_response, error_callback=self.verify_response)
         # self.accept()
         
     def cancel(self):
         self.reject()
     
+    def start_verify(self, uuid) -> None:
+        """Show the dialog without waiting for it. The result is known when the dialog emits finished."""
+        self.uuid = uuid
+        self.open()
+
     def verify_login(self, uuid) -> bool: 
         self.uuid = uuid
         if self.exec() == QDialog.DialogCode.Accepted:
@@ -146,12 +147,15 @@ class LoginWindow(QDialog):
         # self.setWindowTitle(i18n_catalog.i18n("GFD_Cura - Login"))
         self.setWindowTitle(i18n_catalog.i18n("功夫豆Cura - 登录"))
         self.setFixedSize(350, 250)
-        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | Qt.WindowType.WindowTitleHint)
+        # Stay above the splash screen, since Cura keeps loading while the user logs in.
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.CustomizeWindowHint | Qt.WindowType.WindowTitleHint | Qt.WindowType.WindowStaysOnTopHint)
         self.settings = QSettings("GFD", "Cura")
-        self.network_manager = QNetworkAccessManager()
         self.reply_login = None
         self.reply_auth = None
         self._token = ""
+        self._verification_dialog = None
+        self._done = False
+        self.finished.connect(self._on_finished)
         self.setup_ui()
         self._load_cached_credentials()
         
@@ -279,11 +283,13 @@ class LoginWindow(QDialog):
             # 保存账号密码
             self.settings.setValue("login/username", self.username_input.text().strip())
             self.settings.setValue("login/password", self.password_input.text().strip())
+            self.settings.setValue("login/token", self._token)  # For running without interface later.
             self.settings.setValue("login/remember", True)
         else:
             # 清空缓存
             self.settings.remove("login/username")
             self.settings.remove("login/password")
+            self.settings.remove("login/token")
             self.settings.setValue("login/remember", False)
         
         # 立即同步到文件（可选，QSettings默认自动同步）
@@ -292,9 +298,10 @@ class LoginWindow(QDialog):
     def setTipText(self, text):
         self.tip_label.setText(text)
     
-    def on_auth_finished(self):
-        if self.reply_auth.error() == QNetworkReply.NetworkError.NoError:
-            data = self.reply_auth.readAll()      
+    def on_auth_finished(self, reply: QNetworkReply, error: QNetworkReply.NetworkError = None):
+        self.reply_auth = None
+        if error is None:
+            data = reply.readAll()      
             response_data = json.loads(data.data().decode('utf-8'))
             Logger.debug("auth_response:%s ", response_data)
             if response_data["msg"] == "success":
@@ -306,24 +313,23 @@ class LoginWindow(QDialog):
                if not username or not password:
                 #    QMessageBox.warning(self, i18n_catalog.i18n("Input error"), i18n_catalog.i18n("Please enter your username and password."))
                    QMessageBox.warning(self, i18n_catalog.i18n("输入错误"), i18n_catalog.i18n("请输入账户或密码."))
+                   self.login_button.setEnabled(True)
                    return
                login_data = {
                    "email": username,
                    "password": self.rsa_encrypt(password, public_key)
                }
-               json_data = json.dumps(login_data, ensure_ascii=False)
-               request = QNetworkRequest(QUrl(LOGIN_URL))
-               request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json")
                # self.login_button.setEnabled(False)
-               Logger.debug("login_request:%s ", json_data)
-               self.reply_login = self.network_manager.post(request, QByteArray(json_data.encode('utf-8')))
-               self.reply_login.finished.connect(self.on_login_response)
+               Logger.debug("login_request:%s ", login_data)
+               self.reply_login = HttpClient.getInstance().postJson(LOGIN_URL, login_data, callback=self.on_login_response, error_callback=self.on_login_response)
+               return
+        else:
+            Logger.debug("auth_response error: %s", reply.errorString())
+        self.login_button.setEnabled(True)
 
     def attempt_login(self):
-        request = QNetworkRequest(QUrl(PUBLIC_KEY_URL))
         self.login_button.setEnabled(False)
-        self.reply_auth = self.network_manager.get(request)
-        self.reply_auth.finished.connect(self.on_auth_finished)
+        self.reply_auth = HttpClient.getInstance().get(PUBLIC_KEY_URL, callback=self.on_auth_finished, error_callback=self.on_auth_finished)
 
 
     def rsa_encrypt(self, password, public_key) -> str:
@@ -349,22 +355,16 @@ class LoginWindow(QDialog):
         except Exception as e:
             Logger.error(f"encode error: {e}")
     
-    def on_login_response(self):
+    def on_login_response(self, reply: QNetworkReply, error: QNetworkReply.NetworkError = None):
         self.login_button.setEnabled(True)
+        self.reply_login = None
         
-        error = self.reply_login.error()
-        if error == QNetworkReply.NetworkError.NoError:
-            data = self.reply_login.readAll()      
+        if error is None:
+            data = reply.readAll()      
             response_data = json.loads(data.data().decode('utf-8'))
             Logger.debug("login_response:%s ", response_data)
             if response_data["msg"] == "success":
-                if self.verify_credentials(response_data["data"]["uuid"]):
-                    self._save_credentials()
-                    self._logined = True
-                    self.accept()
-                else:
-                    Logger.debug("login_response error... ")
-                    self._logined = False
+                self.verify_credentials(response_data["data"]["uuid"])
             else:
                 self.setTipText(response_data["msg"])
         else:
@@ -416,10 +416,21 @@ class LoginWindow(QDialog):
         else:
             self.reject()
         
-    def verify_credentials(self, uuid) -> bool:
-        dialog = VerificationDialog()
-        dialog.update_token_signal.connect(self.on_update_token)
-        return dialog.verify_login(uuid)
+    def verify_credentials(self, uuid) -> None:
+        # Don't wait for the verification code in a nested event loop, so that Cura can keep loading meanwhile.
+        self._verification_dialog = VerificationDialog()
+        self._verification_dialog.update_token_signal.connect(self.on_update_token)
+        self._verification_dialog.finished.connect(self.on_verify_finished)
+        self._verification_dialog.start_verify(uuid)
+
+    def on_verify_finished(self, result):
+        if result == QDialog.DialogCode.Accepted and self._verification_dialog.verify_success:
+            self._save_credentials()
+            self._logined = True
+            self.accept()
+        else:
+            Logger.debug("login_response error... ")
+            self._logined = False
     
     def on_update_token(self, token):
         Logger.debug("toker: %s", token)
@@ -428,15 +439,101 @@ class LoginWindow(QDialog):
     def auth_token(self) -> str:
         return self._token
 
+    def _on_finished(self, result):
+        self._done = True
+
+    def start_login(self):
+        """Show the dialog without waiting for it, so that the application can keep loading while the user logs in.
+
+        If the account and password were remembered, the login starts right away.
+        """
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        if self.check_remember.isChecked() and self.username_input.text().strip() and self.password_input.text().strip():
+            self.attempt_login()
+
+    def wait_login(self) -> bool:
+        """Wait until the dialog started with start_login is closed.
+
+        :return: Whether the user logged in.
+        """
+        if not self._done:
+            loop = QEventLoop()
+            self.finished.connect(loop.quit)
+            loop.exec()
+        if self.result() == QDialog.DialogCode.Accepted and self._logined:
+            Logger.log("i", "Logged in.")
+            return True
+        Logger.log("i", "The login dialog was closed without logging in.")
+        return False
+
     def exec_login(self) -> bool:
         result = self.exec()
         if result == QDialog.DialogCode.Accepted:
             if self._logined:
-                print("login success")
+                Logger.log("i", "Logged in.")
                 return True
             else:
                 return False
         else:
-            print("login failed")
+            Logger.log("i", "The login dialog was closed without logging in.")
             return False
 
+
+class TokenLogin(QObject):
+    """Logs in with a token instead of the login dialog, when running without interface.
+
+    Nobody can enter the account, password and verification code then. The token is checked with the server, with the
+    same interface as the LoginWindow: start_login, wait_login and auth_token.
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, token, parent=None):
+        super().__init__(parent)
+        self._token = token
+        self._done = False
+        self._logined = False
+
+    @staticmethod
+    def cached_token() -> str:
+        """The token of the last login in the login dialog, if the account was remembered."""
+        return QSettings("GFD", "Cura").value("login/token", "")
+
+    def start_login(self):
+        """Check the token with the server, without waiting for the answer."""
+        url = QUrl(OBS_TOKEN_URL)
+        query = QUrlQuery()
+        query.addQueryItem("ruleCode", "print3dPermanently")
+        query.addQueryItem("suffix", "gcode")
+        url.setQuery(query)
+        headers = {"Authorization": self._token, "Biz": "ZXBMan"}
+        HttpClient.getInstance().get(url.toString(), headers_dict=headers, callback=self.on_check_response, error_callback=self.on_check_response)
+
+    def on_check_response(self, reply: QNetworkReply, error: QNetworkReply.NetworkError = None):
+        if error is None:
+            response_data = HttpClient.readJSON(reply)
+            self._logined = response_data is not None and response_data.get("msg") == "success"
+            if not self._logined:
+                Logger.log("w", "The token was refused: %s", response_data)
+        else:
+            Logger.log("w", "Unable to check the token: %s", reply.errorString())
+            self._logined = False
+        self._done = True
+        self.finished.emit()
+
+    def wait_login(self) -> bool:
+        """Wait until the server answered.
+
+        :return: Whether the token is valid.
+        """
+        if not self._done:
+            loop = QEventLoop()
+            self.finished.connect(loop.quit)
+            loop.exec()
+        if self._logined:
+            Logger.log("i", "Logged in with a token.")
+        return self._logined
+
+    def auth_token(self) -> str:
+        return self._token
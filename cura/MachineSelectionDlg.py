@@ -1,39 +1,198 @@
-import sys
-import json
 from PyQt6.QtWidgets import (
-    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QComboBox, QPushButton, QTableWidget, QTableWidgetItem, QAbstractItemView,
-    QCheckBox, QHeaderView, QWidget
+    QDialog, QVBoxLayout, QHBoxLayout,
+    QLabel, QLineEdit, QComboBox, QPushButton, QTableView, QAbstractItemView,
+    QHeaderView, QWidget
+)
+from PyQt6.QtCore import (
+    Qt, QTimer,
+    QAbstractTableModel, QSortFilterProxyModel, QModelIndex
 )
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from PyQt6.QtCore import Qt, pyqtSlot, QUrl, QByteArray, QUrlQuery
-from PyQt6.QtCore import QVariant
-from PyQt6.QtGui import QFont, QColor, QBrush
-from UM.Logger import Logger
 from UM.i18n import i18nCatalog
-from typing import Any, Dict, List, Callable
-from collections.abc import Mapping
-from cura.config import DEVICE_QUERY_URL
+from typing import Any, Dict, List, Optional, Set, Tuple
+from cura.DeviceFleet import DeviceFleet
 
 i18n_catalog = i18nCatalog("uranium")
 
+
+class DeviceTableModel(QAbstractTableModel):
+    """设备表格数据模型，勾选状态保存在模型中，按 DeviceFleet 的差异增删改行"""
+
+    CheckColumn = 0
+    Columns = ["", "设备mac", "使用人", "打印机型号", "设备状态", "固件版本号"]
+    ColumnFields = [None, "mac", "operator", "device_type", "status_title", "last_version"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._devices = []  # type: List[Dict[str, Any]]
+        self._rows = {}  # type: Dict[str, int]  # 设备 key -> 行号
+        self._search_index = []  # type: List[Tuple[str, str]]  # 每行预先转小写的 (mac, 使用人)，过滤时不再逐行转换
+        self._checked_keys = set()  # type: Set[str]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._devices)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.Columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return i18n_catalog.i18n(self.Columns[section]) if self.Columns[section] else ""
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.CheckColumn:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        device = self._devices[index.row()]
+        column = index.column()
+        if column == self.CheckColumn:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                checked = DeviceFleet.getDeviceKey(device) in self._checked_keys
+                return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return device[self.ColumnFields[column]]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.CheckColumn or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        key = DeviceFleet.getDeviceKey(self._devices[index.row()])
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked_keys.add(key)
+        else:
+            self._checked_keys.discard(key)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def getDevice(self, row):
+        return self._devices[row]
+
+    def getSearchText(self, row):
+        return self._search_index[row]
+
+    def getCheckedDevices(self):
+        """按表格顺序返回已勾选的设备，包括当前被筛选隐藏的设备"""
+        return [device for device in self._devices if DeviceFleet.getDeviceKey(device) in self._checked_keys]
+
+    def setDevices(self, devices):
+        """整表替换，只在首次显示时使用"""
+        self.beginResetModel()
+        self._devices = list(devices)
+        self._rebuildIndex()
+        self._checked_keys &= set(self._rows)
+        self.endResetModel()
+
+    def applyChanges(self, added, changed, removed):
+        """
+        只更新有变化的行
+        :param added: 新增的设备，追加到末尾
+        :param changed: 内容有变化的设备
+        :param removed: 已删除的设备
+        """
+        removed_rows = sorted((self._rows[key] for key in map(DeviceFleet.getDeviceKey, removed) if key in self._rows), reverse=True)
+        # 连续的行一次删除
+        while removed_rows:
+            last = first = removed_rows.pop(0)
+            while removed_rows and removed_rows[0] == first - 1:
+                first = removed_rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._devices[first:last + 1]
+            del self._search_index[first:last + 1]
+            self.endRemoveRows()
+        if removed:
+            self._rebuildIndex()
+            self._checked_keys &= set(self._rows)
+
+        for device in changed:
+            row = self._rows.get(DeviceFleet.getDeviceKey(device))
+            if row is None:
+                continue
+            self._devices[row] = device
+            self._search_index[row] = self._createSearchText(device)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+        if added:
+            first = len(self._devices)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for row, device in enumerate(added, first):
+                self._devices.append(device)
+                self._search_index.append(self._createSearchText(device))
+                self._rows[DeviceFleet.getDeviceKey(device)] = row
+            self.endInsertRows()
+
+    def _rebuildIndex(self):
+        self._rows = {DeviceFleet.getDeviceKey(device): row for row, device in enumerate(self._devices)}
+        self._search_index = [self._createSearchText(device) for device in self._devices]
+
+    @staticmethod
+    def _createSearchText(device):
+        return (device["mac"] or "").lower(), (device["operator"] or "").lower()
+
+
+class DeviceFilterProxyModel(QSortFilterProxyModel):
+    """按 mac、使用人和机型筛选设备，使用模型中预先转小写的索引"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mac_filter = ""
+        self._user_filter = ""
+        self._model_filter = None  # type: Optional[str]  # None 表示全部机型
+        self.setDynamicSortFilter(True)  # 模型增删改行时只对这些行重新筛选
+
+    def setFilter(self, mac_filter, user_filter, model_filter):
+        mac_filter = mac_filter.lower()
+        user_filter = user_filter.lower()
+        if (mac_filter, user_filter, model_filter) == (self._mac_filter, self._user_filter, self._model_filter):
+            return
+        self._mac_filter = mac_filter
+        self._user_filter = user_filter
+        self._model_filter = model_filter
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        mac, operator = model.getSearchText(source_row)
+        if self._mac_filter not in mac or self._user_filter not in operator:
+            return False
+        return self._model_filter is None or model.getDevice(source_row)["device_type"] == self._model_filter
+
 class MachineSelectionDlg(QDialog):
+    FilterDelay = 250  # 毫秒，输入停顿后再筛选
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("打印机选择")
         self.setModal(True)
         self.resize(900, 600)
-        self.network_manager = QNetworkAccessManager()
-        self.reply_query = None
         self.reply_obs = None
         self._auth_token = ""
         # self._obs_token = ""
         # self._download_url = ""
         self._device_list = []
         self._device_typr_set = []
+
+        self._device_model = DeviceTableModel(self)
+        self._filter_model = DeviceFilterProxyModel(self)
+        self._filter_model.setSourceModel(self._device_model)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FilterDelay)
+        self._filter_timer.timeout.connect(self.apply_filter)
         
         self.init_ui()
 
+        # 设备列表由 DeviceFleet 统一轮询，对话框打开期间才刷新，关闭后保留缓存供下次直接显示
+        self._fleet = DeviceFleet.getInstance()
+        self._watching_fleet = False
+
     def init_ui(self):
         main_layout = QVBoxLayout(self)
         
@@ -89,8 +248,8 @@ class MachineSelectionDlg(QDialog):
             }
         """)
         self.search_btn.clicked.connect(self.apply_filter)
-        self.mac_input.textChanged.connect(self.apply_filter)
-        self.user_input.textChanged.connect(self.apply_filter)
+        self.mac_input.textChanged.connect(self._filter_timer.start)
+        self.user_input.textChanged.connect(self._filter_timer.start)
         self.model_combo.currentIndexChanged.connect(self.apply_filter)
         
         self.reset_btn = QPushButton(i18n_catalog.i18n("重置"))
@@ -118,20 +277,17 @@ class MachineSelectionDlg(QDialog):
         filter_layout.addWidget(self.search_btn)
         filter_layout.addWidget(self.reset_btn)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "", i18n_catalog.i18n("设备mac"), i18n_catalog.i18n("使用人"), i18n_catalog.i18n("打印机型号"), i18n_catalog.i18n("设备状态"), i18n_catalog.i18n("固件版本号")
-        ])
+        self.table = QTableView()
+        self.table.setModel(self._filter_model)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #ddd;
                 alternate-background-color: #fafafa;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
             QHeaderView::section{
@@ -151,6 +307,9 @@ class MachineSelectionDlg(QDialog):
 
         header.setStretchLastSection(False)
         self.table.verticalHeader().setVisible(False)
+        # 行高固定，视图不必逐行计算，只绘制可见的行
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(32)
         
         main_layout.addWidget(filter_widget)
         main_layout.addWidget(self.table)
@@ -186,174 +345,71 @@ class MachineSelectionDlg(QDialog):
 
     def set_auth_token(self, value):
         self._auth_token = value
-        self.query_test_device()
+        self._fleet.setAuthToken(value)
+        if not self._watching_fleet:
+            self._watching_fleet = True
+            self._fleet.devicesChanged.connect(self._on_devices_changed)
+            self._fleet.watch()
+        # 先显示上次缓存的设备列表，更新到达后再按差异刷新
+        self._on_devices_changed([], [], [])
         # self.query_obs_token()
-    
-    def parse_data(self, json_data) -> List[Dict[str, Any]]:
-        devices = json_data['data']
-        device_list = []
-        self._device_typr_set = set()
-        for device in devices:
-            device_info = {
-                'mac': device.get('mac', None),
-                'operator': device.get('operator', None),
-                'device_type': device.get('deviceType', None),
-                'device_status': device.get('deviceStatus', None),
-                'last_version': device.get('lastVersionFormat', None),
-                'device_sn': device.get('sn', None),
-                'device_id': device.get('deviceId', None),
-                'status_title': device.get('deviceStatusTitle', None)
-            }
-            if device.get('deviceType', None) not in self._device_typr_set:
-                self._device_typr_set.add(device.get('deviceType', None))
-            device_list.append(device_info)
-        return device_list
-
-    def on_query_response(self):
-        if self.reply_query.error() == QNetworkReply.NetworkError.NoError:
-            data = self.reply_query.readAll()      
-            response_data = json.loads(data.data().decode('utf-8'))
-            Logger.debug("query_response:%s ", response_data)
-            if response_data["msg"] == "success":
-                self._device_list = self.parse_data(response_data)
-                self.update_table(self._device_list)
-                self.update_device_type()
+
+    def done(self, result):
+        if self._watching_fleet:
+            self._watching_fleet = False
+            self._fleet.devicesChanged.disconnect(self._on_devices_changed)
+            self._fleet.unwatch()
+        super().done(result)
+
+    def _on_devices_changed(self, added, changed, removed):
+        """设备列表有变化时只更新变化的行，勾选状态保存在模型中"""
+        self._device_list = self._fleet.getDevices()
+        self._device_typr_set = self._fleet.getDeviceTypes()
+        self.update_device_type()
+        if self._device_model.rowCount() == 0:
+            self._device_model.setDevices(self._device_list)
+        else:
+            self._device_model.applyChanges(added, changed, removed)
+        self.apply_filter()
 
     def update_device_type(self):
+        """重建机型下拉框，保留当前选择"""
+        current = self.model_combo.currentText()
+        self.model_combo.blockSignals(True)
+        while self.model_combo.count() > 1:
+            self.model_combo.removeItem(1)
         for device_type in self._device_typr_set:
             self.model_combo.addItem(device_type)
-
-    def _create_checkbox(self):
-        checkbox = QCheckBox()
-        checkbox.setStyleSheet("QCheckBox::indicator { width: 16px; height: 16px; }")
-        return checkbox
-
-    def _create_table_item(self, text, align_center=True, user_role_data=None, user_role_1_data=None):
-        """
-        创建统一样式的表格项
-        :param text: 显示文本
-        :param align_center: 是否居中对齐
-        :param user_role_data: UserRole 绑定数据
-        :param user_role_1_data: UserRole+1 绑定数据
-        :return: QTableWidgetItem
-        """
-        item = QTableWidgetItem(text)
-        if align_center:
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        if user_role_data is not None:
-            item.setData(Qt.ItemDataRole.UserRole, user_role_data)
-        if user_role_1_data is not None:
-            item.setData(Qt.ItemDataRole.UserRole + 1, user_role_1_data)
-        # 可扩展：统一设置文字颜色/背景色等
-        return item
-
-    def _fill_device_row(self, row, device):
-        """
-        填充单行设备数据
-        :param row: 行索引
-        :param device: 设备字典
-        """
-        self.table.setCellWidget(row, 0, self._create_checkbox())
-        
-        self.table.setItem(row, 1, self._create_table_item(
-            text=device['mac'],
-            user_role_data=device['device_sn'],
-            user_role_1_data=device['device_id']
-        ))
-        self.table.setItem(row, 2, self._create_table_item(device['operator']))
-        self.table.setItem(row, 3, self._create_table_item(device['device_type']))
-        self.table.setItem(row, 4, self._create_table_item(
-            text=device['status_title'],
-            user_role_data=device['device_status']
-        ))
-        self.table.setItem(row, 5, self._create_table_item(device['last_version']))
-
-    def update_table(self, device_list):
-        """更新整表数据（清空后重新填充）"""
-        self._device_list = device_list 
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(device_list))
-        
-        for row, device in enumerate(device_list):
-            self._fill_device_row(row, device)
+        index = self.model_combo.findText(current)
+        self.model_combo.setCurrentIndex(index if index >= 0 else 0)
+        self.model_combo.blockSignals(False)
 
     def get_selected_rows(self):
         selected_devices = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if not (checkbox and checkbox.isChecked()):
-                continue
-            
-            mac_item = self.table.item(row, 1)
-            status_item = self.table.item(row, 4)
-            
-            device = {
-                'mac': mac_item.text(),
-                'device_sn': mac_item.data(Qt.ItemDataRole.UserRole),
-                'device_id': mac_item.data(Qt.ItemDataRole.UserRole + 1),
-                'operator': self.table.item(row, 2).text(),
-                'device_type': self.table.item(row, 3).text(),
-                'status_title': status_item.text(),
-                'device_status': status_item.data(Qt.ItemDataRole.UserRole),
-                'last_version': self.table.item(row, 5).text()
-            }
-            
+        for device in self._device_model.getCheckedDevices():
             if device.get('device_status', 'offline') == 'offline':
                 continue
-            print(f"select = {device}")
             selected_devices.append(device)
         return selected_devices
 
     def query_test_device(self):
-        """查询设备列表（网络请求）"""
-        request = QNetworkRequest(QUrl(DEVICE_QUERY_URL))
-        biz = "ZXBMan"
-        request.setRawHeader(b"Authorization", self._auth_token.encode('utf-8'))
-        request.setRawHeader(b"Biz", biz.encode("utf-8"))
-        self.reply_query = self.network_manager.get(request)
-        self.reply_query.finished.connect(self.on_query_response)
-
-    def _filter_device(self, mac_filter, user_filter, model_filter):
-        """
-        过滤设备列表
-        :return: 过滤后的设备列表
-        """
-        filtered_list = []
-        for device in self._device_list:
-            mac_match = mac_filter == "" or mac_filter in device["mac"].lower()
-            user_match = user_filter == "" or user_filter in device["operator"].lower()
-            model_match = model_filter == "All" or model_filter == device["device_type"]
-            
-            if mac_match and user_match and model_match:
-                filtered_list.append(device)
-        return filtered_list
+        """立即刷新设备列表（网络请求由 DeviceFleet 发出）"""
+        self._fleet.refresh()
 
     def apply_filter(self):
         """应用筛选条件"""
-        mac_filter = self.mac_input.text().lower()
-        user_filter = self.user_input.text().lower()
-        model_filter = self.model_combo.currentText()
-        
-        self.table.setRowCount(0)
-        
+        self._filter_timer.stop()
         if not self._device_list:
             self.query_test_device()
-        else:
-            filtered_devices = self._filter_device(mac_filter, user_filter, model_filter)
-            for row, device in enumerate(filtered_devices):
-                self.table.insertRow(row)
-                self._fill_device_row(row, device)
+        model_filter = self.model_combo.currentText() if self.model_combo.currentIndex() > 0 else None
+        self._filter_model.setFilter(self.mac_input.text(), self.user_input.text(), model_filter)
 
     def reset_filter(self):
         """重置筛选条件并恢复全量数据"""
         self.mac_input.clear()
         self.user_input.clear()
         self.model_combo.setCurrentIndex(0)
-        
-        self.table.setRowCount(0)
-        for row, device in enumerate(self._device_list):
-            self.table.insertRow(row)
-            self._fill_device_row(row, device)
+        self.apply_filter()
 
     # def get_download_url(self) ->str:
     #     return self._download_url
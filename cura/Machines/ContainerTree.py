@@ -11,12 +11,12 @@ from cura.Machines.MachineNode import MachineNode
 from cura.Settings.GlobalStack import GlobalStack  # To listen only to global stacks being added.
 
 from typing import Dict, List, Optional, TYPE_CHECKING
+import threading
 import time
 
 if TYPE_CHECKING:
     from cura.Machines.QualityGroup import QualityGroup
     from cura.Machines.QualityChangesGroup import QualityChangesGroup
-    from UM.Settings.ContainerStack import ContainerStack
 
 
 class ContainerTree:
@@ -80,7 +80,14 @@ class ContainerTree:
         """Ran after completely starting up the application."""
 
         currently_added = ContainerRegistry.getInstance().findContainerStacks()  # Find all currently added global stacks.
-        JobQueue.getInstance().add(self._MachineNodeLoadJob(self, currently_added))
+        definition_ids = []  # type: List[str]
+        for stack in currently_added:
+            if not isinstance(stack, GlobalStack):
+                continue
+            definition_id = stack.definition.getId()
+            if definition_id not in definition_ids:
+                definition_ids.append(definition_id)
+        JobQueue.getInstance().add(self._MachineNodeLoadJob(self, definition_ids))
 
     class _MachineNodeMap:
         """Dictionary-like object that contains the machines.
@@ -90,6 +97,8 @@ class ContainerTree:
 
         def __init__(self) -> None:
             self._machines = {}  # type: Dict[str, MachineNode]
+            self._loading_locks = {}  # type: Dict[str, threading.Lock]  # Held while a machine node is being loaded.
+            self._loading_locks_lock = threading.Lock()
 
         def __contains__(self, definition_id: str) -> bool:
             """Returns whether a printer with a certain definition ID exists.
@@ -114,10 +123,16 @@ class ContainerTree:
             """
 
             if definition_id not in self._machines:
-                start_time = time.time()
-                self._machines[definition_id] = MachineNode(definition_id)
-                self._machines[definition_id].materialsChanged.connect(ContainerTree.getInstance().materialsChanged)
-                Logger.log("d", "Adding container tree for {definition_id} took {duration} seconds.".format(definition_id = definition_id, duration = time.time() - start_time))
+                # The node may be loaded in the background at the same time. Then wait for that instead of loading it twice.
+                with self._loading_locks_lock:
+                    loading_lock = self._loading_locks.setdefault(definition_id, threading.Lock())
+                with loading_lock:
+                    if definition_id not in self._machines:
+                        start_time = time.time()
+                        machine_node = MachineNode(definition_id)
+                        machine_node.materialsChanged.connect(ContainerTree.getInstance().materialsChanged)
+                        self._machines[definition_id] = machine_node
+                        Logger.log("d", "Adding container tree for {definition_id} took {duration} seconds.".format(definition_id = definition_id, duration = time.time() - start_time))
             return self._machines[definition_id]
 
         def get(self, definition_id: str, default: Optional[MachineNode] = None) -> Optional[MachineNode]:
@@ -151,19 +166,22 @@ class ContainerTree:
     class _MachineNodeLoadJob(Job):
         """Pre-loads all currently added printers as a background task so that switching printers in the interface is
         faster.
+
+        The printers are loaded one after another in a single job, so that only one background thread searches the
+        container registry, and the main thread gets a chance to use it in between.
         """
 
-        def __init__(self, tree_root: "ContainerTree", container_stacks: List["ContainerStack"]) -> None:
+        def __init__(self, tree_root: "ContainerTree", definition_ids: List[str]) -> None:
             """Creates a new background task.
 
             :param tree_root: The container tree instance. This cannot be obtained through the singleton static
             function since the instance may not yet be constructed completely.
-            :param container_stacks: All of the stacks to pre-load the container trees for. This needs to be provided
-            from here because the stacks need to be constructed on the main thread because they are QObject.
+            :param definition_ids: The definitions of the printers to pre-load the container trees for. These need to be
+            taken from the stacks on the main thread because the stacks are QObject.
             """
 
             self.tree_root = tree_root
-            self.container_stacks = container_stacks
+            self.definition_ids = definition_ids
             super().__init__()
 
         def run(self) -> None:
@@ -172,14 +190,11 @@ class ContainerTree:
             The ``JobQueue`` will schedule this on a different thread.
             """
             Logger.log("d", "Started background loading of MachineNodes")
-            for stack in self.container_stacks:  # Load all currently-added containers.
-                if not isinstance(stack, GlobalStack):
-                    continue
+            for definition_id in self.definition_ids:  # Load all currently-added containers.
                 # Allow a thread switch after every container.
                 # Experimentally, sleep(0) didn't allow switching. sleep(0.1) or sleep(0.2) neither.
                 # We're in no hurry though. Half a second is fine.
                 time.sleep(0.5)
-                definition_id = stack.definition.getId()
                 if not self.tree_root.machines.is_loaded(definition_id):
                     _ = self.tree_root.machines[definition_id]
             Logger.log("d", "All MachineNode loading completed")
\ No newline at end of file
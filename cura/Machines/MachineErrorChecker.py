@@ -1,20 +1,63 @@
 # Copyright (c) 2020 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 
+import threading
 import time
 
 from collections import deque
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtProperty
-from typing import Optional, Any, Set
+from typing import Optional, Any, Dict, List, Set, Tuple
 
 from UM.Logger import Logger
 from UM.Settings.SettingDefinition import SettingDefinition
+from UM.Settings.SettingRelation import RelationType
 from UM.Settings.Validator import ValidatorState
 
 import cura.CuraApplication
 
 
+class _SettingSnapshot:
+    """The properties of some settings of a stack, as they were when they were read on the Qt thread.
+
+    Validators only use getProperty and getSettingDefinition, so they can run on a worker thread against a snapshot,
+    while the Qt thread keeps changing the stack itself.
+    """
+
+    # The properties that the validators read.
+    VALIDATOR_PROPERTIES = ("value", "type", "allow_empty", "is_uuid", "regex_blacklist_pattern", "minimum_value",
+                            "maximum_value", "minimum_value_warning", "maximum_value_warning", "warning_value",
+                            "error_value")
+
+    def __init__(self, stack_id: str) -> None:
+        self._stack_id = stack_id
+        self._properties = {}  # type: Dict[str, Dict[str, Any]]
+        self._definitions = {}  # type: Dict[str, Optional[SettingDefinition]]
+
+    def getId(self) -> str:
+        return self._stack_id
+
+    def addSetting(self, stack, key: str) -> None:
+        """Read the properties that are needed to validate a setting from the stack. Only call this on the Qt thread."""
+
+        properties = {"enabled": stack.getProperty(key, "enabled")}
+        self._properties[key] = properties
+        if not properties["enabled"]:
+            return
+        properties["validationState"] = stack.getProperty(key, "validationState")
+        if properties["validationState"] is not None:
+            return
+        self._definitions[key] = stack.getSettingDefinition(key)
+        for property_name in self.VALIDATOR_PROPERTIES:
+            properties[property_name] = stack.getProperty(key, property_name)
+
+    def getProperty(self, key: str, property_name: str, context: Any = None) -> Any:
+        return self._properties.get(key, {}).get(property_name)
+
+    def getSettingDefinition(self, key: str) -> Optional[SettingDefinition]:
+        return self._definitions.get(key)
+
+
 class MachineErrorChecker(QObject):
     """This class performs setting error checks for the currently active machine.
 
@@ -23,8 +66,19 @@ class MachineErrorChecker(QObject):
     stack. According to my profiling results, the maximal runtime for such a sub-task is <0.03 secs, which should be
     good enough. Moreover, if any changes happened to the machine, we can cancel the check in progress without wait
     for it to finish the complete work.
+
+    The outcome of every (stack, key) check is cached. When a single setting value changes, only that setting and the
+    settings whose formulas depend on it are validated again. Only a change of containers (or of the active machine)
+    invalidates the whole cache. For large revalidations, the Qt thread only takes a snapshot of the setting properties
+    and the validators run on a worker thread, since the stacks must not be read while the Qt thread changes them.
     """
 
+    # Checks with more (stack, key) pairs than this are done on a worker thread instead of on the Qt thread.
+    WORKER_THRESHOLD = 200
+
+    # How long to take snapshots on the Qt thread at a time, in seconds, before letting it handle other events.
+    SNAPSHOT_TIME_BUDGET = 0.02
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
 
@@ -32,7 +86,6 @@ class MachineErrorChecker(QObject):
 
         self._has_errors = True  # Result of the error check, indicating whether there are errors in the stack
         self._error_keys = set()  # type: Set[str] # A set of settings keys that have errors
-        self._error_keys_in_progress = set()  # type: Set[str]  # The variable that stores the results of the currently in progress check
 
         self._stacks_and_keys_to_check = None  # type: Optional[deque]  # a FIFO queue of tuples (stack, key) to check for errors
 
@@ -40,6 +93,19 @@ class MachineErrorChecker(QObject):
                                      # error check needs to take place while there is already one running at the moment.
         self._check_in_progress = False  # Whether there is an error check running in progress at the moment.
 
+        # Cached validation results; (stack ID, setting key) -> whether that setting has an error in that stack.
+        self._validation_cache = {}  # type: Dict[Tuple[str, str], bool]
+        self._check_all_keys = True  # Whether the cache is invalid as a whole, so all keys need to be checked.
+
+        # Set whenever there is no check scheduled or running, so other threads can wait for the result.
+        self._result_ready = threading.Event()
+        self._result_ready.set()
+
+        self._worker_thread = None  # type: Optional[threading.Thread]
+        self._snapshots = {}  # type: Dict[str, _SettingSnapshot]  # By stack ID, while they are being taken.
+        self._snapshot_position = 0  # How many (stack, key) pairs of the check in progress are in the snapshots.
+        self._cancel_worker = threading.Event()
+
         self._application = cura.CuraApplication.CuraApplication.getInstance()
         self._machine_manager = self._application.getMachineManager()
 
@@ -106,10 +172,30 @@ class MachineErrorChecker(QObject):
     def needToWaitForResult(self) -> bool:
         return self._need_to_check or self._check_in_progress
 
+    def waitForResult(self, timeout: Optional[float] = None) -> bool:
+        """Block the calling thread until there is no error check scheduled or running any more.
+
+        This must not be called from the Qt thread, since the check itself needs the Qt thread to make progress.
+
+        :param timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+        :return: True if the result is available, or False if the timeout expired before that.
+        """
+
+        return self._result_ready.wait(timeout)
+
+    def _emitNeedToWaitForResultChanged(self) -> None:
+        if self.needToWaitForResult:
+            self._result_ready.clear()
+        else:
+            self._result_ready.set()
+        self.needToWaitForResultChanged.emit()
+
     def startErrorCheckPropertyChanged(self, key: str, property_name: str) -> None:
         """Start the error check for property changed
         this is separate from the startErrorCheck because it ignores a number property types
 
+        Only the changed setting and the settings that depend on it get checked again.
+
         :param key:
         :param property_name:
         """
@@ -117,106 +203,195 @@ class MachineErrorChecker(QObject):
         if property_name != "value":
             return
         self._keys_to_check.add(key)
-        self.startErrorCheck()
+        if self._global_stack:
+            definition = self._global_stack.getSettingDefinition(key)
+            if definition is not None:
+                self._addDependentKeys(self._keys_to_check, definition.relations)
+        self._scheduleErrorCheck()
 
     def startErrorCheck(self, *args: Any) -> None:
-        """Starts the error check timer to schedule a new error check.
+        """Starts the error check timer to schedule a new error check of all settings.
 
         :param args:
         """
 
+        self._check_all_keys = True
+        self._scheduleErrorCheck()
+
+    def _scheduleErrorCheck(self) -> None:
         if not self._check_in_progress:
             self._need_to_check = True
-            self.needToWaitForResultChanged.emit()
+            self._emitNeedToWaitForResultChanged()
         self._error_check_timer.start()
 
+    def _addDependentKeys(self, keys: Set[str], relations: List[Any]) -> None:
+        """Recursively add the keys of all settings that are affected by a change in the given relations.
+
+        :param keys: The set of keys to add the dependent settings to.
+        :param relations: The relations of the setting that has changed.
+        """
+
+        for relation in relations:
+            if relation.type == RelationType.RequiresTarget:
+                continue
+            if relation.target.key in keys:
+                continue
+            keys.add(relation.target.key)
+            self._addDependentKeys(keys, relation.target.relations)
+
     def _rescheduleCheck(self) -> None:
         """This function is called by the timer to reschedule a new error check.
 
         If there is no check in progress, it will start a new one. If there is any, it sets the "_need_to_check" flag
-        to notify the current check to stop and start a new one.
+        to notify the current check to stop and start a new one. The results that the interrupted check already
+        gathered are kept.
         """
 
-        if self._check_in_progress and not self._need_to_check:
+        if self._check_in_progress:
             self._need_to_check = True
-            self.needToWaitForResultChanged.emit()
+            self._cancel_worker.set()
+            self._emitNeedToWaitForResultChanged()
             return
 
-        self._error_keys_in_progress = set()
         self._need_to_check = False
-        self.needToWaitForResultChanged.emit()
 
         global_stack = self._machine_manager.activeMachine
         if global_stack is None:
             Logger.log("i", "No active machine, nothing to check.")
+            self._emitNeedToWaitForResultChanged()
             return
 
+        if self._check_all_keys:
+            self._validation_cache.clear()
+
         # Populate the (stack, key) tuples to check
         self._stacks_and_keys_to_check = deque()
         for stack in global_stack.extruderList:
-            if not self._keys_to_check:
-                self._keys_to_check = stack.getAllKeys()
-
-            for key in self._keys_to_check:
+            keys_to_check = stack.getAllKeys() if self._check_all_keys else self._keys_to_check
+            for key in keys_to_check:
                 self._stacks_and_keys_to_check.append((stack, key))
+        self._check_all_keys = False
+        self._keys_to_check = set()
 
-        self._application.callLater(self._checkStack)
+        self._check_in_progress = True
+        self._emitNeedToWaitForResultChanged()
         self._check_start_time = time.time()
-        Logger.log("d", "New error check scheduled.")
 
-    def _checkStack(self) -> None:
+        if len(self._stacks_and_keys_to_check) > self.WORKER_THRESHOLD:
+            self._snapshots = {}  # type: Dict[str, _SettingSnapshot]
+            self._snapshot_position = 0
+            self._application.callLater(self._takeSnapshot)
+            Logger.log("d", "New error check of {num} settings scheduled on a worker thread.".format(num = len(self._stacks_and_keys_to_check)))
+        else:
+            self._application.callLater(self._checkStack)
+            Logger.log("d", "New error check scheduled.")
+
+    def _takeSnapshot(self) -> None:
+        """Read the properties of the settings to check on the Qt thread, a bit at a time, and hand them to a worker."""
+
         if self._need_to_check:
-            Logger.log("d", "Need to check for errors again. Discard the current progress and reschedule a check.")
-            self._check_in_progress = False
-            self._application.callLater(self.startErrorCheck)
+            self._abortCheck(self._stacks_and_keys_to_check)
             return
 
-        self._check_in_progress = True
+        pairs = self._stacks_and_keys_to_check
+        end_time = time.time() + self.SNAPSHOT_TIME_BUDGET
+        while self._snapshot_position < len(pairs) and time.time() < end_time:
+            stack, key = pairs[self._snapshot_position]
+            snapshot = self._snapshots.get(stack.getId())
+            if snapshot is None:
+                snapshot = self._snapshots[stack.getId()] = _SettingSnapshot(stack.getId())
+            snapshot.addSetting(stack, key)
+            self._snapshot_position += 1
+
+        if self._snapshot_position < len(pairs):
+            self._application.callLater(self._takeSnapshot)
+            return
+
+        snapshots_and_keys_to_check = deque((self._snapshots[stack.getId()], key) for stack, key in pairs)
+        self._snapshots = {}
+        self._cancel_worker.clear()
+        self._worker_thread = threading.Thread(target = self._checkStacksOnWorker, args = (snapshots_and_keys_to_check, ), daemon = True, name = "MachineErrorCheckWorker")
+        self._worker_thread.start()
+
+    def _checkStacksOnWorker(self, snapshots_and_keys_to_check: deque) -> None:
+        """Validate a large batch of settings on a worker thread, against snapshots of their stacks.
+
+        The results are handed back to the Qt thread, which is the only one that touches the cache.
+        """
+
+        results = []  # type: List[Tuple[str, str, bool]]
+        while snapshots_and_keys_to_check and not self._cancel_worker.is_set():
+            snapshot, key = snapshots_and_keys_to_check.popleft()
+            results.append((snapshot.getId(), key, self._hasValidationError(snapshot, key)))
+        self._application.callLater(self._onWorkerCheckFinished, results, snapshots_and_keys_to_check)
+
+    def _onWorkerCheckFinished(self, results: List[Tuple[str, str, bool]], stacks_and_keys_not_checked: deque) -> None:
+        for stack_id, key, has_error in results:
+            self._validation_cache[(stack_id, key)] = has_error
+        self._worker_thread = None
+        if stacks_and_keys_not_checked or self._need_to_check:
+            self._abortCheck(stacks_and_keys_not_checked)
+            return
+        self._setResult()
+
+    def _abortCheck(self, stacks_and_keys_not_checked: Optional[deque]) -> None:
+        """Stop the check in progress and schedule a new one, which also covers what this one didn't get to."""
+
+        Logger.log("d", "Need to check for errors again. Keep the progress so far and reschedule a check.")
+        if stacks_and_keys_not_checked:
+            self._keys_to_check.update(key for _, key in stacks_and_keys_not_checked)
+        self._check_in_progress = False
+        self._application.callLater(self._scheduleErrorCheck)
+
+    def _checkStack(self) -> None:
+        if self._need_to_check:
+            self._abortCheck(self._stacks_and_keys_to_check)
+            return
 
         for i in range(self._num_keys_to_check_per_update):
-            # If there is nothing to check any more, it means there is no error.
+            # If there is nothing to check any more, the check is done.
             if not self._stacks_and_keys_to_check:
                 # Finish
-                self._setResult(False)
+                self._setResult()
                 return
 
             # Get the next stack and key to check
             stack, key = self._stacks_and_keys_to_check.popleft()
-
-            enabled = stack.getProperty(key, "enabled")
-            if not enabled:
-                continue
-
-            validation_state = stack.getProperty(key, "validationState")
-            if validation_state is None:
-                # Setting is not validated. This can happen if there is only a setting definition.
-                # We do need to validate it, because a setting definitions value can be set by a function, which could
-                # be an invalid setting.
-                definition = stack.getSettingDefinition(key)
-                validator_type = SettingDefinition.getValidatorForType(definition.type)
-                if validator_type:
-                    validator = validator_type(key)
-                    validation_state = validator(stack)
-            if validation_state in (ValidatorState.Exception, ValidatorState.MaximumError, ValidatorState.MinimumError, ValidatorState.Invalid):
-                # Since we don't know if any of the settings we didn't check is has an error value, store the list for the
-                # next check.
-                keys_to_recheck = {setting_key for stack, setting_key in self._stacks_and_keys_to_check}
-                keys_to_recheck.add(key)
-                self._setResult(True, keys_to_recheck = keys_to_recheck)
-                return
+            self._validation_cache[(stack.getId(), key)] = self._hasValidationError(stack, key)
 
         # Schedule the check for the next key
         self._application.callLater(self._checkStack)
 
-    def _setResult(self, result: bool, keys_to_recheck = None) -> None:
+    @staticmethod
+    def _hasValidationError(stack, key: str) -> bool:
+        enabled = stack.getProperty(key, "enabled")
+        if not enabled:
+            return False
+
+        validation_state = stack.getProperty(key, "validationState")
+        if validation_state is None:
+            # Setting is not validated. This can happen if there is only a setting definition.
+            # We do need to validate it, because a setting definitions value can be set by a function, which could
+            # be an invalid setting.
+            definition = stack.getSettingDefinition(key)
+            if definition is None:
+                return False
+            validator_type = SettingDefinition.getValidatorForType(definition.type)
+            if validator_type:
+                validator = validator_type(key)
+                validation_state = validator(stack)
+        return validation_state in (ValidatorState.Exception, ValidatorState.MaximumError, ValidatorState.MinimumError, ValidatorState.Invalid)
+
+    def _setResult(self) -> None:
+        self._error_keys = {key for (_, key), has_error in self._validation_cache.items() if has_error}
+        result = bool(self._error_keys)
         if result != self._has_errors:
             self._has_errors = result
             self.hasErrorUpdated.emit()
             self._machine_manager.stacksValidationChanged.emit()
-        self._keys_to_check = keys_to_recheck if keys_to_recheck else set()
         self._need_to_check = False
         self._check_in_progress = False
-        self.needToWaitForResultChanged.emit()
+        self._emitNeedToWaitForResultChanged()
         self.errorCheckFinished.emit()
         execution_time = time.time() - self._check_start_time
         Logger.info(f"Error check finished, result = {result}, time = {execution_time:.2f}s")
@@ -61,6 +61,8 @@ class MultiplyObjectsJob(Job):
             processed_nodes.append(current_node)
 
             for _ in range(self._count):
+                # The copies share the (immutable) mesh data of the original, and through that also its convex hull and
+                # the transformed vertices that are sent to the engine. Changing the mesh of a copy replaces its mesh data.
                 new_node = copy.deepcopy(node)
                 # Same build plate
                 build_plate_number = current_node.callDecoration("getBuildPlateNumber")
@@ -81,7 +83,11 @@ class MultiplyObjectsJob(Job):
             if self._grid_arrange:
                 arranger = GridArrange(nodes, Application.getInstance().getBuildVolume(), fixed_nodes)
             else:
-                arranger = Nest2DArrange(nodes, Application.getInstance().getBuildVolume(), fixed_nodes, factor=1000)
+                preferences = Application.getInstance().getPreferences()
+                arranger = Nest2DArrange(nodes, Application.getInstance().getBuildVolume(), fixed_nodes, factor=1000,
+                                         parallel=preferences.getValue("arrange/parallel_search"),
+                                         time_budget=float(preferences.getValue("arrange/time_budget")),
+                                         arrange_state=Application.getInstance().getArrangeState())
 
             group_operation, not_fit_count = arranger.createGroupOperationForArrange(add_new_nodes_in_scene=True)
             found_solution_for_all = not_fit_count == 0
@@ -0,0 +1,183 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QTimer
+
+from UM.Logger import Logger
+
+StatusListener = Callable[[Any, bool], None]
+FetchFunction = Callable[[Callable[[Any], None], Callable[..., None]], None]
+
+
+class _StatusSource:
+    """A part of the fleet of which the status is fetched with one request, such as a cluster or a list of devices."""
+
+    def __init__(self, key: str, fetch: FetchFunction, is_active: Optional[Callable[[Any], bool]],
+                 is_equal: Optional[Callable[[Any, Any], bool]], interval: float) -> None:
+        self.key = key
+        self.fetch = fetch
+        self.is_active = is_active
+        self.is_equal = is_equal
+        self.listeners = []  # type: List[StatusListener]
+        self.status = None  # type: Optional[Any]
+        self.has_status = False
+        self.interval = interval
+        self.next_poll_time = 0.0
+        self.is_polling = False
+        self.generation = 0  # To ignore the replies to requests that were made before the source was removed.
+
+
+class FleetStatusService:
+    """Keeps the status of a fleet of printers up to date, for everyone who shows it.
+
+    The fleet consists of sources of which the status is fetched with one request each, such as a cloud cluster or the
+    list of devices of the account. A source is polled while anyone listens to it, and everyone who listens to the same
+    source shares the same requests and the same status.
+
+    Polling adapts to what the fleet is doing. A source is polled every ActiveInterval seconds while it's active, for
+    instance while one of its printers is printing, or when its status just changed. When nothing changes, the interval
+    doubles after every poll up to IdleInterval. Sources that are due within BatchWindow seconds of each other are
+    polled together, so that the requests go out in one burst over the same connection instead of one timer per source.
+
+    Listeners are called after every poll, with whether the status differs from the previous one. That way they can
+    skip updating their models if nothing changed, and still know that the source is reachable.
+    """
+
+    ActiveInterval = 5.0  # seconds
+    IdleInterval = 20.0  # seconds
+    BatchWindow = 1.0  # seconds
+
+    __instance = None  # type: Optional[FleetStatusService]
+
+    @classmethod
+    def getInstance(cls) -> "FleetStatusService":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._sources = {}  # type: Dict[str, _StatusSource]
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._poll)
+
+    def addListener(self, key: str, fetch: FetchFunction, listener: StatusListener,
+                    is_active: Optional[Callable[[Any], bool]] = None,
+                    is_equal: Optional[Callable[[Any, Any], bool]] = None) -> None:
+        """Start listening to the status of a source. The source is polled right away if it isn't polled yet.
+
+        :param key: The unique name of the source.
+        :param fetch: Fetches the status of the source. It's called with a callback for the status, and a callback that
+        is called with any arguments if it failed. If others listen to the source already, theirs is used.
+        :param listener: Called with the status and whether it changed, after every poll.
+        :param is_active: Whether the source should be polled often, given its status. By default, it's only polled
+        often when its status just changed.
+        :param is_equal: Whether two statuses are the same. By default, they are compared with ==.
+        """
+
+        source = self._sources.get(key)
+        if source is None:
+            source = _StatusSource(key, fetch, is_active, is_equal, self.ActiveInterval)
+            self._sources[key] = source
+        if listener not in source.listeners:
+            source.listeners.append(listener)
+        if source.has_status:
+            listener(source.status, True)  # The status is known already, so don't let them wait for the next poll.
+        else:
+            source.next_poll_time = self._clock()
+        self._schedule()
+
+    def removeListener(self, key: str, listener: StatusListener) -> None:
+        """Stop listening to the status of a source. The source is no longer polled if nobody listens to it anymore."""
+
+        source = self._sources.get(key)
+        if source is None:
+            return
+        if listener in source.listeners:
+            source.listeners.remove(listener)
+        if not source.listeners:
+            del self._sources[key]
+            source.generation += 1
+            self._schedule()
+
+    def getStatus(self, key: str) -> Optional[Any]:
+        """Get the last known status of a source, or None if nobody listens to it or it wasn't fetched yet."""
+
+        source = self._sources.get(key)
+        return source.status if source is not None else None
+
+    def requestUpdate(self, key: str) -> None:
+        """Poll a source soon, because something happened that probably changed its status, such as sending a print."""
+
+        source = self._sources.get(key)
+        if source is None:
+            return
+        source.interval = self.ActiveInterval
+        source.next_poll_time = min(source.next_poll_time, self._clock())
+        self._schedule()
+
+    def clear(self) -> None:
+        """Stop polling all sources, for instance when the user logs out."""
+
+        for source in self._sources.values():
+            source.generation += 1
+        self._sources.clear()
+        self._timer.stop()
+
+    def _schedule(self) -> None:
+        due_times = [source.next_poll_time for source in self._sources.values() if not source.is_polling]
+        if not due_times:
+            self._timer.stop()
+            return
+        delay = max(0.0, min(due_times) - self._clock())
+        self._timer.start(int(delay * 1000))
+
+    def _poll(self) -> None:
+        """Poll every source that is due, or almost due."""
+
+        batch_end = self._clock() + self.BatchWindow
+        due_sources = [source for source in self._sources.values() if not source.is_polling and source.next_poll_time <= batch_end]
+        for source in due_sources:
+            source.is_polling = True
+            generation = source.generation
+            try:
+                source.fetch(lambda status, source = source, generation = generation: self._onStatus(source, generation, status),
+                             lambda *args, source = source, generation = generation: self._onFailed(source, generation))
+            except Exception:
+                Logger.logException("e", "Failed to request the status of %s.", source.key)
+                self._onFailed(source, generation)
+        self._schedule()
+
+    def _onStatus(self, source: _StatusSource, generation: int, status: Any) -> None:
+        if generation != source.generation:
+            return
+        if source.has_status:
+            changed = not (source.is_equal(source.status, status) if source.is_equal is not None else source.status == status)
+        else:
+            changed = True
+        source.status = status
+        source.has_status = True
+        source.is_polling = False
+
+        if changed or (source.is_active is not None and source.is_active(status)):
+            source.interval = self.ActiveInterval
+        else:
+            source.interval = min(self.IdleInterval, source.interval * 2)
+        source.next_poll_time = self._clock() + source.interval
+        self._schedule()
+
+        for listener in list(source.listeners):
+            listener(status, changed)
+
+    def _onFailed(self, source: _StatusSource, generation: int) -> None:
+        if generation != source.generation:
+            return
+        source.is_polling = False
+        source.interval = self.IdleInterval  # Don't keep asking a server that has trouble.
+        source.next_poll_time = self._clock() + source.interval
+        self._schedule()
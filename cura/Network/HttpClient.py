@@ -0,0 +1,368 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+from PyQt6.QtCore import QByteArray, QTimer, QUrl
+from PyQt6.QtNetwork import QNetworkReply, QNetworkRequest
+
+from UM.Logger import Logger
+from UM.TaskManagement.HttpRequestManager import HttpRequestData, HttpRequestManager
+from UM.TaskManagement.HttpRequestScope import HttpRequestScope
+
+from .HttpMetrics import HttpMetrics
+
+ReplyCallback = Callable[[QNetworkReply], None]
+ErrorCallback = Callable[[QNetworkReply, "QNetworkReply.NetworkError"], None]
+ProgressCallback = Callable[[int, int], None]
+
+
+class HttpClientRequest:
+    """A request that was made with the HTTP client. It can be used to abort the request."""
+
+    def __init__(self, callback: Optional[ReplyCallback], error_callback: Optional[ErrorCallback],
+                 download_progress_callback: Optional[ProgressCallback], upload_progress_callback: Optional[ProgressCallback]) -> None:
+        self.callback = callback
+        self.error_callback = error_callback
+        self.download_progress_callback = download_progress_callback
+        self.upload_progress_callback = upload_progress_callback
+        self.is_aborted = False
+        self.transfer = None  # type: Optional[_Transfer]
+
+
+class _Transfer:
+    """Sends a request to the server, as often as it needs to be retried, for everyone who made that request."""
+
+    def __init__(self, method: str, url: str, headers_dict: Optional[Dict[str, str]], data: Optional[Union[bytes, bytearray]],
+                 scope: Optional[HttpRequestScope], timeout: Optional[float], retries: int, endpoint: str, key: Optional[Tuple]) -> None:
+        self.method = method
+        self.url = url
+        self.headers_dict = headers_dict
+        self.data = data
+        self.scope = scope
+        self.timeout = timeout
+        self.retries_left = retries
+        self.attempt = 0
+        self.endpoint = endpoint
+        self.key = key  # To find identical GET requests that are still running. None if it can't be shared.
+        self.revalidate = False  # Whether the reply is cached, to ask the server next time whether it changed.
+        self.start_time = time.monotonic()
+        self.request_data = None  # type: Optional[HttpRequestData]
+        self.requests = []  # type: List[HttpClientRequest]
+        self.is_aborted = False
+
+
+class _SharedReply:
+    """A view on a reply that is passed to every caller of a coalesced request.
+
+    The body of a reply can only be read once, so it's read up front and every caller gets a copy of it. If the server
+    answered that a revalidated reply didn't change, the body and status code of the cached reply are used instead.
+    """
+
+    def __init__(self, reply: QNetworkReply, body: bytes, status_code: Optional[int] = None) -> None:
+        self._reply = reply
+        self._body = body
+        self._status_code = status_code
+
+    def readAll(self) -> QByteArray:
+        return QByteArray(self._body)
+
+    def bytesAvailable(self) -> int:
+        return len(self._body)
+
+    def attribute(self, attribute: QNetworkRequest.Attribute) -> Any:
+        if self._status_code is not None and attribute == QNetworkRequest.Attribute.HttpStatusCodeAttribute:
+            return self._status_code
+        return self._reply.attribute(attribute)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._reply, name)
+
+
+class _CachedReply:
+    """The body of a reply, and what the server gave to ask whether it changed since."""
+
+    def __init__(self, status_code: int, body: bytes, etag: bytes, last_modified: bytes) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def getValidators(self) -> Dict[str, str]:
+        validators = {}
+        if self.etag:
+            validators["If-None-Match"] = self.etag.decode("latin-1")
+        if self.last_modified:
+            validators["If-Modified-Since"] = self.last_modified.decode("latin-1")
+        return validators
+
+
+class _HttpClientScope(HttpRequestScope):
+    """Allows HTTP/2 for the request, on top of the scope that the caller asked for."""
+
+    def __init__(self, scope: Optional[HttpRequestScope]) -> None:
+        super().__init__()
+        self._scope = scope
+
+    def requestHook(self, request: QNetworkRequest) -> None:
+        if self._scope is not None:
+            self._scope.requestHook(request)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+
+
+class HttpClient:
+    """Makes the HTTP requests of Cura, on top of the HttpRequestManager.
+
+    All requests go through the single network access manager of the HttpRequestManager, so connections to a host are
+    kept alive and reused between requests, and HTTP/2 is used if the server supports it. On top of that, the client:
+
+    - Sends identical GET requests that are made while one of them is running only once. Everyone who made the request
+      gets the same reply.
+    - Retries GET requests that failed because of the network or a temporary server error, waiting a bit longer after
+      every try. Other requests are only retried when asked for, since they may not be safe to send twice.
+    - Times out GET and DELETE requests after DefaultTimeout seconds, unless a different timeout is given. Uploads with
+      PUT and POST can take long, so they only time out if a timeout is given.
+    - Revalidates GET requests that are made with revalidate, such as status polls: the server is asked whether the
+      reply changed since the last time with If-None-Match and If-Modified-Since. If not, the server doesn't send it
+      again and the callback gets the cached reply.
+    - Keeps track of the latency of the requests per endpoint, see getMetrics.
+
+    The methods take the same arguments as those of the HttpRequestManager, and call the callbacks in the same way.
+    """
+
+    DefaultTimeout = 30  # seconds
+    DefaultGetRetries = 2
+    RetryDelay = 0.5  # seconds, doubled for every next try.
+
+    RetriableErrors = frozenset({
+        QNetworkReply.NetworkError.ConnectionRefusedError,
+        QNetworkReply.NetworkError.RemoteHostClosedError,
+        QNetworkReply.NetworkError.HostNotFoundError,
+        QNetworkReply.NetworkError.TimeoutError,
+        QNetworkReply.NetworkError.OperationCanceledError,  # Also when the request times out.
+        QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+        QNetworkReply.NetworkError.NetworkSessionFailedError,
+        QNetworkReply.NetworkError.ProxyConnectionClosedError,
+        QNetworkReply.NetworkError.UnknownNetworkError,
+        QNetworkReply.NetworkError.InternalServerError,
+        QNetworkReply.NetworkError.ServiceUnavailableError,
+        QNetworkReply.NetworkError.UnknownServerError
+    })
+
+    __instance = None  # type: Optional[HttpClient]
+
+    @classmethod
+    def getInstance(cls) -> "HttpClient":
+        if cls.__instance is None:
+            cls.__instance = cls(HttpRequestManager.getInstance())
+        return cls.__instance
+
+    def __init__(self, http: HttpRequestManager) -> None:
+        self._http = http
+        self._metrics = HttpMetrics()
+        self._running_gets = {}  # type: Dict[Tuple, _Transfer]
+        self._cached_replies = {}  # type: Dict[Tuple, _CachedReply]  # Of the GET requests that are revalidated.
+
+    def get(self, url: str, headers_dict: Optional[Dict[str, str]] = None, callback: Optional[ReplyCallback] = None,
+            error_callback: Optional[ErrorCallback] = None, download_progress_callback: Optional[ProgressCallback] = None,
+            upload_progress_callback: Optional[ProgressCallback] = None, timeout: Optional[float] = DefaultTimeout,
+            scope: Optional[HttpRequestScope] = None, retries: int = DefaultGetRetries, revalidate: bool = False) -> HttpClientRequest:
+        """
+        :param revalidate: Keep the reply, and only get it again if it changed since. The callback is called either way.
+        The other arguments are the same as those of HttpRequestManager.get.
+        """
+
+        request = HttpClientRequest(callback, error_callback, download_progress_callback, upload_progress_callback)
+        key = self._getRequestKey(url, headers_dict, scope)
+        transfer = self._running_gets.get(key)
+        if transfer is not None:
+            transfer.requests.append(request)
+            request.transfer = transfer
+            self._metrics.addCoalesced(transfer.endpoint)
+            return request
+
+        cached_reply = self._cached_replies.get(key) if revalidate else None
+        if cached_reply is not None:
+            headers_dict = dict(headers_dict or {})
+            headers_dict.update(cached_reply.getValidators())
+        transfer = _Transfer("GET", url, headers_dict, None, scope, timeout, retries, HttpMetrics.getEndpoint("GET", url), key)
+        transfer.revalidate = revalidate
+        self._running_gets[key] = transfer
+        return self._start(transfer, request)
+
+    def put(self, url: str, headers_dict: Optional[Dict[str, str]] = None, data: Optional[Union[bytes, bytearray]] = None,
+            callback: Optional[ReplyCallback] = None, error_callback: Optional[ErrorCallback] = None,
+            download_progress_callback: Optional[ProgressCallback] = None, upload_progress_callback: Optional[ProgressCallback] = None,
+            timeout: Optional[float] = None, scope: Optional[HttpRequestScope] = None, retries: int = 0) -> HttpClientRequest:
+        request = HttpClientRequest(callback, error_callback, download_progress_callback, upload_progress_callback)
+        transfer = _Transfer("PUT", url, headers_dict, data, scope, timeout, retries, HttpMetrics.getEndpoint("PUT", url), None)
+        return self._start(transfer, request)
+
+    def post(self, url: str, headers_dict: Optional[Dict[str, str]] = None, data: Optional[Union[bytes, bytearray]] = None,
+             callback: Optional[ReplyCallback] = None, error_callback: Optional[ErrorCallback] = None,
+             download_progress_callback: Optional[ProgressCallback] = None, upload_progress_callback: Optional[ProgressCallback] = None,
+             timeout: Optional[float] = None, scope: Optional[HttpRequestScope] = None, retries: int = 0) -> HttpClientRequest:
+        request = HttpClientRequest(callback, error_callback, download_progress_callback, upload_progress_callback)
+        transfer = _Transfer("POST", url, headers_dict, data, scope, timeout, retries, HttpMetrics.getEndpoint("POST", url), None)
+        return self._start(transfer, request)
+
+    def delete(self, url: str, headers_dict: Optional[Dict[str, str]] = None, callback: Optional[ReplyCallback] = None,
+               error_callback: Optional[ErrorCallback] = None, download_progress_callback: Optional[ProgressCallback] = None,
+               upload_progress_callback: Optional[ProgressCallback] = None, timeout: Optional[float] = DefaultTimeout,
+               scope: Optional[HttpRequestScope] = None, retries: int = 0) -> HttpClientRequest:
+        request = HttpClientRequest(callback, error_callback, download_progress_callback, upload_progress_callback)
+        transfer = _Transfer("DELETE", url, headers_dict, None, scope, timeout, retries, HttpMetrics.getEndpoint("DELETE", url), None)
+        return self._start(transfer, request)
+
+    def postJson(self, url: str, data: Any, headers_dict: Optional[Dict[str, str]] = None, **kwargs) -> HttpClientRequest:
+        """Post data as JSON. The other arguments are the same as those of post."""
+
+        headers = {"Content-Type": "application/json"}
+        if headers_dict:
+            headers.update(headers_dict)
+        return self.post(url, headers_dict = headers, data = json.dumps(data, ensure_ascii = False).encode("utf-8"), **kwargs)
+
+    def abortRequest(self, request: HttpClientRequest) -> None:
+        """Abort a request. Its callbacks are not called anymore.
+
+        If others made the same request, it continues for them.
+        """
+
+        if request.is_aborted:
+            return
+        request.is_aborted = True
+        transfer = request.transfer
+        if transfer is None or request not in transfer.requests:
+            return
+        transfer.requests.remove(request)
+        if transfer.requests:
+            return
+        transfer.is_aborted = True
+        self._forget(transfer)
+        if transfer.request_data is not None:
+            self._http.abortRequest(transfer.request_data)
+
+    def getMetrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the number of requests, failures and retries, and the latencies in seconds, per endpoint."""
+
+        return self._metrics.toDict()
+
+    def logMetrics(self) -> None:
+        metrics = self.getMetrics()
+        if metrics:
+            Logger.log("i", "HTTP requests per endpoint: %s", json.dumps(metrics, indent = 4))
+
+    @staticmethod
+    def readJSON(reply: QNetworkReply) -> Optional[Any]:
+        """Read the body of a reply as JSON.
+
+        :return: The parsed JSON, or None if it's not valid.
+        """
+
+        try:
+            return json.loads(bytes(reply.readAll()).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            Logger.log("w", "Unable to parse the reply of %s as JSON: %s", reply.url().toDisplayString(), str(e))
+            return None
+
+    def _start(self, transfer: _Transfer, request: HttpClientRequest) -> HttpClientRequest:
+        transfer.requests.append(request)
+        request.transfer = transfer
+        self._send(transfer)
+        return request
+
+    def _send(self, transfer: _Transfer) -> None:
+        if transfer.is_aborted:
+            return
+        arguments = {
+            "headers_dict": transfer.headers_dict,
+            "callback": lambda reply: self._onFinished(transfer, reply, None),
+            "error_callback": lambda reply, error: self._onFinished(transfer, reply, error),
+            "download_progress_callback": lambda received, total: self._onDownloadProgress(transfer, received, total),
+            "timeout": transfer.timeout,
+            "scope": _HttpClientScope(transfer.scope)
+        }  # type: Dict[str, Any]
+        if transfer.method == "GET":
+            transfer.request_data = self._http.get(transfer.url, **arguments)
+        elif transfer.method == "DELETE":
+            transfer.request_data = self._http.delete(transfer.url, **arguments)
+        else:
+            arguments["data"] = transfer.data
+            arguments["upload_progress_callback"] = lambda sent, total: self._onUploadProgress(transfer, sent, total)
+            send = self._http.put if transfer.method == "PUT" else self._http.post
+            transfer.request_data = send(transfer.url, **arguments)
+
+    def _onFinished(self, transfer: _Transfer, reply: QNetworkReply, error: Optional["QNetworkReply.NetworkError"]) -> None:
+        if transfer.is_aborted:
+            return
+        if error is not None and transfer.retries_left > 0 and error in self.RetriableErrors:
+            transfer.retries_left -= 1
+            transfer.attempt += 1
+            delay = self.RetryDelay * 2 ** (transfer.attempt - 1)
+            Logger.log("d", "Retrying %s %s in %s seconds, because of %s.", transfer.method, transfer.url, delay, HttpRequestManager.qt_network_error_name(error))
+            QTimer.singleShot(int(delay * 1000), lambda: self._send(transfer))
+            return
+
+        self._forget(transfer)  # Before the callbacks, so that they can make the same request again.
+        self._metrics.addRequest(transfer.endpoint, time.monotonic() - transfer.start_time, error is not None, transfer.attempt)
+
+        shared_reply = reply  # type: Union[QNetworkReply, _SharedReply]
+        if error is None and transfer.revalidate:
+            shared_reply = self._revalidate(transfer, reply)
+        elif len(transfer.requests) > 1:
+            shared_reply = _SharedReply(reply, bytes(reply.readAll()))
+        for request in list(transfer.requests):
+            if request.is_aborted:
+                continue
+            if error is None:
+                if request.callback is not None:
+                    request.callback(shared_reply)
+            elif request.error_callback is not None:
+                request.error_callback(shared_reply, error)
+
+    def _revalidate(self, transfer: _Transfer, reply: QNetworkReply) -> _SharedReply:
+        """Keep the reply of a revalidated request, or get the cached reply if the server answered that it didn't change."""
+
+        status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        cached_reply = self._cached_replies.get(cast(Tuple, transfer.key))
+        if status_code == 304 and cached_reply is not None:
+            self._metrics.addNotModified(transfer.endpoint)
+            return _SharedReply(reply, cached_reply.body, cached_reply.status_code)
+
+        body = bytes(reply.readAll())
+        etag = bytes(reply.rawHeader(b"ETag"))
+        last_modified = bytes(reply.rawHeader(b"Last-Modified"))
+        if etag or last_modified:
+            self._cached_replies[cast(Tuple, transfer.key)] = _CachedReply(status_code, body, etag, last_modified)
+        else:  # The server doesn't support it for this request, so don't keep the reply.
+            self._cached_replies.pop(cast(Tuple, transfer.key), None)
+        return _SharedReply(reply, body)
+
+    def _onDownloadProgress(self, transfer: _Transfer, received: int, total: int) -> None:
+        for request in list(transfer.requests):
+            if request.download_progress_callback is not None and not request.is_aborted:
+                request.download_progress_callback(received, total)
+
+    def _onUploadProgress(self, transfer: _Transfer, sent: int, total: int) -> None:
+        for request in list(transfer.requests):
+            if request.upload_progress_callback is not None and not request.is_aborted:
+                request.upload_progress_callback(sent, total)
+
+    def _forget(self, transfer: _Transfer) -> None:
+        if transfer.key is not None and self._running_gets.get(transfer.key) is transfer:
+            del self._running_gets[transfer.key]
+
+    @staticmethod
+    def _getRequestKey(url: str, headers_dict: Optional[Dict[str, str]], scope: Optional[HttpRequestScope]) -> Tuple:
+        """Get what makes a GET request unique: its URL, and the headers that are sent with it, including the ones that
+        the scope adds."""
+
+        request = QNetworkRequest(QUrl(url))
+        for name, value in (headers_dict or {}).items():
+            request.setRawHeader(name.encode("utf-8"), value.encode("utf-8"))
+        if scope is not None:
+            scope.requestHook(request)
+        headers = tuple(sorted((bytes(name), bytes(request.rawHeader(name))) for name in request.rawHeaderList()))
+        return url, headers
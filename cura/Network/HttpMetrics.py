@@ -0,0 +1,103 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import re
+from collections import deque
+from typing import Any, Deque, Dict
+from urllib.parse import urlsplit
+
+
+class EndpointMetrics:
+    """The latencies and failures of the requests to one endpoint."""
+
+    SampleCount = 200  # How many of the last latencies are kept to compute the percentiles.
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.coalesced = 0  # Requests that were answered by an identical request that was already running.
+        self.not_modified = 0  # Revalidated requests of which the reply didn't change, so it wasn't sent again.
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._samples = deque(maxlen = self.SampleCount)  # type: Deque[float]
+
+    def addRequest(self, latency: float, failed: bool, retries: int) -> None:
+        """
+        :param latency: How long the request took, from sending it the first time until the last reply, in seconds.
+        :param failed: Whether the request failed, also after retrying.
+        :param retries: How often the request was sent again.
+        """
+
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.retries += retries
+        self.total_time += latency
+        self.max_time = max(self.max_time, latency)
+        self._samples.append(latency)
+
+    def getPercentile(self, fraction: float) -> float:
+        """Get a percentile of the latency of the last requests, in seconds."""
+
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "coalesced": self.coalesced,
+            "not_modified": self.not_modified,
+            "mean": round(self.total_time / self.count, 4) if self.count else 0.0,
+            "p50": round(self.getPercentile(0.5), 4),
+            "p90": round(self.getPercentile(0.9), 4),
+            "p99": round(self.getPercentile(0.99), 4),
+            "max": round(self.max_time, 4)
+        }
+
+
+class HttpMetrics:
+    """Collects the latency of HTTP requests per endpoint.
+
+    An endpoint is the method, host and path of a request. Parts of the path that look like IDs are replaced with {id},
+    so that for instance the status of every cluster counts as the same endpoint.
+    """
+
+    _id_pattern = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|(?=.*\d)[\w.~-]{20,})$")
+
+    def __init__(self) -> None:
+        self._endpoints = {}  # type: Dict[str, EndpointMetrics]
+
+    @classmethod
+    def getEndpoint(cls, method: str, url: str) -> str:
+        parts = urlsplit(url)
+        path = "/".join("{id}" if cls._id_pattern.match(segment) else segment for segment in parts.path.split("/"))
+        return "{method} {host}{path}".format(method = method.upper(), host = parts.netloc, path = path)
+
+    def addRequest(self, endpoint: str, latency: float, failed: bool, retries: int = 0) -> None:
+        self._getEndpointMetrics(endpoint).addRequest(latency, failed, retries)
+
+    def addCoalesced(self, endpoint: str) -> None:
+        self._getEndpointMetrics(endpoint).coalesced += 1
+
+    def addNotModified(self, endpoint: str) -> None:
+        self._getEndpointMetrics(endpoint).not_modified += 1
+
+    def toDict(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of every endpoint, by endpoint. Latencies are in seconds."""
+
+        return {endpoint: metrics.toDict() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def clear(self) -> None:
+        self._endpoints.clear()
+
+    def _getEndpointMetrics(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self._endpoints[endpoint] = metrics
+        return metrics
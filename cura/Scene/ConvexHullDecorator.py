@@ -4,6 +4,7 @@
 from PyQt6.QtCore import QTimer
 
 from UM.Application import Application
+from UM.Math.Matrix import Matrix
 from UM.Math.Polygon import Polygon
 from UM.Scene.SceneNodeDecorator import SceneNodeDecorator
 from UM.Settings.ContainerRegistry import ContainerRegistry
@@ -12,14 +13,15 @@ from cura.Settings.ExtruderManager import ExtruderManager
 from cura.Scene import ConvexHullNode
 
 import numpy
+import weakref
+from collections import OrderedDict
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from UM.Scene.SceneNode import SceneNode
     from cura.Settings.GlobalStack import GlobalStack
     from UM.Mesh.MeshData import MeshData
-    from UM.Math.Matrix import Matrix
 
 
 class ConvexHullDecorator(SceneNodeDecorator):
@@ -28,6 +30,13 @@ class ConvexHullDecorator(SceneNodeDecorator):
     If a scene node has a convex hull decorator, it will have a shadow in which other objects can not be printed.
     """
 
+    # The convex hulls of meshes without their translation, shared by all nodes with the same mesh data, such as copies
+    # made with "Multiply Selected". Per mesh, the hulls are stored by the rotation and scale they were computed for.
+    # Mesh data is immutable, so a node that gets a modified mesh automatically stops sharing the hull.
+    # Only the most recently used hulls are kept per mesh, since rotating or scaling a node computes a hull every frame.
+    _shared_mesh_hulls = {}  # type: Dict[int, Tuple[weakref.ref, OrderedDict[bytes, Polygon]]]
+    _max_shared_hulls_per_mesh = 8
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -271,35 +280,25 @@ class ConvexHullDecorator(SceneNodeDecorator):
             if mesh is self._2d_convex_hull_mesh and world_transform == self._2d_convex_hull_mesh_world_transform:
                 return self._offsetHull(self._2d_convex_hull_mesh_result)
 
-            vertex_data = mesh.getConvexHullTransformedVertices(world_transform)
-            # Don't use data below 0.
-            # TODO; We need a better check for this as this gives poor results for meshes with long edges.
-            # Do not throw away vertices: the convex hull may be too small and objects can collide.
-            # vertex_data = vertex_data[vertex_data[:,1] >= -0.01]
-
-            if vertex_data is not None and len(vertex_data) >= 4:  # type: ignore # mypy and numpy don't play along well just yet.
-                # Round the vertex data to 1/10th of a mm, then remove all duplicate vertices
-                # This is done to greatly speed up further convex hull calculations as the convex hull
-                # becomes much less complex when dealing with highly detailed models.
-                vertex_data = numpy.round(vertex_data, 1)
-
-                vertex_data = vertex_data[:, [0, 2]]  # Drop the Y components to project to 2D.
-
-                # Grab the set of unique points.
-                #
-                # This basically finds the unique rows in the array by treating them as opaque groups of bytes
-                # which are as long as the 2 float64s in each row, and giving this view to numpy.unique() to munch.
-                # See http://stackoverflow.com/questions/16970982/find-unique-rows-in-numpy-array
-                vertex_byte_view = numpy.ascontiguousarray(vertex_data).view(
-                    numpy.dtype((numpy.void, vertex_data.dtype.itemsize * vertex_data.shape[1])))
-                _, idx = numpy.unique(vertex_byte_view, return_index = True)
-                vertex_data = vertex_data[idx]  # Select the unique rows by index.
-
-                hull = Polygon(vertex_data)
+            # Nodes with the same mesh, rotation and scale have the same convex hull, except for its position.
+            transform_data = world_transform.getData()
+            translation = transform_data[:3, 3]
+            rotation_scale_key = transform_data[:3, :3].tobytes()
+            mesh_hulls = self._getSharedMeshHulls(mesh)
+            local_convex_hull = mesh_hulls.get(rotation_scale_key)
+            if local_convex_hull is None:
+                local_transform_data = transform_data.copy()
+                local_transform_data[:3, 3] = 0
+                local_convex_hull = self._computeMeshConvexHull(mesh, Matrix(local_transform_data))
+                mesh_hulls[rotation_scale_key] = local_convex_hull
+                if len(mesh_hulls) > self._max_shared_hulls_per_mesh:
+                    mesh_hulls.popitem(last = False)  # The least recently used.
+            else:
+                mesh_hulls.move_to_end(rotation_scale_key)
 
-                if len(vertex_data) >= 3:
-                    convex_hull = hull.getConvexHull()
-                    offset_hull = self._offsetHull(convex_hull)
+            if len(local_convex_hull.getPoints()) >= 3:
+                convex_hull = local_convex_hull.translate(translation[0], translation[2])
+                offset_hull = self._offsetHull(convex_hull)
 
             # Store the result in the cache
             self._2d_convex_hull_mesh = mesh
@@ -308,6 +307,53 @@ class ConvexHullDecorator(SceneNodeDecorator):
 
             return offset_hull
 
+    @classmethod
+    def _getSharedMeshHulls(cls, mesh: "MeshData") -> "OrderedDict[bytes, Polygon]":
+        """Get the convex hulls that were last computed for a mesh, by the rotation and scale they were computed for,
+        from least to most recently used."""
+
+        mesh_id = id(mesh)
+        entry = cls._shared_mesh_hulls.get(mesh_id)
+        if entry is None or entry[0]() is not mesh:
+            # Forget the hulls as soon as the mesh is deleted, also so that its id can't be confused with a new mesh.
+            entry = (weakref.ref(mesh, lambda _: cls._shared_mesh_hulls.pop(mesh_id, None)), OrderedDict())
+            cls._shared_mesh_hulls[mesh_id] = entry
+        return entry[1]
+
+    @staticmethod
+    def _computeMeshConvexHull(mesh: "MeshData", transform: Matrix) -> Polygon:
+        """Compute the 2D convex hull of a transformed mesh, without any offsets."""
+
+        vertex_data = mesh.getConvexHullTransformedVertices(transform)
+        # Don't use data below 0.
+        # TODO; We need a better check for this as this gives poor results for meshes with long edges.
+        # Do not throw away vertices: the convex hull may be too small and objects can collide.
+        # vertex_data = vertex_data[vertex_data[:,1] >= -0.01]
+
+        if vertex_data is None or len(vertex_data) < 4:  # type: ignore # mypy and numpy don't play along well just yet.
+            return Polygon([])
+
+        # Round the vertex data to 1/10th of a mm, then remove all duplicate vertices
+        # This is done to greatly speed up further convex hull calculations as the convex hull
+        # becomes much less complex when dealing with highly detailed models.
+        vertex_data = numpy.round(vertex_data, 1)
+
+        vertex_data = vertex_data[:, [0, 2]]  # Drop the Y components to project to 2D.
+
+        # Grab the set of unique points.
+        #
+        # This basically finds the unique rows in the array by treating them as opaque groups of bytes
+        # which are as long as the 2 float64s in each row, and giving this view to numpy.unique() to munch.
+        # See http://stackoverflow.com/questions/16970982/find-unique-rows-in-numpy-array
+        vertex_byte_view = numpy.ascontiguousarray(vertex_data).view(
+            numpy.dtype((numpy.void, vertex_data.dtype.itemsize * vertex_data.shape[1])))
+        _, idx = numpy.unique(vertex_byte_view, return_index = True)
+        vertex_data = vertex_data[idx]  # Select the unique rows by index.
+
+        if len(vertex_data) < 3:
+            return Polygon([])
+        return Polygon(vertex_data).getConvexHull()
+
     def _getHeadAndFans(self) -> Polygon:
         if not self._global_stack:
             return Polygon()
@@ -0,0 +1,132 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import re
+from typing import Dict, IO, Iterable, Iterator, List, MutableSequence, Optional, Tuple, Union, overload
+
+
+class _GCodeChunk:
+    """A single piece of g-code as received from the engine, with the locations of the placeholders in it."""
+
+    __slots__ = ("data", "placeholders")
+
+    def __init__(self, data: Union[bytes, str], placeholders: Optional[List[Tuple[int, int, str]]] = None) -> None:
+        self.data = data
+        self.placeholders = placeholders  # List of (start, end, name) byte positions, or None if there are none.
+
+
+class GCodeBuffer(MutableSequence[str]):
+    """Stores the g-code of a build plate as a sequence of chunks, the way CuraEngine sends it.
+
+    The chunks are kept as the raw UTF-8 bytes that were received. While receiving, the positions of the post-slice
+    placeholders (like {print_time}) are recorded. The placeholder values only become known after slicing has finished
+    and are filled in when a chunk is read, so the whole g-code is never copied to substitute them.
+
+    This behaves like the list of strings that was used before, so writers and post-processing scripts can index,
+    iterate and modify it as such. Chunks that are replaced through the sequence interface are stored as strings.
+    """
+
+    PLACEHOLDERS = ("print_time", "filament_amount", "filament_weight", "filament_cost", "jobname")
+
+    _placeholder_regex = re.compile(rb"\{(" + b"|".join(name.encode("ascii") for name in PLACEHOLDERS) + rb")\}")
+
+    def __init__(self, lines: Optional[Iterable[str]] = None) -> None:
+        self._chunks = []  # type: List[_GCodeChunk]
+        self._placeholder_values = {}  # type: Dict[str, str]
+        if lines is not None:
+            for line in lines:
+                self.append(line)
+
+    def appendRaw(self, data: bytes) -> None:
+        """Add a chunk of UTF-8 encoded g-code at the end, as received from the engine."""
+
+        self._chunks.append(self._createRawChunk(data))
+
+    def prependRaw(self, data: bytes) -> None:
+        """Add a chunk of UTF-8 encoded g-code at the start, like the g-code prefix (header) of the engine."""
+
+        self._chunks.insert(0, self._createRawChunk(data))
+
+    def _createRawChunk(self, data: bytes) -> _GCodeChunk:
+        placeholders = None
+        if b"{" in data:
+            placeholders = [(match.start(), match.end(), match.group(1).decode("ascii")) for match in self._placeholder_regex.finditer(data)]
+        return _GCodeChunk(data, placeholders or None)
+
+    def setPlaceholderValues(self, values: Dict[str, str]) -> None:
+        """Set the values of the placeholders, which get substituted when the g-code is read.
+
+        :param values: The values to substitute per placeholder name, e.g. {"print_time": "PT1H"}.
+        """
+
+        self._placeholder_values = dict(values)
+
+    def getPlaceholderValues(self) -> Dict[str, str]:
+        return dict(self._placeholder_values)
+
+    def _materialise(self, chunk: _GCodeChunk) -> str:
+        if isinstance(chunk.data, str):
+            return chunk.data
+        if chunk.placeholders is None or not self._placeholder_values:
+            return chunk.data.decode("utf-8", "replace")
+
+        parts = []  # type: List[bytes]
+        position = 0
+        for start, end, name in chunk.placeholders:
+            value = self._placeholder_values.get(name)
+            if value is None:
+                continue
+            parts.append(chunk.data[position:start])
+            parts.append(value.encode("utf-8"))
+            position = end
+        parts.append(chunk.data[position:])
+        return b"".join(parts).decode("utf-8", "replace")
+
+    def writeTo(self, stream: IO[str]) -> None:
+        """Write the complete g-code to a text stream, one chunk at a time."""
+
+        for chunk in self._chunks:
+            stream.write(self._materialise(chunk))
+
+    def getByteSize(self) -> int:
+        """Get the amount of memory that the g-code chunks take, without substitutions."""
+
+        return sum(len(chunk.data) for chunk in self._chunks)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialise(chunk) for chunk in self._chunks[index]]
+        return self._materialise(self._chunks[index])
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            self._chunks[index] = [_GCodeChunk(line) for line in value]
+        else:
+            self._chunks[index] = _GCodeChunk(value)
+
+    def __delitem__(self, index) -> None:
+        del self._chunks[index]
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._chunks:
+            yield self._materialise(chunk)
+
+    def insert(self, index: int, value: str) -> None:
+        self._chunks.insert(index, _GCodeChunk(value))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (GCodeBuffer, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "<GCodeBuffer chunks={chunks} bytes={size}>".format(chunks = len(self._chunks), size = self.getByteSize())
@@ -4,6 +4,8 @@
 import os
 import re
 import configparser
+import json
+import time
 
 from typing import Any, cast, Dict, Optional, List, Union, Tuple
 from PyQt6.QtWidgets import QMessageBox
@@ -13,6 +15,7 @@ from UM.Settings.ContainerFormatError import ContainerFormatError
 from UM.Settings.Interfaces import ContainerInterface
 from UM.Settings.ContainerRegistry import ContainerRegistry
 from UM.Settings.ContainerStack import ContainerStack
+from UM.Settings.DefinitionContainer import DefinitionContainer
 from UM.Settings.InstanceContainer import InstanceContainer
 from UM.Settings.SettingInstance import SettingInstance
 from UM.Logger import Logger
@@ -35,6 +38,8 @@ from UM.i18n import i18nCatalog
 from .DatabaseHandlers.IntentDatabaseHandler import IntentDatabaseHandler
 from .DatabaseHandlers.QualityDatabaseHandler import QualityDatabaseHandler
 from .DatabaseHandlers.VariantDatabaseHandler import VariantDatabaseHandler
+from .MetadataCache import MetadataCache
+from .MetadataIndex import MetadataIndex
 
 catalog = i18nCatalog("cura")
 
@@ -43,6 +48,14 @@ class CuraContainerRegistry(ContainerRegistry):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Connected first, so that the index is up to date when the other listeners search for containers.
+        # Every way that the metadata of the registry changes must update the index, see also addMetadata.
+        self._metadata_index = MetadataIndex()
+        self.containerAdded.connect(self._onContainerAddedToIndex)
+        self.containerMetaDataChanged.connect(self._onContainerAddedToIndex)
+        self.containerRemoved.connect(self._onContainerRemovedFromIndex)
+        self.containerLoadComplete.connect(self._onContainerLoadedToIndex)  # Loading a container replaces its metadata.
+
         # We don't have all the machines loaded in the beginning, so in order to add the missing extruder stack
         # for single extrusion machines, we subscribe to the containerAdded signal, and whenever a global stack
         # is added, we check to see if an extruder stack needs to be added.
@@ -368,6 +381,34 @@ class CuraContainerRegistry(ContainerRegistry):
         # If it hasn't returned by now, none of the plugins loaded the profile successfully.
         return {"status": "error", "message": catalog.i18nc("@info:status", "Profile {0} has an unknown file type or is corrupted.", file_name)}
 
+    @override(ContainerRegistry)
+    def findInstanceContainersMetadata(self, *, ignore_case: bool = False, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Find the metadata of instance containers, using an index of the entries that are searched for most.
+
+        Falls back to searching through all metadata for searches that the index doesn't support, like searching with
+        wildcards or ignoring case.
+        """
+
+        if not ignore_case:
+            result = self._metadata_index.find(self.metadata, kwargs)
+            if result is not None:
+                return result
+        return super().findInstanceContainersMetadata(ignore_case = ignore_case, **kwargs)
+
+    def _onContainerAddedToIndex(self, container: ContainerInterface) -> None:
+        self._metadata_index.updateContainer(container.getId(), self.metadata)
+
+    def _onContainerRemovedFromIndex(self, container: ContainerInterface) -> None:
+        self._metadata_index.removeContainer(container.getId(), self.metadata)
+
+    def _onContainerLoadedToIndex(self, container_id: str) -> None:
+        self._metadata_index.updateContainer(container_id, self.metadata)
+
+    @override(ContainerRegistry)
+    def addMetadata(self, metadata: Dict[str, Any]) -> None:
+        super().addMetadata(metadata)
+        self._metadata_index.updateContainer(metadata["id"], self.metadata)  # The registry doesn't signal this.
+
     @override(ContainerRegistry)
     def load(self) -> None:
         super().load()
@@ -376,7 +417,12 @@ class CuraContainerRegistry(ContainerRegistry):
 
     @override(ContainerRegistry)
     def loadAllMetadata(self) -> None:
-        super().loadAllMetadata()
+        metadata_cache = MetadataCache.getInstance()
+        metadata_cache.resetStatistics()
+        start_time = time.monotonic()
+        with metadata_cache.batch():
+            super().loadAllMetadata()
+        Logger.log("i", metadata_cache.recordLoadTime(time.monotonic() - start_time))
         self._cleanUpInvalidQualityChanges()
 
     def _cleanUpInvalidQualityChanges(self) -> None:
@@ -855,3 +901,53 @@ class CuraContainerRegistry(ContainerRegistry):
     @override(ContainerRegistry)
     def getInstance(cls, *args, **kwargs) -> "CuraContainerRegistry":
         return cast(CuraContainerRegistry, super().getInstance(*args, **kwargs))
+
+
+_inherits_regex = re.compile(r'"inherits"\s*:\s*"([^"]*)"')
+
+
+def _getParentMetadataKey(serialized: str) -> str:
+    """Get what the metadata of a definition depends on besides its own file: the metadata of the definition it inherits
+    from.
+
+    :param serialized: The JSON of the definition.
+    :return: The metadata of the parent definition as JSON, or an empty string if it doesn't inherit from anything.
+    """
+
+    match = _inherits_regex.search(serialized)
+    if match is None:
+        return ""
+    parents = ContainerRegistry.getInstance().findDefinitionContainersMetadata(id = match.group(1))
+    if not parents:
+        return "missing"
+    return json.dumps(parents[0], sort_keys = True, default = str)
+
+
+_uraniumDeserializeDefinitionMetadata = DefinitionContainer.deserializeMetadata.__func__
+
+
+def _deserializeDefinitionMetadata(cls, serialized: str, container_id: str) -> List[Dict[str, Any]]:
+    """Get the metadata of a definition file, taking it from the metadata cache if the file was parsed before.
+
+    Uranium has no way to extend how definitions are read, so this replaces DefinitionContainer.deserializeMetadata.
+    Since the metadata of a definition includes the metadata it inherits, the cache entry also depends on its parent.
+    """
+
+    metadata_cache = MetadataCache.getInstance()
+    cache_key = _getParentMetadataKey(serialized) + "\n" + serialized
+    cached = metadata_cache.get("definition", container_id, cache_key)
+    if cached is not None:
+        for metadata in cached:
+            metadata["container_type"] = DefinitionContainer  # The class can't be stored as JSON.
+        return cached
+
+    result = _uraniumDeserializeDefinitionMetadata(cls, serialized, container_id)
+    if result:
+        try:
+            metadata_cache.put("definition", container_id, cache_key, [{key: value for key, value in metadata.items() if key != "container_type"} for metadata in result])
+        except (TypeError, ValueError):  # Not all metadata could be stored as JSON.
+            Logger.log("w", "Could not cache the metadata of definition {definition_id}.".format(definition_id = container_id))
+    return result
+
+
+DefinitionContainer.deserializeMetadata = classmethod(_deserializeDefinitionMetadata)
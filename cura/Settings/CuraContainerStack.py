@@ -14,6 +14,7 @@ from UM.Settings.DefinitionContainer import DefinitionContainer
 from UM.Settings.ContainerRegistry import ContainerRegistry
 from UM.Settings.Interfaces import ContainerInterface, DefinitionContainerInterface
 from cura.Settings import cura_empty_instance_containers
+from cura.Settings.FormulaEvaluationMemo import FormulaEvaluationMemo
 
 from . import Exceptions
 
@@ -400,7 +401,12 @@ class CuraContainerStack(ContainerStack):
                 self._settable_per_extruder_cache[key] = super().getProperty(key, property_name, context)
                 return self._settable_per_extruder_cache[key]
 
-        return super().getProperty(key, property_name, context)
+        # The formulas that are evaluated for this property share the extruder lookups of the formula functions.
+        FormulaEvaluationMemo.beginPass()
+        try:
+            return super().getProperty(key, property_name, context)
+        finally:
+            FormulaEvaluationMemo.endPass()
 
     def getValue(self, key: str, context = None) -> Any:
         return self.getProperty(key, "value", context)
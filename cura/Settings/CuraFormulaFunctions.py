@@ -1,12 +1,14 @@
 # Copyright (c) 2018 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
 
 from UM.Settings.PropertyEvaluationContext import PropertyEvaluationContext
 from UM.Settings.SettingFunction import SettingFunction
 from UM.Logger import Logger
 
+from cura.Settings.FormulaEvaluationMemo import FormulaEvaluationMemo
+
 if TYPE_CHECKING:
     from cura.CuraApplication import CuraApplication
     from cura.Settings.CuraContainerStack import CuraContainerStack
@@ -21,6 +23,32 @@ class CuraFormulaFunctions:
     def __init__(self, application: "CuraApplication") -> None:
         self._application = application
 
+        # Hit/miss counters of the per-evaluation memos, aggregated over all evaluation passes.
+        self._memo_statistics = {"hits": 0, "misses": 0}  # type: Dict[str, int]
+
+    # Gets the hit and miss counters of the extruder lookups that were cached during evaluation passes.
+    def getMemoStatistics(self) -> Dict[str, int]:
+        return dict(self._memo_statistics)
+
+    def resetMemoStatistics(self) -> None:
+        self._memo_statistics["hits"] = 0
+        self._memo_statistics["misses"] = 0
+
+    # Gets the memo of the evaluation pass that the context belongs to, or of the one that runs on this thread if
+    # there is no context, like when a formula calls the functions.
+    def _getMemo(self, context: Optional["PropertyEvaluationContext"]) -> Optional[FormulaEvaluationMemo]:
+        if context is None:
+            return FormulaEvaluationMemo.fromCurrentPass(self._memo_statistics)
+        return FormulaEvaluationMemo.fromContext(context, self._memo_statistics)
+
+    def _getMemoKeySuffix(self, context: Optional["PropertyEvaluationContext"]) -> Tuple[Optional[int], FrozenSet[str]]:
+        # Values evaluated from a different container index differ, so they need to be cached separately. So do values
+        # evaluated while a setting is being resolved, since the global stack gives its value instead of its resolve then.
+        start_index = context.context.get("evaluate_from_container_index") if context is not None else None
+        global_stack = self._application.getMachineManager().activeMachine
+        resolving = global_stack.getResolvingSettings() if global_stack is not None else frozenset()
+        return start_index, resolving
+
     # ================
     # Custom Functions
     # ================
@@ -52,6 +80,15 @@ class CuraFormulaFunctions:
             Logger.log("w", "Value for %s of extruder %s was requested, but that extruder is not available. " % (property_key, extruder_position))
             return None
 
+        memo = self._getMemo(context)
+        if memo is None:
+            return self._evaluateInExtruder(extruder_stack, property_key, context)
+        memo_key = ("extruder_value", extruder_stack.getId(), property_key, self._getMemoKeySuffix(context))
+        return memo.lookup(memo_key, lambda: self._evaluateInExtruder(extruder_stack, property_key, context))
+
+    @staticmethod
+    def _evaluateInExtruder(extruder_stack: "CuraContainerStack", property_key: str,
+                            context: Optional["PropertyEvaluationContext"] = None) -> Any:
         value = extruder_stack.getRawProperty(property_key, "value", context = context)
         if isinstance(value, SettingFunction):
             value = value(extruder_stack, context = context)
@@ -62,6 +99,13 @@ class CuraFormulaFunctions:
         return value
 
     def _getActiveExtruders(self, context: Optional["PropertyEvaluationContext"] = None) -> List[str]:
+        memo = self._getMemo(context)
+        if memo is None:
+            return self._findActiveExtruders(context)
+        # Copy the list, so callers can't modify the cached one.
+        return list(memo.lookup(("active_extruders", self._getMemoKeySuffix(context)), lambda: self._findActiveExtruders(context)))
+
+    def _findActiveExtruders(self, context: Optional["PropertyEvaluationContext"] = None) -> List[str]:
         machine_manager = self._application.getMachineManager()
         extruder_manager = self._application.getExtruderManager()
 
@@ -82,17 +126,20 @@ class CuraFormulaFunctions:
     def getValuesInAllExtruders(self, property_key: str,
                                 context: Optional["PropertyEvaluationContext"] = None) -> List[Any]:
         global_stack = self._application.getMachineManager().activeMachine
+        memo = self._getMemo(context)
+        memo_key_suffix = self._getMemoKeySuffix(context) if memo is not None else None
 
         result = []
         for extruder in self._getActiveExtruders(context):
-            value = extruder.getRawProperty(property_key, "value", context = context)
+            if memo is None:
+                value = self._evaluateRawInExtruder(extruder, property_key, context)
+            else:
+                memo_key = ("extruder_raw_value", extruder.getId(), property_key, memo_key_suffix)
+                value = memo.lookup(memo_key, lambda: self._evaluateRawInExtruder(extruder, property_key, context))
 
             if value is None:
                 continue
 
-            if isinstance(value, SettingFunction):
-                value = value(extruder, context = context)
-
             result.append(value)
 
         if not result:
@@ -100,6 +147,14 @@ class CuraFormulaFunctions:
 
         return result
 
+    @staticmethod
+    def _evaluateRawInExtruder(extruder: "CuraContainerStack", property_key: str,
+                               context: Optional["PropertyEvaluationContext"] = None) -> Any:
+        value = extruder.getRawProperty(property_key, "value", context = context)
+        if isinstance(value, SettingFunction):
+            value = value(extruder, context = context)
+        return value
+
     # Get the first extruder that adheres to a specific (boolean) property, like 'material_is_support_material'.
     def getAnyExtruderPositionWithOrDefault(self, filter_key: str,
                                             context: Optional["PropertyEvaluationContext"] = None) -> str:
@@ -124,9 +179,12 @@ class CuraFormulaFunctions:
         machine_manager = self._application.getMachineManager()
 
         global_stack = machine_manager.activeMachine
-        resolved_value = global_stack.getProperty(property_key, "value", context = context)
+        memo = self._getMemo(context)
+        if memo is None:
+            return global_stack.getProperty(property_key, "value", context = context)
 
-        return resolved_value
+        memo_key = ("resolve_or_value", property_key, self._getMemoKeySuffix(context))
+        return memo.lookup(memo_key, lambda: global_stack.getProperty(property_key, "value", context = context))
 
     # Gets the default setting value from given extruder position. The default value is what excludes the values in
     # the user_changes container.
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from UM.Settings.PropertyEvaluationContext import PropertyEvaluationContext
+
+
+class FormulaEvaluationMemo:
+    """Caches the lookups done by the Cura formula functions for the duration of one evaluation pass.
+
+    A single setting value can trigger thousands of calls to functions like extruderValues(), which each walk the
+    active extruders and evaluate the same raw setting functions over and over again.
+
+    When the formula functions get an evaluation context, the memo is stored in the context dictionary of the
+    PropertyEvaluationContext, so it lives exactly as long as the evaluation that created that context. Formulas call
+    the functions without a context though. For those, the stacks mark an evaluation pass with beginPass and endPass
+    around every property they get, and the memo lives until the outermost of those calls on the thread returns.
+    Nothing can change the settings while a single property is being evaluated on a thread.
+    """
+
+    CONTEXT_KEY = "cura_formula_memo"
+
+    # The evaluation pass of every thread: how deep the stacks are nested in getting properties, and its memo.
+    _current_pass = threading.local()
+
+    def __init__(self, statistics: Optional[Dict[str, int]] = None) -> None:
+        """
+        :param statistics: Optional dictionary with "hits" and "misses" counters that are shared between memos, to
+            aggregate the counters over many evaluation passes.
+        """
+
+        self._values = {}  # type: Dict[Hashable, Any]
+        self._statistics = statistics
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def fromContext(cls, context: Optional["PropertyEvaluationContext"], statistics: Optional[Dict[str, int]] = None) -> Optional["FormulaEvaluationMemo"]:
+        """Get the memo of an evaluation context, creating it if the context doesn't have one yet.
+
+        :param context: The context of the evaluation pass. Without a context there is no pass to cache for.
+        :param statistics: Shared counters to use when a new memo is created.
+        :return: The memo of the context, or None if no context was given.
+        """
+
+        if context is None:
+            return None
+        memo = context.context.get(cls.CONTEXT_KEY)
+        if memo is None:
+            memo = cls(statistics)
+            context.context[cls.CONTEXT_KEY] = memo
+        return memo
+
+    @classmethod
+    def beginPass(cls) -> None:
+        """Start evaluating a property on this thread, or nest in the evaluation that is already running."""
+
+        current_pass = cls._current_pass
+        current_pass.depth = getattr(current_pass, "depth", 0) + 1
+
+    @classmethod
+    def endPass(cls) -> None:
+        """Finish evaluating a property on this thread. Drops the memo once the outermost evaluation is finished."""
+
+        current_pass = cls._current_pass
+        current_pass.depth -= 1
+        if current_pass.depth == 0:
+            current_pass.memo = None
+
+    @classmethod
+    def fromCurrentPass(cls, statistics: Optional[Dict[str, int]] = None) -> Optional["FormulaEvaluationMemo"]:
+        """Get the memo of the evaluation pass that is running on this thread, creating it if needed.
+
+        :param statistics: Shared counters to use when a new memo is created.
+        :return: The memo of the pass, or None if no property is being evaluated on this thread.
+        """
+
+        current_pass = cls._current_pass
+        if getattr(current_pass, "depth", 0) == 0:
+            return None
+        memo = getattr(current_pass, "memo", None)
+        if memo is None:
+            memo = cls(statistics)
+            current_pass.memo = memo
+        return memo
+
+    def lookup(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a cached value, or compute and cache it if it hasn't been computed in this pass yet.
+
+        :param key: The key to cache the value under.
+        :param compute: The function that computes the value if it is not cached.
+        :return: The (cached) value.
+        """
+
+        try:
+            value = self._values[key]
+        except KeyError:
+            self.misses += 1
+            if self._statistics is not None:
+                self._statistics["misses"] += 1
+            value = compute()
+            self._values[key] = value
+            return value
+
+        self.hits += 1
+        if self._statistics is not None:
+            self._statistics["hits"] += 1
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
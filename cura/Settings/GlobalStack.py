@@ -3,7 +3,7 @@
 
 from collections import defaultdict
 import threading
-from typing import Any, Dict, Optional, Set, TYPE_CHECKING, List
+from typing import Any, Dict, FrozenSet, Optional, Set, TYPE_CHECKING, List
 import uuid
 
 from PyQt6.QtCore import pyqtProperty, pyqtSlot, pyqtSignal
@@ -260,6 +260,11 @@ class GlobalStack(CuraContainerStack):
 
         raise Exceptions.InvalidOperationError("Global stack cannot have a next stack!")
 
+    def getResolvingSettings(self) -> FrozenSet[str]:
+        """Get the keys of the settings of which the resolve is being evaluated on this thread."""
+
+        return frozenset(self._resolving_settings[threading.current_thread().name])
+
     # Determine whether or not we should try to get the "resolve" property instead of the
     # requested property.
     def _shouldResolve(self, key: str, property_name: str, context: Optional[PropertyEvaluationContext] = None) -> bool:
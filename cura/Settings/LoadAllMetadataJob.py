@@ -0,0 +1,24 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from typing import TYPE_CHECKING
+
+from UM.Job import Job
+
+if TYPE_CHECKING:
+    from cura.Settings.CuraContainerRegistry import CuraContainerRegistry
+
+
+class LoadAllMetadataJob(Job):
+    """Loads the metadata of all containers on a worker thread.
+
+    Nothing else may use the container registry until the job is finished. Its finished signal is emitted on the main
+    thread.
+    """
+
+    def __init__(self, container_registry: "CuraContainerRegistry") -> None:
+        super().__init__()
+        self._container_registry = container_registry
+
+    def run(self) -> None:
+        self._container_registry.loadAllMetadata()
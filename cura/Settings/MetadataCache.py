@@ -0,0 +1,204 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from UM.Logger import Logger
+from UM.Resources import Resources
+
+
+class MetadataCache:
+    """Keeps what was parsed from container files between runs, so that unchanged files don't need to be parsed again.
+
+    Entries are stored per kind of container and per container ID. An entry is only used if the contents of the file
+    are the same as when it was stored, which is checked with the size and a hash of the contents, and if it was
+    stored by a Cura with the same setting version.
+
+    Every load of all metadata is also timed, so that the time to load with the cache can be compared to the time it
+    took when nothing could be taken from the cache.
+
+    When the cache is opened, entries of another setting version are removed, as well as entries that weren't used for
+    MaxEntryAge seconds, e.g. because their file was removed. Only the last MaxTimings load times are kept, besides the
+    last cold and warm load.
+    """
+
+    # Increase this whenever the data stored in the cache changes shape, to throw away the old entries.
+    CacheVersion = 1
+    # Increase this whenever the tables change, to create them again.
+    SchemaVersion = 2
+
+    MaxEntryAge = 30 * 24 * 60 * 60  # A month.
+    MaxTimings = 20
+
+    __instance = None  # type: Optional[MetadataCache]
+
+    def __init__(self, database_path: Optional[str] = None, setting_version: Optional[int] = None) -> None:
+        """
+        :param database_path: Where to store the cache. By default it's stored in the cache storage of Cura.
+        :param setting_version: The setting version of the entries. By default the one of the running Cura.
+        """
+        if setting_version is None:
+            from cura.CuraApplication import CuraApplication
+            setting_version = CuraApplication.SettingVersion
+        self._version = "{cache}-{setting}".format(cache = self.CacheVersion, setting = setting_version)
+
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self._hits = 0
+        self._misses = 0
+        self._entries = {}  # type: Dict[Tuple[str, str], Tuple[str, int, str]]  # The digest, size and data of each (kind, container ID).
+        self._used_entries = set()  # type: Set[Tuple[str, str]]  # Entries that were taken from the cache, but not marked as used yet.
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        if database_path is None:
+            database_path = os.path.join(Resources.getCacheStoragePath(), "metadata_cache.db")
+        self._open(database_path)
+
+    @classmethod
+    def getInstance(cls) -> "MetadataCache":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _open(self, database_path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(database_path), exist_ok = True)
+            self._connection = sqlite3.connect(database_path, check_same_thread = False)
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.SchemaVersion:
+                self._connection.execute("DROP TABLE IF EXISTS entries")
+                self._connection.execute("DROP TABLE IF EXISTS timings")
+                self._connection.execute("PRAGMA user_version = {version}".format(version = self.SchemaVersion))
+            self._connection.execute("CREATE TABLE IF NOT EXISTS entries (kind TEXT, id TEXT, digest TEXT, size INTEGER, version TEXT, data TEXT, last_used REAL, PRIMARY KEY (kind, id))")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS timings (timestamp REAL, hits INTEGER, misses INTEGER, duration REAL)")
+            self._prune()
+            for kind, container_id, digest, size, data in self._connection.execute("SELECT kind, id, digest, size, data FROM entries WHERE version = ?", (self._version, )):
+                self._entries[(kind, container_id)] = (digest, size, data)
+            self._connection.commit()
+        except (OSError, sqlite3.Error) as e:
+            Logger.log("w", "Unable to use the metadata cache at {path}, so all metadata will be parsed: {err}".format(path = database_path, err = str(e)))
+            self._connection = None
+
+    def _prune(self) -> None:
+        """Remove the entries that won't be used anymore, and the load times that won't be compared to anymore."""
+
+        self._connection.execute("DELETE FROM entries WHERE version != ? OR last_used < ?", (self._version, time.time() - self.MaxEntryAge))
+        self._connection.execute("""DELETE FROM timings WHERE rowid NOT IN (SELECT rowid FROM timings ORDER BY timestamp DESC LIMIT ?)
+                                    AND rowid NOT IN (SELECT rowid FROM timings WHERE hits = 0 AND misses > 0 ORDER BY timestamp DESC LIMIT 1)
+                                    AND rowid NOT IN (SELECT rowid FROM timings WHERE hits > 0 AND misses = 0 ORDER BY timestamp DESC LIMIT 1)""", (self.MaxTimings, ))
+
+    def _commit(self) -> None:
+        """Store the changes to the cache, and when the entries that were taken from it were last used."""
+
+        now = time.time()
+        self._connection.executemany("UPDATE entries SET last_used = ? WHERE kind = ? AND id = ?", ((now, kind, container_id) for kind, container_id in self._used_entries))
+        self._used_entries.clear()
+        self._connection.commit()
+
+    @staticmethod
+    def _getDigest(serialized: str) -> Tuple[str, int]:
+        encoded = serialized.encode("utf-8", errors = "surrogatepass")
+        return hashlib.sha1(encoded).hexdigest(), len(encoded)
+
+    def get(self, kind: str, container_id: str, serialized: str) -> Optional[Any]:
+        """Get what was parsed from a file before.
+
+        :param kind: The kind of container, to keep entries for different kinds of containers apart.
+        :param container_id: The ID of the container that the file is for.
+        :param serialized: The current contents of the file.
+        :return: The parsed data that was stored, or None if the file was not parsed before or changed since then.
+        """
+
+        digest, size = self._getDigest(serialized)
+        with self._lock:
+            entry = self._entries.get((kind, container_id))
+            if entry is None or entry[0] != digest or entry[1] != size:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._used_entries.add((kind, container_id))
+        return json.loads(entry[2])
+
+    def put(self, kind: str, container_id: str, serialized: str, data: Any) -> None:
+        """Store what was parsed from a file, for the next time the same file is parsed.
+
+        :param kind: The kind of container, to keep entries for different kinds of containers apart.
+        :param container_id: The ID of the container that the file is for.
+        :param serialized: The contents of the file that was parsed.
+        :param data: The parsed data. This has to be serializable to JSON.
+        """
+
+        digest, size = self._getDigest(serialized)
+        encoded_data = json.dumps(data)
+        with self._lock:
+            self._entries[(kind, container_id)] = (digest, size, encoded_data)
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute("INSERT OR REPLACE INTO entries (kind, id, digest, size, version, data, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                         (kind, container_id, digest, size, self._version, encoded_data, time.time()))
+                if not self._in_batch:
+                    self._commit()
+            except sqlite3.Error as e:
+                Logger.log("w", "Unable to store metadata of {container_id} in the cache: {err}".format(container_id = container_id, err = str(e)))
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Store everything that's put in the cache in one go at the end, instead of after every file."""
+
+        with self._lock:
+            was_in_batch = self._in_batch
+            self._in_batch = True
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_batch = was_in_batch
+                if not was_in_batch and self._connection is not None:
+                    try:
+                        self._commit()
+                    except sqlite3.Error as e:
+                        Logger.log("w", "Unable to store the metadata cache: {err}".format(err = str(e)))
+
+    def getStatistics(self) -> Tuple[int, int]:
+        """Get how many files could be taken from the cache and how many had to be parsed, since the last reset."""
+
+        with self._lock:
+            return self._hits, self._misses
+
+    def resetStatistics(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def recordLoadTime(self, duration: float) -> str:
+        """Remember how long it took to load all metadata, and compare it to the loads before.
+
+        :param duration: How long it took to load all metadata, in seconds.
+        :return: A report that compares the time of this load to the last cold load (where every file had to be
+            parsed) and the last warm load (where every file could be taken from the cache).
+        """
+
+        hits, misses = self.getStatistics()
+        report = "Loaded all metadata in {duration:.2f}s, with {hits} files from the cache and {misses} files parsed.".format(duration = duration, hits = hits, misses = misses)
+        with self._lock:
+            if self._connection is None:
+                return report
+            try:
+                last_cold = self._connection.execute("SELECT duration FROM timings WHERE hits = 0 AND misses > 0 ORDER BY timestamp DESC LIMIT 1").fetchone()
+                last_warm = self._connection.execute("SELECT duration FROM timings WHERE hits > 0 AND misses = 0 ORDER BY timestamp DESC LIMIT 1").fetchone()
+                self._connection.execute("INSERT INTO timings (timestamp, hits, misses, duration) VALUES (?, ?, ?, ?)", (time.time(), hits, misses, duration))
+                self._commit()
+            except sqlite3.Error as e:
+                Logger.log("w", "Unable to store the metadata load time: {err}".format(err = str(e)))
+                return report
+        if last_cold is not None:
+            report += " The last cold start took {duration:.2f}s.".format(duration = last_cold[0])
+        if last_warm is not None:
+            report += " The last warm start took {duration:.2f}s.".format(duration = last_warm[0])
+        return report
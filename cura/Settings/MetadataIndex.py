@@ -0,0 +1,169 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from UM.Settings.InstanceContainer import InstanceContainer
+
+metadata_type = Dict[str, Any]
+
+
+class MetadataIndex:
+    """Indexes the metadata of instance containers by the entries that the container tree searches for the most.
+
+    Looking up containers by their type, definition, variant, material, brand or GUID then only needs to look at the
+    containers with the requested values, instead of going through the metadata of every container.
+
+    The index keeps the containers in the same order as the metadata of the registry, so that the results are the same
+    as when searching through all metadata.
+    """
+
+    # The metadata entries to index.
+    IndexedKeys = ("type", "definition", "variant", "variant_name", "material", "base_file", "brand", "GUID", "quality_type")
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._index = {key: {} for key in self.IndexedKeys}  # type: Dict[str, Dict[str, List[Tuple[int, str]]]]  # For each key and value, the containers in the order of the registry.
+        self._indexed_values = {}  # type: Dict[str, Dict[str, str]]  # For each container, the values it's indexed by.
+        self._sequence_numbers = {}  # type: Dict[str, int]  # The position of each container in the metadata of the registry.
+        self._next_sequence_number = 0
+        self._indexed_count = -1  # How many containers the registry had when the index was built, or -1 if it needs to be built.
+
+    def find(self, all_metadata: Dict[str, metadata_type], filters: Dict[str, Any]) -> Optional[List[metadata_type]]:
+        """Find the metadata of the instance containers that match all filters.
+
+        :param all_metadata: The metadata of all containers in the registry, by container ID.
+        :param filters: The metadata entries to match. Containers match if they have all of these entries with the same
+            values.
+        :return: The metadata of the matching containers, in the same order as in the registry. None if the filters
+            can't be looked up in the index, for instance because they contain wildcards or aren't strings.
+        """
+
+        indexed_filters = []
+        for key, value in filters.items():
+            if key == "id" or not isinstance(value, str) or "*" in value:
+                return None  # Let the registry look up IDs (possibly loading them) and handle wildcards and other types.
+            if key in self._index:
+                indexed_filters.append((key, value))
+        if not indexed_filters:
+            return None
+
+        with self._lock:
+            if self._indexed_count != len(all_metadata):
+                self._build(all_metadata)
+            candidate_lists = []
+            for key, value in indexed_filters:
+                candidates = self._index[key].get(value)
+                if not candidates:
+                    return []
+                candidate_lists.append(candidates)
+            candidates = list(min(candidate_lists, key = len))
+
+        result = []
+        for _, container_id in candidates:
+            metadata = all_metadata.get(container_id)
+            # Check all filters again, since metadata can change before the index hears about it.
+            if metadata is not None and self._isInstanceContainer(metadata) and all(key in metadata and str(metadata[key]) == value for key, value in filters.items()):
+                result.append(metadata)
+        return result
+
+    def invalidate(self) -> None:
+        """Build the index again the next time it's used."""
+
+        with self._lock:
+            self._indexed_count = -1
+
+    def updateContainer(self, container_id: str, all_metadata: Dict[str, metadata_type]) -> None:
+        """Update the index for a container that was added, or of which the metadata changed.
+
+        :param container_id: The ID of the container.
+        :param all_metadata: The metadata of all containers in the registry, by container ID.
+        """
+
+        with self._lock:
+            if self._indexed_count < 0:
+                return  # Will be built completely anyway.
+            expected_count = self._indexed_count
+            if container_id not in self._sequence_numbers:
+                self._sequence_numbers[container_id] = self._next_sequence_number
+                self._next_sequence_number += 1
+                expected_count += 1
+            if len(all_metadata) != expected_count:  # Other containers were added or removed without updating the index.
+                self._indexed_count = -1
+                return
+            metadata = all_metadata.get(container_id)
+            if metadata is None or not self._isInstanceContainer(metadata):
+                self._removeFromIndex(container_id)
+            else:
+                self._addToIndex(container_id, metadata)
+            self._indexed_count = expected_count
+
+    def removeContainer(self, container_id: str, all_metadata: Dict[str, metadata_type]) -> None:
+        """Remove a container from the index that was removed from the registry.
+
+        :param container_id: The ID of the container.
+        :param all_metadata: The metadata of all containers in the registry, by container ID.
+        """
+
+        with self._lock:
+            if self._indexed_count < 0:
+                return
+            expected_count = self._indexed_count
+            if container_id in self._sequence_numbers:
+                self._removeFromIndex(container_id)
+                del self._sequence_numbers[container_id]
+                expected_count -= 1
+            self._indexed_count = expected_count if len(all_metadata) == expected_count else -1
+
+    def _build(self, all_metadata: Dict[str, metadata_type]) -> None:
+        self._index = {key: {} for key in self.IndexedKeys}
+        self._indexed_values = {}
+        self._sequence_numbers = {}
+        items = list(all_metadata.items())  # Copy in one go, in case containers are added in another thread.
+        for sequence_number, (container_id, metadata) in enumerate(items):
+            self._sequence_numbers[container_id] = sequence_number
+            if not self._isInstanceContainer(metadata):
+                continue
+            values = {}
+            for key in self.IndexedKeys:
+                if key in metadata:
+                    value = str(metadata[key])
+                    values[key] = value
+                    self._index[key].setdefault(value, []).append((sequence_number, container_id))  # Already in order.
+            self._indexed_values[container_id] = values
+        self._next_sequence_number = len(items)
+        self._indexed_count = len(items)
+
+    def _addToIndex(self, container_id: str, metadata: metadata_type) -> None:
+        old_values = self._indexed_values.get(container_id, {})
+        new_values = {key: str(metadata[key]) for key in self.IndexedKeys if key in metadata}
+        entry = (self._sequence_numbers[container_id], container_id)
+        for key in self.IndexedKeys:
+            if old_values.get(key) == new_values.get(key):
+                continue
+            if key in old_values:
+                self._removeEntry(self._index[key].get(old_values[key], []), entry)
+            if key in new_values:
+                bisect.insort(self._index[key].setdefault(new_values[key], []), entry)
+        self._indexed_values[container_id] = new_values
+
+    def _removeFromIndex(self, container_id: str) -> None:
+        old_values = self._indexed_values.pop(container_id, None)
+        if old_values is None:
+            return
+        entry = (self._sequence_numbers[container_id], container_id)
+        for key, value in old_values.items():
+            self._removeEntry(self._index[key].get(value, []), entry)
+
+    @staticmethod
+    def _removeEntry(entries: List[Tuple[int, str]], entry: Tuple[int, str]) -> None:
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    @staticmethod
+    def _isInstanceContainer(metadata: metadata_type) -> bool:
+        container_type = metadata.get("container_type")
+        return isinstance(container_type, type) and issubclass(container_type, InstanceContainer)
@@ -0,0 +1,177 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, TYPE_CHECKING
+
+from UM.Logger import Logger
+
+from .SliceRequest import SliceRequest
+
+if TYPE_CHECKING:
+    from .SliceService import SliceService
+
+
+class SliceBatch:
+    """Slices all jobs of a manifest with the slice service, and writes a summary of the results.
+
+    The manifest is a JSON file like this:
+
+        {
+            "output_directory": "gcode",
+            "defaults": {"machine": "Fleet printer", "quality": "normal"},
+            "jobs": [
+                {"id": "bracket", "files": ["bracket.3mf"], "quality": "fine"},
+                "housing.3mf"
+            ]
+        }
+
+    Every job has the fields of a slice request (see SliceRequest.fromDict). Fields that a job doesn't have are taken
+    from the defaults. A job can also just be the name of a file, which is then also its ID. Relative paths are relative
+    to the manifest, and the g-code is written to the output directory if a job doesn't say where.
+
+    Projects are read as models, with their per-model settings. The printer and the profile come from the manifest.
+
+    The service starts reading the models of a job as soon as it gets the job, and keeps them until the job is sliced.
+    So the jobs are passed on a few at a time, instead of reading every model of a large manifest at once.
+    """
+
+    DefaultMaxJobsInFlight = 8
+
+    def __init__(self, service: "SliceService", requests: List[SliceRequest], summary_path: Optional[str] = None,
+                 max_jobs_in_flight: int = DefaultMaxJobsInFlight) -> None:
+        """
+        :param service: The service to slice the jobs with.
+        :param requests: The jobs to slice.
+        :param summary_path: Where to write the summary to. None to print it.
+        :param max_jobs_in_flight: How many jobs the service may be reading or slicing at the same time.
+        """
+        self._service = service
+        self._requests = requests
+        self._summary_path = summary_path
+        self._max_jobs_in_flight = max(1, max_jobs_in_flight)
+        self._waiting = deque()  # type: Deque[SliceRequest]  # The jobs that weren't passed on to the service yet.
+        self._jobs_in_flight = 0
+        self._results = {}  # type: Dict[str, Dict[str, Any]]
+        self._submit_times = {}  # type: Dict[str, float]
+        self._start_time = 0.0
+        self._finished_callbacks = []  # type: List[Callable[[bool], None]]
+
+    @staticmethod
+    def loadManifest(manifest_path: str) -> List[SliceRequest]:
+        """Read the jobs from a manifest.
+
+        :raise ValueError: The manifest is not valid. The message says which job is wrong.
+        :raise OSError: The manifest can't be read.
+        """
+
+        with open(manifest_path, encoding = "utf-8") as manifest_file:
+            try:
+                manifest = json.load(manifest_file)
+            except json.JSONDecodeError as e:
+                raise ValueError("The manifest is not valid JSON: {err}".format(err = str(e)))
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("jobs"), list):
+            raise ValueError("The manifest needs a list of \"jobs\".")
+        defaults = manifest.get("defaults", {})
+        if not isinstance(defaults, dict):
+            raise ValueError("The \"defaults\" of the manifest must be an object.")
+
+        base_directory = os.path.dirname(os.path.abspath(manifest_path))
+        output_directory = os.path.join(base_directory, manifest.get("output_directory", ""))
+
+        requests = []
+        request_ids = set()
+        for index, job in enumerate(manifest["jobs"]):
+            if isinstance(job, str):
+                job = {"id": os.path.splitext(os.path.basename(job))[0], "files": [job]}
+            if not isinstance(job, dict):
+                raise ValueError("Job {index} of the manifest must be an object or a file name.".format(index = index))
+            data = dict(defaults)
+            data.update(job)
+            if isinstance(data.get("files"), str):
+                data["files"] = [data["files"]]
+            if isinstance(data.get("files"), list):
+                data["files"] = [os.path.join(base_directory, file_name) if isinstance(file_name, str) else file_name for file_name in data["files"]]
+            if isinstance(data.get("output"), str):
+                data["output"] = os.path.join(base_directory, data["output"])
+            try:
+                request = SliceRequest.fromDict(data, output_directory)
+            except ValueError as e:
+                raise ValueError("Job {index} of the manifest is not valid: {err}".format(index = index, err = str(e)))
+            if request.request_id in request_ids:
+                raise ValueError("There are multiple jobs with the ID {request_id}.".format(request_id = request.request_id))
+            request_ids.add(request.request_id)
+            requests.append(request)
+        return requests
+
+    def addFinishedCallback(self, callback: Callable[[bool], None]) -> None:
+        """Get called when all jobs are finished, with whether all of them succeeded and the summary was written."""
+
+        self._finished_callbacks.append(callback)
+
+    def start(self) -> None:
+        self._start_time = time.monotonic()
+        Logger.log("i", "Slicing a batch of %s jobs.", len(self._requests))
+        if not self._requests:
+            self._finish()
+            return
+        self._waiting = deque(self._requests)
+        self._submitNext()
+
+    def _submitNext(self) -> None:
+        while self._waiting and self._jobs_in_flight < self._max_jobs_in_flight:
+            request = self._waiting.popleft()
+            self._jobs_in_flight += 1
+            self._submit_times[request.request_id] = time.monotonic()
+            self._service.submit(request, self._onResult)
+
+    def _onResult(self, result: Dict[str, Any]) -> None:
+        self._jobs_in_flight -= 1
+        request_id = result["id"]
+        result["duration"] = round(time.monotonic() - self._submit_times.get(request_id, self._start_time), 3)
+        self._results[request_id] = result
+        Logger.log("i", "Batch job %s finished with status %s (%s of %s).", request_id, result["status"], len(self._results), len(self._requests))
+        if len(self._results) == len(self._requests):
+            self._finish()
+        else:
+            self._submitNext()
+
+    def getSummary(self) -> Dict[str, Any]:
+        """Get the summary of the jobs that are finished so far, in the order of the manifest."""
+
+        results = [self._results[request.request_id] for request in self._requests if request.request_id in self._results]
+        succeeded = [result for result in results if result["status"] == "done"]
+        return {
+            "jobs": len(self._requests),
+            "succeeded": len(succeeded),
+            "failed": len(results) - len(succeeded),
+            "duration": round(time.monotonic() - self._start_time, 3),
+            "total_print_time": sum(result.get("print_time", 0) for result in succeeded),
+            "total_material_weight": sum(sum(result.get("material_weights", [])) for result in succeeded),
+            "failures": [{"id": result["id"], "error": result.get("error", "")} for result in results if result["status"] != "done"],
+            "results": results
+        }
+
+    def _finish(self) -> None:
+        summary = self.getSummary()
+        Logger.log("i", "Sliced a batch of %s jobs in %ss, %s failed.", summary["jobs"], summary["duration"], summary["failed"])
+        serialized = json.dumps(summary, indent = 4)
+        succeeded = summary["failed"] == 0
+        if self._summary_path is None:
+            print(serialized)
+        else:
+            try:
+                with open(self._summary_path, "w", encoding = "utf-8") as summary_file:
+                    summary_file.write(serialized)
+            except OSError as e:
+                message = "Unable to write the summary of the batch to {path}: {err}".format(path = self._summary_path, err = str(e))
+                Logger.log("e", message)
+                print(message, file = sys.stderr)
+                print(serialized)
+                succeeded = False  # Whoever asked for the summary file won't find it.
+        for callback in self._finished_callbacks:
+            callback(succeeded)
@@ -0,0 +1,73 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class SliceRequest:
+    """A request to slice a set of model files with a printer and profile, and write the g-code to a file.
+
+    Requests with the same configuration (the same printer, quality, intent and custom profile) can be sliced at the
+    same time, each on a build plate of its own.
+    """
+
+    def __init__(self, request_id: str, files: List[str], output: str, *,
+                 machine: Optional[str] = None,
+                 quality: Optional[str] = None,
+                 intent: Optional[str] = None,
+                 profile: Optional[str] = None) -> None:
+        """
+        :param request_id: The ID of the request, to report the result with.
+        :param files: The model files to slice. These are placed on the same build plate.
+        :param output: Where to write the g-code to.
+        :param machine: The name or ID of the printer to slice with. None to slice with the active printer.
+        :param quality: The quality type to slice with, like "normal". None to keep the quality of the printer.
+        :param intent: The intent category to slice with, like "engineering". None to keep the intent of the printer.
+        :param profile: The name of the custom profile to slice with. None to keep the profile of the printer.
+        """
+        self.request_id = request_id
+        self.files = files
+        self.output = output
+        self.machine = machine
+        self.quality = quality
+        self.intent = intent
+        self.profile = profile
+
+    @classmethod
+    def fromDict(cls, data: Dict[str, Any], output_directory: Optional[str] = None) -> "SliceRequest":
+        """Create a request from the JSON that was sent to the slice service.
+
+        :param data: The fields of the request: "id", "files" and optionally "output", "machine", "quality", "intent"
+            and "profile".
+        :param output_directory: Where to write the g-code to if the request has no output, named after the ID.
+        :raise ValueError: The request is missing fields or has fields of the wrong type.
+        """
+
+        request_id = data.get("id")
+        if not isinstance(request_id, str) or not request_id:
+            raise ValueError("The request needs an \"id\".")
+        files = data.get("files")
+        if isinstance(files, str):
+            files = [files]
+        if not isinstance(files, list) or not files or not all(isinstance(file_name, str) for file_name in files):
+            raise ValueError("The request needs a list of \"files\" to slice.")
+        for key in ("output", "machine", "quality", "intent", "profile"):
+            if data.get(key) is not None and not isinstance(data[key], str):
+                raise ValueError("The \"{key}\" of the request must be a string.".format(key = key))
+
+        output = data.get("output")
+        if not output:
+            if output_directory is None:
+                raise ValueError("The request needs an \"output\" file.")
+            output = os.path.join(output_directory, request_id + ".gcode")
+        return cls(request_id, [os.path.abspath(file_name) for file_name in files], os.path.abspath(output),
+                   machine = data.get("machine"),
+                   quality = data.get("quality"),
+                   intent = data.get("intent"),
+                   profile = data.get("profile"))
+
+    def getConfigurationKey(self) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+        """Get what the request needs to be sliced with. Requests with the same key can be sliced together."""
+
+        return self.machine, self.quality, self.intent, self.profile
@@ -0,0 +1,360 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QTimer
+
+from UM.Backend.Backend import BackendState
+from UM.Logger import Logger
+from UM.Math.Vector import Vector
+from UM.Mesh.ReadMeshJob import ReadMeshJob
+from UM.PluginRegistry import PluginRegistry
+from UM.Scene.SceneNode import SceneNode
+
+from cura.Arranging.Nest2DArrange import Nest2DArrange
+from cura.Machines.ContainerTree import ContainerTree
+from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
+from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+from cura.Scene.CuraSceneNode import CuraSceneNode
+from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
+from cura.Settings.CuraContainerRegistry import CuraContainerRegistry
+
+from .SliceRequest import SliceRequest
+
+if TYPE_CHECKING:
+    from cura.CuraApplication import CuraApplication
+
+ResultCallback = Callable[[Dict[str, Any]], None]
+
+
+class _PendingRequest:
+    """A request that is waiting to be sliced, with the models that were read for it so far."""
+
+    def __init__(self, request: SliceRequest, on_finished: ResultCallback) -> None:
+        self.request = request
+        self.on_finished = on_finished
+        self.files_left = len(request.files)
+        self.nodes = []  # type: List[Tuple[str, SceneNode]]  # The nodes that were read, with the file they are from.
+        self.error = None  # type: Optional[str]
+        self.warnings = []  # type: List[str]
+        self.scene_nodes = []  # type: List[CuraSceneNode]  # The nodes that were added to the scene to slice.
+
+
+class SliceService(QObject):
+    """Slices requests without an interface, through the same pipeline as the interface does.
+
+    The models of requests are read in the background as soon as they come in. Requests that are read and that need
+    the same printer and profile are then put on a build plate each and sliced together, so that the backend slices
+    them in parallel in as many engine processes as the backend is allowed to use. Requests with other configurations
+    wait for the next batch, since the scene has only one active printer. After slicing, the g-code of each build plate
+    goes through the post-processing scripts and is written by the g-code writer.
+
+    The containers and the backend are kept between requests, so only the first request pays for loading them.
+    """
+
+    def __init__(self, application: "CuraApplication", parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._application = application
+        self._application.getPreferences().addPreference("slice_service/job_timeout", 600)
+
+        self._queue = deque()  # type: Deque[_PendingRequest]
+        self._reading = {}  # type: Dict[ReadMeshJob, _PendingRequest]
+        self._batch = []  # type: List[_PendingRequest]  # The requests that are being sliced, by build plate number.
+        self._estimates = {}  # type: Dict[int, Tuple[Dict[str, float], List[float]]]  # The print times and material amounts, by build plate number.
+        self._waiting_for_error_check = False
+        self._slice_start_time = 0.0
+
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._onTimeout)
+
+        self._backend = self._application.getBackend()
+        self._backend.backendStateChange.connect(self._onBackendStateChanged)
+        self._backend.printDurationMessage.connect(self._onPrintDurationMessage)
+        self._application.getMachineErrorChecker().errorCheckFinished.connect(self._onErrorCheckFinished)
+
+    def submit(self, request: SliceRequest, on_finished: ResultCallback) -> int:
+        """Queue a request to be sliced.
+
+        :param request: The request to slice.
+        :param on_finished: Called with the result of the request once it's sliced or failed. The result has the ID,
+            the status ("done" or "error"), and either the error or the output file with the estimates.
+        :return: The number of requests that are waiting before this one.
+        """
+
+        pending = _PendingRequest(request, on_finished)
+        position = len(self._queue)
+        self._queue.append(pending)
+        for file_name in request.files:
+            job = ReadMeshJob(file_name, add_to_recent_files = False)
+            self._reading[job] = pending
+            job.finished.connect(self._onReadMeshFinished)
+            job.start()
+        return position
+
+    def getQueueLength(self) -> int:
+        return len(self._queue)
+
+    def getActiveCount(self) -> int:
+        return len(self._batch)
+
+    def _onReadMeshFinished(self, job: ReadMeshJob) -> None:
+        pending = self._reading.pop(job, None)
+        if pending is None:
+            return
+        pending.files_left -= 1
+        nodes = job.getResult()
+        if not nodes:
+            pending.error = "Unable to read {file_name}.".format(file_name = job.getFileName())
+        else:
+            pending.nodes.extend((job.getFileName(), node) for node in nodes)
+        self._startNextBatch()
+
+    def _startNextBatch(self) -> None:
+        """Slice the next requests, if nothing is being sliced and the first request in the queue is read."""
+
+        if self._batch or not self._queue or self._queue[0].files_left > 0:
+            return
+
+        configuration = self._queue[0].request.getConfigurationKey()
+        max_batch_size = self._backend.getMaxEngineProcesses()
+        batch = []
+        for pending in self._queue:
+            if len(batch) >= max_batch_size:
+                break
+            if pending.files_left == 0 and pending.request.getConfigurationKey() == configuration:
+                batch.append(pending)
+        for pending in batch:
+            self._queue.remove(pending)
+
+        error = self._applyConfiguration(batch[0].request)
+        for pending in batch:
+            if pending.error is None and error is not None:
+                pending.error = error
+            if pending.error is not None:
+                self._reportError(pending, pending.error)
+        batch = [pending for pending in batch if pending.error is None]
+        if not batch:
+            self._application.callLater(self._startNextBatch)
+            return
+
+        self._batch = batch
+        self._estimates = {}
+        for build_plate_number, pending in enumerate(batch):
+            self._placeOnBuildPlate(pending, build_plate_number)
+        self._application.getCuraSceneController().updateMaxBuildPlate()
+        Logger.log("i", "Slicing requests %s.", ", ".join(pending.request.request_id for pending in batch))
+
+        self._timeout_timer.start(int(self._application.getPreferences().getValue("slice_service/job_timeout")) * 1000)
+        # Changing the printer or profile starts a check of the settings. Slicing has to wait for it, or it restarts.
+        self._waiting_for_error_check = self._application.getMachineErrorChecker().needToWaitForResult
+        if not self._waiting_for_error_check:
+            self._startSlicing()
+
+    def _startSlicing(self) -> None:
+        self._slice_start_time = time.monotonic()
+        self._backend.forceSlice()
+
+    def _applyConfiguration(self, request: SliceRequest) -> Optional[str]:
+        """Activate the printer and profile that a request needs to be sliced with.
+
+        :return: Why the configuration could not be activated, or None if it was activated.
+        """
+
+        machine_manager = self._application.getMachineManager()
+        if request.machine:
+            registry = CuraContainerRegistry.getInstance()
+            stacks = registry.findContainerStacks(type = "machine", id = request.machine) or registry.findContainerStacks(type = "machine", name = request.machine)
+            if not stacks:
+                return "There is no printer named {machine}.".format(machine = request.machine)
+            active_machine = machine_manager.activeMachine
+            if active_machine is None or active_machine.getId() != stacks[0].getId():
+                machine_manager.setActiveMachine(stacks[0].getId())
+        if self._application.getGlobalContainerStack() is None:
+            return "There is no printer to slice with."
+
+        if request.profile:
+            quality_changes_groups = [group for group in ContainerTree.getInstance().getCurrentQualityChangesGroups() if group.name == request.profile]
+            if not quality_changes_groups or not quality_changes_groups[0].is_available:
+                return "The profile {profile} is not available for this printer.".format(profile = request.profile)
+            machine_manager.setQualityChangesGroup(quality_changes_groups[0], no_dialog = True)
+        elif request.quality:
+            quality_group = ContainerTree.getInstance().getCurrentQualityGroups().get(request.quality)
+            if quality_group is None or not quality_group.is_available:
+                return "The quality {quality} is not available for this printer.".format(quality = request.quality)
+            machine_manager.setQualityGroup(quality_group, no_dialog = True)
+        if request.intent:
+            machine_manager.setIntentByCategory(request.intent)
+        return None
+
+    def _placeOnBuildPlate(self, pending: _PendingRequest, build_plate_number: int) -> None:
+        """Add the models of a request to the scene, and arrange them on a build plate of their own."""
+
+        global_stack = self._application.getGlobalContainerStack()
+        default_extruder_position = self._application.getMachineManager().defaultExtruderPosition
+        default_extruder_id = global_stack.extruderList[int(default_extruder_position)].getId()
+        build_volume = self._application.getBuildVolume()
+        root = self._application.getController().getScene().getRoot()
+
+        for file_name, original_node in pending.nodes:
+            # Create a CuraSceneNode just if the original node is not that type
+            if isinstance(original_node, CuraSceneNode):
+                node = original_node
+            else:
+                node = CuraSceneNode()
+                node.setMeshData(original_node.getMeshData())
+                node.source_mime_type = original_node.source_mime_type
+
+                # Setting meshdata does not apply scaling.
+                if original_node.getScale() != Vector(1.0, 1.0, 1.0):
+                    node.scale(original_node.getScale())
+            if not node.getName():
+                node.setName(os.path.basename(file_name))
+
+            if not node.callDecoration("isSliceable"):
+                node.addDecorator(SliceableObjectDecorator())
+            if not node.getDecorator(ConvexHullDecorator):
+                node.addDecorator(ConvexHullDecorator())
+            for child in node.getAllChildren():
+                if not child.getDecorator(ConvexHullDecorator):
+                    child.addDecorator(ConvexHullDecorator())
+            build_plate_decorator = node.getDecorator(BuildPlateDecorator)
+            if build_plate_decorator is None:
+                build_plate_decorator = BuildPlateDecorator(build_plate_number)
+                node.addDecorator(build_plate_decorator)
+            build_plate_decorator.setBuildPlateNumber(build_plate_number)
+
+            # Ensure that the bottom of the bounding box is on the build plate
+            if node.getBoundingBox():
+                node.translate(Vector(0, node.getWorldPosition().y - node.getBoundingBox().bottom, 0))
+            root.addChild(node)
+            node.callDecoration("setActiveExtruder", default_extruder_id)
+            pending.scene_nodes.append(node)
+
+        # Not pushed on the operation stack, since nobody can undo this.
+        arranger = Nest2DArrange(pending.scene_nodes, build_volume, [],
+                                 parallel = self._application.getPreferences().getValue("arrange/parallel_search"),
+                                 time_budget = float(self._application.getPreferences().getValue("arrange/time_budget")))
+        operation, not_fit_count = arranger.createGroupOperationForArrange()
+        operation.redo()
+        if not_fit_count > 0:
+            pending.warnings.append("{count} models did not fit on the build plate and are not sliced.".format(count = not_fit_count))
+        for node in pending.scene_nodes:
+            node.translate(Vector(0, -node.getBoundingBox().bottom, 0), SceneNode.TransformSpace.World)
+            build_volume.checkBoundsAndUpdate(node)
+
+    def _onErrorCheckFinished(self) -> None:
+        if self._waiting_for_error_check:
+            self._waiting_for_error_check = False
+            self._startSlicing()
+
+    def _onPrintDurationMessage(self, build_plate_number: int, print_times_per_feature: Dict[str, float], material_amounts: List[float]) -> None:
+        if not self._batch or not print_times_per_feature:  # Empty when the estimates are reset.
+            return
+        self._estimates[build_plate_number] = (print_times_per_feature, material_amounts)
+
+    def _onBackendStateChanged(self, state: BackendState) -> None:
+        if not self._batch or self._waiting_for_error_check:
+            return
+        if state == BackendState.Error or state == BackendState.Disabled:
+            self._finishBatch("Unable to slice. Check the settings of the printer and the log for details.")
+        elif state == BackendState.Done and not self._backend.isSlicing():
+            self._finishBatch()
+
+    def _onTimeout(self) -> None:
+        if self._batch:
+            self._backend.stopSlicing()
+            self._finishBatch("Slicing took longer than {timeout} seconds.".format(timeout = self._application.getPreferences().getValue("slice_service/job_timeout")))
+
+    def _finishBatch(self, error: Optional[str] = None) -> None:
+        """Write the g-code of every build plate that was sliced, and report the results.
+
+        :param error: Why none of the requests could be sliced, or None if the backend finished slicing.
+        """
+
+        self._timeout_timer.stop()
+        self._waiting_for_error_check = False
+        slice_time = round(time.monotonic() - self._slice_start_time, 3)
+        batch = self._batch
+        self._batch = []
+        scene_controller = self._application.getCuraSceneController()
+        for build_plate_number, pending in enumerate(batch):
+            if error is not None:
+                self._reportError(pending, error)
+                continue
+            estimates = self._estimates.get(build_plate_number)
+            if estimates is None:
+                self._reportError(pending, "Nothing could be sliced. The models may be outside of the build volume.")
+                continue
+
+            scene_controller.setActiveBuildPlate(build_plate_number)
+            write_error = self._writeGCode(pending.request.output)
+            if write_error is not None:
+                self._reportError(pending, write_error)
+                continue
+
+            print_times_per_feature, material_amounts = estimates
+            result = {
+                "id": pending.request.request_id,
+                "status": "done",
+                "output": pending.request.output,
+                "print_time": int(sum(time for time in print_times_per_feature.values() if time == time)),  # Skip NaN.
+                "print_times_per_feature": {feature: time for feature, time in print_times_per_feature.items() if time == time},
+                "material_amounts": list(material_amounts),
+                "slice_time": slice_time  # How long the backend took, for the whole batch.
+            }
+            material_estimates = self._application.getPrintInformation().calculateMaterialEstimates(material_amounts)
+            if material_estimates is not None:
+                result.update({
+                    "material_lengths": material_estimates["lengths"],
+                    "material_weights": material_estimates["weights"],
+                    "material_costs": material_estimates["costs"],
+                    "material_names": material_estimates["names"]
+                })
+            if pending.warnings:
+                result["warnings"] = pending.warnings
+            self._report(pending, result)
+        scene_controller.setActiveBuildPlate(0)
+
+        for pending in batch:
+            for node in pending.scene_nodes:
+                parent = node.getParent()
+                if parent is not None:
+                    parent.removeChild(node)
+        self._application.getController().getScene().sceneChanged.emit(self._application.getController().getScene().getRoot())
+        self._application.callLater(self._startNextBatch)
+
+    def _writeGCode(self, file_name: str) -> Optional[str]:
+        """Write the g-code of the active build plate to a file.
+
+        :return: Why the g-code could not be written, or None if it was written.
+        """
+
+        # Let the post-processing scripts (and anything else that changes the g-code before it's written) do their work.
+        self._application.getOutputDeviceManager().writeStarted.emit(self)
+        writer = PluginRegistry.getInstance().getPluginObject("GCodeWriter")
+        if writer is None:
+            return "The g-code writer is not available."
+        try:
+            os.makedirs(os.path.dirname(file_name), exist_ok = True)
+            with open(file_name, "w", encoding = "utf-8") as stream:
+                if not writer.write(stream, None):
+                    return writer.getInformation()
+        except OSError as e:
+            return "Unable to write {file_name}: {err}".format(file_name = file_name, err = str(e))
+        return None
+
+    def _reportError(self, pending: _PendingRequest, error: str) -> None:
+        Logger.log("w", "Slice request %s failed: %s", pending.request.request_id, error)
+        self._report(pending, {"id": pending.request.request_id, "status": "error", "error": error})
+
+    @staticmethod
+    def _report(pending: _PendingRequest, result: Dict[str, Any]) -> None:
+        try:
+            pending.on_finished(result)
+        except Exception:
+            Logger.logException("e", "Unable to report the result of slice request %s.", pending.request.request_id)
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import json
+import os
+from typing import Any, Dict, Optional, Set
+
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+from UM.Logger import Logger
+
+from .SliceRequest import SliceRequest
+from .SliceService import SliceService
+
+
+class SliceServiceServer:
+    """Accepts slice requests for the slice service on a local socket.
+
+    The protocol is the same as the one of the single instance server: every command and every reply is one line of
+    JSON. The "command" field holds the name of the command, the other fields depend on the command:
+
+    - "slice" queues a slice request, see SliceRequest.fromDict for its fields. It's answered with a "queued" reply
+      right away, and with a "done" or "error" reply with the same ID once the request is finished.
+    - "status" is answered with the number of requests that are waiting and being sliced.
+    - "close-connection" closes the connection. Requests that are still running are sliced anyway.
+    """
+
+    DefaultServerName = "cura-slice-service"
+    ProbeTimeout = 1000  # How many milliseconds to wait for another slice service that listens on the same name.
+
+    def __init__(self, service: SliceService, server_name: Optional[str] = None, output_directory: Optional[str] = None) -> None:
+        """
+        :param service: The service to pass the requests to.
+        :param server_name: The name of the local socket to listen on.
+        :param output_directory: Where to write the g-code of requests that don't specify an output file.
+        """
+        self._service = service
+        self._server_name = server_name or self.DefaultServerName
+        self._output_directory = os.path.abspath(output_directory or os.getcwd())
+        self._server = None  # type: Optional[QLocalServer]
+        self._connections = set()  # type: Set[QLocalSocket]
+
+    def start(self) -> bool:
+        """Start listening for requests.
+
+        :return: Whether the server is listening.
+        """
+
+        # Only take over the name if no other slice service answers on it, i.e. it was left behind by one that crashed.
+        probe_socket = QLocalSocket()
+        probe_socket.connectToServer(self._server_name)
+        if probe_socket.waitForConnected(msecs = self.ProbeTimeout):
+            probe_socket.disconnectFromServer()
+            Logger.log("e", "Another slice service is already listening on %s.", self._server_name)
+            return False
+        QLocalServer.removeServer(self._server_name)
+
+        self._server = QLocalServer()
+        self._server.newConnection.connect(self._onClientConnected)
+        if not self._server.listen(self._server_name):
+            Logger.log("e", "The slice service can't listen on %s: %s", self._server_name, self._server.errorString())
+            return False
+        Logger.log("i", "The slice service is listening on %s.", self._server.fullServerName())
+        return True
+
+    def _onClientConnected(self) -> None:
+        if self._server is None:
+            return
+        connection = self._server.nextPendingConnection()
+        while connection is not None:
+            self._connections.add(connection)
+            connection.readyRead.connect(lambda c = connection: self._readCommands(c))
+            connection.disconnected.connect(lambda c = connection: self._onClientDisconnected(c))
+            connection = self._server.nextPendingConnection()
+
+    def _onClientDisconnected(self, connection: QLocalSocket) -> None:
+        self._connections.discard(connection)
+        connection.deleteLater()
+
+    def _readCommands(self, connection: QLocalSocket) -> None:
+        while connection.canReadLine():
+            line = connection.readLine()
+            try:
+                payload = json.loads(bytes(line).decode("utf-8").strip())
+                if not isinstance(payload, dict):
+                    raise ValueError("A command must be a JSON object.")
+            except (UnicodeDecodeError, ValueError) as e:
+                Logger.log("w", "Unable to parse slice service command '%s': %s", line, repr(e))
+                self._send(connection, {"status": "error", "error": "Unable to parse the command: {err}".format(err = str(e))})
+                continue
+            self._handleCommand(connection, payload)
+
+    def _handleCommand(self, connection: QLocalSocket, payload: Dict[str, Any]) -> None:
+        command = payload.get("command")
+
+        # Command: Slice models and write the g-code to a file.
+        if command == "slice":
+            try:
+                request = SliceRequest.fromDict(payload, self._output_directory)
+            except ValueError as e:
+                self._send(connection, {"id": payload.get("id"), "status": "error", "error": str(e)})
+                return
+            position = self._service.submit(request, lambda result, c = connection: self._send(c, result))
+            self._send(connection, {"id": request.request_id, "status": "queued", "position": position})
+
+        # Command: Report how busy the service is.
+        elif command == "status":
+            self._send(connection, {"status": "ok", "queued": self._service.getQueueLength(), "slicing": self._service.getActiveCount()})
+
+        # Command: Close the socket connection. We're done.
+        elif command == "close-connection":
+            connection.close()
+
+        else:
+            Logger.log("w", "Received an unrecognized slice service command " + str(command))
+            self._send(connection, {"status": "error", "error": "Unknown command {command}.".format(command = command)})
+
+    def _send(self, connection: QLocalSocket, reply: Dict[str, Any]) -> None:
+        if connection not in self._connections or connection.state() != QLocalSocket.LocalSocketState.ConnectedState:
+            return  # The client left before its request was finished.
+        connection.write(bytes(json.dumps(reply) + "\n", encoding = "utf-8"))
+        connection.flush()
@@ -197,14 +197,33 @@ class PrintInformation(QObject):
         self._current_print_time[build_plate_number].setDuration(total_estimated_time)
 
     def _calculateInformation(self, build_plate_number: int) -> None:
+        estimates = self.calculateMaterialEstimates(self._material_amounts)
+        if estimates is None:
+            return
+
+        self._material_lengths[build_plate_number] = estimates["lengths"]
+        self._material_weights[build_plate_number] = estimates["weights"]
+        self._material_costs[build_plate_number] = estimates["costs"]
+        self._material_names[build_plate_number] = estimates["names"]
+
+        self.materialLengthsChanged.emit()
+        self.materialWeightsChanged.emit()
+        self.materialCostsChanged.emit()
+        self.materialNamesChanged.emit()
+
+    def calculateMaterialEstimates(self, material_amounts: List[float]) -> Optional[Dict[str, List]]:
+        """Calculate how much of each material a print uses, for the active printer.
+
+        :param material_amounts: The volume of material that each extruder uses, in mm^3.
+        :return: The "lengths" (in m), "weights" (in g), "costs" and "names" of the materials, per extruder. None if
+            there is no active printer.
+        """
+
         global_stack = self._application.getGlobalContainerStack()
         if global_stack is None:
-            return
+            return None
 
-        self._material_lengths[build_plate_number] = []
-        self._material_weights[build_plate_number] = []
-        self._material_costs[build_plate_number] = []
-        self._material_names[build_plate_number] = []
+        estimates = {"lengths": [], "weights": [], "costs": [], "names": []}  # type: Dict[str, List]
 
         try:
             material_preference_values = json.loads(self._application.getInstance().getPreferences().getValue("cura/material_settings"))
@@ -213,9 +232,9 @@ class PrintInformation(QObject):
             material_preference_values = {}
 
         for index, extruder_stack in enumerate(global_stack.extruderList):
-            if index >= len(self._material_amounts):
+            if index >= len(material_amounts):
                 continue
-            amount = self._material_amounts[index]
+            amount = material_amounts[index]
             # Find the right extruder stack. As the list isn't sorted because it's a annoying generator, we do some
             # list comprehension filtering to solve this for us.
             density = extruder_stack.getMetaDataEntry("properties", {}).get("density", 0)
@@ -249,15 +268,11 @@ class PrintInformation(QObject):
             else:
                 length = 0
 
-            self._material_weights[build_plate_number].append(weight)
-            self._material_lengths[build_plate_number].append(length)
-            self._material_costs[build_plate_number].append(cost)
-            self._material_names[build_plate_number].append(material_name)
-
-        self.materialLengthsChanged.emit()
-        self.materialWeightsChanged.emit()
-        self.materialCostsChanged.emit()
-        self.materialNamesChanged.emit()
+            estimates["weights"].append(weight)
+            estimates["lengths"].append(length)
+            estimates["costs"].append(cost)
+            estimates["names"].append(material_name)
+        return estimates
 
     def _onPreferencesChanged(self, preference: str) -> None:
         if preference != "cura/material_settings":
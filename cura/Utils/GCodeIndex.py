@@ -0,0 +1,161 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import gzip
+import os
+import re
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+
+class GCodeIndex:
+    """The byte offsets of the layers and of the settings block in a g-code file.
+
+    The index can be written in a footer at the end of the g-code, so that readers can seek to a single layer or to
+    the settings directly instead of scanning the whole file. The footer consists of comments:
+
+        ;INDEX_SETTINGS:<offset>
+        ;INDEX_LAYER:<layer number> <offset>
+        ;INDEX_START:<offset of the first index line, padded to a fixed width>
+
+    The last line has a fixed length, so it can be found by seeking from the end of the file. The offsets can become
+    invalid if the file is changed afterwards, or if line endings are converted while writing. Readers should check
+    what they find at an offset and fall back to scanning the file if it's not what they expected.
+
+    The offsets are those of the uncompressed g-code. Compressed files are not indexed when read, since seeking in them
+    means decompressing everything up to that point again.
+    """
+
+    START_KEYWORD = ";INDEX_START:"
+    LAYER_KEYWORD = ";INDEX_LAYER:"
+    SETTINGS_KEYWORD = ";INDEX_SETTINGS:"
+
+    _offset_digits = 20
+    _layer_regex = re.compile(r"^;LAYER:(-?\d+)", re.MULTILINE)
+    _settings_regex = re.compile(r"^;SETTING_", re.MULTILINE)
+
+    def __init__(self) -> None:
+        self.layer_offsets = {}  # type: Dict[int, int]
+        self.settings_offset = None  # type: Optional[int]
+        self.index_offset = None  # type: Optional[int]  # Where the index itself starts, which is the end of the g-code.
+        self._size = 0  # Number of bytes of g-code added so far.
+
+    def addGCode(self, gcode: str) -> None:
+        """Record the layers and settings in a piece of g-code, which is written right after the previous piece.
+
+        :param gcode: The g-code as it is written to the file.
+        """
+
+        for match in self._layer_regex.finditer(gcode):
+            self.layer_offsets.setdefault(int(match.group(1)), self._size + self._byteLength(gcode[:match.start()]))
+        if self.settings_offset is None:
+            match = self._settings_regex.search(gcode)
+            if match is not None:
+                self.settings_offset = self._size + self._byteLength(gcode[:match.start()])
+        self._size += self._byteLength(gcode)
+
+    def serialise(self) -> str:
+        """Get the footer to write after all g-code that was added."""
+
+        lines = []  # type: List[str]
+        if self.settings_offset is not None:
+            lines.append("{keyword}{offset}\n".format(keyword = self.SETTINGS_KEYWORD, offset = self.settings_offset))
+        for layer_number, offset in sorted(self.layer_offsets.items()):
+            lines.append("{keyword}{layer} {offset}\n".format(keyword = self.LAYER_KEYWORD, layer = layer_number, offset = offset))
+        lines.append("{keyword}{offset:0{digits}d}\n".format(keyword = self.START_KEYWORD, offset = self._size, digits = self._offset_digits))
+        return "".join(lines)
+
+    def getLayerRange(self, layer_number: int) -> Optional[Tuple[int, int]]:
+        """Get the byte range of the g-code of a layer, up to the next layer or the end of the g-code.
+
+        :param layer_number: The layer number, as in the ;LAYER: comment.
+        :return: The start and end offset of the layer, where an end of -1 means the end of the file, or None if the
+            layer is not in the index.
+        """
+
+        start = self.layer_offsets.get(layer_number)
+        if start is None:
+            return None
+        ends = [offset for offset in self.layer_offsets.values() if offset > start]
+        if self.settings_offset is not None and self.settings_offset > start:
+            ends.append(self.settings_offset)
+        if self.index_offset is not None:
+            ends.append(self.index_offset)
+        return start, min(ends) if ends else -1
+
+    @classmethod
+    def read(cls, stream: BinaryIO) -> Optional["GCodeIndex"]:
+        """Read the index from the footer of a g-code file.
+
+        :param stream: The g-code file, opened in binary mode.
+        :return: The index, or None if the file has no index at the end, or is gzipped.
+        """
+
+        if isinstance(stream, gzip.GzipFile):
+            # Seeking to the end and back would decompress the whole file again for every seek.
+            return None
+
+        trailer_length = len(cls.START_KEYWORD) + cls._offset_digits + 2  # Room for a \r\n line ending.
+        try:
+            size = stream.seek(0, os.SEEK_END)
+            stream.seek(max(size - trailer_length, 0))
+            trailer = stream.read().rstrip(b"\r\n")
+        except (OSError, ValueError):
+            return None
+        trailer = trailer[trailer.rfind(b"\n") + 1:]
+        if not trailer.startswith(cls.START_KEYWORD.encode("ascii")):
+            return None
+
+        index = cls()
+        try:
+            index.index_offset = int(trailer[len(cls.START_KEYWORD):])
+            stream.seek(index.index_offset)
+            for raw_line in stream.read().decode("utf-8").splitlines():
+                if raw_line.startswith(cls.LAYER_KEYWORD):
+                    layer_number, offset = raw_line[len(cls.LAYER_KEYWORD):].split(" ")
+                    index.layer_offsets[int(layer_number)] = int(offset)
+                elif raw_line.startswith(cls.SETTINGS_KEYWORD):
+                    index.settings_offset = int(raw_line[len(cls.SETTINGS_KEYWORD):])
+        except (OSError, ValueError, UnicodeDecodeError):
+            return None
+        return index
+
+    @classmethod
+    def readLayer(cls, stream: BinaryIO, layer_number: int) -> Optional[str]:
+        """Read the g-code of a single layer, e.g. to preview it without loading the whole file.
+
+        If the file has an index, this seeks to the layer directly. Otherwise the file is scanned up to the layer.
+
+        :param stream: The g-code file, opened in binary mode.
+        :param layer_number: The layer number, as in the ;LAYER: comment.
+        :return: The g-code of the layer, starting with its ;LAYER: comment, or None if the layer is not in the file.
+        """
+
+        layer_marker = ";LAYER:{layer}".format(layer = layer_number).encode("utf-8")
+        index = cls.read(stream)
+        layer_range = index.getLayerRange(layer_number) if index is not None else None
+        if layer_range is not None:
+            start, end = layer_range
+            stream.seek(start)
+            layer = stream.read(end - start if end >= 0 else -1)
+            if layer.split(b"\n", 1)[0].rstrip(b"\r") == layer_marker:
+                return layer.decode("utf-8")
+            # The index doesn't match the g-code, e.g. because the file was edited afterwards.
+
+        # The layer ends at the next layer, or at the settings or index after the last layer.
+        end_markers = tuple(keyword.encode("utf-8") for keyword in (";LAYER:", ";SETTING_", cls.SETTINGS_KEYWORD, cls.LAYER_KEYWORD, cls.START_KEYWORD))
+        stream.seek(0)
+        lines = []  # type: List[bytes]
+        for line in stream:
+            if lines:
+                if line.startswith(end_markers):
+                    break
+                lines.append(line)
+            elif line.rstrip(b"\r\n") == layer_marker:
+                lines.append(line)
+        if not lines:
+            return None
+        return b"".join(lines).decode("utf-8")
+
+    @staticmethod
+    def _byteLength(text: str) -> int:
+        return len(text) if text.isascii() else len(text.encode("utf-8"))
@@ -0,0 +1,70 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from typing import Optional
+
+import numpy
+
+from UM.Mesh.MeshBuilder import MeshBuilder
+from UM.Mesh.MeshData import MeshData
+
+
+def calculateFaceNormals(corners: numpy.ndarray) -> numpy.ndarray:
+    """Calculate the normal of each triangle.
+
+    :param corners: The corners of the triangles, with shape (face count, 3, 3).
+    :return: The unit normal of each triangle, or zero for degenerate triangles, with shape (face count, 3).
+    """
+
+    normals = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]).astype(numpy.float32)
+    lengths = numpy.linalg.norm(normals, axis = 1)
+    numpy.divide(normals, lengths[:, numpy.newaxis], out = normals, where = lengths[:, numpy.newaxis] > 0)
+    return normals
+
+
+def createIndexedMeshData(vertices: numpy.ndarray, indices: Optional[numpy.ndarray] = None, uvs: Optional[numpy.ndarray] = None, file_name: Optional[str] = None, mesh_id: Optional[str] = None) -> MeshData:
+    """Create mesh data in which vertices are shared between the triangles that use them, instead of a triangle soup.
+
+    Every vertex gets the normal of the triangles it's part of, so models look the same as with a vertex per corner.
+    Vertices are only shared between triangles with the same normal (and UV coordinates). For flat surfaces, which
+    are common in models for printing, this stores most vertices once instead of up to six times.
+
+    :param vertices: The vertex positions. Without indices, every 3 consecutive vertices form a triangle.
+    :param indices: Optionally, the vertex indices of each triangle, with shape (face count, 3).
+    :param uvs: Optionally, the UV coordinates of each corner of each triangle, with shape (face count * 3, 2).
+    :param file_name: The file the mesh was read from.
+    :param mesh_id: The ID of the mesh in the file it was read from, e.g. the object ID in a 3MF file.
+    :return: Mesh data with vertices, normals and indices (and UV coordinates if given).
+    """
+
+    vertices = numpy.asarray(vertices, dtype = numpy.float32).reshape((-1, 3))
+    if indices is not None:
+        corners = vertices[numpy.asarray(indices).reshape((-1, 3))]
+    else:
+        corners = vertices[:len(vertices) - len(vertices) % 3].reshape((-1, 3, 3))
+    face_count = corners.shape[0]
+    builder = MeshBuilder()
+    builder.setFileName(file_name)
+    if mesh_id is not None:
+        builder.setMeshId(mesh_id)
+    if face_count == 0:
+        builder.setVertices(numpy.zeros((0, 3), dtype = numpy.float32))
+        return builder.build()
+
+    face_normals = calculateFaceNormals(corners)
+    columns = [corners.reshape((-1, 3)), numpy.repeat(face_normals, 3, axis = 0)]
+    if uvs is not None:
+        columns.append(numpy.asarray(uvs, dtype = numpy.float32).reshape((-1, 2))[:face_count * 3])
+    corner_data = numpy.ascontiguousarray(numpy.hstack(columns))
+
+    # Find the unique corners by comparing their bytes, which is a lot faster than comparing rows of floats.
+    corner_keys = corner_data.view(numpy.dtype((numpy.void, corner_data.dtype.itemsize * corner_data.shape[1]))).ravel()
+    _, unique_corners, corner_indices = numpy.unique(corner_keys, return_index = True, return_inverse = True)
+    unique_data = corner_data[unique_corners]
+
+    builder.setVertices(unique_data[:, 0:3].copy())
+    builder.setNormals(unique_data[:, 3:6].copy())
+    builder.setIndices(corner_indices.astype(numpy.int32).reshape((face_count, 3)))
+    if uvs is not None:
+        builder.setUVCoordinates(unique_data[:, 6:8].copy())
+    return builder.build()
@@ -0,0 +1,221 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from UM.Logger import Logger
+
+
+class TraceSpan:
+    """A single timed phase of a slice session."""
+
+    def __init__(self, name: str, start: float, end: float, thread_id: int, args: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.start = start  # Seconds, as returned by time.perf_counter().
+        self.end = end
+        self.thread_id = thread_id
+        self.args = args if args is not None else {}
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class SliceSession:
+    """All spans that were recorded while slicing one build plate."""
+
+    def __init__(self, session_id: int, build_plate_number: Optional[int]) -> None:
+        self.session_id = session_id
+        self.build_plate_number = build_plate_number
+        self.start = time.perf_counter()
+        self.wall_clock_start = time.time()
+        self.end = None  # type: Optional[float]
+        self.spans = []  # type: List[TraceSpan]
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def getPhaseDurations(self) -> Dict[str, float]:
+        """Get the total time spent per phase name, in seconds."""
+
+        result = {}  # type: Dict[str, float]
+        for span in self.spans:
+            result[span.name] = result.get(span.name, 0.0) + span.duration
+        return result
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "build_plate_number": self.build_plate_number,
+            "start_time": self.wall_clock_start,
+            "duration": self.duration,
+            "phases": self.getPhaseDurations(),
+            "spans": [{
+                "name": span.name,
+                "start": span.start - self.start,
+                "duration": span.duration,
+                "thread_id": span.thread_id,
+                "args": span.args
+            } for span in self.spans]
+        }
+
+    def toChromeTrace(self) -> Dict[str, Any]:
+        """Convert the session to the Trace Event Format, as read by chrome://tracing and Perfetto."""
+
+        events = []
+        for span in self.spans:
+            events.append({
+                "name": span.name,
+                "cat": "slice",
+                "ph": "X",  # Complete event, with a start and a duration.
+                "ts": (span.start - self.start) * 1e6,  # In microseconds.
+                "dur": span.duration * 1e6,
+                "pid": self.session_id,
+                "tid": span.thread_id,
+                "args": span.args
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"build_plate_number": self.build_plate_number}
+        }
+
+
+# The session that spans are added to, for the thread or job that is running.
+_current_session = ContextVar("slice_session", default = None)  # type: ContextVar[Optional[SliceSession]]
+
+
+class SliceSessionTracer:
+    """Records where the time goes in the slicing pipeline.
+
+    A session is started for every build plate that gets sliced. While the session is running, the different parts
+    of the pipeline (error check, StartSliceJob, the engine, processing the layers) add spans to it. Sessions can be
+    exported as JSON or as a Chrome trace.
+
+    The session that spans go to is context-local. Starting a session makes it the current session of the thread that
+    started it. Jobs that run on other threads take the session that was current when they were created, and activate
+    it while they run. That way, spans of jobs for different sessions that run at the same time each go to their own
+    session. Code that outlives the context it started in, such as a callback of the engine, can pass the session to
+    addSpan instead.
+    """
+
+    __instance = None  # type: Optional["SliceSessionTracer"]
+
+    @classmethod
+    def getInstance(cls) -> "SliceSessionTracer":
+        if cls.__instance is None:
+            cls.__instance = SliceSessionTracer()
+        return cls.__instance
+
+    def __init__(self, max_sessions: int = 20) -> None:
+        self._lock = threading.Lock()
+        self._sessions = deque(maxlen = max_sessions)  # type: Deque[SliceSession]
+        self._next_session_id = 1
+
+    def startSession(self, build_plate_number: Optional[int] = None) -> SliceSession:
+        """Start recording a new session, and make it the current session. The session that was current is ended."""
+
+        previous_session = _current_session.get()
+        with self._lock:
+            if previous_session is not None and previous_session.end is None:
+                previous_session.end = time.perf_counter()
+            session = SliceSession(self._next_session_id, build_plate_number)
+            self._next_session_id += 1
+            self._sessions.append(session)
+        _current_session.set(session)
+        return session
+
+    def endSession(self, session: Optional[SliceSession] = None) -> Optional[SliceSession]:
+        """End a session and log a summary of its phases.
+
+        Spans that are added afterwards (e.g. when processing the layers finishes later) still go to this session.
+        :param session: The session to end. Defaults to the current session.
+        """
+
+        if session is None:
+            session = _current_session.get()
+        with self._lock:
+            if session is None or session.end is not None:
+                return session
+            session.end = time.perf_counter()
+
+        phases = ", ".join("{name}: {duration:.3f}s".format(name = name, duration = duration) for name, duration in session.getPhaseDurations().items())
+        Logger.log("d", "Slice session {id} for build plate {plate} took {duration:.3f}s ({phases})".format(id = session.session_id, plate = session.build_plate_number, duration = session.duration, phases = phases))
+        return session
+
+    def addSpan(self, name: str, start: float, end: Optional[float] = None, session: Optional[SliceSession] = None, **kwargs: Any) -> None:
+        """Add a span of which the start time was measured separately.
+
+        :param name: The name of the phase.
+        :param start: The start of the span, from time.perf_counter().
+        :param end: The end of the span, from time.perf_counter(). Defaults to now.
+        :param session: The session to add the span to. Defaults to the current session.
+        :param kwargs: Extra information to store with the span.
+        """
+
+        if session is None:
+            session = _current_session.get()
+            if session is None:
+                return
+        if end is None:
+            end = time.perf_counter()
+        span = TraceSpan(name, start, end, threading.get_ident(), kwargs)
+        with self._lock:
+            session.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, **kwargs: Any) -> Iterator[None]:
+        """Context manager that records the code that it wraps as a span in the current session."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addSpan(name, start, **kwargs)
+
+    @contextmanager
+    def activate(self, session: Optional[SliceSession]) -> Iterator[None]:
+        """Context manager that makes a session the current one while the code that it wraps runs.
+
+        :param session: The session, usually the one that was current when a job was created. None to record nothing.
+        """
+
+        token = _current_session.set(session)
+        try:
+            yield
+        finally:
+            _current_session.reset(token)
+
+    def getCurrentSession(self) -> Optional[SliceSession]:
+        return _current_session.get()
+
+    def getSessions(self) -> List[SliceSession]:
+        with self._lock:
+            return list(self._sessions)
+
+    def exportJson(self, file_path: str) -> None:
+        """Write all recorded sessions to a JSON file."""
+
+        with open(file_path, "w", encoding = "utf-8") as f:
+            json.dump([session.toDict() for session in self.getSessions()], f, indent = 2)
+
+    def exportChromeTrace(self, file_path: str) -> None:
+        """Write all recorded sessions to a file that can be loaded in chrome://tracing or Perfetto."""
+
+        events = []  # type: List[Dict[str, Any]]
+        sessions = self.getSessions()
+        for session in sessions:
+            offset = (session.wall_clock_start - sessions[0].wall_clock_start) * 1e6
+            for event in session.toChromeTrace()["traceEvents"]:
+                event["ts"] += offset
+                events.append(event)
+        with open(file_path, "w", encoding = "utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -14,8 +14,14 @@ if "" in sys.path:
 
 import argparse
 import faulthandler
+import multiprocessing
 import os
 
+# Worker processes (for instance the ones that arrange objects) are started by running this script again. A frozen build
+# has to hand those processes over to multiprocessing here, before anything else happens.
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
 # set the environment variable QT_QUICK_FLICKABLE_WHEEL_DECELERATION to 5000 as mentioned in qt6.6 update log to overcome scroll related issues
 os.environ["QT_QUICK_FLICKABLE_WHEEL_DECELERATION"] = str(int(os.environ.get("QT_QUICK_FLICKABLE_WHEEL_DECELERATION", "5000")))
 
@@ -239,5 +245,7 @@ if ApplicationMetadata.CuraDebugMode:
     ssl_conf.setPeerVerifyMode(QSslSocket.PeerVerifyMode.VerifyNone)
     QSslConfiguration.setDefaultConfiguration(ssl_conf)
 
-app = CuraApplication()
-app.run()
+# Worker processes also run this script, but must not start the application.
+if __name__ == "__main__":
+    app = CuraApplication()
+    app.run()
@@ -3,6 +3,7 @@
 import json
 import os.path
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union, TYPE_CHECKING, cast
 
 import pySavitar as Savitar
@@ -13,7 +14,7 @@ from PyQt6.QtGui import QImage, QImageReader
 from UM.Logger import Logger
 from UM.Math.Matrix import Matrix
 from UM.Math.Vector import Vector
-from UM.Mesh.MeshBuilder import MeshBuilder
+from UM.Mesh.MeshData import MeshData
 from UM.Mesh.MeshReader import MeshReader
 from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType
 from UM.Scene.GroupDecorator import GroupDecorator
@@ -30,6 +31,7 @@ from cura.Scene.CuraSceneNode import CuraSceneNode
 from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
 from cura.Scene.ZOffsetDecorator import ZOffsetDecorator
 from cura.Settings.ExtruderManager import ExtruderManager
+from cura.Utils.IndexedMesh import createIndexedMeshData
 
 try:
     if not TYPE_CHECKING:
@@ -39,6 +41,17 @@ except ImportError:
     import xml.etree.ElementTree as ET
 
 
+class _PreparedSavitarNode:
+    """A node of a 3MF file of which the component data and meshes are read, but that is not a scene node yet."""
+
+    def __init__(self, savitar_node: Savitar.SceneNode, file_name: str) -> None:
+        self.savitar_node = savitar_node
+        self.file_name = file_name
+        self.mesh_data = None  # type: Optional[MeshData]
+        self.texture_data = None  # type: Optional[bytes]
+        self.children = []  # type: List[_PreparedSavitarNode]
+
+
 class ThreeMFReader(MeshReader):
     """Base implementation for reading 3MF files. Has no support for textures. Only loads meshes!"""
 
@@ -59,6 +72,8 @@ class ThreeMFReader(MeshReader):
         self._unit = None
         self._empty_project = False
 
+        CuraApplication.getInstance().getPreferences().addPreference("3mfreader/parallel_import", True)
+
     def emptyFileHintSet(self) -> bool:
         return self._empty_project
 
@@ -97,12 +112,82 @@ class ThreeMFReader(MeshReader):
 
         return temp_mat
 
+    @staticmethod
+    def _prepareSavitarNode(savitar_node: Savitar.SceneNode, file_name: str = "", archive: zipfile.ZipFile = None, scene: Savitar.Scene = None) -> "_PreparedSavitarNode":
+        """Read the component data and build the meshes of a node and its children.
+
+        This doesn't touch the Cura scene, so it can be done for multiple nodes at the same time.
+
+        :returns: The prepared data of the node, to create a scene node from.
+        """
+
+        component_path = savitar_node.getComponentPath()
+        if component_path != "" and archive is not None:
+            savitar_node.parseComponentData(archive.open(component_path.lstrip("/")).read())
+
+        try:
+            mesh_id = str(savitar_node.getId())
+        except AttributeError:  # Outdated version of libSavitar, which is logged when creating the scene node.
+            mesh_id = ""
+
+        mesh_data = savitar_node.getMeshData()
+
+        # Read the indexed vertices from Savitar without copying them, if this version of Savitar supports it.
+        if hasattr(mesh_data, "getVerticesAsBytes") and hasattr(mesh_data, "getFacesAsBytes"):
+            vertices = numpy.frombuffer(mesh_data.getVerticesAsBytes(), dtype = numpy.float32)
+            faces = numpy.frombuffer(mesh_data.getFacesAsBytes(), dtype = numpy.int32)
+        else:
+            vertices = numpy.frombuffer(mesh_data.getFlatVerticesAsBytes(), dtype = numpy.float32)
+            faces = None
+
+        texture_path = mesh_data.getTexturePath(scene)
+        uv_coordinates = numpy.frombuffer(mesh_data.getUVCoordinatesPerVertexAsBytes(scene), dtype = numpy.float32)
+        if uv_coordinates.size == 0:
+            uv_coordinates = None
+
+        # The filename is used to give the user the option to reload the file if it is changed on disk
+        # It is only set for the root node of the 3mf file
+        prepared = _PreparedSavitarNode(savitar_node, file_name)
+        prepared.mesh_data = createIndexedMeshData(vertices, faces, uvs = uv_coordinates, file_name = file_name if file_name else None, mesh_id = mesh_id)
+        if texture_path != "" and archive is not None and len(prepared.mesh_data.getVertices()):
+            prepared.texture_data = archive.open(texture_path).read()
+
+        prepared.children = [ThreeMFReader._prepareSavitarNode(child, archive = archive, scene = scene) for child in savitar_node.getChildren()]
+        return prepared
+
+    @staticmethod
+    def _prepareSavitarNodes(savitar_nodes: List[Savitar.SceneNode], file_name: str, archive: zipfile.ZipFile, scene: Savitar.Scene) -> List["_PreparedSavitarNode"]:
+        """Prepare the top-level nodes of a 3MF file, on multiple threads if parallel import is enabled.
+
+        The nodes are independent objects, so their component files and meshes can be read at the same time. The
+        archive is shared; zipfile allows reading multiple members from it at once.
+        """
+
+        parallel = CuraApplication.getInstance().getPreferences().getValue("3mfreader/parallel_import")
+        if not parallel or len(savitar_nodes) < 2:
+            return [ThreeMFReader._prepareSavitarNode(node, file_name, archive, scene) for node in savitar_nodes]
+
+        with ThreadPoolExecutor(max_workers = min(len(savitar_nodes), os.cpu_count() or 1), thread_name_prefix = "ThreeMFReader") as executor:
+            return list(executor.map(lambda node: ThreeMFReader._prepareSavitarNode(node, file_name, archive, scene), savitar_nodes))
+
     @staticmethod
     def _convertSavitarNodeToUMNode(savitar_node: Savitar.SceneNode, file_name: str = "", archive: zipfile.ZipFile = None, scene: Savitar.Scene = None) -> Optional[SceneNode]:
         """Convenience function that converts a SceneNode object (as obtained from libSavitar) to a scene node.
 
         :returns: Scene node.
         """
+
+        return ThreeMFReader._createUMNode(ThreeMFReader._prepareSavitarNode(savitar_node, file_name, archive, scene))
+
+    @staticmethod
+    def _createUMNode(prepared: "_PreparedSavitarNode") -> Optional[SceneNode]:
+        """Create the scene node, with its decorators and settings, from a prepared node of a 3MF file.
+
+        :returns: Scene node.
+        """
+
+        savitar_node = prepared.savitar_node
+        file_name = prepared.file_name
         try:
             node_name = savitar_node.getName()
             node_id = str(savitar_node.getId())
@@ -119,10 +204,6 @@ class ThreeMFReader(MeshReader):
 
         active_build_plate = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
 
-        component_path = savitar_node.getComponentPath()
-        if component_path != "" and archive is not None:
-            savitar_node.parseComponentData(archive.open(component_path.lstrip("/")).read())
-
         um_node = CuraSceneNode() # This adds a SettingOverrideDecorator
         um_node.addDecorator(BuildPlateDecorator(active_build_plate))
         try:
@@ -133,33 +214,12 @@ class ThreeMFReader(MeshReader):
         um_node.setId(node_id)
         transformation = ThreeMFReader._createMatrixFromTransformationString(savitar_node.getTransformation())
         um_node.setTransformation(transformation)
-        mesh_builder = MeshBuilder()
-
-        mesh_data = savitar_node.getMeshData()
-
-        vertices_data = numpy.fromstring(mesh_data.getFlatVerticesAsBytes(), dtype=numpy.float32)
-        vertices = numpy.resize(vertices_data, (int(vertices_data.size / 3), 3))
-
-        texture_path = mesh_data.getTexturePath(scene)
-        uv_data = numpy.fromstring(mesh_data.getUVCoordinatesPerVertexAsBytes(scene), dtype=numpy.float32)
-        uv_coordinates = numpy.resize(uv_data, (int(uv_data.size / 2), 2))
-
-        mesh_builder.setVertices(vertices)
-        mesh_builder.calculateNormals(fast=True)
-        mesh_builder.setMeshId(node_id)
-        mesh_builder.setUVCoordinates(uv_coordinates)
-        if file_name:
-            # The filename is used to give the user the option to reload the file if it is changed on disk
-            # It is only set for the root node of the 3mf file
-            mesh_builder.setFileName(file_name)
-
-        mesh_data = mesh_builder.build()
 
-        if len(mesh_data.getVertices()):
-            um_node.setMeshData(mesh_data)
+        if len(prepared.mesh_data.getVertices()):
+            um_node.setMeshData(prepared.mesh_data)
 
-        for child in savitar_node.getChildren():
-            child_node = ThreeMFReader._convertSavitarNodeToUMNode(child, archive=archive, scene=scene)
+        for child in prepared.children:
+            child_node = ThreeMFReader._createUMNode(child)
             if child_node:
                 um_node.addChild(child_node)
 
@@ -232,11 +292,10 @@ class ThreeMFReader(MeshReader):
             sliceable_decorator = SliceableObjectDecorator()
             um_node.addDecorator(sliceable_decorator)
 
-            if texture_path != "" and archive is not None:
-                texture_data = archive.open(texture_path).read()
+            if prepared.texture_data is not None:
                 texture_buffer = QBuffer()
                 texture_buffer.open(QBuffer.OpenModeFlag.ReadWrite)
-                texture_buffer.write(texture_data)
+                texture_buffer.write(prepared.texture_data)
 
                 image_reader = QImageReader(texture_buffer, b"png")
 
@@ -260,6 +319,7 @@ class ThreeMFReader(MeshReader):
     def _read(self, file_name: str) -> Union[SceneNode, List[SceneNode]]:
         self._empty_project = False
         result = []
+        archive = None
         # The base object of 3mf is a zipped archive.
         try:
             archive = zipfile.ZipFile(file_name, "r")
@@ -271,8 +331,10 @@ class ThreeMFReader(MeshReader):
             for key, value in scene_3mf.getMetadata().items():
                 CuraApplication.getInstance().getController().getScene().setMetaDataEntry(key, value)
 
-            for node in scene_3mf.getSceneNodes():
-                um_node = ThreeMFReader._convertSavitarNodeToUMNode(node, file_name, archive, scene_3mf)
+            # Read the objects first, possibly in parallel. Only then create the scene nodes from them, one by one.
+            prepared_nodes = ThreeMFReader._prepareSavitarNodes(scene_3mf.getSceneNodes(), file_name, archive, scene_3mf)
+            for prepared_node in prepared_nodes:
+                um_node = ThreeMFReader._createUMNode(prepared_node)
                 if um_node is None:
                     continue
 
@@ -333,6 +395,9 @@ class ThreeMFReader(MeshReader):
         except Exception:
             Logger.logException("e", "An exception occurred in 3mf reader.")
             return []
+        finally:
+            if archive is not None:
+                archive.close()
 
         return result
 
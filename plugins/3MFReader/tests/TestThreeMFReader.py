@@ -0,0 +1,110 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+import sys
+import threading
+import time
+import zipfile
+from unittest.mock import ANY, MagicMock, patch
+
+import numpy
+import pytest
+
+from UM.Mesh.MeshBuilder import MeshBuilder
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ThreeMFReader
+
+
+def createSavitarNode(node_id: int, name: str = "") -> MagicMock:
+    """Create a node like libSavitar reads from a 3MF file, with a single triangle as mesh."""
+
+    vertices = numpy.array([[0, 0, 0], [10, 0, 0], [0, 10, node_id]], dtype = numpy.float32)
+    mesh_data = MagicMock()
+    mesh_data.getVerticesAsBytes.return_value = vertices.tobytes()
+    mesh_data.getFacesAsBytes.return_value = numpy.array([0, 1, 2], dtype = numpy.int32).tobytes()
+    mesh_data.getTexturePath.return_value = ""
+    mesh_data.getUVCoordinatesPerVertexAsBytes.return_value = b""
+
+    savitar_node = MagicMock()
+    savitar_node.getId.return_value = node_id
+    savitar_node.getName.return_value = name
+    savitar_node.getComponentPath.return_value = ""
+    savitar_node.getMeshData.return_value = mesh_data
+    savitar_node.getTransformation.return_value = ""
+    savitar_node.getChildren.return_value = []
+    savitar_node.getSettings.return_value = {}
+    return savitar_node
+
+
+@pytest.fixture
+def application():
+    application = MagicMock()
+    application.getGlobalContainerStack.return_value = None
+    application.getPreferences().getValue.return_value = True  # Parallel import.
+    with patch("cura.CuraApplication.CuraApplication.getInstance", MagicMock(return_value = application)):
+        yield application
+
+
+def test_meshIdRoundTrips(application):
+    savitar_node = createSavitarNode(12)
+    with patch.object(MeshBuilder, "setMeshId", autospec = True, side_effect = MeshBuilder.setMeshId) as set_mesh_id:
+        um_node = ThreeMFReader.ThreeMFReader._convertSavitarNodeToUMNode(savitar_node)
+
+    assert um_node.getId() == "12"
+    set_mesh_id.assert_called_once_with(ANY, "12")
+
+
+def prepareNodes(application, savitar_nodes, parallel):
+    application.getPreferences().getValue.return_value = parallel
+    return ThreeMFReader.ThreeMFReader._prepareSavitarNodes(savitar_nodes, "", None, None)
+
+
+def test_parallelImportKeepsOrder(application):
+    savitar_nodes = [createSavitarNode(node_id) for node_id in range(1, 5)]
+    mesh_data = savitar_nodes[0].getMeshData.return_value
+    read_threads = []
+
+    def slowMeshData():
+        read_threads.append(threading.current_thread().name)
+        time.sleep(0.1)  # The first object finishes last.
+        return mesh_data
+    savitar_nodes[0].getMeshData.return_value = None
+    savitar_nodes[0].getMeshData.side_effect = slowMeshData
+
+    sequential = prepareNodes(application, savitar_nodes, parallel = False)
+    assert read_threads == [threading.current_thread().name]
+    parallel = prepareNodes(application, savitar_nodes, parallel = True)
+    assert read_threads[1].startswith("ThreeMFReader")
+
+    assert [prepared.savitar_node for prepared in parallel] == savitar_nodes
+    for sequential_node, parallel_node in zip(sequential, parallel):
+        assert numpy.array_equal(sequential_node.mesh_data.getVertices(), parallel_node.mesh_data.getVertices())
+        assert numpy.array_equal(sequential_node.mesh_data.getIndices(), parallel_node.mesh_data.getIndices())
+
+    sequential_ids = [ThreeMFReader.ThreeMFReader._createUMNode(prepared).getId() for prepared in sequential]
+    parallel_ids = [ThreeMFReader.ThreeMFReader._createUMNode(prepared).getId() for prepared in parallel]
+    assert sequential_ids == parallel_ids == ["1", "2", "3", "4"]
+
+
+def test_parallelImportError(application, tmp_path):
+    savitar_nodes = [createSavitarNode(node_id) for node_id in range(1, 5)]
+    savitar_nodes[2].getMeshData.side_effect = RuntimeError("Corrupt mesh")
+
+    with pytest.raises(RuntimeError):
+        prepareNodes(application, savitar_nodes, parallel = True)
+
+    # Reading the file fails as a whole, instead of leaving out the object that failed.
+    file_name = str(tmp_path / "objects.3mf")
+    with zipfile.ZipFile(file_name, "w") as archive:
+        archive.writestr("3D/3dmodel.model", "")
+    scene = MagicMock()
+    scene.getSceneNodes.return_value = savitar_nodes
+    scene.getMetadata.return_value = {}
+    scene.getUnit.return_value = "millimeter"
+    with patch("ThreeMFReader.Savitar.ThreeMFParser") as parser, patch("ThreeMFReader.Logger") as logger:
+        parser.return_value.parse.return_value = scene
+        assert ThreeMFReader.ThreeMFReader()._read(file_name) == []
+    logger.logException.assert_called_once()
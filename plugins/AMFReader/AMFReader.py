@@ -7,13 +7,14 @@ from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType
 from cura.CuraApplication import CuraApplication
 from UM.Logger import Logger
 
-from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices
+from UM.Mesh.MeshData import MeshData
 from UM.Mesh.MeshReader import MeshReader
 
 from cura.Scene.CuraSceneNode import CuraSceneNode
 from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
 from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
 from cura.Scene.ConvexHullDecorator import ConvexHullDecorator
+from cura.Utils.IndexedMesh import createIndexedMeshData
 from UM.Scene.GroupDecorator import GroupDecorator
 
 import numpy
@@ -154,26 +155,4 @@ class AMFReader(MeshReader):
         :param file_name: The full original filename used to watch for changes
         :return: Mesh data from the Trimesh in a way that Uranium can understand it.
         """
-        tri_faces = tri_node.faces
-        tri_vertices = tri_node.vertices
-
-        indices_list = []
-        vertices_list = []
-
-        index_count = 0
-        face_count = 0
-        for tri_face in tri_faces:
-            face = []
-            for tri_index in tri_face:
-                vertices_list.append(tri_vertices[tri_index])
-                face.append(index_count)
-                index_count += 1
-            indices_list.append(face)
-            face_count += 1
-
-        vertices = numpy.asarray(vertices_list, dtype = numpy.float32)
-        indices = numpy.asarray(indices_list, dtype = numpy.int32)
-        normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
-
-        mesh_data = MeshData(vertices = vertices, indices = indices, normals = normals,file_name = file_name)
-        return mesh_data
+        return createIndexedMeshData(tri_node.vertices, tri_node.faces, file_name = file_name)
@@ -7,7 +7,7 @@ from collections import defaultdict
 import os
 from PyQt6.QtCore import QObject, QTimer, QUrl, pyqtSlot
 import sys
-from time import time
+from time import perf_counter, time
 from typing import Any, cast, Dict, List, Optional, Set, TYPE_CHECKING
 
 from PyQt6.QtGui import QDesktopServices, QImage
@@ -26,9 +26,12 @@ from UM.Settings.SettingInstance import SettingInstance #For typing.
 from UM.Tool import Tool #For typing.
 
 from cura.CuraApplication import CuraApplication
+from cura.Scene.GCodeBuffer import GCodeBuffer
 from cura.Settings.ExtruderManager import ExtruderManager
 from cura.Snapshot import Snapshot
+from cura.Utils.SliceSessionTracer import SliceSession, SliceSessionTracer
 from cura.Utils.Threading import call_on_qt_thread
+from .EnginePool import EnginePool, EngineWorker
 from .ProcessSlicedLayersJob import ProcessSlicedLayersJob
 from .StartSliceJob import StartSliceJob, StartJobResult
 
@@ -155,6 +158,7 @@ class CuraEngineBackend(QObject, Backend):
         self._always_restart: bool = True # Always restart the engine when starting a new slice. Don't keep the process running. TODO: Fix engine statelessness.
         self._process_layers_job: Optional[ProcessSlicedLayersJob] = None # The currently active job to process layers, or None if it is not processing layers.
         self._build_plates_to_be_sliced: List[int] = []  # what needs slicing?
+        self._engine_pool: Optional[EnginePool] = None  # Additional engine processes, to slice multiple build plates at the same time.
         self._engine_is_fresh: bool = True  # Is the newly started engine used before or not?
 
         self._backend_log_max_lines: int = 20000  # Maximum number of lines to buffer
@@ -169,9 +173,23 @@ class CuraEngineBackend(QObject, Backend):
         self._time_start_process: Optional[float] = None
         self._is_disabled: bool = False
 
+        # Structured timing of the phases of each slice, see exportSliceTrace().
+        self._slice_tracer: SliceSessionTracer = SliceSessionTracer.getInstance()
+        self._trace_session: Optional[SliceSession] = None  # The messages of the engine may arrive outside the context of the slice.
+        self._trace_engine_start: Optional[float] = None
+        self._trace_gcode_receive_start: Optional[float] = None
+
         application.getPreferences().addPreference("general/auto_slice", False)
         application.getPreferences().addPreference("info/send_engine_crash", True)
         application.getPreferences().addPreference("info/anonymous_engine_crash_report", True)
+        # The number of engine processes to slice multiple build plates with at the same time. 1 disables this.
+        application.getPreferences().addPreference("backend/max_engine_processes", 1)
+        self._max_engine_processes_override: Optional[int] = None
+        # Keep the engine processes of the engine pool running between slices, see EnginePool. This only applies to
+        # slicing multiple build plates in parallel. A single build plate is sliced by the engine of the backend itself,
+        # which is already started again right after every slice (see _onBackendQuit).
+        application.getPreferences().addPreference("backend/persistent_engine", True)
+        self._persistent_engine_override: Optional[bool] = None
 
         self._use_timer: bool = False
 
@@ -248,6 +266,19 @@ class CuraEngineBackend(QObject, Backend):
         self._resetLastSliceTimeStats()
         return last_slice_data
 
+    @pyqtSlot(str)
+    def exportSliceTrace(self, file_path: str) -> None:
+        """Write the timing of the recent slices to a file, in the Chrome trace format.
+
+        The file can be opened with chrome://tracing or https://ui.perfetto.dev.
+        :param file_path: The file to write to. If it ends with ".json", the plain JSON summary is written instead.
+        """
+
+        if file_path.endswith(".trace.json") or not file_path.endswith(".json"):
+            self._slice_tracer.exportChromeTrace(file_path)
+        else:
+            self._slice_tracer.exportJson(file_path)
+
     def initialize(self) -> None:
         application = CuraApplication.getInstance()
         self._multi_build_plate_model = application.getMultiBuildPlateModel()
@@ -287,11 +318,14 @@ class CuraEngineBackend(QObject, Backend):
 
         # Terminate CuraEngine if it is still running at this point
         self._terminate()
+        if self._engine_pool is not None:
+            self._engine_pool.terminate()
 
-    def getEngineCommand(self) -> List[str]:
+    def getEngineCommand(self, port: Optional[int] = None) -> List[str]:
         """Get the command that is used to call the engine.
 
         This is useful for debugging and used to actually start the engine.
+        :param port: The port the engine should connect to. Defaults to the port of the main engine process.
         :return: list of commands and args / parameters.
         """
         from cura import ApplicationMetadata
@@ -299,7 +333,7 @@ class CuraEngineBackend(QObject, Backend):
             command = [self._default_engine_location]
         else:
             command = [CuraApplication.getInstance().getPreferences().getValue("backend/location")]
-        command += ["connect", "127.0.0.1:{0}".format(self._port), ""]
+        command += ["connect", "127.0.0.1:{0}".format(port if port is not None else self._port), ""]
 
         parser = argparse.ArgumentParser(prog = "cura", add_help = False)
         parser.add_argument("--debug", action = "store_true", default = False,
@@ -333,6 +367,15 @@ class CuraEngineBackend(QObject, Backend):
         self.markSliceAll()
         self.slice()
 
+    def isSlicing(self) -> bool:
+        """Whether a slice is running, or build plates are still waiting to be sliced.
+
+        The state is set to Done after every build plate that is sliced on its own, so this tells whether the g-code of
+        all build plates is there yet.
+        """
+
+        return self._slicing or bool(self._build_plates_to_be_sliced)
+
     @call_on_qt_thread  # Must be called from the main thread because of OpenGL
     def _createSnapshot(self) -> None:
         self._snapshot = None
@@ -377,6 +420,10 @@ class CuraEngineBackend(QObject, Backend):
             self._scene.gcode_dict = {}  # type: ignore
             # We need to ignore type because we are creating the missing attribute here.
 
+        if self._shouldSliceInEnginePool():
+            self._sliceInEnginePool()
+            return
+
         # see if we really have to slice
         application = CuraApplication.getInstance()
         active_build_plate = application.getMultiBuildPlateModel().activeBuildPlate
@@ -387,7 +434,7 @@ class CuraEngineBackend(QObject, Backend):
         self._stored_layer_data = []
 
         if build_plate_to_be_sliced not in num_objects or num_objects[build_plate_to_be_sliced] == 0:
-            self._scene.gcode_dict[build_plate_to_be_sliced] = []   # type: ignore
+            self._scene.gcode_dict[build_plate_to_be_sliced] = GCodeBuffer()   # type: ignore
             # We need to ignore the type because we created this attribute above.
             Logger.log("d", "Build plate %s has no objects to be sliced, skipping", build_plate_to_be_sliced)
             if self._build_plates_to_be_sliced:
@@ -405,12 +452,16 @@ class CuraEngineBackend(QObject, Backend):
         self.processingProgress.emit(0.0)
         self.backendStateChange.emit(BackendState.NotStarted)
 
-        self._scene.gcode_dict[build_plate_to_be_sliced] = []  # type: ignore #[] indexed by build plate number
+        self._scene.gcode_dict[build_plate_to_be_sliced] = GCodeBuffer()  # type: ignore #GCodeBuffer indexed by build plate number
         self._slicing = True
         self.slicingStarted.emit()
 
         self.determineAutoSlicing()  # Switch timer on or off if appropriate
 
+        self._trace_session = self._slice_tracer.startSession(build_plate_to_be_sliced)
+        self._trace_engine_start = None
+        self._trace_gcode_receive_start = None
+
         slice_message = self._socket.createMessage("cura.proto.Slice")
         self._start_slice_job = StartSliceJob(slice_message)
         self._start_slice_job_build_plate = build_plate_to_be_sliced
@@ -418,12 +469,181 @@ class CuraEngineBackend(QObject, Backend):
         self._start_slice_job.start()
         self._start_slice_job.finished.connect(self._onStartSliceCompleted)
 
+    def getMaxEngineProcesses(self) -> int:
+        """The number of engine processes to slice multiple build plates with at the same time."""
+
+        if self._max_engine_processes_override is not None:
+            return self._max_engine_processes_override
+        return max(1, int(CuraApplication.getInstance().getPreferences().getValue("backend/max_engine_processes")))
+
+    def setMaxEngineProcesses(self, max_engine_processes: Optional[int]) -> None:
+        """Use a different number of engine processes than the preference says, without changing the preference.
+
+        :param max_engine_processes: The number of engine processes to use, or None to use the preference again.
+        """
+
+        self._max_engine_processes_override = max(1, max_engine_processes) if max_engine_processes is not None else None
+
+    def usePersistentEngine(self) -> bool:
+        """Whether the engine processes that slice build plates in parallel are kept running between slices.
+
+        Has no effect when slicing a single build plate, or when backend/max_engine_processes is 1.
+        """
+
+        if self._persistent_engine_override is not None:
+            return self._persistent_engine_override
+        return bool(CuraApplication.getInstance().getPreferences().getValue("backend/persistent_engine"))
+
+    def setPersistentEngine(self, persistent: Optional[bool]) -> None:
+        """Keep the engine processes running between slices or not, without changing the preference.
+
+        :param persistent: Whether to keep the engine processes running, or None to use the preference again.
+        """
+
+        self._persistent_engine_override = persistent
+        if self._engine_pool is not None:
+            self._engine_pool.setPersistent(self.usePersistentEngine())
+
+    def _shouldSliceInEnginePool(self) -> bool:
+        """Whether the build plates that need slicing should be sliced in parallel, by multiple engine processes."""
+
+        application = CuraApplication.getInstance()
+        if application.getUseExternalBackend():
+            return False
+        if self.getMaxEngineProcesses() < 2:
+            return False
+        if len(self._build_plates_to_be_sliced) < 2:
+            return False
+        # Engine plug-ins serve a single engine, so they can't be used by multiple engines at the same time.
+        return not any(plugin.usePlugin() for plugin in application.getBackendPlugins())
+
+    def _sliceInEnginePool(self) -> None:
+        """Slice all build plates that need slicing at the same time, each in an engine process of its own."""
+
+        application = CuraApplication.getInstance()
+        max_workers = self.getMaxEngineProcesses()
+        if self._engine_pool is None:
+            plugin_path = PluginRegistry.getInstance().getPluginPath(self.getPluginId())
+            if not plugin_path:
+                Logger.error("Could not get plugin path!", self.getPluginId())
+                return
+            self._engine_pool = EnginePool(self, os.path.abspath(os.path.join(plugin_path, "Cura.proto")), max_workers, self.usePersistentEngine())
+        else:
+            self._engine_pool.setMaxWorkers(max_workers)
+            self._engine_pool.setPersistent(self.usePersistentEngine())
+
+        self.stopSlicing()
+        self._trace_session = self._slice_tracer.startSession()
+        self._stored_layer_data = []
+        self.processingProgress.emit(0.0)
+        self.backendStateChange.emit(BackendState.NotStarted)
+        self._slicing = True
+        self.slicingStarted.emit()
+        self.determineAutoSlicing()  # Switch timer on or off if appropriate
+
+        active_build_plate = application.getMultiBuildPlateModel().activeBuildPlate
+        num_objects = self._numObjectsPerBuildPlate()
+        self._engine_pool.resetProgress()
+        while self._build_plates_to_be_sliced:
+            build_plate_number = self._build_plates_to_be_sliced.pop(0)
+            self._scene.gcode_dict[build_plate_number] = GCodeBuffer()  # type: ignore
+            if num_objects[build_plate_number] == 0:
+                Logger.log("d", "Build plate %s has no objects to be sliced, skipping", build_plate_number)
+                continue
+            self._stored_optimized_layer_data[build_plate_number] = []
+            if application.getPrintInformation() and build_plate_number == active_build_plate:
+                application.getPrintInformation().setToZeroPrintInformation(build_plate_number)
+            self._engine_pool.submit(build_plate_number)
+
+        if not self._engine_pool.isBusy():
+            self._onEnginePoolFinished()
+
+    def onEngineWorkerStartSliceCompleted(self, worker: EngineWorker, job: StartSliceJob) -> None:
+        """Called when the slice message for one of the build plates in the engine pool is ready."""
+
+        if job.getResult() == StartJobResult.NothingToSlice and not job.isCancelled() and not job.getError():
+            # Nothing on this build plate can be sliced, so there is no g-code for it. Continue with the others.
+            self._onEngineWorkerBuildPlateDone(worker)
+            return
+
+        self._onStartSliceCompleted(job, worker)
+        if job.isCancelled() or job.getError() or job.getResult() != StartJobResult.Finished:
+            self._stopEnginePool()
+
+    def onEngineWorkerMessage(self, worker: EngineWorker, message: Arcus.PythonMessage) -> None:
+        """Called when one of the engines in the engine pool sends a message."""
+
+        message_type = message.getTypeName()
+        if message_type == "cura.proto.Progress":
+            worker.progress = message.amount
+            if self._engine_pool is not None:
+                self.processingProgress.emit(self._engine_pool.getProgress())
+            self.setState(BackendState.Processing)
+            return
+        if message_type == "cura.proto.SlicingFinished":
+            if worker.engine_start_time is not None:
+                self._slice_tracer.addSpan("engine", worker.engine_start_time, session = self._trace_session, build_plate_number = worker.getBuildPlate())
+            self._fillInGCodePlaceholders(worker.getBuildPlate())
+            self._onEngineWorkerBuildPlateDone(worker)
+            return
+
+        handler = self._message_handlers.get(message_type)
+        if handler is None:
+            Logger.log("w", "No handler for message type %s from the engine pool.", message_type)
+            return
+        # The message handlers store their results for the build plate that is being sliced, so switch to the build
+        # plate of this engine while handling its message.
+        previous_build_plate = self._start_slice_job_build_plate
+        self._start_slice_job_build_plate = worker.getBuildPlate()
+        try:
+            handler(message)
+        finally:
+            self._start_slice_job_build_plate = previous_build_plate
+
+    def onEngineWorkerFailed(self, worker: EngineWorker) -> None:
+        """Called when one of the engines in the engine pool could not be started or lost its connection."""
+
+        Logger.log("e", "Engine process for build plate %s failed. Stopping all engine processes.", worker.getBuildPlate())
+        self._stopEnginePool()
+        self._slicing_error_message.show()
+        self.setState(BackendState.Error)
+
+    def _onEngineWorkerBuildPlateDone(self, worker: EngineWorker) -> None:
+        if self._engine_pool is None:
+            return
+        build_plate_number = worker.getBuildPlate()
+        self._engine_pool.onWorkerFinished(worker)
+        if build_plate_number is not None:
+            self._processSlicedLayersIfVisible(build_plate_number)
+        self.processingProgress.emit(self._engine_pool.getProgress())
+        if not self._engine_pool.isBusy():
+            self._onEnginePoolFinished()
+
+    def _onEnginePoolFinished(self) -> None:
+        self._slicing = False
+        self._time_end_slice = time()
+        self.setState(BackendState.Done)
+        self.processingProgress.emit(1.0)
+        self._slice_tracer.endSession(self._trace_session)
+        if self._time_start_process:
+            Logger.log("d", "Slicing all build plates took %s seconds", time() - self._time_start_process)
+        if self._build_plates_to_be_sliced:
+            self.enableTimer()  # manually enable timer to be able to invoke slice, also when in manual slice mode
+            self._invokeSlice()
+
+    def _stopEnginePool(self) -> None:
+        if self._engine_pool is not None:
+            self._engine_pool.cancel()
+        self._slicing = False
+
     def _terminate(self) -> None:
         """Terminate the engine process.
 
         Start the engine process by calling _createSocket()
         """
         self._slicing = False
+        if self._engine_pool is not None:
+            self._engine_pool.cancel()
         self._stored_layer_data = []
         if self._start_slice_job_build_plate in self._stored_optimized_layer_data:
             del self._stored_optimized_layer_data[self._start_slice_job_build_plate]
@@ -450,7 +670,7 @@ class CuraEngineBackend(QObject, Backend):
                 # Terminating a process that is already terminating causes an exception, silently ignore this.
                 Logger.log("d", "Exception occurred while trying to kill the engine %s", str(e))
 
-    def _onStartSliceCompleted(self, job: StartSliceJob) -> None:
+    def _onStartSliceCompleted(self, job: StartSliceJob, worker: Optional[EngineWorker] = None) -> None:
         """Event handler to call when the job to initiate the slicing process is
         completed.
 
@@ -459,6 +679,7 @@ class CuraEngineBackend(QObject, Backend):
         bootstrapping of a slice job.
 
         :param job: The start slice job that was just finished.
+        :param worker: The engine of the engine pool that the job was for, or None for the main engine.
         """
         if self._error_message:
             self._error_message.hide()
@@ -598,7 +819,10 @@ class CuraEngineBackend(QObject, Backend):
             return
 
         # Preparation completed, send it to the backend.
-        immediate_success = self._socket.sendMessage(job.getSliceMessage())
+        if worker is not None:
+            immediate_success = worker.sendSliceMessage(job.getSliceMessage())
+        else:
+            immediate_success = self._socket.sendMessage(job.getSliceMessage())
         if (not CuraApplication.getInstance().getUseExternalBackend()) and (not immediate_success):
             if self._last_socket_error is not None and self._last_socket_error.getErrorCode() == Arcus.ErrorCode.MessageTooBigError:
                 error_txt = catalog.i18nc("@info:status", "Unable to send the model data to the engine. Please try to use a less detailed model, or reduce the number of instances.")
@@ -611,6 +835,8 @@ class CuraEngineBackend(QObject, Backend):
             self._error_message.show()
             self.setState(BackendState.Error)
             self.backendError.emit(job)
+            if worker is not None:
+                self._stopEnginePool()
             return
 
         # Notify the user that it's now up to the backend to do its job
@@ -618,6 +844,7 @@ class CuraEngineBackend(QObject, Backend):
 
         # Handle time reporting.
         self._time_send_message = time()
+        self._trace_engine_start = perf_counter()
         if self._time_start_process:
             Logger.log("d", "Sending slice message took %s seconds", self._time_send_message - self._time_start_process)
 
@@ -863,22 +1090,11 @@ class CuraEngineBackend(QObject, Backend):
         self.setState(BackendState.Done)
         self.processingProgress.emit(1.0)
         self._time_end_slice = time()
-
-        try:
-            gcode_list = self._scene.gcode_dict[self._start_slice_job_build_plate] #type: ignore
-            # We need to ignore the type because it was generated dynamically.
-        except KeyError:
-            # Can occur if the g-code has been cleared while a slice message is still arriving from the other end.
-            gcode_list = []
-        application = CuraApplication.getInstance()
-        for index, line in enumerate(gcode_list):
-            replaced = line.replace("{print_time}", str(application.getPrintInformation().currentPrintTime.getDisplayString(DurationFormat.Format.ISO8601)))
-            replaced = replaced.replace("{filament_amount}", str(application.getPrintInformation().materialLengths))
-            replaced = replaced.replace("{filament_weight}", str(application.getPrintInformation().materialWeights))
-            replaced = replaced.replace("{filament_cost}", str(application.getPrintInformation().materialCosts))
-            replaced = replaced.replace("{jobname}", str(application.getPrintInformation().jobName))
-
-            gcode_list[index] = replaced
+        if self._trace_engine_start is not None:
+            self._slice_tracer.addSpan("engine", self._trace_engine_start, session = self._trace_session)
+        if self._trace_gcode_receive_start is not None:
+            self._slice_tracer.addSpan("gcode_receive", self._trace_gcode_receive_start, session = self._trace_session)
+        self._fillInGCodePlaceholders(self._start_slice_job_build_plate)
 
         self._slicing = False
         if self._time_start_process:
@@ -886,16 +1102,11 @@ class CuraEngineBackend(QObject, Backend):
         Logger.log("d", "Number of models per buildplate: %s", dict(self._numObjectsPerBuildPlate()))
 
         # See if we need to process the sliced layers job.
-        active_build_plate = application.getMultiBuildPlateModel().activeBuildPlate
-        if (
-            self._layer_view_active and
-            (self._process_layers_job is None or not self._process_layers_job.isRunning()) and
-            active_build_plate == self._start_slice_job_build_plate and
-            active_build_plate not in self._build_plates_to_be_sliced):
-
-            self._startProcessSlicedLayersJob(active_build_plate)
+        if self._start_slice_job_build_plate is not None:
+            self._processSlicedLayersIfVisible(self._start_slice_job_build_plate)
         # self._onActiveViewChanged()
         self._start_slice_job_build_plate = None
+        self._slice_tracer.endSession(self._trace_session)
 
         Logger.log("d", "See if there is more to slice...")
         # Somehow this results in an Arcus Error
@@ -905,14 +1116,57 @@ class CuraEngineBackend(QObject, Backend):
             self.enableTimer()  # manually enable timer to be able to invoke slice, also when in manual slice mode
             self._invokeSlice()
 
+    def _fillInGCodePlaceholders(self, build_plate_number: Optional[int]) -> None:
+        """Provide the values of the placeholders that only become known after slicing, like {print_time}."""
+
+        placeholder_start = perf_counter()
+        try:
+            gcode_list = self._scene.gcode_dict[build_plate_number] #type: ignore
+            # We need to ignore the type because it was generated dynamically.
+        except KeyError:
+            # Can occur if the g-code has been cleared while a slice message is still arriving from the other end.
+            gcode_list = GCodeBuffer()
+        application = CuraApplication.getInstance()
+        print_information = application.getPrintInformation()
+        placeholder_values = {
+            "print_time": str(print_information.currentPrintTime.getDisplayString(DurationFormat.Format.ISO8601)),
+            "filament_amount": str(print_information.materialLengths),
+            "filament_weight": str(print_information.materialWeights),
+            "filament_cost": str(print_information.materialCosts),
+            "jobname": str(print_information.jobName)
+        }
+        if isinstance(gcode_list, GCodeBuffer):
+            # The placeholders are filled in lazily, when the g-code gets written.
+            gcode_list.setPlaceholderValues(placeholder_values)
+        else:
+            for index, line in enumerate(gcode_list):
+                for placeholder, value in placeholder_values.items():
+                    line = line.replace("{" + placeholder + "}", value)
+                gcode_list[index] = line
+        self._slice_tracer.addSpan("gcode_placeholders", placeholder_start, session = self._trace_session, build_plate_number = build_plate_number)
+
+    def _processSlicedLayersIfVisible(self, build_plate_number: int) -> None:
+        """Start processing the sliced layers of a build plate if they are going to be shown in the layer view."""
+
+        active_build_plate = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
+        if (
+            self._layer_view_active and
+            (self._process_layers_job is None or not self._process_layers_job.isRunning()) and
+            active_build_plate == build_plate_number and
+            active_build_plate not in self._build_plates_to_be_sliced):
+
+            self._startProcessSlicedLayersJob(active_build_plate)
+
     def _onGCodeLayerMessage(self, message: Arcus.PythonMessage) -> None:
         """Called when a g-code message is received from the engine.
 
         :param message: The protobuf message containing g-code, encoded as UTF-8.
         """
 
+        if self._trace_gcode_receive_start is None:
+            self._trace_gcode_receive_start = perf_counter()
         try:
-            self._scene.gcode_dict[self._start_slice_job_build_plate].append(message.data.decode("utf-8", "replace")) #type: ignore #Because we generate this attribute dynamically.
+            self._scene.gcode_dict[self._start_slice_job_build_plate].appendRaw(message.data) #type: ignore #Because we generate this attribute dynamically.
         except KeyError:
             # Can occur if the g-code has been cleared while a slice message is still arriving from the other end.
             pass  # Throw the message away.
@@ -925,7 +1179,7 @@ class CuraEngineBackend(QObject, Backend):
         """
 
         try:
-            self._scene.gcode_dict[self._start_slice_job_build_plate].insert(0, message.data.decode("utf-8", "replace")) #type: ignore #Because we generate this attribute dynamically.
+            self._scene.gcode_dict[self._start_slice_job_build_plate].prependRaw(message.data) #type: ignore #Because we generate this attribute dynamically.
         except KeyError:
             # Can occur if the g-code has been cleared while a slice message is still arriving from the other end.
             pass  # Throw the message away.
@@ -0,0 +1,368 @@
+#  Copyright (c) 2026 UltiMaker
+#  Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+import socket
+import subprocess
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Optional, TYPE_CHECKING
+
+import pyArcus as Arcus
+
+from UM.Backend.SignalSocket import SignalSocket
+from UM.Logger import Logger
+from UM.Platform import Platform
+from UM.Resources import Resources
+
+from cura.Utils.SliceSessionTracer import SliceSession, SliceSessionTracer
+
+from .StartSliceJob import StartSliceJob
+
+if TYPE_CHECKING:
+    from .CuraEngineBackend import CuraEngineBackend
+
+
+class EngineWorker:
+    """One additional CuraEngine process with its own socket, which slices one build plate at a time.
+
+    Messages from the engine are handed to the backend together with the worker they came from, so the backend knows
+    which build plate they belong to.
+
+    The engine quits after every slice. If the pool is persistent, the worker starts the engine for its next slice right
+    away, so that it's connected and waiting by the time the next slice message is ready.
+    """
+
+    StopTimeout = 2.0  # seconds to wait for an engine process to quit before killing it.
+
+    def __init__(self, pool: "EnginePool", index: int) -> None:
+        self._pool = pool
+        self._index = index
+        self._port = self._findAvailablePort()
+        self._socket: Optional[SignalSocket] = None
+        self._connected = False
+        self._process: Optional[subprocess.Popen] = None
+        self._build_plate: Optional[int] = None
+        self._start_slice_job: Optional[StartSliceJob] = None
+        self._pending_slice_message: Optional[Arcus.PythonMessage] = None
+        self._engine_used = False  # Whether the running engine got a slice message, so it quits after that slice.
+        self._wait_start_time: Optional[float] = None  # When the slice message started waiting for the engine to connect.
+        self._trace_session: Optional[SliceSession] = None  # The slice trace that the build plate of this worker is part of.
+
+        self.progress: float = 0.0
+        self.engine_start_time: Optional[float] = None  # When the slice message was sent, for the slice trace.
+
+    def getBuildPlate(self) -> Optional[int]:
+        return self._build_plate
+
+    def isIdle(self) -> bool:
+        return self._build_plate is None
+
+    def isEngineReady(self) -> bool:
+        """Whether an engine process is running that can take a slice message right away."""
+
+        return self._connected and not self._engine_used and self._process is not None and self._process.poll() is None
+
+    def prepare(self) -> None:
+        """Start a fresh engine process that waits for the next slice message, if there isn't one already."""
+
+        if self._socket is not None and not self._engine_used and (self._process is None or self._process.poll() is None):
+            return  # Already started, or starting.
+        self._stopProcess()
+        self._port = self._findAvailablePort()  # The previous engine may still be closing its connection on the old port.
+        self._createSocket()
+
+    def slice(self, build_plate: int) -> None:
+        """Start slicing a build plate: prepare the slice message, and start a fresh engine process to send it to if
+        there is no engine waiting yet."""
+
+        self._build_plate = build_plate
+        self.progress = 0.0
+        self.engine_start_time = None
+        self._trace_session = SliceSessionTracer.getInstance().getCurrentSession()
+        self.prepare()
+        if self._socket is None:
+            Logger.log("e", "Could not prepare engine process {index} for build plate {plate}.".format(index = self._index, plate = build_plate))
+            self._pool.getBackend().onEngineWorkerFailed(self)
+            return
+
+        self._start_slice_job = StartSliceJob(self._socket.createMessage("cura.proto.Slice"))
+        self._start_slice_job.setBuildPlate(build_plate)
+        self._start_slice_job.finished.connect(self._onStartSliceCompleted)
+        self._start_slice_job.start()
+
+    def sendSliceMessage(self, message: Arcus.PythonMessage) -> bool:
+        """Send the slice message to the engine, or send it as soon as the engine has connected."""
+
+        self.engine_start_time = perf_counter()
+        if self._socket is None:
+            return False
+        self._engine_used = True
+        if not self._connected:
+            self._pending_slice_message = message
+            self._wait_start_time = perf_counter()
+            return True
+        return self._socket.sendMessage(message)
+
+    def release(self) -> None:
+        """Mark the worker as available again. The engine process quits by itself after it finished slicing, and is
+        reaped here."""
+
+        self._build_plate = None
+        self._start_slice_job = None
+        self._pending_slice_message = None
+        self._wait_start_time = None
+        if self._engine_used:
+            self._stopProcess()
+            if self._pool.isPersistent():
+                self.prepare()
+
+    def terminate(self) -> None:
+        """Cancel whatever the worker is doing and kill its engine process."""
+
+        if self._start_slice_job is not None:
+            self._start_slice_job.cancel()
+        self._build_plate = None
+        self._start_slice_job = None
+        self._pending_slice_message = None
+        self._wait_start_time = None
+        self._closeSocket()
+        self._engine_used = False
+        self._stopProcess()
+
+    def _stopProcess(self) -> None:
+        """Kill the engine process if it's still running, and wait for it, so it doesn't linger as a zombie process."""
+
+        if self._process is None:
+            return
+        try:
+            if self._process.poll() is None:
+                self._process.terminate()
+            try:
+                return_code = self._process.wait(timeout = self.StopTimeout)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                return_code = self._process.wait()
+            Logger.log("d", "Engine process {index} is stopped. Received return code {code}".format(index = self._index, code = return_code))
+        except Exception as e:
+            # Terminating a process that is already terminating causes an exception, silently ignore this.
+            Logger.log("d", "Exception occurred while trying to kill engine process {index}: {error}".format(index = self._index, error = str(e)))
+        self._process = None
+
+    def _onStartSliceCompleted(self, job: StartSliceJob) -> None:
+        if job is not self._start_slice_job:
+            return  # This job was cancelled.
+        self._start_slice_job = None
+        self._pool.getBackend().onEngineWorkerStartSliceCompleted(self, job)
+
+    @staticmethod
+    def _findAvailablePort() -> int:
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        return port
+
+    def _createSocket(self) -> None:
+        self._closeSocket()
+        self._engine_used = False
+        self._socket = SignalSocket()
+        self._socket.stateChanged.connect(self._onSocketStateChanged)
+        self._socket.messageReceived.connect(self._onMessageReceived)
+        self._socket.error.connect(self._onSocketError)
+        if not self._socket.registerAllMessageTypes(self._pool.getProtocolFile()):
+            Logger.log("e", "Could not register the Cura protocol on the socket of engine process {index}.".format(index = self._index))
+            self._socket = None
+            return
+        self._socket.listen("127.0.0.1", self._port)
+
+    def _closeSocket(self) -> None:
+        self._connected = False
+        if self._socket is None:
+            return
+        self._socket.stateChanged.disconnect(self._onSocketStateChanged)
+        self._socket.messageReceived.disconnect(self._onMessageReceived)
+        self._socket.error.disconnect(self._onSocketError)
+        self._socket.close()
+        self._socket = None
+
+    def _onSocketStateChanged(self, state: Arcus.SocketState) -> None:
+        if state == Arcus.SocketState.Listening:
+            self._startEngine()
+        elif state == Arcus.SocketState.Connected:
+            self._connected = True
+            if self._pending_slice_message is not None and self._socket is not None:
+                if self._wait_start_time is not None:
+                    SliceSessionTracer.getInstance().addSpan("engine_wait", self._wait_start_time, session = self._trace_session, build_plate_number = self._build_plate)
+                    self._wait_start_time = None
+                self._socket.sendMessage(self._pending_slice_message)
+                self._pending_slice_message = None
+
+    def _startEngine(self) -> None:
+        self._stopProcess()  # A previous engine of this worker that is still around.
+        command = self._pool.getBackend().getEngineCommand(port = self._port)
+        log_path = os.path.join(Resources.getDataStoragePath(), "CuraEngine_{index}.log".format(index = self._index))
+        try:
+            # STDIN needs to be None because we provide no input, but communicate via a local socket instead.
+            with open(log_path, "w") as f:
+                popen_kwargs = {
+                    "stdin": None,
+                    "stdout": f,
+                    "stderr": subprocess.STDOUT,
+                }
+                if Platform.isWindows():
+                    popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+                self._process = subprocess.Popen(command, **popen_kwargs)
+        except OSError:
+            Logger.logException("e", "Unable to start engine process {index}.".format(index = self._index))
+            if self.isIdle():
+                self._closeSocket()  # Only started to wait for the next slice. Try again when that comes.
+                return
+            self._pool.getBackend().onEngineWorkerFailed(self)
+
+    def _onMessageReceived(self) -> None:
+        if self._socket is None:
+            return
+        message = self._socket.takeNextMessage()
+        if message is None or self.isIdle():
+            return
+        self._pool.getBackend().onEngineWorkerMessage(self, message)
+
+    def _onSocketError(self, error: Arcus.Error) -> None:
+        if error.getErrorCode() == Arcus.ErrorCode.Debug:
+            return
+        if error.getErrorCode() == Arcus.ErrorCode.BindFailedError:
+            Logger.log("d", "Port {port} is taken, trying another one for engine process {index}.".format(port = self._port, index = self._index))
+            self._port = self._findAvailablePort()
+            if self._start_slice_job is not None or self._pending_slice_message is not None or self._pool.isPersistent():
+                self._createSocket()
+            return
+        if self.isIdle():
+            return  # The engine quits after it has finished slicing, so the connection is closed.
+        Logger.log("w", "Socket error on engine process {index}: {error}".format(index = self._index, error = error.getErrorMessage()))
+        self._pool.getBackend().onEngineWorkerFailed(self)
+
+
+class EnginePool:
+    """Slices multiple build plates at the same time, each in a CuraEngine process of its own.
+
+    Build plates are queued and handed to the first idle worker. At most max_workers engine processes run at the
+    same time.
+
+    A persistent pool keeps an engine process waiting in every worker between slices. Cancelling a slice then only
+    replaces the engines that were slicing, and idle workers are handed the next build plates with their engine already
+    connected.
+    """
+
+    def __init__(self, backend: "CuraEngineBackend", protocol_file: str, max_workers: int, persistent: bool = False) -> None:
+        self._backend = backend
+        self._protocol_file = protocol_file
+        self._persistent = persistent
+        self._max_workers = max(1, max_workers)
+        self._workers: List[EngineWorker] = []
+        self._queue: Deque[int] = deque()
+        self._num_submitted = 0
+        self._num_finished = 0
+
+    def getBackend(self) -> "CuraEngineBackend":
+        return self._backend
+
+    def getProtocolFile(self) -> str:
+        return self._protocol_file
+
+    def isPersistent(self) -> bool:
+        return self._persistent
+
+    def setPersistent(self, persistent: bool) -> None:
+        if persistent == self._persistent:
+            return
+        self._persistent = persistent
+        for worker in self._workers:
+            if not worker.isIdle():
+                continue
+            if persistent:
+                worker.prepare()
+            else:
+                worker.terminate()
+
+    def setMaxWorkers(self, max_workers: int) -> None:
+        self._max_workers = max(1, max_workers)
+        # Stop the engines of idle workers that are no longer allowed.
+        while len(self._workers) > self._max_workers and self._workers[-1].isIdle():
+            self._workers.pop().terminate()
+
+    def submit(self, build_plate: int) -> None:
+        """Queue a build plate to be sliced by the first available engine process."""
+
+        if build_plate in self._queue or any(worker.getBuildPlate() == build_plate for worker in self._workers):
+            return
+        self._queue.append(build_plate)
+        self._num_submitted += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._queue:
+            # Prefer the workers of which the engine is already connected.
+            idle_workers = [worker for worker in self._workers if worker.isIdle()]
+            worker = next((worker for worker in idle_workers if worker.isEngineReady()), idle_workers[0] if idle_workers else None)
+            if worker is None:
+                if len(self._workers) >= self._max_workers:
+                    return
+                worker = self._createWorker()
+                self._workers.append(worker)
+            build_plate = self._queue.popleft()
+            Logger.log("d", "Slicing build plate {plate} in engine process {index}.".format(plate = build_plate, index = self._workers.index(worker)))
+            worker.slice(build_plate)
+
+    def _createWorker(self) -> EngineWorker:
+        return EngineWorker(self, len(self._workers))
+
+    def onWorkerFinished(self, worker: EngineWorker) -> None:
+        """Called when a worker is done with its build plate, so it can take the next one."""
+
+        worker.release()
+        self._num_finished += 1
+        self._dispatch()
+
+    def isBusy(self) -> bool:
+        return bool(self._queue) or any(not worker.isIdle() for worker in self._workers)
+
+    def getProgress(self) -> float:
+        """Get the combined progress of all build plates that were submitted since the pool was last idle."""
+
+        if self._num_submitted == 0:
+            return 1.0
+        in_progress = sum(worker.progress for worker in self._workers if not worker.isIdle())
+        return (self._num_finished + in_progress) / self._num_submitted
+
+    def resetProgress(self) -> None:
+        self._num_submitted = len(self._queue) + sum(1 for worker in self._workers if not worker.isIdle())
+        self._num_finished = 0
+
+    def cancel(self) -> None:
+        """Stop slicing all build plates.
+
+        If the pool is persistent, only the engines that were slicing are killed, and they are replaced by fresh ones
+        that wait for the next slice. Otherwise all engine processes are killed.
+        """
+
+        if not self._persistent:
+            self.terminate()
+            return
+        self._queue.clear()
+        for worker in self._workers:
+            if not worker.isIdle():
+                worker.terminate()
+                worker.prepare()
+        self._num_submitted = 0
+        self._num_finished = 0
+
+    def terminate(self) -> None:
+        """Stop slicing all build plates and kill all engine processes."""
+
+        self._queue.clear()
+        for worker in self._workers:
+            worker.terminate()
+        self._workers = []
+        self._num_submitted = 0
+        self._num_finished = 0
@@ -18,12 +18,13 @@ from UM.Math.Vector import Vector
 from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
 from cura.Scene.CuraSceneNode import CuraSceneNode
 from cura.Settings.ExtruderManager import ExtruderManager
+from cura.Utils.SliceSessionTracer import SliceSessionTracer
 from cura import LayerDataBuilder
 from cura import LayerDataDecorator
 from cura import LayerPolygon
 
 import numpy
-from time import time
+from time import perf_counter, time
 from cura.Machines.Models.ExtrudersModel import ExtrudersModel
 catalog = i18nCatalog("cura")
 
@@ -52,6 +53,7 @@ class ProcessSlicedLayersJob(Job):
         self._progress_message = Message(catalog.i18nc("@info:status", "Processing Layers"), 0, False, -1)
         self._abort_requested = False
         self._build_plate_number = None
+        self._trace_session = SliceSessionTracer.getInstance().getCurrentSession()
 
     def abort(self):
         """Aborts the processing of layers.
@@ -71,8 +73,14 @@ class ProcessSlicedLayersJob(Job):
         return self._build_plate_number
 
     def run(self):
+        # The job runs on a different thread, so record its spans in the slice trace of whoever started it.
+        with SliceSessionTracer.getInstance().activate(self._trace_session):
+            self._run()
+
+    def _run(self):
         Logger.log("d", "Processing new layer for build plate %s..." % self._build_plate_number)
         start_time = time()
+        trace_start = perf_counter()
         view = Application.getInstance().getController().getActiveView()
         if view.getPluginId() == "SimulationView":
             view.resetLayerData()
@@ -252,6 +260,7 @@ class ProcessSlicedLayersJob(Job):
         self._layers = None
 
         Logger.log("d", "Processing layers took %s seconds", time() - start_time)
+        SliceSessionTracer.getInstance().addSpan("process_sliced_layers_job", trace_start, build_plate_number = self._build_plate_number)
 
     def _onActiveViewChanged(self):
         if self.isRunning():
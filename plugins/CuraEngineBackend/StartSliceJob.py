@@ -8,8 +8,11 @@ import numpy
 from string import Formatter
 from enum import IntEnum
 import time
-from typing import Any, cast, Dict, List, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import Any, cast, Dict, List, Optional, Set
 import re
+import threading
+import weakref
 import pyArcus as Arcus  # For typing.
 from PyQt6.QtCore import QCoreApplication
 
@@ -32,6 +35,7 @@ from cura.CuraApplication import CuraApplication
 from cura.Scene.CuraSceneNode import CuraSceneNode
 from cura.OneAtATimeIterator import OneAtATimeIterator
 from cura.Settings.ExtruderManager import ExtruderManager
+from cura.Utils.SliceSessionTracer import SliceSession, SliceSessionTracer
 from cura.CuraVersion import CuraVersion
 
 
@@ -224,9 +228,158 @@ class GcodeStartEndFormatter:
             return ""
 
 
+class PreparedMeshCache:
+    """Keeps the vertices of meshes as they are sent to the engine, between slices.
+
+    Preparing the vertices (rotating, scaling, converting to Z up and unindexing them) is the most expensive part of
+    building the slice message for big meshes. Mesh data is never changed but replaced, so as long as a mesh and its
+    rotation and scale stay the same, the prepared vertices can be reused for the next slice. Only moving a mesh still
+    needs the translation to be added again.
+
+    Entries are dropped when their mesh data is garbage collected.
+
+    The prepared vertices are unindexed, so they take about three times the memory of an indexed mesh, for every
+    rotation and scale that is remembered. To keep that bounded for scenes with many or big meshes, the meshes that
+    were used least recently are dropped once the cache holds more than MaxSize bytes.
+    """
+
+    # How many rotations and scales to remember for every mesh.
+    MaxTransformationsPerMesh = 2
+
+    # How many bytes of vertices and UV coordinates to keep for all meshes together.
+    MaxSize = 256 * 1024 * 1024
+
+    class _Entry:
+        def __init__(self, mesh_ref: "weakref.ref") -> None:
+            self.mesh_ref = mesh_ref
+            self.vertices = {}  # type: Dict[bytes, numpy.ndarray]  # By rotation and scale.
+            self.has_uv_coordinates = False
+            self.uv_coordinates = None  # type: Optional[numpy.ndarray]
+
+        def getSize(self) -> int:
+            size = sum(vertices.nbytes for vertices in self.vertices.values())
+            if self.uv_coordinates is not None:
+                size += self.uv_coordinates.nbytes
+            return size
+
+    def __init__(self) -> None:
+        # Multiple start slice jobs can run at the same time, for different build plates. The lock is reentrant, since a
+        # mesh can be garbage collected (which removes its entry) while the lock is held.
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()  # type: OrderedDict[int, PreparedMeshCache._Entry]  # By the ID of the mesh data, least recently used first.
+        self._size = 0
+
+    def getSize(self) -> int:
+        """Get how many bytes of vertices and UV coordinates are kept."""
+
+        return self._size
+
+    def _getEntry(self, mesh_data: Any) -> "PreparedMeshCache._Entry":
+        """Get the entry of a mesh, creating it if needed. Must be called with the lock held."""
+
+        mesh_id = id(mesh_data)
+        entry = self._entries.get(mesh_id)
+        if entry is None or entry.mesh_ref() is not mesh_data:
+            if entry is not None:
+                self._size -= entry.getSize()
+            entry = PreparedMeshCache._Entry(weakref.ref(mesh_data, lambda ref, mesh_id = mesh_id: self._remove(mesh_id, ref)))
+            self._entries[mesh_id] = entry
+        self._entries.move_to_end(mesh_id)
+        return entry
+
+    def _remove(self, mesh_id: int, mesh_ref: "weakref.ref") -> None:
+        with self._lock:
+            entry = self._entries.get(mesh_id)
+            if entry is not None and entry.mesh_ref is mesh_ref:
+                self._size -= entry.getSize()
+                del self._entries[mesh_id]
+
+    def _shrink(self) -> None:
+        """Drop the least recently used meshes until the cache fits in MaxSize. Must be called with the lock held.
+
+        The most recently used mesh is kept, even if it doesn't fit by itself, since it's being sliced.
+        """
+
+        while self._size > self.MaxSize and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last = False)
+            self._size -= entry.getSize()
+
+    def getVertices(self, mesh_data: Any, rot_scale: numpy.ndarray) -> numpy.ndarray:
+        """Get the unindexed vertices of a mesh, rotated and scaled, in the coordinates of the engine.
+
+        The result is shared between slices, so it can't be modified.
+        """
+
+        key = rot_scale.tobytes()
+        with self._lock:
+            local_verts = self._getEntry(mesh_data).vertices.get(key)
+        if local_verts is not None:
+            return local_verts
+
+        # This effectively performs a limited form of MeshData.getTransformed that ignores normals.
+        verts = mesh_data.getVertices()
+        verts = verts.dot(rot_scale)
+
+        # Convert from Y up axes to Z up axes. Equals a 90 degree rotation.
+        verts[:, [1, 2]] = verts[:, [2, 1]]
+        verts[:, 1] *= -1
+
+        indices = mesh_data.getIndices()
+        if indices is not None:
+            local_verts = numpy.take(verts, indices.flatten(), axis=0)
+        else:
+            local_verts = numpy.array(verts)
+        local_verts.flags.writeable = False
+
+        with self._lock:
+            transformations = self._getEntry(mesh_data).vertices
+            if len(transformations) >= self.MaxTransformationsPerMesh:
+                # Probably being rotated or scaled. Only keep the latest.
+                self._size -= sum(vertices.nbytes for vertices in transformations.values())
+                transformations.clear()
+            if key not in transformations:
+                transformations[key] = local_verts
+                self._size += local_verts.nbytes
+            self._shrink()
+        return local_verts
+
+    def getUVCoordinates(self, mesh_data: Any) -> Optional[numpy.ndarray]:
+        """Get the UV coordinates of a mesh, unindexed like its vertices, or None if it has none."""
+
+        with self._lock:
+            entry = self._getEntry(mesh_data)
+            if entry.has_uv_coordinates:
+                return entry.uv_coordinates
+
+        uv_coordinates = mesh_data.getUVCoordinates()
+        if uv_coordinates is not None:
+            # The UV coordinates are per vertex, so they need to be unindexed like the vertices.
+            indices = mesh_data.getIndices()
+            if indices is not None:
+                uv_coordinates = numpy.take(uv_coordinates, indices.flatten(), axis=0)
+            uv_coordinates = uv_coordinates.flatten()
+
+        with self._lock:
+            entry = self._getEntry(mesh_data)
+            if not entry.has_uv_coordinates:
+                entry.uv_coordinates = uv_coordinates
+                entry.has_uv_coordinates = True
+                if uv_coordinates is not None:
+                    self._size += uv_coordinates.nbytes
+                self._shrink()
+        return uv_coordinates
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
 class StartSliceJob(Job):
     """Job class that builds up the message of scene data to send to CuraEngine."""
 
+    _prepared_meshes = PreparedMeshCache()  # Shared by all start slice jobs, so that it's kept between slices.
+
     def __init__(self, slice_message: Arcus.PythonMessage) -> None:
         super().__init__()
 
@@ -235,6 +388,7 @@ class StartSliceJob(Job):
         self._is_cancelled: bool = False
         self._build_plate_number: Optional[int] = None
         self._associated_disabled_extruders: List[int] = []
+        self._trace_session: Optional[SliceSession] = SliceSessionTracer.getInstance().getCurrentSession()
 
         # cache for all setting values from all stacks (global & extruder) for the current machine
         self._all_extruders_settings: Optional[Dict[str, Any]] = None
@@ -287,10 +441,18 @@ class StartSliceJob(Job):
     def run(self) -> None:
         """Runs the job that initiates the slicing."""
 
+        # The job runs on a different thread, so record its spans in the slice trace of whoever started it.
+        with SliceSessionTracer.getInstance().activate(self._trace_session):
+            self._run()
+
+    def _run(self) -> None:
         if self._build_plate_number is None:
             self.setResult(StartJobResult.Error)
             return
 
+        tracer = SliceSessionTracer.getInstance()
+        phase_start = time.perf_counter()
+
         stack = CuraApplication.getInstance().getGlobalContainerStack()
         if not stack:
             self.setResult(StartJobResult.Error)
@@ -305,9 +467,13 @@ class StartSliceJob(Job):
             self.setResult(StartJobResult.BuildPlateError)
             return
 
+        tracer.addSpan("start_slice_job.validation", phase_start)
+
         # Wait for error checker to be done.
-        while CuraApplication.getInstance().getMachineErrorChecker().needToWaitForResult:
-            time.sleep(0.1)
+        phase_start = time.perf_counter()
+        CuraApplication.getInstance().getMachineErrorChecker().waitForResult()
+        tracer.addSpan("error_check_wait", phase_start)
+        phase_start = time.perf_counter()
 
         if CuraApplication.getInstance().getMachineErrorChecker().hasError:
             self.setResult(StartJobResult.SettingError)
@@ -337,6 +503,9 @@ class StartSliceJob(Job):
                 self.setResult(StartJobResult.ObjectSettingError)
                 return
 
+        tracer.addSpan("start_slice_job.validation", phase_start)
+        phase_start = time.perf_counter()
+
         # Remove old layer data.
         for node in DepthFirstIterator(self._scene.getRoot()):
             if node.callDecoration("getLayerData") and node.callDecoration("getBuildPlateNumber") == self._build_plate_number:
@@ -436,6 +605,9 @@ class StartSliceJob(Job):
             self.setResult(StartJobResult.NothingToSlice)
             return
 
+        tracer.addSpan("start_slice_job.grouping", phase_start, num_groups = len(filtered_object_groups))
+        phase_start = time.perf_counter()
+
         self._buildGlobalSettingsMessage(stack)
         self._buildGlobalInheritsStackMessage(stack)
 
@@ -476,6 +648,12 @@ class StartSliceJob(Job):
                 plugin_message.plugin_name = plugin.getPluginId()
                 plugin_message.plugin_version = plugin.getVersion()
 
+        tracer.addSpan("start_slice_job.settings_message", phase_start)
+        phase_start = time.perf_counter()
+
+        # Copies of an object share their mesh data. Their vertices only need to be transformed and unindexed once
+        # for each rotation and scale, after which each copy only has to be translated. This is remembered between
+        # slices too, so meshes that didn't change don't need to be prepared again.
         for group in filtered_object_groups:
             group_message = self._slice_message.addRepeatedMessage("object_lists")
             parent = group[0].getParent()
@@ -486,32 +664,21 @@ class StartSliceJob(Job):
                 mesh_data = object.getMeshData()
                 if mesh_data is None:
                     continue
-                rot_scale = object.getWorldTransformation().getTransposed().getData()[0:3, 0:3]
-                translate = object.getWorldTransformation().getData()[:3, 3]
+                world_transformation = object.getWorldTransformation()
+                rot_scale = world_transformation.getTransposed().getData()[0:3, 0:3]
+                translate = world_transformation.getData()[:3, 3]
 
-                # This effectively performs a limited form of MeshData.getTransformed that ignores normals.
-                verts = mesh_data.getVertices()
-                verts = verts.dot(rot_scale)
-                verts += translate
-
-                # Convert from Y up axes to Z up axes. Equals a 90 degree rotation.
-                verts[:, [1, 2]] = verts[:, [2, 1]]
-                verts[:, 1] *= -1
+                local_verts = self._prepared_meshes.getVertices(mesh_data, rot_scale)
 
                 obj = group_message.addRepeatedMessage("objects")
                 obj.id = id(object)
                 obj.name = object.getName()
-                indices = mesh_data.getIndices()
-                if indices is not None:
-                    flat_verts = numpy.take(verts, indices.flatten(), axis=0)
-                else:
-                    flat_verts = numpy.array(verts)
-
-                obj.vertices = flat_verts
+                # The translation, converted to Z up axes as well.
+                obj.vertices = local_verts + numpy.array([translate[0], -translate[2], translate[1]], dtype = translate.dtype)
 
-                uv_coordinates = mesh_data.getUVCoordinates()
+                uv_coordinates = self._prepared_meshes.getUVCoordinates(mesh_data)
                 if uv_coordinates is not None:
-                    obj.uv_coordinates = uv_coordinates.flatten()
+                    obj.uv_coordinates = uv_coordinates
 
                 packed_texture = object.callDecoration("packTexture")
                 if packed_texture is not None:
@@ -521,6 +688,7 @@ class StartSliceJob(Job):
 
                 Job.yieldThread()
 
+        tracer.addSpan("start_slice_job.mesh_serialisation", phase_start)
         self.setResult(StartJobResult.Finished)
 
     def cancel(self) -> None:
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ..EnginePool import EnginePool, EngineWorker
+
+
+class FakeWorker:
+    """Takes build plates like an EngineWorker, without starting engine processes."""
+
+    def __init__(self, pool, index, engine_ready = False):
+        self.index = index
+        self.engine_ready = engine_ready
+        self.build_plate = None
+        self.progress = 0.0
+        self.prepared = 0
+        self.terminated = 0
+
+    def getBuildPlate(self):
+        return self.build_plate
+
+    def isIdle(self):
+        return self.build_plate is None
+
+    def isEngineReady(self):
+        return self.engine_ready
+
+    def slice(self, build_plate):
+        self.build_plate = build_plate
+
+    def release(self):
+        self.build_plate = None
+
+    def prepare(self):
+        self.prepared += 1
+
+    def terminate(self):
+        self.build_plate = None
+        self.terminated += 1
+
+
+@pytest.fixture
+def backend():
+    return MagicMock()
+
+
+def createPool(backend, max_workers, persistent = False):
+    return EnginePool(backend, "Cura.proto", max_workers, persistent = persistent)
+
+
+def test_dispatchUpToMaxWorkers(backend):
+    with patch.object(EnginePool, "_createWorker", lambda pool: FakeWorker(pool, len(pool._workers))):
+        pool = createPool(backend, max_workers = 2)
+        for build_plate in (0, 1, 2):
+            pool.submit(build_plate)
+        pool.submit(2)  # Already queued.
+
+        assert [worker.getBuildPlate() for worker in pool._workers] == [0, 1]
+        assert list(pool._queue) == [2]
+        assert pool.isBusy()
+
+        pool.onWorkerFinished(pool._workers[1])
+        assert [worker.getBuildPlate() for worker in pool._workers] == [0, 2]
+        assert pool.getProgress() == pytest.approx(1 / 3)
+
+        pool.onWorkerFinished(pool._workers[0])
+        pool.onWorkerFinished(pool._workers[1])
+        assert not pool.isBusy()
+        assert pool.getProgress() == pytest.approx(1.0)
+
+
+def test_dispatchPrefersReadyEngines(backend):
+    with patch.object(EnginePool, "_createWorker", lambda pool: FakeWorker(pool, len(pool._workers), engine_ready = len(pool._workers) == 1)):
+        pool = createPool(backend, max_workers = 2, persistent = True)
+        pool.submit(0)
+        pool.submit(1)
+        pool.onWorkerFinished(pool._workers[0])
+        pool.onWorkerFinished(pool._workers[1])
+
+        pool.submit(2)
+        assert [worker.getBuildPlate() for worker in pool._workers] == [None, 2]
+
+
+def test_cancelPersistent(backend):
+    with patch.object(EnginePool, "_createWorker", lambda pool: FakeWorker(pool, len(pool._workers))):
+        pool = createPool(backend, max_workers = 2, persistent = True)
+        for build_plate in (0, 1, 2):
+            pool.submit(build_plate)
+        pool.onWorkerFinished(pool._workers[1])  # Takes build plate 2.
+        pool.onWorkerFinished(pool._workers[1])  # Idle now.
+        busy_worker, idle_worker = pool._workers
+
+        pool.cancel()
+
+        assert not pool.isBusy()
+        assert busy_worker.terminated == 1 and busy_worker.prepared == 1  # Replaced by a fresh engine.
+        assert idle_worker.terminated == 0  # Keeps its engine waiting.
+        assert pool._workers == [busy_worker, idle_worker]
+
+
+def test_cancelNotPersistent(backend):
+    with patch.object(EnginePool, "_createWorker", lambda pool: FakeWorker(pool, len(pool._workers))):
+        pool = createPool(backend, max_workers = 2)
+        pool.submit(0)
+        worker = pool._workers[0]
+
+        pool.cancel()
+
+        assert worker.terminated == 1
+        assert pool._workers == []
+        assert not pool.isBusy()
+
+
+def test_sliceFailsWithoutSocket(backend):
+    pool = createPool(backend, max_workers = 1)
+    with patch.object(EngineWorker, "_createSocket", lambda worker: setattr(worker, "_socket", None)):  # Like when the protocol can't be registered.
+        pool.submit(0)
+
+    backend.onEngineWorkerFailed.assert_called_once_with(pool._workers[0])
+
+
+def test_releaseReapsEngine(backend):
+    pool = createPool(backend, max_workers = 1)
+    worker = EngineWorker(pool, 0)
+    process = MagicMock()
+    process.poll.return_value = None
+    process.wait.side_effect = [subprocess.TimeoutExpired("CuraEngine", EngineWorker.StopTimeout), -9]
+    worker._process = process
+    worker._engine_used = True
+    worker._build_plate = 0
+
+    worker.release()
+
+    process.terminate.assert_called_once_with()
+    process.kill.assert_called_once_with()
+    assert worker._process is None
+    assert worker.isIdle()
@@ -0,0 +1,52 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import numpy
+
+from ..StartSliceJob import PreparedMeshCache
+
+
+class FakeMeshData:
+    def __init__(self, vertex_count = 30):
+        self._vertices = numpy.zeros((vertex_count, 3), dtype = numpy.float32)
+
+    def getVertices(self):
+        return self._vertices
+
+    def getIndices(self):
+        return None
+
+
+def test_getVerticesIsCached():
+    cache = PreparedMeshCache()
+    mesh = FakeMeshData()
+
+    vertices = cache.getVertices(mesh, numpy.identity(3, dtype = numpy.float32))
+
+    assert cache.getVertices(mesh, numpy.identity(3, dtype = numpy.float32)) is vertices
+    assert cache.getSize() == vertices.nbytes
+
+
+def test_leastRecentlyUsedAreDropped():
+    cache = PreparedMeshCache()
+    meshes = [FakeMeshData() for _ in range(3)]
+    rot_scale = numpy.identity(3, dtype = numpy.float32)
+    mesh_size = cache.getVertices(meshes[0], rot_scale).nbytes
+    cache.MaxSize = mesh_size * 2
+
+    first_vertices = cache.getVertices(meshes[0], rot_scale)
+    cache.getVertices(meshes[1], rot_scale)
+    cache.getVertices(meshes[0], rot_scale)  # Used again, so the second mesh is the least recently used.
+    cache.getVertices(meshes[2], rot_scale)
+
+    assert cache.getSize() == mesh_size * 2
+    assert cache.getVertices(meshes[0], rot_scale) is first_vertices
+
+
+def test_transformationsPerMesh():
+    cache = PreparedMeshCache()
+    mesh = FakeMeshData()
+    for scale in range(1, PreparedMeshCache.MaxTransformationsPerMesh + 2):
+        vertices = cache.getVertices(mesh, numpy.identity(3, dtype = numpy.float32) * scale)
+
+    assert cache.getSize() == vertices.nbytes  # The others were dropped when there were too many.
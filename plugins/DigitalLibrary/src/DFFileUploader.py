@@ -5,7 +5,8 @@ from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
 from typing import Callable, Any, cast, Optional, Union
 
 from UM.Logger import Logger
-from UM.TaskManagement.HttpRequestManager import HttpRequestManager
+
+from cura.Network.HttpClient import HttpClient
 from .DFLibraryFileUploadResponse import DFLibraryFileUploadResponse
 from .DFPrintJobUploadResponse import DFPrintJobUploadResponse
 
@@ -20,7 +21,7 @@ class DFFileUploader:
     RETRY_HTTP_CODES = {500, 502, 503, 504}
 
     def __init__(self,
-                 http: HttpRequestManager,
+                 http: HttpClient,
                  df_file: Union[DFLibraryFileUploadResponse, DFPrintJobUploadResponse],
                  data: bytes,
                  on_finished: Callable[[str], Any],
@@ -30,7 +31,7 @@ class DFFileUploader:
                  ) -> None:
         """Creates a mesh upload object.
 
-        :param http: The network access manager that will handle the HTTP requests.
+        :param http: The HTTP client that will handle the requests.
         :param df_file: The file response that was received by the Digital Factory after registering the upload.
         :param data: The mesh bytes to be uploaded.
         :param on_finished: The method to be called when done.
@@ -39,7 +40,7 @@ class DFFileUploader:
         :param on_error: The method to be called when an error occurs.
         """
 
-        self._http: HttpRequestManager = http
+        self._http: HttpClient = http
         self._df_file: Union[DFLibraryFileUploadResponse, DFPrintJobUploadResponse] = df_file
         self._file_name = ""
         if isinstance(self._df_file, DFLibraryFileUploadResponse):
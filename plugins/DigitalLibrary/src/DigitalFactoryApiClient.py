@@ -9,9 +9,9 @@ from typing import List, Any, Optional, Union, Type, Tuple, Dict, cast, TypeVar,
 from PyQt6.QtNetwork import QNetworkReply, QNetworkRequest
 
 from UM.Logger import Logger
-from UM.TaskManagement.HttpRequestManager import HttpRequestManager
 from UM.TaskManagement.HttpRequestScope import JsonDecoratorScope
 from cura.CuraApplication import CuraApplication
+from cura.Network.HttpClient import HttpClient
 from cura.UltimakerCloud import UltimakerCloudConstants
 from cura.UltimakerCloud.UltimakerCloudScope import UltimakerCloudScope
 from .DFPrintJobUploadResponse import DFPrintJobUploadResponse
@@ -51,7 +51,7 @@ class DigitalFactoryApiClient:
         self._application = application
         self._account = application.getCuraAPI().account
         self._scope = JsonDecoratorScope(UltimakerCloudScope(application))
-        self._http = HttpRequestManager.getInstance()
+        self._http = HttpClient.getInstance()
         self._on_error = on_error
         self._file_uploader: Optional[DFFileUploader] = None
         self._library_max_private_projects: Optional[int] = None
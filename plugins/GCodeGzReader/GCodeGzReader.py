@@ -2,6 +2,8 @@
 # Cura is released under the terms of the LGPLv3 or higher.
 
 import gzip
+import io
+import os
 
 from UM.Mesh.MeshReader import MeshReader #The class we're extending/implementing.
 from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType #To add the .gcode.gz files to the MIME type database.
@@ -26,10 +28,13 @@ class GCodeGzReader(MeshReader):
         self._supported_extensions = [".gcode.gz"]
 
     def _read(self, file_name):
-        with open(file_name, "rb") as file:
-            file_data = file.read()
-        uncompressed_gcode = gzip.decompress(file_data).decode("utf-8")
-        PluginRegistry.getInstance().getPluginObject("GCodeReader").preReadFromStream(uncompressed_gcode)
-        result = PluginRegistry.getInstance().getPluginObject("GCodeReader").readFromStream(uncompressed_gcode, file_name)
+        gcode_reader = PluginRegistry.getInstance().getPluginObject("GCodeReader")
+        # Decompress while reading, so the uncompressed g-code is never in memory as a whole. The progress is reported
+        # in compressed bytes, since the size of the uncompressed g-code isn't known up front.
+        with open(file_name, "rb") as compressed_file:
+            with io.TextIOWrapper(gzip.GzipFile(fileobj = compressed_file), encoding = "utf-8") as file:
+                gcode_reader.preReadFromLines(file)
+                file.seek(0)  # The flavor is in the header, so this only decompresses the header again.
+                result = gcode_reader.readFromLines(file, file_name, os.fstat(compressed_file.fileno()).st_size, compressed_file.tell)
 
         return result
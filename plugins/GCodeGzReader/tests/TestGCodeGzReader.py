@@ -0,0 +1,36 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import gzip
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from GCodeGzReader import GCodeGzReader
+
+
+def test_read(tmp_path):
+    file_name = str(tmp_path / "test.gcode.gz")
+    gcode = ";FLAVOR:Marlin\n" + "G1 X10 Y10 E1\n" * 10000
+    with gzip.open(file_name, "wt", encoding = "utf-8") as file:
+        file.write(gcode)
+
+    gcode_reader = MagicMock()
+    gcode_reader.preReadFromLines.side_effect = lambda lines: next(iter(lines))  # Stops after the flavor.
+    read_sizes = []
+
+    def readFromLines(lines, filename, total_size, get_read_size):
+        assert "".join(lines) == gcode  # From the start again.
+        read_sizes.append((get_read_size(), total_size))
+        return "node"
+    gcode_reader.readFromLines.side_effect = readFromLines
+
+    with patch("GCodeGzReader.PluginRegistry.getInstance") as plugin_registry:
+        plugin_registry.return_value.getPluginObject.return_value = gcode_reader
+        with patch("GCodeGzReader.MimeTypeDatabase"):
+            assert GCodeGzReader()._read(file_name) == "node"
+
+    # The progress is in compressed bytes, since the uncompressed size isn't known.
+    assert read_sizes == [(os.path.getsize(file_name), os.path.getsize(file_name))]
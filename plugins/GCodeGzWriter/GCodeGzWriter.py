@@ -43,7 +43,7 @@ class GCodeGzWriter(MeshWriter):
             self.setInformation(catalog.i18nc("@error:not supported", "GCodeGzWriter does not support text mode."))
             return False
 
-        #Get the g-code from the g-code writer.
+        #Get the g-code from the g-code writer. This includes its footer index, if enabled, with the offsets in the uncompressed g-code.
         gcode_textio = StringIO() #We have to convert the g-code into bytes.
         gcode_writer = cast(MeshWriter, PluginRegistry.getInstance().getPluginObject("GCodeWriter"))
         success = gcode_writer.write(gcode_textio, None)
@@ -3,13 +3,14 @@
 
 import re  # Regular expressions for parsing escape characters in the settings.
 import json
-from typing import Optional
+from typing import List, Optional
 
 from UM.Settings.ContainerFormatError import ContainerFormatError
 from UM.Settings.InstanceContainer import InstanceContainer
 from UM.Logger import Logger
 from UM.i18n import i18nCatalog
 from cura.ReaderWriters.ProfileReader import ProfileReader, NoProfileException
+from cura.Utils.GCodeIndex import GCodeIndex
 
 catalog = i18nCatalog("cura")
 
@@ -59,15 +60,16 @@ class GCodeProfileReader(ProfileReader):
         prefix_length = len(prefix)
 
         # Loading all settings from the file.
-        # They are all at the end, but Python has no reverse seek any more since Python3.
-        # TODO: Consider moving settings to the start?
-        serialized = ""  # Will be filled with the serialized profile.
+        # They are all at the end. If the file has a footer index, it tells where, otherwise the file is scanned.
         try:
-            with open(file_name, "r", encoding = "utf-8") as f:
-                for line in f:
-                    if line.startswith(prefix):
-                        # Remove the prefix and the newline from the line and add it to the rest.
-                        serialized += line[prefix_length: -1]
+            serialized = self._readIndexedSettings(file_name, prefix)
+            if serialized is None:
+                serialized = ""  # Will be filled with the serialized profile.
+                with open(file_name, "r", encoding = "utf-8") as f:
+                    for line in f:
+                        if line.startswith(prefix):
+                            # Remove the prefix and the newline from the line and add it to the rest.
+                            serialized += line[prefix_length: -1]
         except IOError as e:
             Logger.log("e", "Unable to open file %s for reading: %s", file_name, str(e))
             return None
@@ -100,6 +102,30 @@ class GCodeProfileReader(ProfileReader):
             profiles.append(readQualityProfileFromString(profile_string))
         return profiles
 
+    @staticmethod
+    def _readIndexedSettings(file_name: str, prefix: str) -> Optional[str]:
+        """Read the serialized settings by seeking to them with the footer index of the g-code file.
+
+        :param file_name: The g-code file to read from.
+        :param prefix: The prefix of the lines with settings.
+        :return: The serialized settings, or None if the file has no (valid) index, so it needs to be scanned.
+        """
+
+        with open(file_name, "rb") as f:
+            index = GCodeIndex.read(f)
+            if index is None or index.settings_offset is None:
+                return None
+            f.seek(index.settings_offset)
+            encoded_prefix = prefix.encode("utf-8")
+            lines = []  # type: List[str]
+            for line in f:
+                if not line.startswith(encoded_prefix):
+                    break
+                lines.append(line[len(encoded_prefix):].rstrip(b"\r\n").decode("utf-8"))
+        if not lines:  # The index doesn't point at the settings.
+            return None
+        return "".join(lines)
+
 
 def unescapeGcodeComment(string: str) -> str:
     """Unescape a string which has been escaped for use in a gcode comment.
@@ -1,9 +1,10 @@
 # Copyright (c) 2022 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 
+import io
 import math
 import re
-from typing import Dict, List, NamedTuple, Optional, Union, Set
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union, Set
 
 import numpy
 
@@ -33,6 +34,15 @@ class FlavorParser:
 
     MAX_EXTRUDER_COUNT = 16
     DEFAULT_FILAMENT_DIAMETER = 2.85
+    PREVIEW_LAYER_BATCH = 10  # Minimum number of layers to parse before updating the preview in progressive mode.
+
+    _travel_types = [LayerPolygon.MoveUnretractedType,
+                     LayerPolygon.MoveRetractedType,
+                     LayerPolygon.MoveWhileRetractingType,
+                     LayerPolygon.MoveWhileUnretractingType]
+
+    _value_end_regex = re.compile("[;\\s]")
+    _parameter_regex = re.compile(r"(?<!\S)([XYZFE])(\S+)")
 
     def __init__(self) -> None:
         CuraApplication.getInstance().hideMessageSignal.connect(self._onHideMessage)
@@ -44,6 +54,8 @@ class FlavorParser:
         self._extruders_seen = {0}  # type: Set[int]
         self._clearValues()
         self._scene_node = None
+        self._preview_node = None  # type: Optional[CuraSceneNode]  # Only used on the main thread.
+        self._preview_shown = False  # Whether the parsing thread handed a preview to the main thread.
         # X, Y, Z position, F feedrate and E extruder values are stored
         self._position = Position
         self._is_layers_in_file = False  # Does the Gcode have the layers comment?
@@ -70,8 +82,7 @@ class FlavorParser:
         if n < 0:
             return None
         n += len(code)
-        pattern = re.compile("[;\\s]")
-        match = pattern.search(line, n)
+        match = FlavorParser._value_end_regex.search(line, n)
         m = match.start() if match is not None else -1
         try:
             if m < 0:
@@ -99,14 +110,11 @@ class FlavorParser:
             self._cancelled = True
 
     def _createPolygon(self, layer_thickness: float, path: List[List[Union[float, int]]], extruder_offsets: List[float]) -> bool:
-        countvalid = 0
-        for point in path:
-            if point[5] > 0:
-                countvalid += 1
-                if countvalid >= 2:
-                    # we know what to do now, no need to count further
-                    continue
-        if countvalid < 2:
+        if len(path) < 2:
+            return False
+        # Columns: x, y, z, feedrate, extrusion and line type of each point.
+        path_columns = numpy.array(path, dtype = numpy.float64)
+        if numpy.count_nonzero(path_columns[:, 5] > 0) < 2:
             return False
         try:
             self._layer_data_builder.addLayer(self._layer_number)
@@ -118,30 +126,20 @@ class FlavorParser:
         except ValueError:
             return False
         count = len(path)
-        line_types = numpy.empty((count - 1, 1), numpy.int32)
-        line_widths = numpy.empty((count - 1, 1), numpy.float32)
-        line_thicknesses = numpy.empty((count - 1, 1), numpy.float32)
-        line_feedrates = numpy.empty((count - 1, 1), numpy.float32)
-        line_widths[:, 0] = 0.35  # Just a guess
-        line_thicknesses[:, 0] = layer_thickness
         points = numpy.empty((count, 3), numpy.float32)
-        extrusion_values = numpy.empty((count, 1), numpy.float32)
-        i = 0
-        for point in path:
-            points[i, :] = [point[0] + extruder_offsets[0], point[2], -point[1] - extruder_offsets[1]]
-            extrusion_values[i] = point[4]
-            if i > 0:
-                line_feedrates[i - 1] = point[3]
-                line_types[i - 1] = point[5]
-                if point[5] in [LayerPolygon.MoveUnretractedType,
-                                LayerPolygon.MoveRetractedType,
-                                LayerPolygon.MoveWhileRetractingType,
-                                LayerPolygon.MoveWhileUnretractingType]:
-                    line_widths[i - 1] = 0.1
-                    line_thicknesses[i - 1] = 0.0 # Travels are set as zero thickness lines
-                else:
-                    line_widths[i - 1] = self._calculateLineWidth(points[i], points[i-1], extrusion_values[i], extrusion_values[i-1], layer_thickness)
-            i += 1
+        points[:, 0] = path_columns[:, 0] + extruder_offsets[0]
+        points[:, 1] = path_columns[:, 2]
+        points[:, 2] = -path_columns[:, 1] - extruder_offsets[1]
+        extrusion_values = path_columns[:, 4].astype(numpy.float32)
+
+        line_types = path_columns[1:, 5].astype(numpy.int32).reshape((count - 1, 1))
+        line_feedrates = path_columns[1:, 3].astype(numpy.float32).reshape((count - 1, 1))
+        line_widths = self._calculateLineWidths(points, extrusion_values, layer_thickness).reshape((count - 1, 1))
+        line_thicknesses = numpy.full((count - 1, 1), layer_thickness, numpy.float32)
+
+        is_travel = numpy.isin(line_types, self._travel_types)
+        line_widths[is_travel] = 0.1
+        line_thicknesses[is_travel] = 0.0  # Travels are set as zero thickness lines
 
         this_poly = LayerPolygon(self._extruder_number, line_types, points, line_widths, line_thicknesses, line_feedrates)
         this_poly.buildCache()
@@ -154,30 +152,32 @@ class FlavorParser:
         self._layer_data_builder.setLayerHeight(layer_number, 0)
         self._layer_data_builder.setLayerThickness(layer_number, 0)
 
-    def _calculateLineWidth(self, current_point: Position, previous_point: Position, current_extrusion: float, previous_extrusion: float, layer_thickness: float) -> float:
+    def _calculateLineWidths(self, points: numpy.ndarray, extrusion_values: numpy.ndarray, layer_thickness: float) -> numpy.ndarray:
+        """Calculate the width of all line segments of a path at once, from the volume of filament extruded for each.
+
+        :param points: The points of the path, in scene coordinates.
+        :param extrusion_values: The extrusion value at each point of the path.
+        :param layer_thickness: The thickness of the layer the path is in.
+        :return: The width of each of the len(points) - 1 line segments.
+        """
+
         # Area of the filament
         Af = (self._current_filament_diameter / 2) ** 2 * numpy.pi
-        # Length of the extruded filament
-        de = current_extrusion - previous_extrusion
         # Volume of the extruded filament
-        dVe = de * Af
+        dVe = (extrusion_values[1:] - extrusion_values[:-1]) * Af
         # Length of the printed line
-        dX = numpy.sqrt((current_point[0] - previous_point[0])**2 + (current_point[2] - previous_point[2])**2)
-        # When the extruder recovers from a retraction, we get zero distance
-        if dX == 0:
-            return 0.1
-        # Area of the printed line. This area is a rectangle
-        Ae = dVe / dX
-        # This area is a rectangle with area equal to layer_thickness * layer_width
-        line_width = Ae / layer_thickness
+        dX = numpy.sqrt((points[1:, 0] - points[:-1, 0]) ** 2 + (points[1:, 2] - points[:-1, 2]) ** 2)
+        with numpy.errstate(divide = "ignore", invalid = "ignore"):
+            # Area of the printed line. This area is a rectangle with area equal to layer_thickness * layer_width
+            line_widths = (dVe / dX / layer_thickness).astype(numpy.float32)
 
         # A threshold is set to avoid weird paths in the GCode
-        if line_width > 1.2:
-            return 0.35
+        line_widths[line_widths > 1.2] = 0.35
         # Prevent showing infinitely wide lines
-        if line_width < 0.0:
-            return 0.0
-        return line_width
+        line_widths[line_widths < 0.0] = 0.0
+        # When the extruder recovers from a retraction, we get zero distance
+        line_widths[dX == 0] = 0.1
+        return line_widths
 
     def _gCode0(self, position: Position, params: PositionOptional, path: List[List[Union[float, int]]]) -> Position:
         x, y, z, f, e = position
@@ -265,27 +265,14 @@ class FlavorParser:
         func = getattr(self, "_gCode%s" % G, None)
         line = line.split(";", 1)[0]  # Remove comments (if any)
         if func is not None:
-            s = line.upper().split(" ")
-            x, y, z, f, e = None, None, None, None, None
-            for item in s[1:]:
-                if len(item) <= 1:
-                    continue
-                if item.startswith(";"):
-                    continue
+            parameters = {"X": None, "Y": None, "Z": None, "F": None, "E": None}  # type: Dict[str, Optional[float]]
+            for code, value in self._parameter_regex.findall(line.upper()):
                 try:
-                    if item[0] == "X":
-                        x = float(item[1:])
-                    elif item[0] == "Y":
-                        y = float(item[1:])
-                    elif item[0] == "Z":
-                        z = float(item[1:])
-                    elif item[0] == "F":
-                        f = float(item[1:]) / 60
-                    elif item[0] == "E":
-                        e = float(item[1:])
+                    parameters[code] = float(value)
                 except ValueError:  # Improperly formatted g-code: Coordinates are not floats.
                     continue  # Skip the command then.
-            params = PositionOptional(x, y, z, f, e)
+            f = parameters["F"]
+            params = PositionOptional(parameters["X"], parameters["Y"], parameters["Z"], f / 60 if f is not None else None, parameters["E"])
             return func(position, params, path)
         return position
 
@@ -312,6 +299,62 @@ class FlavorParser:
 
     _type_keyword = ";TYPE:"
     _layer_keyword = ";LAYER:"
+    _setting_keyword = ";SETTING_"
+
+    @staticmethod
+    def _createMaterialColorMap() -> numpy.ndarray:
+        material_color_map = numpy.zeros((8, 4), dtype = numpy.float32)
+        material_color_map[0, :] = [0.0, 0.7, 0.9, 1.0]
+        material_color_map[1, :] = [0.7, 0.9, 0.0, 1.0]
+        material_color_map[2, :] = [0.9, 0.0, 0.7, 1.0]
+        material_color_map[3, :] = [0.7, 0.0, 0.0, 1.0]
+        material_color_map[4, :] = [0.0, 0.7, 0.0, 1.0]
+        material_color_map[5, :] = [0.0, 0.0, 0.7, 1.0]
+        material_color_map[6, :] = [0.3, 0.3, 0.3, 1.0]
+        material_color_map[7, :] = [0.7, 0.7, 0.7, 1.0]
+        return material_color_map
+
+    @staticmethod
+    def _positionOnBuildPlate(node: CuraSceneNode, global_stack) -> None:
+        if not global_stack.getProperty("machine_center_is_zero", "value"):
+            machine_width = global_stack.getProperty("machine_width", "value")
+            machine_depth = global_stack.getProperty("machine_depth", "value")
+            node.setPosition(Vector(-machine_width / 2, 0, machine_depth / 2))
+
+    def _showLayerPreview(self, global_stack) -> None:
+        """Show the layers that are completely parsed, while the rest of the file is still being parsed.
+
+        The preview is built on the parsing thread, and handed to the main thread to be added to the build volume. It
+        replaces the previous preview, and is removed again when parsing ends.
+        """
+
+        layer_mesh = self._layer_data_builder.buildPreview(self._layer_number, self._createMaterialColorMap())
+        decorator = LayerDataDecorator()
+        decorator.setLayerData(layer_mesh)
+        decorator.setIsPartialLayerData(True)
+
+        preview_node = CuraSceneNode(no_setting_override = True)
+        preview_node.addDecorator(decorator)
+        preview_node.setMeshData(layer_mesh)
+        self._positionOnBuildPlate(preview_node, global_stack)
+
+        self._preview_shown = True
+        CuraApplication.getInstance().callLater(self._replaceLayerPreview, preview_node)
+
+    def _removeLayerPreview(self) -> None:
+        if self._preview_shown:
+            self._preview_shown = False
+            CuraApplication.getInstance().callLater(self._replaceLayerPreview, None)
+
+    def _replaceLayerPreview(self, preview_node: Optional[CuraSceneNode]) -> None:
+        """Replace the preview in the build volume by a new one, or remove it. Only call this on the main thread."""
+
+        # Only remove the previous preview after adding the new one, so the layer view keeps showing layers in between.
+        if preview_node is not None:
+            preview_node.setParent(CuraApplication.getInstance().getBuildVolume())
+        if self._preview_node is not None:
+            self._preview_node.setParent(None)
+        self._preview_node = preview_node
 
     def _extruderOffsets(self) -> Dict[int, List[float]]:
         """For showing correct x, y offsets for each extruder"""
@@ -329,6 +372,28 @@ class FlavorParser:
     # F5, that gcode SceneNode will be removed because it doesn't have a file to be reloaded from.
     #
     def processGCodeStream(self, stream: str, filename: str) -> Optional["CuraSceneNode"]:
+        return self.processGCodeLines(io.StringIO(stream), filename, len(stream))
+
+    def processGCodeLines(self, lines: Iterable[str], filename: str, total_size: int,
+                          get_read_size: Optional[Callable[[], int]] = None) -> Optional["CuraSceneNode"]:
+        """Parse g-code line by line, without holding the original text in memory as a whole.
+
+        :param lines: The lines of g-code, including their line endings, e.g. an opened file.
+        :param filename: The file the g-code was read from.
+        :param total_size: The total size of the input, to report the progress of the parsing.
+        :param get_read_size: Gets how much of total_size is read so far, if that's not the length of the lines read,
+        e.g. the position in a compressed file. By default, the length of the lines is used.
+        :return: A scene node with the layer data of the g-code, or None if parsing was cancelled.
+        """
+
+        try:
+            return self._processGCodeLines(lines, filename, total_size, get_read_size)
+        finally:
+            # Also when parsing failed, so no partial preview stays behind in the build volume.
+            self._removeLayerPreview()
+
+    def _processGCodeLines(self, lines: Iterable[str], filename: str, total_size: int,
+                           get_read_size: Optional[Callable[[], int]]) -> Optional["CuraSceneNode"]:
         Logger.log("d", "Preparing to load g-code")
         self._cancelled = False
         # We obtain the filament diameter from the selected extruder to calculate line widths
@@ -353,15 +418,15 @@ class FlavorParser:
         ##############################################################################################
         ##  This part is where the action starts
         ##############################################################################################
-        file_lines = 0
-        current_line = 0
-        for line in stream.split("\n"):
-            file_lines += 1
-            gcode_list.append(line + "\n")
-            if not self._is_layers_in_file and line[:len(self._layer_keyword)] == self._layer_keyword:
-                self._is_layers_in_file = True
+        # The g-code is stored in chunks per layer, like the g-code that comes from the engine, instead of per line.
+        gcode_chunk = []  # type: List[str]
+        read_size = 0
+        progress_step = max(total_size // 100, 1)
+        next_progress_update = progress_step
 
-        file_step = max(math.floor(file_lines / 100), 1)
+        # In progressive mode, the layers that were parsed so far are shown while the rest is still being parsed.
+        progressive = CuraApplication.getInstance().getPreferences().getValue("gcodereader/progressive_loading")
+        next_preview_layer = self.PREVIEW_LAYER_BATCH
 
         self._clearValues()
 
@@ -382,15 +447,25 @@ class FlavorParser:
         previous_layer = 0
         self._previous_extrusion_value = 0.0
 
-        for line in stream.split("\n"):
+        for raw_line in lines:
             if self._cancelled:
                 Logger.log("d", "Parsing g-code file cancelled.")
                 return None
-            current_line += 1
 
-            if current_line % file_step == 0:
-                self._message.setProgress(math.floor(current_line / file_lines * 100))
+            read_size += len(raw_line)
+            if read_size >= next_progress_update:
+                progress_size = get_read_size() if get_read_size is not None else read_size
+                self._message.setProgress(min(math.floor(progress_size / max(total_size, 1) * 100), 100))
+                next_progress_update = read_size + progress_step
                 Job.yieldThread()
+
+            line = raw_line[:-1] if raw_line.endswith("\n") else raw_line
+            if line.startswith(self._layer_keyword) or line.startswith(self._setting_keyword):
+                if gcode_chunk:
+                    gcode_list.append("".join(gcode_chunk))
+                    gcode_chunk.clear()
+            gcode_chunk.append(line + "\n")
+
             if len(line) == 0:
                 continue
 
@@ -416,7 +491,8 @@ class FlavorParser:
                     Logger.log("w", "Encountered a unknown type (%s) while parsing g-code.", type)
 
             # When the layer change is reached, the polygon is computed so we have just one layer per extruder
-            if self._is_layers_in_file and line[:len(self._layer_keyword)] == self._layer_keyword:
+            if line[:len(self._layer_keyword)] == self._layer_keyword:
+                self._is_layers_in_file = True
                 try:
                     layer_number = int(line[len(self._layer_keyword):])
                     self._createPolygon(self._current_layer_thickness, current_path, self._extruder_offsets.get(self._extruder_number, [0, 0]))
@@ -443,10 +519,20 @@ class FlavorParser:
                 except:
                     pass
 
+                if progressive and self._layer_number >= next_preview_layer:
+                    self._showLayerPreview(global_stack)
+                    # Show batches that grow with the number of layers, so the preview doesn't slow down parsing much.
+                    next_preview_layer = self._layer_number + max(self.PREVIEW_LAYER_BATCH, self._layer_number)
+
             # This line is a comment. Ignore it (except for the layer_keyword)
             if line.startswith(";"):
                 continue
 
+            if line.startswith("G1 ") or line.startswith("G0 "):
+                # Moves make up nearly all of the g-code, so don't search for the command in those.
+                current_position = self.processGCode(int(line[1]), line, current_position, current_path)
+                continue
+
             G = self._getInt(line, "G")
             if G is not None:
                 # When find a movement, the new position is calculated and added to the current_path, but
@@ -473,22 +559,16 @@ class FlavorParser:
                 if M is not None:
                     self.processMCode(M, line, current_position, current_path)
 
+        if gcode_chunk:
+            gcode_list.append("".join(gcode_chunk))
+
         # "Flush" leftovers. Last layer paths are still stored
         if len(current_path) > 1:
             if self._createPolygon(self._current_layer_thickness, current_path, self._extruder_offsets.get(self._extruder_number, [0, 0])):
                 self._layer_number += 1
                 current_path.clear()
 
-        material_color_map = numpy.zeros((8, 4), dtype = numpy.float32)
-        material_color_map[0, :] = [0.0, 0.7, 0.9, 1.0]
-        material_color_map[1, :] = [0.7, 0.9, 0.0, 1.0]
-        material_color_map[2, :] = [0.9, 0.0, 0.7, 1.0]
-        material_color_map[3, :] = [0.7, 0.0, 0.0, 1.0]
-        material_color_map[4, :] = [0.0, 0.7, 0.0, 1.0]
-        material_color_map[5, :] = [0.0, 0.0, 0.7, 1.0]
-        material_color_map[6, :] = [0.3, 0.3, 0.3, 1.0]
-        material_color_map[7, :] = [0.7, 0.7, 0.7, 1.0]
-        layer_mesh = self._layer_data_builder.build(material_color_map)
+        layer_mesh = self._layer_data_builder.build(self._createMaterialColorMap())
         decorator = LayerDataDecorator()
         decorator.setLayerData(layer_mesh)
         scene_node.addDecorator(decorator)
@@ -509,10 +589,7 @@ class FlavorParser:
         if self._layer_number == 0:
             Logger.log("w", "File doesn't contain any valid layers")
 
-        if not global_stack.getProperty("machine_center_is_zero", "value"):
-            machine_width = global_stack.getProperty("machine_width", "value")
-            machine_depth = global_stack.getProperty("machine_depth", "value")
-            scene_node.setPosition(Vector(-machine_width / 2, 0, machine_depth / 2))
+        self._positionOnBuildPlate(scene_node, global_stack)
 
         Logger.log("d", "G-code loading finished.")
 
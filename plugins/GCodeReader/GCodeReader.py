@@ -2,7 +2,10 @@
 # Copyright (c) 2020 Ultimaker B.V.
 # Cura is released under the terms of the LGPLv3 or higher.
 
-from typing import Optional, Union, List, TYPE_CHECKING
+import gzip
+import io
+import os
+from typing import Callable, Iterable, Optional, Union, List, TYPE_CHECKING
 
 from UM.FileHandler.FileReader import FileReader
 from UM.Mesh.MeshReader import MeshReader
@@ -10,6 +13,8 @@ from UM.i18n import i18nCatalog
 from UM.Application import Application
 from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType
 
+from cura.Utils.GCodeIndex import GCodeIndex
+
 catalog = i18nCatalog("cura")
 
 from .FlavorParser import FlavorParser
@@ -41,9 +46,14 @@ class GCodeReader(MeshReader):
         self._flavor_reader = None  # type: Optional[FlavorParser]
 
         Application.getInstance().getPreferences().addPreference("gcodereader/show_caution", True)
+        Application.getInstance().getPreferences().addPreference("gcodereader/progressive_loading", True)
 
     def preReadFromStream(self, stream, *args, **kwargs):
-        for line in stream.split("\n"):
+        return self.preReadFromLines(io.StringIO(stream))
+
+    def preReadFromLines(self, lines: Iterable[str]) -> FileReader.PreReadResult:
+        # Only read the lines up to the flavor, which is in the header of the g-code.
+        for line in lines:
             if line[:len(self._flavor_keyword)] == self._flavor_keyword:
                 try:
                     self._flavor_reader = self._flavor_readers_dict[line[len(self._flavor_keyword):].rstrip()]
@@ -59,19 +69,46 @@ class GCodeReader(MeshReader):
     # PreRead is used to get the correct flavor. If not, Marlin is set by default
     def preRead(self, file_name, *args, **kwargs):
         with open(file_name, "r", encoding = "utf-8") as file:
-            file_data = file.read()
-        return self.preReadFromStream(file_data, args, kwargs)
+            return self.preReadFromLines(file)
 
     def readFromStream(self, stream: str, filename: str) -> Optional["CuraSceneNode"]:
         if self._flavor_reader is None:
             return None
         return self._flavor_reader.processGCodeStream(stream, filename)
 
+    def readFromLines(self, lines: Iterable[str], filename: str, total_size: int,
+                      get_read_size: Optional[Callable[[], int]] = None) -> Optional["CuraSceneNode"]:
+        """Read g-code line by line, e.g. from an opened file, so that it is not loaded in memory as a whole.
+
+        :param lines: The lines of g-code, including their line endings.
+        :param filename: The file the g-code is read from.
+        :param total_size: The total size of the input, to report progress.
+        :param get_read_size: Gets how much of total_size is read so far, if that's not the length of the lines read.
+        """
+
+        if self._flavor_reader is None:
+            return None
+        return self._flavor_reader.processGCodeLines(lines, filename, total_size, get_read_size)
+
     def _read(self, file_name: str) -> Union["SceneNode", List["SceneNode"]]:
-        with open(file_name, "r", encoding = "utf-8") as file:
-            file_data = file.read()
         result = []  # type: List[SceneNode]
-        node = self.readFromStream(file_data, file_name)
+        with open(file_name, "r", encoding = "utf-8") as file:
+            node = self.readFromLines(file, file_name, os.path.getsize(file_name))
         if node is not None:
             result.append(node)
         return result
+
+    def readLayer(self, file_name: str, layer_number: int) -> Optional[str]:
+        """Read the g-code of a single layer, e.g. to preview it without loading the whole file.
+
+        If the file has a footer index (see GCodeWriter), this seeks to the layer directly. Otherwise the file is
+        scanned up to the layer.
+
+        :param file_name: The g-code file to read from, which may be gzipped.
+        :param layer_number: The layer number, as in the ;LAYER: comment.
+        :return: The g-code of the layer, starting with its ;LAYER: comment, or None if the layer is not in the file.
+        """
+
+        opener = gzip.open if file_name.endswith(".gz") else open
+        with opener(file_name, "rb") as file:
+            return GCodeIndex.readLayer(file, layer_number)
@@ -0,0 +1,60 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from FlavorParser import FlavorParser
+
+
+@pytest.fixture
+def application():
+    application = MagicMock()
+    application.later_calls = []
+    application.callLater.side_effect = lambda function, *args: application.later_calls.append((function, args))
+    with patch("FlavorParser.CuraApplication.getInstance", MagicMock(return_value = application)):
+        yield application
+
+
+def runLaterCalls(application):
+    """Run the functions that were handed to the main thread."""
+
+    while application.later_calls:
+        function, args = application.later_calls.pop(0)
+        function(*args)
+
+
+def test_previewIsAddedOnMainThread(application):
+    parser = FlavorParser()
+    with patch("FlavorParser.CuraSceneNode") as scene_node:
+        parser._showLayerPreview(MagicMock())
+        preview_node = scene_node.return_value
+        preview_node.setParent.assert_not_called()  # Not from the parsing thread.
+
+        runLaterCalls(application)
+        preview_node.setParent.assert_called_once_with(application.getBuildVolume())
+
+        parser._removeLayerPreview()
+        runLaterCalls(application)
+        preview_node.setParent.assert_called_with(None)
+
+
+def test_previewIsRemovedWhenParsingFails(application):
+    parser = FlavorParser()
+    with patch("FlavorParser.CuraSceneNode") as scene_node:
+        def failingParse(*args):
+            parser._showLayerPreview(MagicMock())
+            raise ValueError("Broken g-code")
+
+        with patch.object(parser, "_processGCodeLines", side_effect = failingParse):
+            with pytest.raises(ValueError):
+                parser.processGCodeLines([";LAYER:0\n"], "broken.gcode", 9)
+
+        runLaterCalls(application)
+        scene_node.return_value.setParent.assert_called_with(None)
+        assert parser._preview_node is None
@@ -9,6 +9,7 @@ from UM.Logger import Logger
 from UM.Application import Application
 from UM.Settings.InstanceContainer import InstanceContainer
 from cura.Machines.ContainerTree import ContainerTree
+from cura.Utils.GCodeIndex import GCodeIndex
 
 from UM.i18n import i18nCatalog
 
@@ -55,6 +56,7 @@ class GCodeWriter(MeshWriter):
         super().__init__(add_to_recent_files = False)
 
         self._application = Application.getInstance()
+        self._application.getPreferences().addPreference("gcodewriter/footer_index", False)
 
     def write(self, stream, nodes, mode = MeshWriter.OutputMode.TextMode, **kwargs):
         """Writes the g-code for the entire scene to a stream.
@@ -82,15 +84,23 @@ class GCodeWriter(MeshWriter):
         gcode_dict = getattr(scene, "gcode_dict")
         gcode_list = gcode_dict.get(active_build_plate, None)
         if gcode_list is not None:
+            # Optionally record where the layers and settings are, so readers can seek to them directly.
+            index = GCodeIndex() if self._application.getPreferences().getValue("gcodewriter/footer_index") else None
             has_settings = False
             for gcode in gcode_list:
                 if gcode[:len(self._setting_keyword)] == self._setting_keyword:
                     has_settings = True
                 stream.write(gcode)
+                if index is not None:
+                    index.addGCode(gcode)
             # Serialise the current container stack and put it at the end of the file.
             if not has_settings:
                 settings = self._serialiseSettings(Application.getInstance().getGlobalContainerStack())
                 stream.write(settings)
+                if index is not None:
+                    index.addGCode(settings)
+            if index is not None:
+                stream.write(index.serialise())
             return True
 
         self.setInformation(catalog.i18nc("@warning:status", "Please prepare G-code before exporting."))
@@ -20,6 +20,7 @@ from UM.Trust import Trust, TrustBasics
 from UM.i18n import i18nCatalog
 from cura import ApplicationMetadata
 from cura.CuraApplication import CuraApplication
+from cura.Utils.SliceSessionTracer import SliceSessionTracer
 
 i18n_catalog = i18nCatalog("cura")
 
@@ -87,10 +88,11 @@ class PostProcessingPlugin(QObject, Extension):
 
         if ";POSTPROCESSED" not in gcode_list[0]:
             for script in self._script_list:
-                try:
-                    gcode_list = script.execute(gcode_list)
-                except Exception:
-                    Logger.logException("e", "Exception in post-processing script.")
+                with SliceSessionTracer.getInstance().span("post_processing", script = type(script).__name__):
+                    try:
+                        gcode_list = script.execute(gcode_list)
+                    except Exception:
+                        Logger.logException("e", "Exception in post-processing script.")
             if len(self._script_list):  # Add comment to g-code if any changes were made.
                 gcode_list[0] += ";POSTPROCESSED\n"
             # Add all the active post processor names to data[0]
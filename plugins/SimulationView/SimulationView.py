@@ -73,6 +73,7 @@ class SimulationView(CuraView):
         self._top_layers_job = None  # type: Optional["_CreateTopLayersJob"]
         self._activity = False
         self._old_max_layers = 0
+        self._is_loading_layers = False  # Whether the layers are a preview of layers that are still being loaded.
 
         self._max_paths = 0
         self._current_path_num: float = 0.0
@@ -301,7 +302,8 @@ class SimulationView(CuraView):
         return self._nozzle_node
 
     def _onSceneChanged(self, node: "SceneNode") -> None:
-        if node.getMeshData() is None:
+        # Loaded g-code is added to the root directly, without mesh data of its own.
+        if node.getMeshData() is None and not any(child.callDecoration("getLayerData") for child in node.getChildren()):
             return
         self.setActivity(False)
         self.calculateColorSchemeLimits()
@@ -538,10 +540,13 @@ class SimulationView(CuraView):
 
         self._old_max_layers = self._max_layers
         new_max_layers = -1
+        has_partial_layer_data = False
         for node in DepthFirstIterator(scene.getRoot()):  # type: ignore
             layer_data = node.callDecoration("getLayerData")
             if not layer_data:
                 continue
+            if node.callDecoration("isPartialLayerData"):
+                has_partial_layer_data = True
 
             self.setActivity(True)
             min_layer_number = sys.maxsize
@@ -561,13 +566,21 @@ class SimulationView(CuraView):
             if new_max_layers < layer_count:
                 new_max_layers = layer_count
 
+        # While layers are still being loaded, users can look at the layers that are loaded already. Don't move them
+        # to the top layer if they went below it, not even when the last layers come in.
+        keep_current_layer = self._is_loading_layers and self._current_layer_num < self._old_max_layers
+        if new_max_layers >= 0:
+            self._is_loading_layers = has_partial_layer_data
+
         if new_max_layers >= 0 and new_max_layers != self._old_max_layers:
             self._max_layers = new_max_layers
 
             # The qt slider has a bit of weird behavior that if the maxvalue needs to be changed first
             # if it's the largest value. If we don't do this, we can have a slider block outside of the
             # slider.
-            if new_max_layers > self._current_layer_num:
+            if keep_current_layer and new_max_layers > self._current_layer_num:
+                self.maxLayersChanged.emit()
+            elif new_max_layers > self._current_layer_num:
                 self.maxLayersChanged.emit()
                 self.setLayer(int(self._max_layers))
             else:
@@ -4,11 +4,10 @@
 # The _toMeshData function is taken from the AMFReader class which was built by fieldOfView.
 
 from typing import Any, List, Union, TYPE_CHECKING
-import numpy  # To create the mesh data.
 import os.path  # To create the mesh name for the resulting mesh.
 import trimesh  # To load the files into a Trimesh.
 
-from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices  # To construct meshes from the Trimesh data.
+from UM.Mesh.MeshData import MeshData  # To construct meshes from the Trimesh data.
 from UM.Mesh.MeshReader import MeshReader  # The plug-in type we're extending.
 from UM.MimeTypeDatabase import MimeTypeDatabase, MimeType  # To add file types that we can open.
 from UM.Scene.GroupDecorator import GroupDecorator  # Added to the parent node if we load multiple nodes at once.
@@ -18,6 +17,7 @@ from cura.Scene.BuildPlateDecorator import BuildPlateDecorator  # Added to the r
 from cura.Scene.ConvexHullDecorator import ConvexHullDecorator  # Added to group nodes if we load multiple nodes at once.
 from cura.Scene.CuraSceneNode import CuraSceneNode  # To create a node in the scene after reading the file.
 from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator  # Added to the resulting scene node.
+from cura.Utils.IndexedMesh import createIndexedMeshData  # To construct indexed meshes from the Trimesh data.
 
 if TYPE_CHECKING:
     from UM.Scene.SceneNode import SceneNode
@@ -135,26 +135,4 @@ class TrimeshReader(MeshReader):
         :return: Mesh data from the Trimesh in a way that Uranium can understand it.
         """
 
-        tri_faces = tri_node.faces
-        tri_vertices = tri_node.vertices
-
-        indices_list = []
-        vertices_list = []
-
-        index_count = 0
-        face_count = 0
-        for tri_face in tri_faces:
-            face = []
-            for tri_index in tri_face:
-                vertices_list.append(tri_vertices[tri_index])
-                face.append(index_count)
-                index_count += 1
-            indices_list.append(face)
-            face_count += 1
-
-        vertices = numpy.asarray(vertices_list, dtype = numpy.float32)
-        indices = numpy.asarray(indices_list, dtype = numpy.int32)
-        normals = calculateNormalsFromIndexedVertices(vertices, indices, face_count)
-
-        mesh_data = MeshData(vertices = vertices, indices = indices, normals = normals, file_name = file_name)
-        return mesh_data
+        return createIndexedMeshData(tri_node.vertices, tri_node.faces, file_name = file_name)
@@ -11,6 +11,7 @@ from UM.Resources import Resources
 from UM.Scene.SceneNode import SceneNode
 
 from cura.CuraApplication import CuraApplication
+from cura.Network.FleetStatusService import FleetStatusService
 from cura.PrinterOutput.NetworkedPrinterOutputDevice import AuthState
 from cura.PrinterOutput.PrinterOutputDevice import ConnectionType
 from .CloudApiClient import CloudApiClient
@@ -21,11 +22,12 @@ I18N_CATALOG = i18nCatalog("cura")
 
 
 class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
-    API_CHECK_INTERVAL = 10.0  # seconds
 
-    def __init__(self, api_client: CloudApiClient, printer_type: str, request_write_callback: Callable, refresh_callback: Callable, parent: QObject = None) -> None:
+    def __init__(self, api_client: CloudApiClient, printer_type: str, request_write_callback: Callable, refresh_callback: Callable, parent: QObject = None,
+                 fleet_status: Optional[FleetStatusService] = None) -> None:
 
         self._api = api_client
+        self._fleet_status = fleet_status if fleet_status is not None else FleetStatusService.getInstance()
         properties = {b"printer_type": printer_type.encode()}
         super().__init__(
             device_id=f"ABSTRACT_{printer_type}",
@@ -42,6 +44,9 @@ class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
 
         self._setInterfaceElements()
 
+        # The clusters are polled less often while nothing changes, so allow for a missed poll before going offline.
+        self._timeout_time = max(self._timeout_time, FleetStatusService.IdleInterval * 2)
+
     def connect(self) -> None:
         """Connects this device."""
 
@@ -51,6 +56,7 @@ class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         super().connect()
 
         self._update()
+        self._fleet_status.addListener(self._getStatusKey(), self._fetchClusters, self._onCompleted)
 
     def disconnect(self) -> None:
         """Disconnects the device"""
@@ -58,21 +64,43 @@ class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         if not self.isConnected():
             return
         super().disconnect()
+        self._fleet_status.removeListener(self._getStatusKey(), self._onCompleted)
+
+    def close(self) -> None:
+        self._fleet_status.removeListener(self._getStatusKey(), self._onCompleted)
+        super().close()
 
     def _update(self) -> None:
-        """Called when the network data should be updated."""
+        """Called when the network data should be updated.
+
+        The clusters themselves are polled by the fleet status service, see _fetchClusters.
+        """
 
         super()._update()
-        if time() - self._time_of_last_request < self.API_CHECK_INTERVAL:
-            return  # avoid calling the cloud too often
-        self._time_of_last_request = time()
         if self._api.account.isLoggedIn:
             self.setAuthenticationState(AuthState.Authenticated)
-            self._last_request_time = time()
-            self._api.getClustersByMachineType(self.printerType, self._onCompleted, self._onError)
         else:
             self.setAuthenticationState(AuthState.NotAuthenticated)
 
+    def _getStatusKey(self) -> str:
+        return "cloud_machine_type:" + self.printerType
+
+    def _fetchClusters(self, on_finished: Callable[[List[CloudClusterWithConfigResponse]], None], on_failed: Callable[..., None]) -> None:
+        """Request the clusters of this printer type, for the fleet status service."""
+
+        if not self._api.account.isLoggedIn:
+            on_failed()
+            return
+        self._time_of_last_request = time()
+        self._last_request_time = time()
+
+        def on_error(*args) -> None:
+            if len(args) == 2:  # Called without arguments if the server answered with an error status.
+                self._onError(*args)
+            on_failed()
+
+        self._api.getClustersByMachineType(self.printerType, on_finished, on_error)
+
     def _setInterfaceElements(self) -> None:
         """Set all the interface elements and texts for this output device."""
 
@@ -81,8 +109,10 @@ class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         self.setDescription(I18N_CATALOG.i18nc("@properties:tooltip", "Print via cloud"))
         self.setConnectionText(I18N_CATALOG.i18nc("@info:status", "Connected via cloud"))
 
-    def _onCompleted(self, clusters: List[CloudClusterWithConfigResponse]) -> None:
+    def _onCompleted(self, clusters: List[CloudClusterWithConfigResponse], changed: bool = True) -> None:
         self._responseReceived()
+        if not changed:
+            return
 
         all_configurations = []
         for resp in clusters:
@@ -107,6 +137,7 @@ class AbstractCloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     def refresh(self):
         self._refresh_callback()
         self._update()
+        self._fleet_status.requestUpdate(self._getStatusKey())
 
     def _openChoosePrinterDialog(self) -> None:
         if self._on_print_dialog is None:
@@ -11,10 +11,10 @@ from PyQt6.QtCore import QUrl
 from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
 
 from UM.Logger import Logger
-from UM.TaskManagement.HttpRequestManager import HttpRequestManager
 from UM.TaskManagement.HttpRequestScope import JsonDecoratorScope
 from cura.API import Account
 from cura.CuraApplication import CuraApplication
+from cura.Network.HttpClient import HttpClient
 from cura.UltimakerCloud import UltimakerCloudConstants
 from cura.UltimakerCloud.UltimakerCloudScope import UltimakerCloudScope
 from .ToolPathUploader import ToolPathUploader
@@ -60,7 +60,7 @@ class CloudApiClient:
         self._app = app
         self._account = app.getCuraAPI().account
         self._scope = JsonDecoratorScope(UltimakerCloudScope(app))
-        self._http = HttpRequestManager.getInstance()
+        self._http = HttpClient.getInstance()
         self._on_error = on_error
         self._upload: Optional[ToolPathUploader] = None
 
@@ -80,7 +80,8 @@ class CloudApiClient:
                        scope=self._scope,
                        callback=self._parseCallback(on_finished, CloudClusterResponse, failed),
                        error_callback=failed,
-                       timeout=self.DEFAULT_REQUEST_TIMEOUT)
+                       timeout=self.DEFAULT_REQUEST_TIMEOUT,
+                       revalidate=True)
 
     def getClustersByMachineType(self, machine_type, on_finished: Callable[[List[CloudClusterWithConfigResponse]], Any], failed: Callable) -> None:
         # HACK: There is something weird going on with the API, as it reports printer types in formats like
@@ -103,20 +104,26 @@ class CloudApiClient:
                        scope=self._scope,
                        callback=self._parseCallback(on_finished, CloudClusterWithConfigResponse, failed),
                        error_callback=failed,
-                       timeout=self.DEFAULT_REQUEST_TIMEOUT)
+                       timeout=self.DEFAULT_REQUEST_TIMEOUT,
+                       revalidate=True)
 
-    def getClusterStatus(self, cluster_id: str, on_finished: Callable[[CloudClusterStatus], Any]) -> None:
+    def getClusterStatus(self, cluster_id: str, on_finished: Callable[[CloudClusterStatus], Any], failed: Optional[Callable] = None) -> None:
         """Retrieves the status of the given cluster.
 
+        The status is revalidated, so if it didn't change since the last time, the server doesn't send it again.
+
         :param cluster_id: The ID of the cluster.
         :param on_finished: The function to be called after the result is parsed.
+        :param failed: The function to be called if the request failed.
         """
 
         url = f"{self.CLUSTER_API_ROOT}/clusters/{cluster_id}/status"
         self._http.get(url,
                        scope=self._scope,
-                       callback=self._parseCallback(on_finished, CloudClusterStatus),
-                       timeout=self.DEFAULT_REQUEST_TIMEOUT)
+                       callback=self._parseCallback(on_finished, CloudClusterStatus, failed),
+                       error_callback=failed,
+                       timeout=self.DEFAULT_REQUEST_TIMEOUT,
+                       revalidate=True)
 
     def requestUpload(self, request: CloudPrintJobUploadRequest,
                       on_finished: Callable[[CloudPrintJobResponse], Any]) -> None:
@@ -3,7 +3,7 @@
 
 from time import time
 import os
-from typing import cast, List, Optional
+from typing import Callable, cast, List, Optional
 
 from PyQt6.QtCore import QObject, QUrl, pyqtProperty, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QDesktopServices
@@ -15,6 +15,7 @@ from UM.Logger import Logger
 from UM.Scene.SceneNode import SceneNode
 from UM.Version import Version
 from cura.CuraApplication import CuraApplication
+from cura.Network.FleetStatusService import FleetStatusService
 from cura.PrinterOutput.NetworkedPrinterOutputDevice import AuthState
 from cura.PrinterOutput.PrinterOutputDevice import ConnectionType
 from cura.Scene.GCodeListDecorator import GCodeListDecorator
@@ -50,9 +51,9 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     Note that this device represents a single remote cluster, not a list of multiple clusters.
     """
 
-    # The interval with which the remote cluster is checked.
-    # We can do this relatively often as this API call is quite fast.
-    CHECK_CLUSTER_INTERVAL = 10.0  # seconds
+    # The states of printers and print jobs for which the status of the cluster is polled often.
+    IDLE_PRINTER_STATES = {"idle", "unreachable", "disabled", "maintenance"}
+    ACTIVE_PRINT_JOB_STATES = {"queued", "pre_print", "printing", "pausing", "paused", "resuming", "sent_to_printer"}
 
     # Override the network response timeout in seconds after which we consider the device offline.
     # For cloud this needs to be higher because the interval at which we check the status is higher as well.
@@ -65,12 +66,14 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
     # Therefore, we create a private signal used to trigger the printersChanged signal.
     _cloudClusterPrintersChanged = pyqtSignal()
 
-    def __init__(self, api_client: CloudApiClient, cluster: CloudClusterResponse, parent: QObject = None) -> None:
+    def __init__(self, api_client: CloudApiClient, cluster: CloudClusterResponse, parent: QObject = None,
+                 fleet_status: Optional[FleetStatusService] = None) -> None:
         """Creates a new cloud output device
 
         :param api_client: The client that will run the API calls
         :param cluster: The device response received from the cloud API.
         :param parent: The optional parent of this output device.
+        :param fleet_status: The service that polls the status of the cluster, shared with the other cloud devices.
         """
 
         # The following properties are expected on each networked output device.
@@ -96,7 +99,11 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         self._api = api_client
         self._account = api_client.account
         self._cluster = cluster
+        self._fleet_status = fleet_status if fleet_status is not None else FleetStatusService.getInstance()
         self.setAuthenticationState(AuthState.NotAuthenticated)
+
+        # The status is polled less often while the cluster is idle, so allow for a missed poll before going offline.
+        self._timeout_time = max(self._timeout_time, FleetStatusService.IdleInterval * 2)
         self._setInterfaceElements()
 
         # Trigger the printersChanged signal when the private signal is triggered.
@@ -125,6 +132,8 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         Logger.log("i", "Attempting to connect to cluster %s", self.key)
         super().connect()
         self._update()
+        self._fleet_status.addListener(self._getStatusKey(), self._fetchStatus, self._onStatusCallFinished,
+                                       is_active = self._isClusterActive, is_equal = self._isSameStatus)
 
     def disconnect(self) -> None:
         """Disconnects the device"""
@@ -132,8 +141,13 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         if not self.isConnected():
             return
         super().disconnect()
+        self._fleet_status.removeListener(self._getStatusKey(), self._onStatusCallFinished)
         Logger.log("i", "Disconnected from cluster %s", self.key)
 
+    def close(self) -> None:
+        self._fleet_status.removeListener(self._getStatusKey(), self._onStatusCallFinished)
+        super().close()
+
     def _onSceneChanged(self, node: SceneNode):
         # This will reset the print job if a ufp file is loaded. This forces a new upload when printing via cloud from ufp.
         if node.getDecorator(GCodeListDecorator) or node.getDecorator(SliceableObjectDecorator):
@@ -167,25 +181,52 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         self.setConnectionText(I18N_CATALOG.i18nc("@info:status", "Connected via cloud"))
 
     def _update(self) -> None:
-        """Called when the network data should be updated."""
+        """Called when the network data should be updated.
+
+        The status of the cluster itself is polled by the fleet status service, see _fetchStatus.
+        """
 
         super()._update()
-        if time() - self._time_of_last_request < self.CHECK_CLUSTER_INTERVAL:
-            return  # avoid calling the cloud too often
-        self._time_of_last_request = time()
         if self._account.isLoggedIn:
             self.setAuthenticationState(AuthState.Authenticated)
-            self._last_request_time = time()
-            self._api.getClusterStatus(self.key, self._onStatusCallFinished)
         else:
             self.setAuthenticationState(AuthState.NotAuthenticated)
 
-    def _onStatusCallFinished(self, status: CloudClusterStatus) -> None:
+    def _getStatusKey(self) -> str:
+        return "cloud_cluster:" + self.key
+
+    def _fetchStatus(self, on_finished: Callable[[CloudClusterStatus], None], on_failed: Callable[..., None]) -> None:
+        """Request the status of the cluster, for the fleet status service."""
+
+        if not self._account.isLoggedIn:
+            on_failed()
+            return
+        self._time_of_last_request = time()
+        self._last_request_time = time()
+        self._api.getClusterStatus(self.key, on_finished, on_failed)
+
+    def _isClusterActive(self, status: CloudClusterStatus) -> bool:
+        """Whether the status of the cluster should be polled often, because something is going on."""
+
+        return any(printer.status not in self.IDLE_PRINTER_STATES for printer in status.printers) \
+            or any(print_job.status in self.ACTIVE_PRINT_JOB_STATES for print_job in status.print_jobs)
+
+    @staticmethod
+    def _isSameStatus(old_status: CloudClusterStatus, new_status: CloudClusterStatus) -> bool:
+        # Leave out the time at which the status was generated, which is different for every response.
+        return old_status.printers == new_status.printers and old_status.print_jobs == new_status.print_jobs \
+            and old_status.active == new_status.active
+
+    def _onStatusCallFinished(self, status: CloudClusterStatus, changed: bool = True) -> None:
         """Method called when HTTP request to status endpoint is finished.
 
         Contains both printers and print jobs statuses in a single response.
+
+        :param changed: Whether the status changed since the last time. If not, the models are left alone.
         """
         self._responseReceived()
+        if not changed:
+            return
         if status.printers != self._received_printers:
             self._received_printers = status.printers
             self._updatePrinters(status.printers)
@@ -279,6 +320,7 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         """
         self._uploaded_print_job = self._pre_upload_print_job
         self._progress.hide()
+        self._fleet_status.requestUpdate(self._getStatusKey())  # To show the new print job right away.
 
         if response:
             message = PrintJobUploadSuccessMessage()
@@ -365,19 +407,23 @@ class CloudOutputDevice(UltimakerNetworkedPrinterOutputDevice):
         """Set the remote print job state."""
 
         self._api.doPrintJobAction(self._cluster.cluster_id, print_job_uuid, state)
+        self._fleet_status.requestUpdate(self._getStatusKey())
 
     @pyqtSlot(str, name="sendJobToTop")
     def sendJobToTop(self, print_job_uuid: str) -> None:
         self._api.doPrintJobAction(self._cluster.cluster_id, print_job_uuid, "move",
                                    {"list": "queued", "to_position": 0})
+        self._fleet_status.requestUpdate(self._getStatusKey())
 
     @pyqtSlot(str, name="deleteJobFromQueue")
     def deleteJobFromQueue(self, print_job_uuid: str) -> None:
         self._api.doPrintJobAction(self._cluster.cluster_id, print_job_uuid, "remove")
+        self._fleet_status.requestUpdate(self._getStatusKey())
 
     @pyqtSlot(str, name="forceSendJob")
     def forceSendJob(self, print_job_uuid: str) -> None:
         self._api.doPrintJobAction(self._cluster.cluster_id, print_job_uuid, "force")
+        self._fleet_status.requestUpdate(self._getStatusKey())
 
     @pyqtSlot(name="openPrintJobControlPanel")
     def openPrintJobControlPanel(self) -> None:
@@ -64,6 +64,9 @@ class CloudOutputDeviceManager:
         # Ensure we don't start twice.
         self._running = False
 
+        # The clusters of the last sync, to skip updating the machines if nothing changed since.
+        self._synced_clusters: Optional[List[CloudClusterResponse]] = None
+
         self._syncing = False
         CuraApplication.getInstance().getContainerRegistry().containerRemoved.connect(self._printerRemoved)
 
@@ -85,6 +88,7 @@ class CloudOutputDeviceManager:
         if not self._running:
             return
         self._running = False
+        self._synced_clusters = None
         self._onGetRemoteClustersFinished([])  # Make sure we remove all cloud output devices.
 
     def refreshConnections(self) -> None:
@@ -108,7 +112,20 @@ class CloudOutputDeviceManager:
 
         self._syncing = True
         self._account.setSyncState(self.SYNC_SERVICE_NAME, SyncState.SYNCING)
-        self._api.getClusters(self._onGetRemoteClustersFinished, self._onGetRemoteClusterFailed)
+        self._api.getClusters(self._onGetRemoteClustersReceived, self._onGetRemoteClusterFailed)
+
+    def _onGetRemoteClustersReceived(self, clusters: List[CloudClusterResponse]) -> None:
+        """Callback for when the clusters are received, which only updates the machines if the clusters changed.
+
+        The list of clusters is revalidated, so most of the time the server only answers that it didn't change.
+        """
+
+        if self._synced_clusters is not None and clusters == self._synced_clusters:
+            self._syncing = False
+            self._account.setSyncState(self.SYNC_SERVICE_NAME, SyncState.SUCCESS)
+            return
+        self._synced_clusters = clusters
+        self._onGetRemoteClustersFinished(clusters)
 
     def _onGetRemoteClustersFinished(self, clusters: List[CloudClusterResponse]) -> None:
         """Callback for when the request for getting the clusters is successful and finished."""
@@ -169,7 +186,7 @@ class CloudOutputDeviceManager:
 
         Logger.debug("Synced cloud printers with account.")
 
-    def _onGetRemoteClusterFailed(self, reply: QNetworkReply, error: QNetworkReply.NetworkError) -> None:
+    def _onGetRemoteClusterFailed(self, reply: Optional[QNetworkReply] = None, error: Optional["QNetworkReply.NetworkError"] = None) -> None:
         self._syncing = False
         self._account.setSyncState(self.SYNC_SERVICE_NAME, SyncState.ERROR)
 
@@ -470,6 +487,7 @@ class CloudOutputDeviceManager:
             container_cluster_id = container.getMetaDataEntry(self.META_CLUSTER_ID, None)
             if container_cluster_id in self._remote_clusters.keys():
                 del self._remote_clusters[container_cluster_id]
+                self._synced_clusters = None  # Handle the clusters again on the next sync, even if they didn't change.
 
     def _onRemovedPrintersMessageActionTriggered(self, removed_printers_message: RemovedPrintersMessage, action: str) -> None:
         if action == "keep_printer_configurations_action":
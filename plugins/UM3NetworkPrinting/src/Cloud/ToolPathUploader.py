@@ -5,7 +5,8 @@ from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
 from typing import Callable, Any, Tuple, cast, Dict, Optional
 
 from UM.Logger import Logger
-from UM.TaskManagement.HttpRequestManager import HttpRequestManager
+
+from cura.Network.HttpClient import HttpClient
 
 from ..Models.Http.CloudPrintJobResponse import CloudPrintJobResponse
 
@@ -20,7 +21,7 @@ class ToolPathUploader:
     # The HTTP codes that should trigger a retry.
     RETRY_HTTP_CODES = {500, 502, 503, 504}
 
-    def __init__(self, http: HttpRequestManager, print_job: CloudPrintJobResponse, data: bytes,
+    def __init__(self, http: HttpClient, print_job: CloudPrintJobResponse, data: bytes,
                  on_finished: Callable[[], Any], on_progress: Callable[[int], Any], on_error: Callable[[], Any]
                  ) -> None:
         """Creates a mesh upload object.
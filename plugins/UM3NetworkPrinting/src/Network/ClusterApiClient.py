@@ -10,11 +10,12 @@ from json import JSONDecodeError
 from typing import Callable, List, Optional, Dict, Union, Any, Type, cast, TypeVar, Tuple
 
 from PyQt6.QtCore import QUrl
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
 
 from UM.Logger import Logger
 
 from cura.CuraApplication import CuraApplication
+from cura.Network.HttpClient import HttpClient
 
 from ..Messages.AuthorizationRequiredMessage import AuthorizationRequiredMessage
 from ..Models.BaseModel import BaseModel
@@ -54,9 +55,6 @@ class ClusterApiClient:
 
     AUTH_MAX_TRIES = 5
 
-    # In order to avoid garbage collection we keep the callbacks in this list.
-    _anti_gc_callbacks = []  # type: List[Callable[[], None]]
-
     def __init__(self, address: str, on_error: Callable, on_auth_required: Callable) -> None:
         """Initializes a new cluster API client.
 
@@ -64,7 +62,7 @@ class ClusterApiClient:
         :param on_error: The callback to be called whenever we receive errors from the server.
         """
         super().__init__()
-        self._manager = QNetworkAccessManager()
+        self._http = HttpClient.getInstance()
         self._address = address
         self._on_error = on_error
 
@@ -100,8 +98,7 @@ class ClusterApiClient:
         :param on_finished: The callback in case the response is successful.
         """
         url = "{}/system".format(self.PRINTER_API_PREFIX)
-        reply = self._manager.get(self.createEmptyRequest(url))
-        self._addCallback(reply, on_finished, PrinterSystemStatus)
+        self._get(url, on_finished, PrinterSystemStatus)
 
     def getMaterials(self, on_finished: Callable[[List[ClusterMaterial]], Any]) -> None:
         """Get the installed materials on the printer.
@@ -109,8 +106,7 @@ class ClusterApiClient:
         :param on_finished: The callback in case the response is successful.
         """
         url = "{}/materials".format(self.CLUSTER_API_PREFIX)
-        reply = self._manager.get(self.createEmptyRequest(url))
-        self._addCallback(reply, on_finished, ClusterMaterial)
+        self._get(url, on_finished, ClusterMaterial)
 
     def getPrinters(self, on_finished: Callable[[List[ClusterPrinterStatus]], Any]) -> None:
         """Get the printers in the cluster.
@@ -118,8 +114,7 @@ class ClusterApiClient:
         :param on_finished: The callback in case the response is successful.
         """
         url = "{}/printers".format(self.CLUSTER_API_PREFIX)
-        reply = self._manager.get(self.createEmptyRequest(url))
-        self._addCallback(reply, on_finished, ClusterPrinterStatus)
+        self._get(url, on_finished, ClusterPrinterStatus)
 
     def getPrintJobs(self, on_finished: Callable[[List[ClusterPrintJobStatus]], Any]) -> None:
         """Get the print jobs in the cluster.
@@ -127,26 +122,25 @@ class ClusterApiClient:
         :param on_finished: The callback in case the response is successful.
         """
         url = "{}/print_jobs".format(self.CLUSTER_API_PREFIX)
-        reply = self._manager.get(self.createEmptyRequest(url))
-        self._addCallback(reply, on_finished, ClusterPrintJobStatus)
+        self._get(url, on_finished, ClusterPrintJobStatus)
 
     def movePrintJobToTop(self, print_job_uuid: str) -> None:
         """Move a print job to the top of the queue."""
 
         url = "{}/print_jobs/{}/action/move".format(self.CLUSTER_API_PREFIX, print_job_uuid)
-        self._manager.post(self.createEmptyRequest(url, method=HttpRequestMethod.POST), json.dumps({"to_position": 0, "list": "queued"}).encode())
+        self._send(HttpRequestMethod.POST, url, json.dumps({"to_position": 0, "list": "queued"}).encode())
 
     def forcePrintJob(self, print_job_uuid: str) -> None:
         """Override print job configuration and force it to be printed."""
 
         url = "{}/print_jobs/{}".format(self.CLUSTER_API_PREFIX, print_job_uuid)
-        self._manager.put(self.createEmptyRequest(url, method=HttpRequestMethod.PUT), json.dumps({"force": True}).encode())
+        self._send(HttpRequestMethod.PUT, url, json.dumps({"force": True}).encode())
 
     def deletePrintJob(self, print_job_uuid: str) -> None:
         """Delete a print job from the queue."""
 
         url = "{}/print_jobs/{}".format(self.CLUSTER_API_PREFIX, print_job_uuid)
-        self._manager.deleteResource(self.createEmptyRequest(url, method=HttpRequestMethod.DELETE))
+        self._send(HttpRequestMethod.DELETE, url)
 
     def setPrintJobState(self, print_job_uuid: str, state: str) -> None:
         """Set the state of a print job."""
@@ -154,14 +148,13 @@ class ClusterApiClient:
         url = "{}/print_jobs/{}/action".format(self.CLUSTER_API_PREFIX, print_job_uuid)
         # We rewrite 'resume' to 'print' here because we are using the old print job action endpoints.
         action = "print" if state == "resume" else state
-        self._manager.put(self.createEmptyRequest(url, method=HttpRequestMethod.PUT), json.dumps({"action": action}).encode())
+        self._send(HttpRequestMethod.PUT, url, json.dumps({"action": action}).encode())
 
     def getPrintJobPreviewImage(self, print_job_uuid: str, on_finished: Callable) -> None:
         """Get the preview image data of a print job."""
 
         url = "{}/print_jobs/{}/preview_image".format(self.CLUSTER_API_PREFIX, print_job_uuid)
-        reply = self._manager.get(self.createEmptyRequest(url))
-        self._addCallback(reply, on_finished)
+        self._get(url, on_finished)
 
     def createEmptyRequest(self, path: str, content_type: Optional[str] = "application/json", method: HttpRequestMethod = HttpRequestMethod.GET, skip_auth: bool = False) -> QNetworkRequest:
         """We override _createEmptyRequest in order to add the user credentials.
@@ -171,19 +164,53 @@ class ClusterApiClient:
         :param method: The HTTP method to use, such as GET, POST, PUT, etc.
         :param skip_auth: Skips the authentication step if set; prevents a loop on request of authentication token.
         """
-        url = QUrl("http://" + self._address + path)
-        request = QNetworkRequest(url)
+        request = QNetworkRequest(QUrl(self._getUrl(path)))
+        for name, value in self._createHeaders(path, content_type, method, skip_auth).items():
+            request.setRawHeader(name.encode("utf-8"), value.encode("utf-8"))
+        return request
+
+    def _getUrl(self, path: str) -> str:
+        return "http://" + self._address + path
+
+    def _createHeaders(self, path: str, content_type: Optional[str] = "application/json", method: HttpRequestMethod = HttpRequestMethod.GET, skip_auth: bool = False) -> Dict[str, str]:
+        """Create the headers of a request to the cluster, including the user credentials.
+
+        Every call uses up a nonce count, so the headers can be used for one request only. The arguments are the same as
+        those of createEmptyRequest.
+        """
+        headers = {}  # type: Dict[str, str]
         if content_type:
-            request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, content_type)
+            headers["Content-Type"] = content_type
         if self._auth_id and self._auth_key:
             digest_str = self._makeAuthDigestHeaderPart(path, method=method)
-            request.setRawHeader(b"Authorization", f"Digest {digest_str}".encode("utf-8"))
+            headers["Authorization"] = f"Digest {digest_str}"
             self._nonce_count += 1
             self._setLocalValueToPrefDict("cluster_api/nonce_counts", self._nonce_count)
             CuraApplication.getInstance().savePreferences()
         elif not skip_auth:
             self._setupAuth()
-        return request
+        return headers
+
+    def _get(self, path: str, on_finished: Union[Callable[[ClusterApiClientModel], Any], Callable[[List[ClusterApiClientModel]], Any]],
+             model: Type[ClusterApiClientModel] = None) -> None:
+        """Get a resource from the cluster, and call on_finished with the parsed result if it's successful."""
+
+        headers = self._createHeaders(path)
+        # A retry would send the same nonce count again, which the printer refuses. So only retry without credentials.
+        retries = 0 if "Authorization" in headers else HttpClient.DefaultGetRetries
+        self._http.get(self._getUrl(path), headers_dict = headers, retries = retries, **self._createCallbacks(on_finished, model))
+
+    def _send(self, method: HttpRequestMethod, path: str, data: Optional[bytes] = None, on_finished: Optional[Callable] = None, skip_auth: bool = False) -> None:
+        """Send a request that changes something on the cluster."""
+
+        headers = self._createHeaders(path, method = method, skip_auth = skip_auth)
+        callbacks = self._createCallbacks(on_finished) if on_finished is not None else {}
+        if method == HttpRequestMethod.DELETE:
+            self._http.delete(self._getUrl(path), headers_dict = headers, **callbacks)
+        elif method == HttpRequestMethod.PUT:
+            self._http.put(self._getUrl(path), headers_dict = headers, data = data, **callbacks)
+        else:
+            self._http.post(self._getUrl(path), headers_dict = headers, data = data, **callbacks)
 
     @staticmethod
     def _parseReply(reply: QNetworkReply) -> Tuple[int, Dict[str, Any]]:
@@ -278,47 +305,19 @@ class ClusterApiClient:
                 "application": CuraApplication.getInstance().getApplicationDisplayName(),
                 "user": f"user@{platform.node()}",
             }).encode("utf-8")
-        reply = self._manager.post(self.createEmptyRequest(url, method=HttpRequestMethod.POST, skip_auth=True), request_body)
-
-        self._addCallback(reply, on_finished)
+        self._send(HttpRequestMethod.POST, url, request_body, on_finished = on_finished, skip_auth = True)
 
-    def _addCallback(self, reply: QNetworkReply, on_finished: Union[Callable[[ClusterApiClientModel], Any],
-                           Callable[[List[ClusterApiClientModel]], Any]], model: Type[ClusterApiClientModel] = None,
-                     ) -> None:
-        """Creates a callback function so that it includes the parsing of the response into the correct model.
+    def _createCallbacks(self, on_finished: Union[Callable[[ClusterApiClientModel], Any],
+                         Callable[[List[ClusterApiClientModel]], Any]], model: Type[ClusterApiClientModel] = None,
+                         ) -> Dict[str, Callable]:
+        """Creates the callbacks of a request so that they include the parsing of the response into the correct model.
 
-        The callback is added to the 'finished' signal of the reply.
-        :param reply: The reply that should be listened to.
         :param on_finished: The callback in case the response is successful.
+        :param model: The type of the model to convert the response to. If not given, the raw data is passed on.
+        :return: The callback and error_callback arguments for the HTTP client.
         """
 
-        def parse() -> None:
-            try:
-                self._anti_gc_callbacks.remove(parse)
-            except ValueError:  # Already removed asynchronously.
-                return  # Then the rest of the function is also already executed.
-
-            # Don't try to parse the reply if we didn't get one
-            if reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) is None:
-                return
-
-            if reply.error() != QNetworkReply.NetworkError.NoError:
-                if reply.error() == QNetworkReply.NetworkError.AuthenticationRequiredError:
-                    self._auth_id = None
-                    self._auth_key = None
-
-                    self._on_auth_required(reply.errorString())
-                    nonce_match = re.search(r'nonce="([^"]+)', str(reply.rawHeader(b"WWW-Authenticate")))
-                    if nonce_match:
-                        self._nonce = nonce_match.group(1)
-                        self._nonce_count = 1
-                        self._setLocalValueToPrefDict("cluster_api/nonce_counts", self._nonce_count)
-                        self._setLocalValueToPrefDict("cluster_api/nonces", self._nonce)
-                        CuraApplication.getInstance().savePreferences()
-                else:
-                    self._on_error(reply.errorString())
-                return
-
+        def on_success(reply: QNetworkReply) -> None:
             if self._auth_id and self._auth_key and self._nonce_count > 1:
                 AuthorizationRequiredMessage.hide()
 
@@ -331,5 +330,24 @@ class ClusterApiClient:
             status_code, response = self._parseReply(reply)
             self._parseModels(response, on_finished, model)
 
-        self._anti_gc_callbacks.append(parse)
-        reply.finished.connect(parse)
+        def on_error(reply: QNetworkReply, error: QNetworkReply.NetworkError) -> None:
+            # Don't try to handle the reply if we didn't get one.
+            if reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) is None:
+                return
+
+            if error == QNetworkReply.NetworkError.AuthenticationRequiredError:
+                self._auth_id = None
+                self._auth_key = None
+
+                self._on_auth_required(reply.errorString())
+                nonce_match = re.search(r'nonce="([^"]+)', str(reply.rawHeader(b"WWW-Authenticate")))
+                if nonce_match:
+                    self._nonce = nonce_match.group(1)
+                    self._nonce_count = 1
+                    self._setLocalValueToPrefDict("cluster_api/nonce_counts", self._nonce_count)
+                    self._setLocalValueToPrefDict("cluster_api/nonces", self._nonce)
+                    CuraApplication.getInstance().savePreferences()
+            else:
+                self._on_error(reply.errorString())
+
+        return {"callback": on_success, "error_callback": on_error}
@@ -0,0 +1,185 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from collections import OrderedDict
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Dict, Optional, TextIO, Tuple
+
+from UM.Logger import Logger
+
+
+def prepareLine(line_number: int, line: str) -> bytes:
+    """Turn a line of g-code into the command that is sent to the printer, with its line number and checksum.
+
+    Comments are stripped. Empty lines become M105, because every line number has to be sent. M0 and M1 also become M105,
+    since they are handled as an LCD menu pause by the printer.
+    """
+
+    comment_start = line.find(";")
+    if comment_start >= 0:
+        line = line[:comment_start]
+    line = line.strip()
+    if line == "" or line == "M0" or line == "M1":
+        line = "M105"
+
+    command = ("N%d%s" % (line_number, line)).encode()
+    checksum = 0
+    for character in command:
+        checksum ^= character
+    return command + b"*%d\n" % checksum
+
+
+class GCodeStream:
+    """Prepares the commands of a print in a background thread, and keeps track of what's in flight at the printer.
+
+    The g-code is read lazily, line by line, from the output of the g-code writer. A producer thread strips the lines and
+    computes their checksums ahead of the printer, so the thread that reads from the serial port only has to write the
+    next command when the printer acknowledges one.
+
+    The commands that were sent last are kept, so that the ones the printer asks to resend can be sent again.
+    """
+
+    LookAhead = 1000  # How many commands are prepared ahead of the printer.
+    History = 256  # How many sent commands are kept to resend.
+
+    def __init__(self, gcode: TextIO) -> None:
+        """
+        :param gcode: The g-code to print, positioned at the start. It's read by the producer thread from now on.
+        """
+
+        self._gcode = gcode
+        self._gcode_size = gcode.seek(0, 2)  # To compute the progress, without having to count the lines first.
+        gcode.seek(0)
+
+        self._prepared = Queue(maxsize = self.LookAhead)  # type: Queue  # Of (line number, command, end position in the g-code), with None at the end.
+        self._cancelled = Event()
+        self._producer = Thread(target = self._produce, daemon = True, name = "USBPrinterGCodeStream")
+
+        self._lock = Lock()
+        self._next_command_lock = Lock()
+        self._sent = OrderedDict()  # type: OrderedDict[int, Tuple[bytes, int]]  # The last commands that were sent, by line number.
+        self._next_line_number = 0  # The line number of the next command to send.
+        self._last_line_number = None  # type: Optional[int]  # Known once all of the g-code is prepared.
+        self._position = 0  # How much of the g-code was sent, in characters.
+        self._duplicate_resends = {}  # type: Dict[int, int]  # Resend requests of the same line that can still come in.
+
+    def start(self) -> None:
+        self._producer.start()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        with self._lock:
+            self._sent.clear()
+
+    def getProgress(self) -> float:
+        """How much of the g-code was sent to the printer, from 0 to 1."""
+
+        if self._gcode_size == 0:
+            return 1
+        return self._position / self._gcode_size
+
+    def isFinished(self) -> bool:
+        """Whether all commands were sent."""
+
+        with self._lock:
+            return self._last_line_number is not None and self._next_line_number > self._last_line_number
+
+    def nextCommand(self) -> Optional[bytes]:
+        """Get the next command to send to the printer, and keep it in case the printer asks to resend it.
+
+        :return: The command, or None if all commands were sent or the stream was cancelled.
+        """
+
+        with self._next_command_lock:  # Only one thread can wait for the producer, or the commands get out of order.
+            return self._nextCommand()
+
+    def _nextCommand(self) -> Optional[bytes]:
+        with self._lock:
+            if self._cancelled.is_set():
+                return None
+            line_number = self._next_line_number
+            resent = self._sent.get(line_number)
+            if resent is not None:
+                self._next_line_number += 1
+                self._sent.move_to_end(line_number)
+                return resent[0]
+            if self._last_line_number is not None and line_number > self._last_line_number:
+                return None
+
+        # Wait for the producer outside of the lock, so that a resend request can be handled meanwhile.
+        prepared = None
+        while not self._cancelled.is_set():
+            try:
+                prepared = self._prepared.get(timeout = 0.1)
+                break
+            except Empty:
+                continue
+
+        with self._lock:
+            if prepared is None:
+                if not self._cancelled.is_set():
+                    self._last_line_number = line_number - 1
+                return self._takeResend()
+            prepared_line_number, command, end_position = prepared
+            self._sent[prepared_line_number] = (command, end_position)
+            while len(self._sent) > self.History:
+                self._sent.popitem(last = False)
+            self._position = max(self._position, end_position)
+            if self._next_line_number == prepared_line_number:
+                self._next_line_number += 1
+                return command
+            # The printer asked to resend while we were waiting. Send that line first, this one is kept until then.
+            return self._takeResend()
+
+    def resend(self, line_number: int, in_flight: int) -> None:
+        """Send the commands again from a line number on, because the printer asked for it.
+
+        The printer asks to resend a line for every command that it received after a bad one, so the same request may
+        come in once for every command that was in flight. Only the first one rewinds the stream.
+
+        :param line_number: The line number that the printer asks for.
+        :param in_flight: How many commands were sent that the printer didn't acknowledge yet.
+        """
+
+        with self._lock:
+            if self._duplicate_resends.get(line_number, 0) > 0:
+                self._duplicate_resends[line_number] -= 1
+                return
+            if line_number not in self._sent:
+                Logger.log("e", "The printer asked to resend line %s, which is no longer available.", line_number)
+                return
+            self._duplicate_resends = {line_number: max(0, in_flight - 1)}
+            self._next_line_number = line_number
+
+    def _takeResend(self) -> Optional[bytes]:
+        resent = self._sent.get(self._next_line_number)
+        if resent is None:
+            return None
+        self._sent.move_to_end(self._next_line_number)
+        self._next_line_number += 1
+        return resent[0]
+
+    def _produce(self) -> None:
+        if not self._put((0, prepareLine(0, "M110"), 0)):  # Reset the line number. If this is not done, the first line is sometimes ignored.
+            return
+        position = 0
+        for line_number, line in enumerate(self._gcode, start = 1):
+            position += len(line)
+            if not self._put((line_number, prepareLine(line_number, line), position)):
+                return
+        self._put(None)
+
+    def _put(self, item: Optional[Tuple[int, bytes, int]]) -> bool:
+        """Hand a prepared command to the sending thread, waiting until there is room for it.
+
+        :return: Whether it was handed over, False if the stream was cancelled meanwhile.
+        """
+
+        while not self._cancelled.is_set():
+            try:
+                self._prepared.put(item, timeout = 0.1)
+                return True
+            except Full:
+                continue
+        return False
@@ -18,16 +18,16 @@ from cura.PrinterOutput.GenericOutputController import GenericOutputController
 
 from .AutoDetectBaudJob import AutoDetectBaudJob
 from .AvrFirmwareUpdater import AvrFirmwareUpdater
+from .GCodeStream import GCodeStream
 
 from io import StringIO # To write the g-code output.
 from queue import Queue
 from serial import Serial, SerialException, SerialTimeoutException
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 from time import time
-from typing import Union, Optional, List, cast, TYPE_CHECKING
+from typing import Union, Optional, List, TextIO, cast, TYPE_CHECKING
 
 import re
-import functools  # Used for reduce
 
 if TYPE_CHECKING:
     from UM.FileHandler.FileHandler import FileHandler
@@ -50,9 +50,13 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
 
         self._timeout = 3
 
-        # List of gcode lines to be printed
-        self._gcode = [] # type: List[str]
-        self._gcode_position = 0
+        # The g-code that is being printed.
+        self._gcode_stream = None  # type: Optional[GCodeStream]
+        self._send_lock = Lock()
+        # The number of commands that were sent, but not acknowledged by the printer yet.
+        self._commands_in_flight = 0
+        # How many commands the printer can buffer. Changed with the usb_printing/commands_in_flight preference.
+        self._max_commands_in_flight = 4
 
         self._use_auto_detect = True
 
@@ -71,6 +75,7 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
         ## Set when print is started in order to check running time.
         self._print_start_time = None  # type: Optional[float]
         self._print_estimated_time = None  # type: Optional[int]
+        self._last_print_job_update = 0.0
 
         self._accepts_commands = True
 
@@ -151,29 +156,27 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
         if not success:
             return
 
-        self._printGCode(gcode_textio.getvalue())
+        self._printGCode(gcode_textio)
 
-    def _printGCode(self, gcode: str):
+    def _printGCode(self, gcode: TextIO):
         """Start a print based on a g-code.
 
-        :param gcode: The g-code to print.
+        :param gcode: The g-code to print. It's read line by line while printing.
         """
-        self._gcode.clear()
+        if self._gcode_stream is not None:
+            self._gcode_stream.cancel()
         self._paused = False
 
-        self._gcode.extend(gcode.split("\n"))
-
-        # Reset line number. If this is not done, first line is sometimes ignored
-        self._gcode.insert(0, "M110")
-        self._gcode_position = 0
+        self._gcode_stream = GCodeStream(gcode)
+        self._gcode_stream.start()
+        self._max_commands_in_flight = max(1, int(CuraApplication.getInstance().getPreferences().getValue("usb_printing/commands_in_flight")))
         self._print_start_time = time()
+        self._last_print_job_update = 0.0
 
         self._print_estimated_time = int(CuraApplication.getInstance().getPrintInformation().currentPrintTime.getDisplayString(DurationFormat.Format.Seconds))
 
-        for i in range(0, 4):  # Push first 4 entries before accepting other inputs
-            self._sendNextGcodeLine()
-
         self._is_printing = True
+        self._sendNextGcodeLines()  # Fill the buffer of the printer before accepting other inputs.
         self.writeFinished.emit(self)
 
     def _autoDetectFinished(self, job: AutoDetectBaudJob):
@@ -250,6 +253,7 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
         try:
             self._command_received.clear()
             self._serial.write(new_command)
+            self._commands_in_flight += 1
         except SerialTimeoutException:
             Logger.log("w", "Timeout when sending command to printer via USB.")
             self._command_received.set()
@@ -318,15 +322,16 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
 
             if line.startswith(b"ok") or self._firmware_idle_count > 1:
                 self._printer_busy = False
+                if self._firmware_idle_count > 1:
+                    self._commands_in_flight = 0  # The printer is idle, so the acknowledgements that are left got lost.
+                else:
+                    self._commands_in_flight = max(0, self._commands_in_flight - 1)
 
                 self._command_received.set()
                 if not self._command_queue.empty():
                     self._sendCommand(self._command_queue.get())
-                elif self._is_printing:
-                    if self._paused:
-                        pass  # Nothing to do!
-                    else:
-                        self._sendNextGcodeLine()
+                if self._is_printing and not self._paused:
+                    self._sendNextGcodeLines()
 
             if line.startswith(b"echo:busy:"):
                 self._printer_busy = True
@@ -337,12 +342,16 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
                     self.cancelPrint()
                 elif line.lower().startswith(b"resend") or line.startswith(b"rs"):
                     # A resend can be requested either by Resend, resend or rs.
+                    line_number = None
                     try:
-                        self._gcode_position = int(line.replace(b"N:", b" ").replace(b"N", b" ").replace(b":", b" ").split()[-1])
+                        line_number = int(line.replace(b"N:", b" ").replace(b"N", b" ").replace(b":", b" ").split()[-1])
                     except:
                         if line.startswith(b"rs"):
                             # In some cases of the RS command it needs to be handled differently.
-                            self._gcode_position = int(line.split()[1])
+                            line_number = int(line.split()[1])
+                    gcode_stream = self._gcode_stream
+                    if line_number is not None and gcode_stream is not None:
+                        gcode_stream.resend(line_number, self._commands_in_flight)
 
     def _setFirmwareName(self, name):
         new_name = re.findall(r"FIRMWARE_NAME:(.*);", str(name))
@@ -361,11 +370,12 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
 
     def resumePrint(self):
         self._paused = False
-        self._sendNextGcodeLine() #Send one line of g-code next so that we'll trigger an "ok" response loop even if we're not polling temperatures.
+        self._sendNextGcodeLines() #Send g-code next so that we'll trigger an "ok" response loop even if we're not polling temperatures.
 
     def cancelPrint(self):
-        self._gcode_position = 0
-        self._gcode.clear()
+        if self._gcode_stream is not None:
+            self._gcode_stream.cancel()
+            self._gcode_stream = None
         self._printers[0].updateActivePrintJob(None)
         self._is_printing = False
         self._paused = False
@@ -380,44 +390,46 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
         self.printers[0].homeHead()
         self._sendCommand("M84")
 
-    def _sendNextGcodeLine(self):
+    def _sendNextGcodeLines(self):
         """
-        Send the next line of g-code, at the current `_gcode_position`, via a
-        serial port to the printer.
+        Send the next lines of g-code via a serial port to the printer, until
+        as many commands are in flight as the printer can buffer.
 
         If the print is done, this sets `_is_printing` to `False` as well.
         """
-        try:
-            line = self._gcode[self._gcode_position]
-        except IndexError:  # End of print, or print got cancelled.
-            self._printers[0].updateActivePrintJob(None)
-            self._is_printing = False
-            return
-
-        if ";" in line:
-            line = line[:line.find(";")]
-
-        line = line.strip()
- 
-        # Don't send empty lines. But we do have to send something, so send M105 instead.
-        # Don't send the M0 or M1 to the machine, as M0 and M1 are handled as an LCD menu pause.
-        if line == "" or line == "M0" or line == "M1":
-            line = "M105"
-
-        checksum = functools.reduce(lambda x, y: x ^ y, map(ord, "N%d%s" % (self._gcode_position, line)))
+        with self._send_lock:
+            gcode_stream = self._gcode_stream
+            if gcode_stream is None:
+                return
+            while self._commands_in_flight < self._max_commands_in_flight:
+                command = gcode_stream.nextCommand()
+                if command is None:
+                    break
+                commands_in_flight = self._commands_in_flight
+                self._sendCommand(command)
+                if self._commands_in_flight == commands_in_flight:  # Couldn't write to the printer.
+                    break
+
+            if gcode_stream.isFinished():  # End of print.
+                self._printers[0].updateActivePrintJob(None)
+                self._is_printing = False
+                self._gcode_stream = None
+                return
+            self._updatePrintJob(gcode_stream.getProgress())
 
-        self._sendCommand("N%d%s*%d" % (self._gcode_position, line, checksum))
+    def _updatePrintJob(self, progress: float) -> None:
+        """Update the progress and time estimates of the print job. This happens at most once per second, not for
+        every line that is sent.
 
-        print_job = self._printers[0].activePrintJob
-        try:
-            progress = self._gcode_position / len(self._gcode)
-        except ZeroDivisionError:
-            # There is nothing to send!
-            if print_job is not None:
-                print_job.updateState("error")
+        :param progress: How much of the g-code was sent, from 0 to 1.
+        """
+        now = time()
+        if now - self._last_print_job_update < 1:
             return
+        self._last_print_job_update = now
 
-        elapsed_time = int(time() - self._print_start_time)
+        print_job = self._printers[0].activePrintJob
+        elapsed_time = int(now - self._print_start_time)
 
         if print_job is None:
             controller = GenericOutputController(self)
@@ -431,5 +443,3 @@ class USBPrinterOutputDevice(PrinterOutputDevice):
         if progress > .1:
             estimated_time = int(self._print_estimated_time * (1 - progress) + elapsed_time)
         print_job.updateTimeTotal(estimated_time)
-
-        self._gcode_position += 1
@@ -47,6 +47,9 @@ class USBPrinterOutputDeviceManager(QObject, OutputDevicePlugin):
         preferences = self._application.getPreferences()
         preferences.addPreference(USB_PRINT_PREFERENCE_KEY, False)
         self._check_updates = preferences.getValue(USB_PRINT_PREFERENCE_KEY)
+        # How many commands are sent ahead of the acknowledgements of the printer. It should match the size of the
+        # command buffer of the firmware (BUFSIZE in Marlin).
+        preferences.addPreference("usb_printing/commands_in_flight", 4)
 
         self._application.applicationShuttingDown.connect(self.stop)
         # Because the model needs to be created in the same thread as the QMLEngine, we use a signal.
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import functools
+from io import StringIO
+
+import pytest
+
+from ..GCodeStream import GCodeStream, prepareLine
+
+
+def _checksum(command: str) -> int:
+    return functools.reduce(lambda x, y: x ^ y, map(ord, command))
+
+
+@pytest.mark.parametrize("line_number, line, expected", [
+    (0, "M110", "N0M110"),
+    (12, "G1 X10 Y20 ; Move.\n", "N12G1 X10 Y20"),
+    (3, "   \n", "N3M105"),
+    (4, ";LAYER:0\n", "N4M105"),
+    (5, "M0\n", "N5M105"),
+    (6, "M104 S200", "N6M104 S200")
+])
+def test_prepareLine(line_number, line, expected):
+    assert prepareLine(line_number, line) == ("%s*%d\n" % (expected, _checksum(expected))).encode()
+
+
+def _startStream(gcode: str) -> GCodeStream:
+    stream = GCodeStream(StringIO(gcode))
+    stream.start()
+    return stream
+
+
+def test_streamAllLines():
+    stream = _startStream("G28\nG1 X10\nM104 S0\n")
+
+    commands = []
+    command = stream.nextCommand()
+    while command is not None:
+        commands.append(command)
+        command = stream.nextCommand()
+
+    assert commands == [prepareLine(0, "M110"), prepareLine(1, "G28"), prepareLine(2, "G1 X10"), prepareLine(3, "M104 S0")]
+    assert stream.isFinished()
+    assert stream.getProgress() == 1
+
+
+def test_progress():
+    stream = _startStream("G28\nG1 X10\n")
+    stream.nextCommand()  # M110, which is not in the g-code.
+    assert stream.getProgress() == 0
+    stream.nextCommand()
+    assert stream.getProgress() == pytest.approx(4 / 11)
+    assert not stream.isFinished()
+
+
+def test_resend():
+    stream = _startStream("G1 X1\nG1 X2\nG1 X3\nG1 X4\n")
+    for _ in range(4):  # Up to and including line 3.
+        stream.nextCommand()
+
+    stream.resend(2, in_flight = 2)
+    assert stream.nextCommand() == prepareLine(2, "G1 X2")
+    stream.resend(2, in_flight = 2)  # For the other line that was in flight. It's already being resent.
+    assert stream.nextCommand() == prepareLine(3, "G1 X3")
+    assert stream.nextCommand() == prepareLine(4, "G1 X4")
+    assert stream.nextCommand() is None
+
+
+def test_resendUnknownLine():
+    stream = _startStream("G1 X1\nG1 X2\n")
+    stream.nextCommand()
+
+    stream.resend(5, in_flight = 1)  # Never sent, so it can't be resent.
+    assert stream.nextCommand() == prepareLine(1, "G1 X1")
+
+
+def test_cancel():
+    stream = _startStream("G1 X1\n" * (GCodeStream.LookAhead * 2))  # More than fits in the look-ahead, so the producer waits.
+    stream.nextCommand()
+
+    stream.cancel()
+    assert stream.nextCommand() is None
+    stream._producer.join(timeout = 5)
+    assert not stream._producer.is_alive()
@@ -20,6 +20,7 @@ from UM.ConfigurationErrorMessage import ConfigurationErrorMessage
 from cura.CuraApplication import CuraApplication
 from cura.PrinterOutput.FormatMaps import FormatMaps
 from cura.Machines.VariantType import VariantType
+from cura.Settings.MetadataCache import MetadataCache
 
 try:
     from .XmlMaterialValidator import XmlMaterialValidator
@@ -851,94 +852,37 @@ class XmlMaterialProfile(InstanceContainer):
     def deserializeMetadata(cls, serialized: str, container_id: str) -> List[Dict[str, Any]]:
         result_metadata = [] #All the metadata that we found except the base (because the base is returned).
 
-        #Update the serialized data to the latest version.
-        serialized = cls._updateSerialized(serialized)
+        # Parsing the XML is what takes most of the time, so the result of that is kept in the cache between runs.
+        metadata_cache = MetadataCache.getInstance()
+        document = metadata_cache.get("material", container_id, serialized)
+        if document is None:
+            document = cls._parseMetadataDocument(serialized)
+            if document is None:
+                return []
+            metadata_cache.put("material", container_id, serialized, document)
 
         base_metadata = {
             "type": "material",
             "status": "unknown", #TODO: Add material verification.
             "container_type": XmlMaterialProfile,
             "id": container_id,
-            "base_file": container_id
+            "base_file": container_id,
+            "setting_version": document["setting_version"]
         }
-
-        try:
-            data = ET.fromstring(serialized)
-        except:
-            Logger.logException("e", "An exception occurred while parsing the material profile")
-            return []
-
-        #TODO: Implement the <inherits> tag. It's unused at the moment though.
-
-        if "version" in data.attrib:
-            base_metadata["setting_version"] = cls.xmlVersionToSettingVersion(data.attrib["version"])
-        else:
-            base_metadata["setting_version"] = cls.xmlVersionToSettingVersion("1.2") #1.2 and lower didn't have that version number there yet.
-
-        for entry in data.iterfind("./um:metadata/*", cls.__namespaces):
-            tag_name = _tag_without_namespace(entry)
-
-            if tag_name == "name":
-                brand = entry.find("./um:brand", cls.__namespaces)
-                material = entry.find("./um:material", cls.__namespaces)
-                color = entry.find("./um:color", cls.__namespaces)
-                label = entry.find("./um:label", cls.__namespaces)
-
-                if label is not None and label.text is not None:
-                    base_metadata["name"] = label.text
-                else:
-                    if material is not None and color is not None:
-                        base_metadata["name"] = cls._profile_name(material.text, color.text)
-                    else:
-                        base_metadata["name"] = "Unknown Material"
-
-                base_metadata["brand"] = brand.text if brand is not None and brand.text is not None else "Unknown Brand"
-                base_metadata["material"] = material.text if material is not None and material.text is not None else "Unknown Type"
-                base_metadata["color_name"] = color.text if color is not None and color.text is not None else "Unknown Color"
-                continue
-
-            #Setting_version is derived from the "version" tag in the schema earlier, so don't set it here.
-            if tag_name == "setting_version":
-                continue
-
-            base_metadata[tag_name] = entry.text
-
-        if "description" not in base_metadata:
-            base_metadata["description"] = ""
-        if "adhesion_info" not in base_metadata:
-            base_metadata["adhesion_info"] = ""
-
-        property_values = {}
-        properties = data.iterfind("./um:properties/*", cls.__namespaces)
-        for entry in properties:
-            tag_name = _tag_without_namespace(entry)
-            property_values[tag_name] = entry.text
-
-        base_metadata["approximate_diameter"] = str(round(float(cast(float, property_values.get("diameter", 2.85))))) # In mm
-        base_metadata["properties"] = property_values
+        base_metadata.update(document["metadata"])
         base_metadata["definition"] = "fdmprinter"
-
-        compatible_entries = data.iterfind("./um:settings/um:setting[@key='hardware compatible']", cls.__namespaces)
-        try:
-            common_compatibility = cls._parseCompatibleValue(next(compatible_entries).text) # type: ignore
-        except StopIteration: #No 'hardware compatible' setting.
-            common_compatibility = True
-        base_metadata["compatible"] = common_compatibility
         result_metadata.append(base_metadata)
 
         # Map machine human-readable names to IDs
         product_id_map = FormatMaps.getProductIdMap()
 
-        for machine in data.iterfind("./um:settings/um:machine", cls.__namespaces):
-            machine_compatibility = common_compatibility
-            for entry in machine.iterfind("./um:setting[@key='hardware compatible']", cls.__namespaces):
-                if entry.text is not None:
-                    machine_compatibility = cls._parseCompatibleValue(entry.text)
+        for machine in document["machines"]:
+            machine_compatibility = machine["compatible"]
 
-            for identifier in machine.iterfind("./um:machine_identifier", cls.__namespaces):
-                machine_id_list = product_id_map.get(identifier.get("product", ""), [])
+            for product, manufacturer in machine["identifiers"]:
+                machine_id_list = product_id_map.get(product if product is not None else "", [])
                 if not machine_id_list:
-                    machine_id_list = cls.getPossibleDefinitionIDsFromName(identifier.get("product"))
+                    machine_id_list = cls.getPossibleDefinitionIDsFromName(product)
 
                 for machine_id in machine_id_list:
                     definition_metadatas = ContainerRegistry.getInstance().findDefinitionContainersMetadata(id = machine_id)
@@ -947,7 +891,7 @@ class XmlMaterialProfile(InstanceContainer):
 
                     definition_metadata = definition_metadatas[0]
 
-                    machine_manufacturer = identifier.get("manufacturer", definition_metadata.get("manufacturer", "Unknown")) #If the XML material doesn't specify a manufacturer, use the one in the actual printer definition.
+                    machine_manufacturer = manufacturer if manufacturer is not None else definition_metadata.get("manufacturer", "Unknown") #If the XML material doesn't specify a manufacturer, use the one in the actual printer definition.
 
                     # Always create the instance of the material even if it is not compatible, otherwise it will never
                     # show as incompatible if the material profile doesn't define hotends in the machine - CURA-5444
@@ -967,15 +911,10 @@ class XmlMaterialProfile(InstanceContainer):
 
                     result_metadata.append(new_material_metadata)
 
-                    buildplates = machine.iterfind("./um:buildplate", cls.__namespaces)
                     buildplate_map = {}  # type: Dict[str, Dict[str, bool]]
                     buildplate_map["buildplate_compatible"] = {}
                     buildplate_map["buildplate_recommended"] = {}
-                    for buildplate in buildplates:
-                        buildplate_id = buildplate.get("id")
-                        if buildplate_id is None:
-                            continue
-
+                    for buildplate_id, buildplate_compatibility, buildplate_recommended in machine["buildplates"]:
                         variant_metadata = ContainerRegistry.getInstance().findInstanceContainersMetadata(id = buildplate_id)
                         if not variant_metadata:
                             # It is not really properly defined what "ID" is so also search for variants by name.
@@ -984,29 +923,12 @@ class XmlMaterialProfile(InstanceContainer):
                         if not variant_metadata:
                             continue
 
-                        settings = buildplate.iterfind("./um:setting", cls.__namespaces)
-                        buildplate_compatibility = True
-                        buildplate_recommended = True
-                        for entry in settings:
-                            key = entry.get("key")
-                            if entry.text is not None:
-                                if key == "hardware compatible":
-                                    buildplate_compatibility = cls._parseCompatibleValue(entry.text)
-                                elif key == "hardware recommended":
-                                    buildplate_recommended = cls._parseCompatibleValue(entry.text)
-
                         buildplate_map["buildplate_compatible"][buildplate_id] = buildplate_compatibility
                         buildplate_map["buildplate_recommended"][buildplate_id] = buildplate_recommended
 
-                    for hotend in machine.iterfind("./um:hotend", cls.__namespaces):
-                        hotend_name = hotend.get("id")
-                        if hotend_name is None:
-                            continue
-
-                        hotend_compatibility = machine_compatibility
-                        for entry in hotend.iterfind("./um:setting[@key='hardware compatible']", cls.__namespaces):
-                            if entry.text is not None:
-                                hotend_compatibility = cls._parseCompatibleValue(entry.text)
+                    for hotend in machine["hotends"]:
+                        hotend_name = hotend["id"]
+                        hotend_compatibility = hotend["compatible"]
 
                         new_hotend_specific_material_id = container_id + "_" + machine_id + "_" + hotend_name.replace(" ", "_")
 
@@ -1028,14 +950,11 @@ class XmlMaterialProfile(InstanceContainer):
                         #
                         # Buildplates in Hotends
                         #
-                        buildplates = hotend.iterfind("./um:buildplate", cls.__namespaces)
-                        for buildplate in buildplates:
+                        for buildplate in hotend["buildplates"]:
                             # The "id" field for buildplate in material profiles is actually name
-                            buildplate_name = buildplate.get("id")
-                            if buildplate_name is None:
-                                continue
+                            buildplate_name = buildplate["name"]
 
-                            buildplate_mapped_settings, buildplate_unmapped_settings, buildplate_reserialize_settings = cls._getSettingsDictForNode(buildplate)
+                            buildplate_unmapped_settings = buildplate["unmapped_settings"]
                             buildplate_compatibility = buildplate_unmapped_settings.get("hardware compatible",
                                                                                         buildplate_map["buildplate_compatible"])
                             buildplate_recommended = buildplate_unmapped_settings.get("hardware recommended",
@@ -1052,7 +971,7 @@ class XmlMaterialProfile(InstanceContainer):
                             new_hotend_and_buildplate_material_metadata["compatible"] = buildplate_compatibility
                             new_hotend_and_buildplate_material_metadata["buildplate_compatible"] = buildplate_compatibility
                             new_hotend_and_buildplate_material_metadata["buildplate_recommended"] = buildplate_recommended
-                            new_hotend_and_buildplate_material_metadata["reserialize_settings"] = buildplate_reserialize_settings
+                            new_hotend_and_buildplate_material_metadata["reserialize_settings"] = buildplate["reserialize_settings"]
 
                             result_metadata.append(new_hotend_and_buildplate_material_metadata)
 
@@ -1062,6 +981,153 @@ class XmlMaterialProfile(InstanceContainer):
 
         return result_metadata
 
+    @classmethod
+    def _parseMetadataDocument(cls, serialized: str) -> Optional[Dict[str, Any]]:
+        """Get everything from a material profile that the metadata is made from.
+
+        This only depends on the contents of the profile, not on which printers and variants are installed, so the
+        result can be cached as long as the profile doesn't change. It only contains data that can be stored as JSON.
+
+        :param serialized: The contents of the material profile.
+        :return: The setting version, the metadata of the base material, and the machines, build plates and hotends
+            that the profile has settings for. None if the profile could not be parsed.
+        """
+
+        #Update the serialized data to the latest version.
+        serialized = cls._updateSerialized(serialized)
+
+        try:
+            data = ET.fromstring(serialized)
+        except:
+            Logger.logException("e", "An exception occurred while parsing the material profile")
+            return None
+
+        #TODO: Implement the <inherits> tag. It's unused at the moment though.
+
+        if "version" in data.attrib:
+            setting_version = cls.xmlVersionToSettingVersion(data.attrib["version"])
+        else:
+            setting_version = cls.xmlVersionToSettingVersion("1.2") #1.2 and lower didn't have that version number there yet.
+
+        base_metadata = {}  # type: Dict[str, Any]
+        for entry in data.iterfind("./um:metadata/*", cls.__namespaces):
+            tag_name = _tag_without_namespace(entry)
+
+            if tag_name == "name":
+                brand = entry.find("./um:brand", cls.__namespaces)
+                material = entry.find("./um:material", cls.__namespaces)
+                color = entry.find("./um:color", cls.__namespaces)
+                label = entry.find("./um:label", cls.__namespaces)
+
+                if label is not None and label.text is not None:
+                    base_metadata["name"] = label.text
+                else:
+                    if material is not None and color is not None:
+                        base_metadata["name"] = cls._profile_name(material.text, color.text)
+                    else:
+                        base_metadata["name"] = "Unknown Material"
+
+                base_metadata["brand"] = brand.text if brand is not None and brand.text is not None else "Unknown Brand"
+                base_metadata["material"] = material.text if material is not None and material.text is not None else "Unknown Type"
+                base_metadata["color_name"] = color.text if color is not None and color.text is not None else "Unknown Color"
+                continue
+
+            #Setting_version is derived from the "version" tag in the schema earlier, so don't set it here.
+            if tag_name == "setting_version":
+                continue
+
+            base_metadata[tag_name] = entry.text
+
+        if "description" not in base_metadata:
+            base_metadata["description"] = ""
+        if "adhesion_info" not in base_metadata:
+            base_metadata["adhesion_info"] = ""
+
+        property_values = {}
+        properties = data.iterfind("./um:properties/*", cls.__namespaces)
+        for entry in properties:
+            tag_name = _tag_without_namespace(entry)
+            property_values[tag_name] = entry.text
+
+        base_metadata["approximate_diameter"] = str(round(float(cast(float, property_values.get("diameter", 2.85))))) # In mm
+        base_metadata["properties"] = property_values
+
+        compatible_entries = data.iterfind("./um:settings/um:setting[@key='hardware compatible']", cls.__namespaces)
+        try:
+            common_compatibility = cls._parseCompatibleValue(next(compatible_entries).text) # type: ignore
+        except StopIteration: #No 'hardware compatible' setting.
+            common_compatibility = True
+        base_metadata["compatible"] = common_compatibility
+
+        machines = []
+        for machine in data.iterfind("./um:settings/um:machine", cls.__namespaces):
+            machine_compatibility = common_compatibility
+            for entry in machine.iterfind("./um:setting[@key='hardware compatible']", cls.__namespaces):
+                if entry.text is not None:
+                    machine_compatibility = cls._parseCompatibleValue(entry.text)
+
+            identifiers = [(identifier.get("product"), identifier.get("manufacturer")) for identifier in machine.iterfind("./um:machine_identifier", cls.__namespaces)]
+
+            buildplates = []
+            for buildplate in machine.iterfind("./um:buildplate", cls.__namespaces):
+                buildplate_id = buildplate.get("id")
+                if buildplate_id is None:
+                    continue
+
+                buildplate_compatibility = True
+                buildplate_recommended = True
+                for entry in buildplate.iterfind("./um:setting", cls.__namespaces):
+                    key = entry.get("key")
+                    if entry.text is not None:
+                        if key == "hardware compatible":
+                            buildplate_compatibility = cls._parseCompatibleValue(entry.text)
+                        elif key == "hardware recommended":
+                            buildplate_recommended = cls._parseCompatibleValue(entry.text)
+                buildplates.append((buildplate_id, buildplate_compatibility, buildplate_recommended))
+
+            hotends = []
+            for hotend in machine.iterfind("./um:hotend", cls.__namespaces):
+                hotend_name = hotend.get("id")
+                if hotend_name is None:
+                    continue
+
+                hotend_compatibility = machine_compatibility
+                for entry in hotend.iterfind("./um:setting[@key='hardware compatible']", cls.__namespaces):
+                    if entry.text is not None:
+                        hotend_compatibility = cls._parseCompatibleValue(entry.text)
+
+                hotend_buildplates = []
+                for buildplate in hotend.iterfind("./um:buildplate", cls.__namespaces):
+                    buildplate_name = buildplate.get("id")
+                    if buildplate_name is None:
+                        continue
+
+                    _, buildplate_unmapped_settings, buildplate_reserialize_settings = cls._getSettingsDictForNode(buildplate)
+                    hotend_buildplates.append({
+                        "name": buildplate_name,
+                        "unmapped_settings": buildplate_unmapped_settings,
+                        "reserialize_settings": buildplate_reserialize_settings
+                    })
+
+                hotends.append({
+                    "id": hotend_name,
+                    "compatible": hotend_compatibility,
+                    "buildplates": hotend_buildplates
+                })
+
+            machines.append({
+                "compatible": machine_compatibility,
+                "identifiers": identifiers,
+                "buildplates": buildplates,
+                "hotends": hotends
+            })
+
+        return {
+            "setting_version": setting_version,
+            "metadata": base_metadata,
+            "machines": machines
+        }
+
     def _addSettingElement(self, builder, instance):
         key = instance.definition.key
         if key in self.__material_settings_setting_map.values():
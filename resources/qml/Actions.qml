@@ -45,6 +45,7 @@ Item
     property alias reloadAll: reloadAllAction
     property alias arrangeAll: arrangeAllAction
     property alias arrangeAllGrid: arrangeAllGridAction
+    property alias arrangeAllBuildPlates: arrangeAllBuildPlatesAction
     property alias resetAllTranslation: resetAllTranslationAction
     property alias resetAll: resetAllAction
 
@@ -482,6 +483,13 @@ Item
         shortcut: "Shift+Ctrl+R"
     }
 
+    Action
+    {
+        id: arrangeAllBuildPlatesAction
+        text: catalog.i18nc("@action:inmenu menubar:edit","Distribute All Models over Build Plates")
+        onTriggered: Printer.arrangeAllOnBuildPlates()
+    }
+
     Action
     {
         id: dropAllAction
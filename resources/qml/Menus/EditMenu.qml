@@ -16,6 +16,26 @@ Cura.Menu
     Cura.MenuSeparator { }
     Cura.MenuItem { action: Cura.Actions.selectAll }
     Cura.MenuItem { action: Cura.Actions.arrangeAll }
+    Cura.MenuItem
+    {
+        id: arrangeAllBuildPlatesItem
+        action: Cura.Actions.arrangeAllBuildPlates
+        visible: UM.Preferences.getValue("cura/use_multi_build_plate")
+
+        //Because there is no signal for individual preferences, we need to manually link to the onPreferenceChanged signal.
+        Connections
+        {
+            target: UM.Preferences
+            function onPreferenceChanged(preference)
+            {
+                if (preference !== "cura/use_multi_build_plate")
+                {
+                    return;
+                }
+                arrangeAllBuildPlatesItem.visible = UM.Preferences.getValue("cura/use_multi_build_plate");
+            }
+        }
+    }
     Cura.MenuItem { action: Cura.Actions.multiplySelection }
     Cura.MenuItem { action: Cura.Actions.deleteSelection }
     Cura.MenuItem { action: Cura.Actions.deleteAll }
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+# Measures how long it takes to slice the same model over and over, with and without keeping the engine processes
+# running between slices. Cura is run as a batch slicer (--slice-batch) with a manifest that has the model a number of
+# times. Engine processes are only kept running when multiple build plates are sliced in parallel, so the jobs are
+# sliced a few build plates at a time, and every batch of build plates is a separate reslice.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+CURA_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cura_app.py")
+
+
+def write_manifest(directory: str, model: str, machine: str, quality: Optional[str], jobs: int) -> str:
+    defaults = {"machine": machine, "files": [os.path.abspath(model)]}  # type: Dict[str, Any]
+    if quality is not None:
+        defaults["quality"] = quality
+    manifest = {
+        "output_directory": "gcode",
+        "defaults": defaults,
+        "jobs": [{"id": "job_{index}".format(index = index)} for index in range(jobs)]
+    }
+    manifest_path = os.path.join(directory, "manifest.json")
+    with open(manifest_path, "w", encoding = "utf-8") as f:
+        json.dump(manifest, f, indent = 4)
+    return manifest_path
+
+
+def run_batch(manifest_path: str, summary_path: str, build_plates: int, persistent: bool) -> Dict[str, Any]:
+    command = [sys.executable, CURA_APP, "--slice-batch", manifest_path, "--slice-batch-summary", summary_path, "--slice-processes", str(build_plates)]
+    if not persistent:
+        command.append("--no-persistent-engine")
+    if os.path.exists(summary_path):
+        os.remove(summary_path)  # Of the previous run.
+    subprocess.run(command, check = False)  # Exits with 1 if a job failed, but the other jobs still count.
+    if not os.path.exists(summary_path):
+        print("Cura didn't write a summary. Check its log.")
+        sys.exit(1)
+    with open(summary_path, "r", encoding = "utf-8") as f:
+        return json.load(f)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def report(name: str, summary: Dict[str, Any], build_plates: int, warmup: int) -> None:
+    # The jobs that are sliced together all have the slice time of their batch, so count every batch once.
+    slice_times = [result["slice_time"] for result in summary["results"] if result["status"] == "done"][::build_plates][warmup:]
+    if not slice_times:
+        print("{name}: nothing was sliced, {failed} jobs failed.".format(name = name, failed = summary["failed"]))
+        return
+    print("{name}: {count} slices, median {median}s, p90 {p90}s, min {minimum}s, max {maximum}s, {failed} failed".format(
+        name = name,
+        count = len(slice_times),
+        median = round(statistics.median(slice_times), 3),
+        p90 = round(percentile(slice_times, 0.9), 3),
+        minimum = round(min(slice_times), 3),
+        maximum = round(max(slice_times), 3),
+        failed = summary["failed"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Compare the reslice latency with and without persistent engine processes.")
+    parser.add_argument("model", help = "The model to slice.")
+    parser.add_argument("--machine", required = True, help = "The name or ID of the printer to slice for. It has to be added in Cura already.")
+    parser.add_argument("--quality", default = None, help = "The quality type to slice with.")
+    parser.add_argument("--runs", type = int, default = 10, help = "How many times to slice the build plates.")
+    parser.add_argument("--build-plates", type = int, default = 2, help = "How many build plates to slice in parallel, with the model on each. At least 2.")
+    parser.add_argument("--warmup", type = int, default = 1, help = "How many of the first slices to leave out of the results.")
+    args = parser.parse_args()
+    if args.build_plates < 2:
+        parser.error("Engine processes are only kept running when slicing at least 2 build plates in parallel.")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = write_manifest(directory, args.model, args.machine, args.quality, args.runs * args.build_plates)
+        for name, persistent in (("persistent engine", True), ("new engine per slice", False)):
+            summary = run_batch(manifest_path, os.path.join(directory, "summary.json"), args.build_plates, persistent)
+            report(name, summary, args.build_plates, args.warmup)
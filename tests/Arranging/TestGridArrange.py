@@ -0,0 +1,107 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import math
+from unittest.mock import MagicMock, patch
+
+import numpy
+import pytest
+
+from UM.Math.AxisAlignedBox import AxisAlignedBox
+from UM.Math.Polygon import Polygon
+from UM.Math.Vector import Vector
+from cura.Arranging.GridArrange import GridArrange
+
+
+def createBox(rng: numpy.random.Generator, max_size: float) -> AxisAlignedBox:
+    left, back = rng.uniform(-130, 110, size = 2)
+    width, depth = rng.uniform(1, max_size, size = 2)
+    return AxisAlignedBox(minimum = Vector(left, 0, back), maximum = Vector(left + width, 20, back + depth))
+
+
+def createNode(bounding_box: AxisAlignedBox) -> MagicMock:
+    node = MagicMock()
+    node.getBoundingBox.return_value = bounding_box
+    node.getWorldPosition.return_value = Vector(0, 0, 0)
+    return node
+
+
+def createHull(rng: numpy.random.Generator) -> Polygon:
+    center = rng.uniform(-110, 110, size = 2)
+    angles = numpy.sort(rng.uniform(0, 2 * math.pi, size = rng.integers(3, 8)))
+    radii = rng.uniform(2, 25, size = len(angles))
+    return Polygon(numpy.column_stack((numpy.cos(angles) * radii, numpy.sin(angles) * radii)) + center)
+
+
+def createArranger(seed: int) -> GridArrange:
+    rng = numpy.random.default_rng(seed)
+    build_volume = MagicMock()
+    build_volume.getBoundingBox.return_value = AxisAlignedBox(minimum = Vector(-110, 0, -110), maximum = Vector(110, 200, 110))
+    build_volume.getShape.return_value = "elliptic" if seed % 3 == 0 else "rectangular"
+    build_volume.getEdgeDisallowedSize.return_value = float(rng.uniform(0, 3))
+    build_volume.getDisallowedAreas.return_value = [createHull(rng) for _ in range(rng.integers(0, 6))]
+
+    nodes = [createNode(createBox(rng, 40)) for _ in range(rng.integers(1, 40))]
+    fixed_nodes = [createNode(createBox(rng, 60)) for _ in range(rng.integers(0, 6))]
+    return GridArrange(nodes, build_volume, fixed_nodes)
+
+
+def referenceGrids(arranger: GridArrange):
+    """Find the occupied and allowed grid cells one cell at a time."""
+
+    def cellsInclusive(bounds):
+        x1, y1, x2, y2 = arranger._getGridCornerPoints(bounds, **arranger._inclusiveMargins())
+        return {(x, y) for x in range(math.floor(x1), math.ceil(x2)) for y in range(math.floor(y1), math.ceil(y2))}
+
+    def isUnderDisc(x, y):
+        left, back = arranger._gridSpaceToCoordSpace(x, y)
+        right, front = arranger._gridSpaceToCoordSpace(x + 1, y + 1)
+        return all(arranger._checkPointUnderDiscSpace(corner_x, corner_y) for corner_x, corner_y in ((left, back), (right, back), (right, front), (left, front)))
+
+    fixed = set()
+    for node in arranger._fixed_nodes:
+        fixed |= cellsInclusive(node.getBoundingBox())
+    for polygon in arranger._build_volume.getDisallowedAreas():
+        fixed |= cellsInclusive(polygon)
+
+    x1, y1, x2, y2 = arranger._getGridCornerPoints(arranger._build_volume_bounding_box, **arranger._exclusiveMargins())
+    build_plate = {(x, y) for x in range(math.ceil(x1), math.floor(x2)) for y in range(math.ceil(y1), math.floor(y2))}
+    if arranger._build_volume.getShape() == "elliptic":
+        build_plate = {(x, y) for x, y in build_plate if isUnderDisc(x, y)}
+    return fixed, build_plate - fixed
+
+
+def referencePlacements(arranger: GridArrange, fixed, allowed):
+    """Find the grid cell of each node, in the order of the allowed cells closest to the centre of the build plate."""
+
+    bounding_box = arranger._build_volume_bounding_box
+    center_x, center_y = arranger._coordSpaceToGridSpace(bounding_box.width * 0.5 + bounding_box.left, bounding_box.depth * 0.5 + bounding_box.back)
+    sequence = sorted(sorted(allowed), key = lambda cell: (center_x - cell[0]) ** 2 + (center_y - cell[1]) ** 2)
+
+    placements = sequence[:len(arranger._nodes_to_arrange)]
+    leftover_y = arranger._initial_leftover_grid_y
+    for _ in arranger._nodes_to_arrange[len(sequence):]:
+        while (arranger._initial_leftover_grid_x, leftover_y) in fixed:
+            leftover_y -= 1
+        placements.append((arranger._initial_leftover_grid_x, leftover_y))
+        leftover_y -= 1
+    return placements
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_gridMatchesReference(seed):
+    arranger = createArranger(seed)
+    fixed, allowed = referenceGrids(arranger)
+
+    allowed_x, allowed_y = numpy.nonzero(arranger._allowed_grid)
+    assert set(zip((allowed_x + arranger._raster_origin[0]).tolist(), (allowed_y + arranger._raster_origin[1]).tolist())) == allowed
+
+    # Also outside of the raster, e.g. where left-over nodes are placed.
+    cells = [cell for cell in fixed] + [(x, y) for x in range(-20, 30) for y in range(-20, 30)]
+    assert {cell for cell in cells if arranger._isFixedGridIdx(*cell)} == fixed
+
+    placements = []
+    with patch("cura.Arranging.GridArrange.Application"), patch.object(arranger, "_moveNodeOnGrid", side_effect = lambda node, x, y: placements.append((x, y))):
+        _, not_fit_count = arranger.createGroupOperationForArrange()
+    assert placements == referencePlacements(arranger, fixed, allowed)
+    assert not_fit_count == max(0, len(arranger._nodes_to_arrange) - len(allowed))
@@ -0,0 +1,86 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from UM.Settings.SettingRelation import RelationType
+from UM.Settings.Validator import ValidatorState
+
+from cura.Machines.MachineErrorChecker import MachineErrorChecker, _SettingSnapshot
+
+
+def createRelation(relation_type, target_key: str, target_relations = None):
+    target = MagicMock()
+    target.key = target_key
+    target.relations = target_relations if target_relations is not None else []
+    return MagicMock(type = relation_type, target = target)
+
+
+@pytest.fixture
+def error_checker():
+    with patch("cura.CuraApplication.CuraApplication.getInstance", MagicMock()):
+        with patch("cura.Machines.MachineErrorChecker.QTimer", MagicMock()):
+            return MachineErrorChecker()
+
+
+def test_addDependentKeys(error_checker):
+    grandchild = createRelation(RelationType.RequiredByTarget, "infill_line_distance")
+    child = createRelation(RelationType.RequiredByTarget, "infill_line_width", [grandchild])
+    requirement = createRelation(RelationType.RequiresTarget, "machine_nozzle_size")
+
+    keys = {"line_width"}
+    error_checker._addDependentKeys(keys, [child, requirement])
+
+    assert keys == {"line_width", "infill_line_width", "infill_line_distance"}
+
+
+def test_propertyChangedOnlyChecksChangedKeys(error_checker):
+    definition = MagicMock(relations = [createRelation(RelationType.RequiredByTarget, "infill_line_width")])
+    error_checker._global_stack = MagicMock(getSettingDefinition = MagicMock(return_value = definition))
+    error_checker._check_all_keys = False
+
+    error_checker.startErrorCheckPropertyChanged("line_width", "value")
+    error_checker.startErrorCheckPropertyChanged("line_width", "enabled")  # Not a value change, so ignored.
+
+    assert error_checker._keys_to_check == {"line_width", "infill_line_width"}
+    assert not error_checker._check_all_keys
+    assert error_checker.needToWaitForResult
+    assert not error_checker.waitForResult(timeout = 0)
+
+
+def test_setResultFromCache(error_checker):
+    error_checker._has_errors = False
+    error_checker._validation_cache = {("extruder_0", "line_width"): False, ("extruder_1", "infill_sparse_density"): True}
+    error_checker._check_in_progress = True
+
+    error_checker._setResult()
+
+    assert error_checker.hasError
+    assert error_checker._error_keys == {"infill_sparse_density"}
+    assert not error_checker.needToWaitForResult
+    assert error_checker.waitForResult(timeout = 0)
+
+
+def test_settingSnapshot():
+    properties = {
+        ("line_width", "enabled"): True,
+        ("line_width", "validationState"): ValidatorState.MaximumError,
+        ("support_angle", "enabled"): False,
+        ("infill_sparse_density", "enabled"): True,
+        ("infill_sparse_density", "validationState"): None,
+        ("infill_sparse_density", "value"): 20,
+    }
+    stack = MagicMock(getProperty = lambda key, property_name: properties.get((key, property_name)))
+    snapshot = _SettingSnapshot("extruder_0")
+    for key in ("line_width", "support_angle", "infill_sparse_density"):
+        snapshot.addSetting(stack, key)
+    properties[("line_width", "validationState")] = ValidatorState.Valid  # Changes after the snapshot don't matter.
+
+    assert snapshot.getId() == "extruder_0"
+    assert MachineErrorChecker._hasValidationError(snapshot, "line_width")
+    assert not MachineErrorChecker._hasValidationError(snapshot, "support_angle")
+    assert snapshot.getProperty("support_angle", "validationState") is None  # Disabled, so not read at all.
+    assert snapshot.getProperty("infill_sparse_density", "value") == 20
+    assert snapshot.getSettingDefinition("infill_sparse_density") is stack.getSettingDefinition("infill_sparse_density")
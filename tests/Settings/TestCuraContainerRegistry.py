@@ -6,9 +6,11 @@ import pytest #To parameterize tests.
 import unittest.mock #To mock and monkeypatch stuff.
 
 from cura.ReaderWriters.ProfileReader import NoProfileException
+from cura.Settings.MetadataCache import MetadataCache
 from cura.Settings.ExtruderStack import ExtruderStack #Testing for returning the correct types of stacks.
 from cura.Settings.GlobalStack import GlobalStack #Testing for returning the correct types of stacks.
 import UM.Settings.InstanceContainer #Creating instance containers to register.
+from UM.Settings.DefinitionContainer import DefinitionContainer #Reading the metadata of definitions.
 import UM.Settings.ContainerRegistry #Making empty container stacks.
 import UM.Settings.ContainerStack #Setting the container registry here properly.
 import cura.CuraApplication
@@ -325,4 +327,21 @@ def test_getIOPlugins(container_registry):
     plugin_registry.getActivePlugins = unittest.mock.MagicMock(return_value = ["lizard"])
     plugin_registry.getMetaData = unittest.mock.MagicMock(return_value = {"zomg": {"test": "test"}})
     with unittest.mock.patch("UM.PluginRegistry.PluginRegistry.getInstance", unittest.mock.MagicMock(return_value = plugin_registry)):
-        assert container_registry._getIOPlugins("zomg") == [("lizard", {"zomg": {"test": "test"}})]
\ No newline at end of file
+        assert container_registry._getIOPlugins("zomg") == [("lizard", {"zomg": {"test": "test"}})]
+
+def test_definitionMetadataIsCached(container_registry, tmp_path):
+    metadata_cache = MetadataCache(os.path.join(str(tmp_path), "metadata_cache.db"), setting_version = 1)
+    serialized = "{\"version\": 2, \"name\": \"Test Printer\", \"inherits\": \"fdmprinter\", \"metadata\": {\"manufacturer\": \"Test\"}}"
+    container_registry.findDefinitionContainersMetadata = unittest.mock.MagicMock(return_value = [{"id": "fdmprinter", "container_type": DefinitionContainer, "setting_version": 1}])
+    uranium_deserialize = unittest.mock.MagicMock(return_value = [{"id": "test_printer", "container_type": DefinitionContainer, "name": "Test Printer", "manufacturer": "Test"}])
+    with unittest.mock.patch.object(MetadataCache, "getInstance", unittest.mock.MagicMock(return_value = metadata_cache)):
+        with unittest.mock.patch("cura.Settings.CuraContainerRegistry.ContainerRegistry.getInstance", unittest.mock.MagicMock(return_value = container_registry)):
+            with unittest.mock.patch("cura.Settings.CuraContainerRegistry._uraniumDeserializeDefinitionMetadata", uranium_deserialize):
+                parsed = DefinitionContainer.deserializeMetadata(serialized, "test_printer")
+                assert DefinitionContainer.deserializeMetadata(serialized, "test_printer") == parsed
+                assert uranium_deserialize.call_count == 1
+
+                # The metadata of the parent is part of the metadata of the definition.
+                container_registry.findDefinitionContainersMetadata.return_value = [{"id": "fdmprinter", "container_type": DefinitionContainer, "setting_version": 2}]
+                DefinitionContainer.deserializeMetadata(serialized, "test_printer")
+                assert uranium_deserialize.call_count == 2
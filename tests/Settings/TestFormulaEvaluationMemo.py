@@ -0,0 +1,93 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from UM.Settings.SettingFunction import SettingFunction
+
+from cura.Settings.CuraFormulaFunctions import CuraFormulaFunctions
+from cura.Settings.FormulaEvaluationMemo import FormulaEvaluationMemo
+
+
+def test_lookupCachesValues():
+    memo = FormulaEvaluationMemo()
+    compute = MagicMock(return_value = 0.4)
+
+    assert memo.lookup(("extruder_value", "extruder_0", "line_width"), compute) == 0.4
+    assert memo.lookup(("extruder_value", "extruder_0", "line_width"), compute) == 0.4
+
+    compute.assert_called_once_with()
+    assert memo.hits == 1
+    assert memo.misses == 1
+    assert len(memo) == 1
+
+
+def test_lookupSharedStatistics():
+    statistics = {"hits": 0, "misses": 0}
+    first = FormulaEvaluationMemo(statistics)
+    second = FormulaEvaluationMemo(statistics)
+
+    first.lookup("a", lambda: 1)
+    first.lookup("a", lambda: 1)
+    second.lookup("a", lambda: 2)
+
+    assert statistics == {"hits": 1, "misses": 2}
+    assert second.lookup("a", lambda: 3) == 2  # Memos of different passes don't share their values.
+
+
+def test_fromContext():
+    assert FormulaEvaluationMemo.fromContext(None) is None
+
+    context = MagicMock(context = {})
+    memo = FormulaEvaluationMemo.fromContext(context)
+
+    assert memo is not None
+    assert context.context[FormulaEvaluationMemo.CONTEXT_KEY] is memo
+    assert FormulaEvaluationMemo.fromContext(context) is memo
+
+
+def test_currentPass():
+    assert FormulaEvaluationMemo.fromCurrentPass() is None  # No property is being evaluated.
+
+    FormulaEvaluationMemo.beginPass()
+    memo = FormulaEvaluationMemo.fromCurrentPass()
+    FormulaEvaluationMemo.beginPass()  # Nested in the same evaluation.
+    assert FormulaEvaluationMemo.fromCurrentPass() is memo
+    FormulaEvaluationMemo.endPass()
+    assert FormulaEvaluationMemo.fromCurrentPass() is memo
+    FormulaEvaluationMemo.endPass()
+
+    assert FormulaEvaluationMemo.fromCurrentPass() is None
+
+
+def test_formulaLookupsDuringStackEvaluation(global_stack):
+    """The extruder values that a formula asks for many times are only looked up once while evaluating a setting."""
+
+    extruders = []
+    for position in range(2):
+        extruder = MagicMock(isEnabled = True)
+        extruder.getId.return_value = "extruder_{}".format(position)
+        extruder.getMetaDataEntry.return_value = str(position)
+        extruder.getRawProperty.return_value = 0.4
+        extruders.append(extruder)
+    application = MagicMock()
+    application.getMachineManager.return_value.activeMachine = global_stack
+    application.getExtruderManager.return_value.getActiveExtruderStacks.return_value = extruders
+    functions = CuraFormulaFunctions(application)
+
+    formula = SettingFunction("extruderValues('line_width')[0] + extruderValues('line_width')[1] + max(extruderValues('line_width'))")
+    definition = MagicMock()
+    definition.getProperty = lambda key, property, context = None: {("machine_extruder_count", "value"): 2, ("wall_line_width", "value"): formula}.get((key, property))
+    with patch("cura.Settings.CuraContainerStack.DefinitionContainer", MagicMock):  # To guard against the type checking.
+        global_stack.definition = definition
+
+    with patch.dict(SettingFunction._SettingFunction__operators, {"extruderValues": functions.getValuesInAllExtruders}):
+        assert global_stack.getProperty("wall_line_width", "value") == pytest.approx(1.2)
+        for extruder in extruders:
+            assert extruder.getRawProperty.call_count == 1  # Instead of three times.
+
+        global_stack.getProperty("wall_line_width", "value")  # A new evaluation, which looks the values up again.
+        for extruder in extruders:
+            assert extruder.getRawProperty.call_count == 2
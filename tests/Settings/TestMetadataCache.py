@@ -0,0 +1,87 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+import sqlite3
+import time
+from unittest.mock import patch
+
+from cura.Settings.MetadataCache import MetadataCache
+
+
+def test_getAfterPut(tmp_path):
+    cache = MetadataCache(os.path.join(str(tmp_path), "metadata_cache.db"), setting_version = 1)
+    cache.put("material", "generic_pla", "<fdmmaterial/>", {"name": "PLA"})
+
+    assert cache.get("material", "generic_pla", "<fdmmaterial/>") == {"name": "PLA"}
+    assert cache.get("material", "generic_pla", "<fdmmaterial version=\"1.3\"/>") is None  # The file changed.
+    assert cache.get("definition", "generic_pla", "<fdmmaterial/>") is None  # Different kind of container.
+    assert cache.getStatistics() == (1, 2)
+
+
+def test_persistsBetweenRuns(tmp_path):
+    database_path = os.path.join(str(tmp_path), "metadata_cache.db")
+    cache = MetadataCache(database_path, setting_version = 1)
+    with cache.batch():
+        cache.put("material", "generic_pla", "<fdmmaterial/>", {"name": "PLA"})
+
+    assert MetadataCache(database_path, setting_version = 1).get("material", "generic_pla", "<fdmmaterial/>") == {"name": "PLA"}
+    assert MetadataCache(database_path, setting_version = 2).get("material", "generic_pla", "<fdmmaterial/>") is None  # Parsed by a different Cura.
+
+
+def test_recordLoadTime(tmp_path):
+    database_path = os.path.join(str(tmp_path), "metadata_cache.db")
+    cache = MetadataCache(database_path, setting_version = 1)
+    cache.get("material", "generic_pla", "<fdmmaterial/>")
+    cache.put("material", "generic_pla", "<fdmmaterial/>", {"name": "PLA"})
+    cache.recordLoadTime(2.0)
+
+    cache = MetadataCache(database_path, setting_version = 1)
+    cache.get("material", "generic_pla", "<fdmmaterial/>")
+    report = cache.recordLoadTime(0.5)
+
+    assert "1 files from the cache" in report
+    assert "The last cold start took 2.00s" in report
+
+
+def test_evictsUnusedEntries(tmp_path):
+    database_path = os.path.join(str(tmp_path), "metadata_cache.db")
+    cache = MetadataCache(database_path, setting_version = 1)
+    with cache.batch():
+        cache.put("material", "generic_pla", "<fdmmaterial/>", {"name": "PLA"})
+        cache.put("material", "generic_abs", "<fdmmaterial/>", {"name": "ABS"})
+        cache.put("material", "removed_material", "<fdmmaterial/>", {"name": "Removed"})
+
+    a_month_later = time.time() + MetadataCache.MaxEntryAge
+    with patch("time.time", return_value = a_month_later - 60):
+        cache = MetadataCache(database_path, setting_version = 1)
+        with cache.batch():  # Loading all metadata again, without the removed material.
+            cache.get("material", "generic_pla", "<fdmmaterial/>")
+            cache.get("material", "generic_abs", "<fdmmaterial/>")
+    with patch("time.time", return_value = a_month_later + 60):
+        cache = MetadataCache(database_path, setting_version = 1)
+    assert cache.get("material", "generic_pla", "<fdmmaterial/>") == {"name": "PLA"}
+    assert cache.get("material", "removed_material", "<fdmmaterial/>") is None
+
+    MetadataCache(database_path, setting_version = 2)  # An upgrade.
+    with sqlite3.connect(database_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+
+def test_prunesTimings(tmp_path):
+    database_path = os.path.join(str(tmp_path), "metadata_cache.db")
+    cache = MetadataCache(database_path, setting_version = 1)
+    cache.get("material", "generic_pla", "<fdmmaterial/>")
+    cache.put("material", "generic_pla", "<fdmmaterial/>", {"name": "PLA"})
+    cache.recordLoadTime(2.0)  # Cold.
+    cache.resetStatistics()
+    for _ in range(MetadataCache.MaxTimings * 2):
+        cache.get("material", "generic_pla", "<fdmmaterial/>")
+        cache.get("material", "generic_abs", "<fdmmaterial/>")  # Neither cold nor warm.
+        cache.recordLoadTime(1.0)
+
+    cache = MetadataCache(database_path, setting_version = 1)
+    with sqlite3.connect(database_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM timings").fetchone()[0] == MetadataCache.MaxTimings + 1
+    cache.get("material", "generic_pla", "<fdmmaterial/>")
+    assert "The last cold start took 2.00s" in cache.recordLoadTime(0.5)
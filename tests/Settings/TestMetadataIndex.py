@@ -0,0 +1,66 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from UM.Settings.DefinitionContainer import DefinitionContainer
+from UM.Settings.InstanceContainer import InstanceContainer
+
+from cura.Settings.MetadataIndex import MetadataIndex
+
+
+def createMetadata():
+    return {
+        "fdmprinter": {"id": "fdmprinter", "type": "machine", "container_type": DefinitionContainer},
+        "generic_pla": {"id": "generic_pla", "type": "material", "definition": "fdmprinter", "brand": "Generic", "material": "PLA", "container_type": InstanceContainer},
+        "generic_abs": {"id": "generic_abs", "type": "material", "definition": "fdmprinter", "brand": "Generic", "material": "ABS", "container_type": InstanceContainer},
+        "brand_pla": {"id": "brand_pla", "type": "material", "definition": "fdmprinter", "brand": "Brand", "material": "PLA", "container_type": InstanceContainer},
+        "normal": {"id": "normal", "type": "quality", "definition": "fdmprinter", "global_quality": True, "container_type": InstanceContainer}
+    }
+
+
+def test_find():
+    metadata = createMetadata()
+    index = MetadataIndex()
+
+    assert [m["id"] for m in index.find(metadata, {"type": "material", "material": "PLA"})] == ["generic_pla", "brand_pla"]  # In the order of the registry.
+    assert [m["id"] for m in index.find(metadata, {"type": "material", "brand": "Generic", "material": "ABS"})] == ["generic_abs"]
+    assert [m["id"] for m in index.find(metadata, {"type": "quality", "global_quality": "True"})] == ["normal"]  # Compared as strings.
+    assert index.find(metadata, {"type": "machine"}) == []  # Only instance containers.
+    assert index.find(metadata, {"type": "material", "brand": "Unknown"}) == []
+
+
+def test_findUnsupported():
+    index = MetadataIndex()
+
+    assert index.find(createMetadata(), {"id": "generic_pla"}) is None
+    assert index.find(createMetadata(), {"type": "material", "material": "P*"}) is None
+    assert index.find(createMetadata(), {"global_quality": True}) is None
+    assert index.find(createMetadata(), {"approximate_diameter": "3"}) is None  # Not indexed.
+
+
+def test_updateContainer():
+    metadata = createMetadata()
+    index = MetadataIndex()
+    index.find(metadata, {"type": "material"})  # Build the index.
+
+    metadata["generic_abs"]["brand"] = "Brand"
+    index.updateContainer("generic_abs", metadata)
+    metadata["generic_petg"] = {"id": "generic_petg", "type": "material", "brand": "Brand", "container_type": InstanceContainer}
+    index.updateContainer("generic_petg", metadata)
+    del metadata["brand_pla"]
+    index.removeContainer("brand_pla", metadata)
+
+    assert [m["id"] for m in index.find(metadata, {"type": "material", "brand": "Brand"})] == ["generic_abs", "generic_petg"]
+    assert [m["id"] for m in index.find(metadata, {"type": "material", "brand": "Generic"})] == ["generic_pla"]
+
+
+def test_updateContainerAfterUnsignalledChange():
+    metadata = createMetadata()
+    index = MetadataIndex()
+    index.find(metadata, {"type": "material"})  # Build the index.
+
+    # Added to the registry without updating the index, followed by a change that does update it.
+    metadata["generic_petg"] = {"id": "generic_petg", "type": "material", "brand": "Generic", "container_type": InstanceContainer}
+    metadata["generic_abs"]["brand"] = "Brand"
+    index.updateContainer("generic_abs", metadata)
+
+    assert [m["id"] for m in index.find(metadata, {"type": "material", "brand": "Generic"})] == ["generic_pla", "generic_petg"]
@@ -0,0 +1,59 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock
+
+import numpy
+
+from cura.Arranging.ArrangeState import ArrangeState
+
+
+def createNode(x: float):
+    node = MagicMock()
+    hull = MagicMock()
+    hull.getPoints = MagicMock(return_value = numpy.array([[x, 0], [x + 10, 0], [x + 10, 10]], dtype = numpy.float32))
+    node.callDecoration = MagicMock(return_value = hull)
+    return node
+
+
+def moveNode(node, x: float):
+    node.callDecoration.return_value.getPoints.return_value = numpy.array([[x, 0], [x + 10, 0], [x + 10, 10]], dtype = numpy.float32)
+
+
+def test_splitNodes():
+    state = ArrangeState()
+    placed_node = createNode(0)
+    moved_node = createNode(20)
+    state.recordPlacements([placed_node, moved_node])
+    moveNode(moved_node, 25)
+    new_node = createNode(40)
+
+    changed, placed = state.splitNodes([placed_node, moved_node, new_node])
+
+    assert changed == [moved_node, new_node]
+    assert placed == [placed_node]
+
+
+def test_getConvertedHullReconvertsChangedHulls():
+    state = ArrangeState()
+    node = createNode(0)
+    convert = MagicMock(side_effect = lambda n: n.callDecoration("getConvexHull").getPoints()[0, 0])
+
+    assert state.getConvertedHull(node, (1000, ), convert) == 0
+    assert state.getConvertedHull(node, (1000, ), convert) == 0
+    assert convert.call_count == 1
+
+    moveNode(node, 5)
+    assert state.getConvertedHull(node, (1000, ), convert) == 5
+    state.getConvertedHull(node, (10000, ), convert)  # Different parameters need a different conversion.
+    assert convert.call_count == 3
+
+
+def test_getConvertedDisallowedAreas():
+    state = ArrangeState()
+    convert = MagicMock(return_value = ["area"])
+
+    assert state.getConvertedDisallowedAreas((1, b"areas"), convert) == ["area"]
+    assert state.getConvertedDisallowedAreas((1, b"areas"), convert) == ["area"]
+    state.getConvertedDisallowedAreas((2, b"areas"), convert)
+    assert convert.call_count == 2
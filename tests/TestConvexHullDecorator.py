@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from UM.Math.Polygon import Polygon
+from UM.Math.Vector import Vector
 from UM.Mesh.MeshBuilder import MeshBuilder
 from UM.Scene.GroupDecorator import GroupDecorator
 from UM.Scene.SceneNode import SceneNode
@@ -189,3 +190,58 @@ def test_compute2DConvexHullMeshDataGrouped(convex_hull_decorator):
             copied_decorator._getSettingProperty = MagicMock(return_value=0)
         node.addDecorator(copied_decorator)
     assert convex_hull_decorator._compute2DConvexHull() == Polygon([[-5.0, 5.0], [5.0, 5.0], [5.0, -5.0], [-5.0, -5.0]])
+
+
+def test_compute2DConvexHullSharedBetweenCopies(convex_hull_decorator):
+    mb = MeshBuilder()
+    mb.addCube(10, 10, 10)
+    mesh_data = mb.build()
+    mocked_stack = MagicMock()
+    mocked_stack.getProperty = MagicMock(return_value = 1)
+
+    node = SceneNode()
+    node.setMeshData(mesh_data)
+    convex_hull_decorator._getSettingProperty = MagicMock(return_value = 0)
+    convex_hull_decorator._global_stack = mocked_stack
+    with patch("UM.Application.Application.getInstance", MagicMock(return_value = mocked_application)):
+        convex_hull_decorator.setNode(node)
+    convex_hull_decorator._compute2DConvexHull()
+
+    # A copy that only differs in position uses the hull of the original, moved to where the copy is.
+    copied_node = SceneNode()
+    copied_node.setMeshData(mesh_data)
+    copied_node.setPosition(Vector(20, 0, 30))
+    with patch("cura.CuraApplication.CuraApplication.getInstance", MagicMock(return_value = mocked_application)):
+        with patch("UM.Application.Application.getInstance", MagicMock(return_value = mocked_application)):
+            with patch("cura.Settings.ExtruderManager.ExtruderManager.getInstance"):
+                copied_decorator = ConvexHullDecorator()
+                copied_decorator.setNode(copied_node)
+    copied_decorator._getSettingProperty = MagicMock(return_value = 0)
+    copied_decorator._global_stack = mocked_stack
+
+    with patch.object(ConvexHullDecorator, "_computeMeshConvexHull") as compute_mesh_convex_hull:
+        assert copied_decorator._compute2DConvexHull() == Polygon([[25.0, 25.0], [15.0, 25.0], [15.0, 35.0], [25.0, 35.0]])
+    compute_mesh_convex_hull.assert_not_called()
+
+
+def test_compute2DConvexHullSharedHullsAreLimited(convex_hull_decorator):
+    mb = MeshBuilder()
+    mb.addCube(10, 10, 10)
+    mesh_data = mb.build()
+    mocked_stack = MagicMock()
+    mocked_stack.getProperty = MagicMock(return_value = 1)
+
+    node = SceneNode()
+    node.setMeshData(mesh_data)
+    convex_hull_decorator._getSettingProperty = MagicMock(return_value = 0)
+    convex_hull_decorator._global_stack = mocked_stack
+    with patch("UM.Application.Application.getInstance", MagicMock(return_value = mocked_application)):
+        convex_hull_decorator.setNode(node)
+        # Like scaling a model by dragging, which computes the hull for every step.
+        for step in range(1, 21):
+            node.setScale(Vector(step / 10, step / 10, step / 10))
+            convex_hull_decorator._compute2DConvexHull()
+
+    mesh_hulls = ConvexHullDecorator._getSharedMeshHulls(mesh_data)
+    assert len(mesh_hulls) == ConvexHullDecorator._max_shared_hulls_per_mesh
+    assert node.getWorldTransformation().getData()[:3, :3].tobytes() in mesh_hulls  # The last one is kept.
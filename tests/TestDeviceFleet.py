@@ -0,0 +1,96 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from cura.DeviceFleet import DeviceFleet
+
+
+def createDevice(number):
+    return {"mac": "mac{}".format(number), "operator": "operator", "deviceType": "Z5", "deviceStatus": "online",
+            "lastVersionFormat": "1.0", "sn": "sn{}".format(number), "deviceId": number, "deviceStatusTitle": "在线"}
+
+
+class Server:
+    """Answers device queries right away with the devices of the requested page, like the HTTP client would."""
+
+    def __init__(self, device_count, paged = True, with_total = False):
+        self.devices = [createDevice(number) for number in range(device_count)]
+        self.paged = paged
+        self.with_total = with_total
+        self.pages = []
+
+    def get(self, url, headers_dict = None, callback = None, error_callback = None, **kwargs):
+        query = parse_qs(urlparse(url).query)
+        page = int(query["pageNum"][0])
+        page_size = int(query["pageSize"][0])
+        self.pages.append(page)
+        if not self.paged:
+            data = self.devices
+        else:
+            data = self.devices[(page - 1) * page_size:page * page_size]
+        if self.with_total:
+            data = {"list": data, "total": len(self.devices)}
+        callback({"msg": "success", "data": data})
+
+
+@pytest.fixture
+def fleet():
+    return DeviceFleet(status_service = MagicMock())
+
+
+def fetch(fleet, server):
+    on_finished = MagicMock()
+    on_failed = MagicMock()
+    with patch("cura.DeviceFleet.HttpClient") as http_client:
+        http_client.getInstance.return_value = server
+        http_client.readJSON.side_effect = lambda reply: reply
+        fleet._fetch(on_finished, on_failed)
+    on_failed.assert_not_called()
+    return on_finished.call_args[0][0]
+
+
+@pytest.mark.parametrize("device_count, expected_pages", [
+    (0, [1]),
+    (3, [1]),
+    (DeviceFleet.PageSize, [1, 2]),
+    (DeviceFleet.PageSize * 2 + 1, [1, 2, 3]),
+])
+def test_fetchAllPages(fleet, device_count, expected_pages):
+    server = Server(device_count)
+    devices = fetch(fleet, server)
+
+    assert server.pages == expected_pages
+    assert [device["device_id"] for device in devices] == list(range(device_count))
+
+
+def test_fetchStopsAtTotal(fleet):
+    server = Server(DeviceFleet.PageSize, with_total = True)
+    devices = fetch(fleet, server)
+
+    assert server.pages == [1]
+    assert len(devices) == DeviceFleet.PageSize
+
+
+def test_fetchWithoutPaging(fleet):
+    server = Server(DeviceFleet.PageSize, paged = False)  # Returns every device for every page.
+    devices = fetch(fleet, server)
+
+    assert server.pages == [1, 2]
+    assert len(devices) == DeviceFleet.PageSize
+
+
+def test_onDevicesReceived(fleet):
+    changes = MagicMock()
+    fleet.devicesChanged.connect(changes)
+    first, second, third = DeviceFleet.parseDevices({"data": [createDevice(number) for number in range(3)]})
+    fleet._onDevicesReceived([first, second], True)
+    changes.assert_called_with([first, second], [], [])
+
+    changed_second = dict(second, device_status = "offline")
+    fleet._onDevicesReceived([changed_second, third], True)
+    changes.assert_called_with([third], [changed_second], [first])
+    assert fleet.getDevices() == [changed_second, third]
@@ -0,0 +1,184 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cura.Network.FleetStatusService import FleetStatusService
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Source:
+    """Fetches a status that the test sets, and keeps the callbacks of the requests that are still running."""
+
+    def __init__(self, status = "idle") -> None:
+        self.status = status
+        self.requests = []
+
+    def fetch(self, on_finished, on_failed) -> None:
+        self.requests.append((on_finished, on_failed))
+
+    def answer(self) -> None:
+        on_finished, _ = self.requests.pop(0)
+        on_finished(self.status)
+
+    def fail(self) -> None:
+        _, on_failed = self.requests.pop(0)
+        on_failed(MagicMock(), MagicMock())
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def service(clock):
+    with patch("cura.Network.FleetStatusService.QTimer"):
+        yield FleetStatusService(clock)
+
+
+def poll(service, clock, seconds):
+    clock.now += seconds
+    service._poll()
+
+
+def test_addListenerPollsRightAway(service, clock):
+    source = Source()
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener)
+    service._poll()
+    source.answer()
+
+    listener.assert_called_once_with("idle", True)
+    assert service.getStatus("cluster") == "idle"
+
+
+def test_listenersShareRequests(service, clock):
+    source = Source()
+    first_listener = MagicMock()
+    second_listener = MagicMock()
+    service.addListener("cluster", source.fetch, first_listener)
+    service._poll()
+    source.answer()
+
+    service.addListener("cluster", source.fetch, second_listener)
+    second_listener.assert_called_once_with("idle", True)  # The known status, without a new request.
+    assert source.requests == []
+
+
+def test_intervalBacksOffWhileUnchanged(service, clock):
+    source = Source()
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener)
+    service._poll()
+    source.answer()  # First status, so it changed.
+
+    intervals = []
+    for _ in range(5):
+        source_interval = service._sources["cluster"].interval
+        intervals.append(source_interval)
+        poll(service, clock, source_interval)
+        source.answer()
+    assert intervals == [5.0, 10.0, 20.0, 20.0, 20.0]
+    listener.assert_called_with("idle", False)
+
+
+def test_activeSourceIsPolledOften(service, clock):
+    source = Source("printing")
+    service.addListener("cluster", source.fetch, MagicMock(), is_active = lambda status: status == "printing")
+    for _ in range(3):
+        poll(service, clock, FleetStatusService.ActiveInterval)
+        source.answer()
+    assert service._sources["cluster"].interval == FleetStatusService.ActiveInterval
+
+
+def test_changePollsOftenAgain(service, clock):
+    source = Source()
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener)
+    for _ in range(4):
+        poll(service, clock, FleetStatusService.IdleInterval)
+        source.answer()
+    assert service._sources["cluster"].interval == FleetStatusService.IdleInterval
+
+    source.status = "printing"
+    poll(service, clock, FleetStatusService.IdleInterval)
+    source.answer()
+    listener.assert_called_with("printing", True)
+    assert service._sources["cluster"].interval == FleetStatusService.ActiveInterval
+
+
+def test_sourcesDueAtAboutTheSameTimeArePolledTogether(service, clock):
+    first_source = Source()
+    second_source = Source()
+    third_source = Source()
+    service.addListener("first", first_source.fetch, MagicMock())
+    clock.now += FleetStatusService.BatchWindow / 2
+    service.addListener("second", second_source.fetch, MagicMock())
+    clock.now += FleetStatusService.BatchWindow * 2
+    service.addListener("third", third_source.fetch, MagicMock())
+    clock.now -= FleetStatusService.BatchWindow * 2
+
+    service._poll()
+    assert len(first_source.requests) == 1
+    assert len(second_source.requests) == 1
+    assert len(third_source.requests) == 0  # Not due yet.
+
+
+def test_isEqual(service, clock):
+    source = Source({"printers": [], "generated_time": 1})
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener, is_equal = lambda old, new: old["printers"] == new["printers"])
+    service._poll()
+    source.answer()
+
+    source.status = {"printers": [], "generated_time": 2}
+    poll(service, clock, FleetStatusService.ActiveInterval)
+    source.answer()
+    assert listener.call_args[0][1] is False
+
+
+def test_failureBacksOff(service, clock):
+    source = Source()
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener)
+    service._poll()
+    source.fail()
+
+    listener.assert_not_called()
+    assert service._sources["cluster"].next_poll_time == clock.now + FleetStatusService.IdleInterval
+
+
+def test_removeListenerStopsPolling(service, clock):
+    source = Source()
+    listener = MagicMock()
+    service.addListener("cluster", source.fetch, listener)
+    service._poll()
+    service.removeListener("cluster", listener)
+    source.answer()  # The reply to a request from before it was removed.
+
+    listener.assert_not_called()
+    assert service.getStatus("cluster") is None
+    poll(service, clock, FleetStatusService.IdleInterval)
+    assert source.requests == []
+
+
+def test_requestUpdate(service, clock):
+    source = Source()
+    service.addListener("cluster", source.fetch, MagicMock())
+    for _ in range(4):
+        poll(service, clock, FleetStatusService.IdleInterval)
+        source.answer()
+
+    service.requestUpdate("cluster")
+    service._poll()
+    assert len(source.requests) == 1
@@ -0,0 +1,46 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import io
+
+from cura.Scene.GCodeBuffer import GCodeBuffer
+
+
+def test_appendAndPrependRaw():
+    buffer = GCodeBuffer()
+    buffer.appendRaw(b";LAYER:0\nG1 X10\n")
+    buffer.appendRaw(b";LAYER:1\nG1 X20\n")
+    buffer.prependRaw(b";FLAVOR:Marlin\n")
+
+    assert len(buffer) == 3
+    assert buffer[0] == ";FLAVOR:Marlin\n"
+    assert list(buffer) == [";FLAVOR:Marlin\n", ";LAYER:0\nG1 X10\n", ";LAYER:1\nG1 X20\n"]
+
+
+def test_placeholdersAreSubstitutedLazily():
+    buffer = GCodeBuffer()
+    buffer.prependRaw(b";TIME:{print_time}\n;Filament used: {filament_amount}m\n;Unknown: {something_else}\n")
+    buffer.appendRaw("M117 Printing {jobname} é\n".encode("utf-8"))
+
+    assert buffer[0] == ";TIME:{print_time}\n;Filament used: {filament_amount}m\n;Unknown: {something_else}\n"
+
+    buffer.setPlaceholderValues({"print_time": "PT1H", "filament_amount": "[1.5]", "jobname": "UMS5_cube"})
+
+    assert buffer[0] == ";TIME:PT1H\n;Filament used: [1.5]m\n;Unknown: {something_else}\n"
+    assert buffer[1] == "M117 Printing UMS5_cube é\n"
+
+    stream = io.StringIO()
+    buffer.writeTo(stream)
+    assert stream.getvalue() == buffer[0] + buffer[1]
+
+
+def test_modifyLikeAList():
+    buffer = GCodeBuffer([";FLAVOR:Marlin\n", ";LAYER:0\n"])
+    buffer[0] += ";POSTPROCESSED\n"
+    buffer.append(";END\n")
+    buffer.insert(1, ";HEADER\n")
+    del buffer[2]
+
+    assert buffer == [";FLAVOR:Marlin\n;POSTPROCESSED\n", ";HEADER\n", ";END\n"]
+    assert buffer[0:2] == [";FLAVOR:Marlin\n;POSTPROCESSED\n", ";HEADER\n"]
+    assert buffer.index(";END\n") == 2
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import gzip
+import io
+
+from cura.Utils.GCodeIndex import GCodeIndex
+
+
+def _writeIndexed(gcode_list):
+    index = GCodeIndex()
+    stream = io.BytesIO()
+    for gcode in gcode_list:
+        stream.write(gcode.encode("utf-8"))
+        index.addGCode(gcode)
+    stream.write(index.serialise().encode("utf-8"))
+    return stream
+
+
+def test_layerOffsets():
+    gcode_list = [";FLAVOR:Marlin\n;LAYER_COUNT:2\n", ";LAYER:0\nG1 X10 ; é\n", ";LAYER:1\nG1 X20\n;LAYER:2\nG1 X30\n", ";SETTING_3 {}\n"]
+    stream = _writeIndexed(gcode_list)
+    data = stream.getvalue()
+
+    index = GCodeIndex.read(stream)
+    assert index is not None
+    assert sorted(index.layer_offsets) == [0, 1, 2]
+    for layer_number in range(3):
+        start, end = index.getLayerRange(layer_number)
+        assert data[start:end].startswith(";LAYER:{layer}\n".format(layer = layer_number).encode("utf-8"))
+    start, end = index.getLayerRange(0)
+    assert data[start:end].decode("utf-8") == ";LAYER:0\nG1 X10 ; é\n"
+    start, end = index.getLayerRange(2)
+    assert data[start:end] == b";LAYER:2\nG1 X30\n"  # Ends at the settings.
+    assert data[index.settings_offset:].startswith(b";SETTING_3 {}\n")
+    assert index.getLayerRange(3) is None
+
+
+def test_withoutSettings():
+    stream = _writeIndexed([";LAYER:0\nG1 X10\n"])
+    data = stream.getvalue()
+
+    index = GCodeIndex.read(stream)
+    assert index.settings_offset is None
+    start, end = index.getLayerRange(0)
+    assert data[start:end] == b";LAYER:0\nG1 X10\n"  # Ends at the index.
+
+
+def test_noIndex():
+    assert GCodeIndex.read(io.BytesIO(b";LAYER:0\nG1 X10\n")) is None
+    assert GCodeIndex.read(io.BytesIO(b"")) is None
+
+
+def test_gzipIsNotIndexed():
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj = compressed, mode = "wb") as file:
+        file.write(_writeIndexed([";LAYER:0\nG1 X10\n"]).getvalue())
+    compressed.seek(0)
+
+    with gzip.GzipFile(fileobj = compressed, mode = "rb") as file:
+        assert GCodeIndex.read(file) is None
+        assert file.tell() == 0  # Didn't decompress anything.
+
+
+class _UnscannableStream(io.BytesIO):
+    def __iter__(self):
+        raise AssertionError("The file was scanned instead of seeking to the layer.")
+
+
+def test_readLayerSeeks():
+    stream = _writeIndexed([";FLAVOR:Marlin\n", ";LAYER:0\nG1 X10 ; é\n", ";LAYER:1\nG1 X20\n", ";SETTING_3 {}\n"])
+    stream = _UnscannableStream(stream.getvalue())
+
+    assert GCodeIndex.readLayer(stream, 0) == ";LAYER:0\nG1 X10 ; é\n"
+    assert GCodeIndex.readLayer(stream, 1) == ";LAYER:1\nG1 X20\n"
+
+
+def test_readLayerScans():
+    gcode_list = [";FLAVOR:Marlin\n", ";LAYER:0\nG1 X10\n", ";LAYER:1\nG1 X20\n", ";SETTING_3 {}\n"]
+    assert GCodeIndex.readLayer(io.BytesIO("".join(gcode_list).encode("utf-8")), 1) == ";LAYER:1\nG1 X20\n"
+
+    # The file was edited after writing the index, so the offsets are wrong.
+    data = _writeIndexed(gcode_list).getvalue().replace(b";FLAVOR:Marlin\n", b";FLAVOR:RepRap\n;Edited\n")
+    assert GCodeIndex.readLayer(io.BytesIO(data), 0) == ";LAYER:0\nG1 X10\n"
+    assert GCodeIndex.readLayer(io.BytesIO(data), 1) == ";LAYER:1\nG1 X20\n"  # Ends at the settings.
+    assert GCodeIndex.readLayer(io.BytesIO(data), 2) is None
+
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj = compressed, mode = "wb") as file:
+        file.write(_writeIndexed(gcode_list[:3]).getvalue())
+    compressed.seek(0)
+    with gzip.GzipFile(fileobj = compressed, mode = "rb") as file:
+        assert GCodeIndex.readLayer(file, 1) == ";LAYER:1\nG1 X20\n"  # Ends at the index.
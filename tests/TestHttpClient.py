@@ -0,0 +1,136 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt6.QtNetwork import QNetworkReply
+
+from cura.Network.HttpClient import HttpClient
+
+
+class FakeNetworkRequest:
+    """Keeps the headers of a request, like a QNetworkRequest."""
+
+    def __init__(self, url):
+        self._headers = {}
+
+    def setRawHeader(self, name, value):
+        self._headers[name] = value
+
+    def rawHeader(self, name):
+        return self._headers.get(name, b"")
+
+    def rawHeaderList(self):
+        return list(self._headers)
+
+    def setAttribute(self, attribute, value):
+        pass
+
+
+class FakeRequestManager:
+    """Keeps the requests that the client sends, so that the test can answer them."""
+
+    def __init__(self):
+        self.requests = []
+        self.aborted = []
+
+    def get(self, url, **kwargs):
+        request_data = MagicMock()
+        self.requests.append((url, kwargs, request_data))
+        return request_data
+
+    def abortRequest(self, request_data):
+        self.aborted.append(request_data)
+
+    def answer(self, index = -1, body = b"{}"):
+        reply = MagicMock()
+        reply.readAll.return_value = body
+        self.requests[index][1]["callback"](reply)
+        return reply
+
+    def fail(self, index = -1, error = QNetworkReply.NetworkError.TimeoutError):
+        reply = MagicMock()
+        self.requests[index][1]["error_callback"](reply, error)
+        return reply
+
+
+@pytest.fixture
+def manager():
+    return FakeRequestManager()
+
+
+@pytest.fixture
+def client(manager):
+    with patch("cura.Network.HttpClient.QNetworkRequest", FakeNetworkRequest), \
+            patch("cura.Network.HttpClient.QUrl"), \
+            patch("cura.Network.HttpClient.HttpRequestManager"):
+        yield HttpClient(manager)
+
+
+def test_getCoalescesIdenticalRequests(client, manager):
+    first_callback = MagicMock()
+    second_callback = MagicMock()
+    client.get("https://example.com/status", callback = first_callback)
+    client.get("https://example.com/status", callback = second_callback)
+    client.get("https://example.com/status", headers_dict = {"Authorization": "other"})  # Other headers, so not shared.
+
+    assert len(manager.requests) == 2
+    manager.answer(0, body = b"{\"status\": \"idle\"}")
+
+    # Both callers can read the body of the same reply.
+    assert bytes(first_callback.call_args[0][0].readAll()) == b"{\"status\": \"idle\"}"
+    assert bytes(second_callback.call_args[0][0].readAll()) == b"{\"status\": \"idle\"}"
+
+    client.get("https://example.com/status")  # The first one finished, so this is a new request.
+    assert len(manager.requests) == 3
+
+
+def test_getRetriesWithBackoff(client, manager):
+    callback = MagicMock()
+    error_callback = MagicMock()
+    with patch("cura.Network.HttpClient.QTimer") as timer:
+        client.get("https://example.com/status", callback = callback, error_callback = error_callback, retries = 2)
+        delays = []
+        for _ in range(2):
+            manager.fail()
+            delay, send = timer.singleShot.call_args[0]
+            delays.append(delay)
+            send()
+        assert len(manager.requests) == 3
+        assert delays == [int(HttpClient.RetryDelay * 1000), int(HttpClient.RetryDelay * 2000)]
+
+        manager.fail()  # No retries left.
+    assert timer.singleShot.call_count == 2
+    error_callback.assert_called_once()
+    callback.assert_not_called()
+
+
+def test_getDoesNotRetryOtherErrors(client, manager):
+    error_callback = MagicMock()
+    with patch("cura.Network.HttpClient.QTimer") as timer:
+        client.get("https://example.com/status", error_callback = error_callback)
+        manager.fail(error = QNetworkReply.NetworkError.ContentNotFoundError)
+
+    timer.singleShot.assert_not_called()
+    error_callback.assert_called_once()
+
+
+def test_abortSharedRequest(client, manager):
+    first_callback = MagicMock()
+    second_callback = MagicMock()
+    first_request = client.get("https://example.com/status", callback = first_callback)
+    second_request = client.get("https://example.com/status", callback = second_callback)
+
+    client.abortRequest(first_request)
+    assert manager.aborted == []  # Still running for the other caller.
+
+    client.abortRequest(second_request)
+    assert manager.aborted == [manager.requests[0][2]]
+
+    manager.answer(0)  # A reply that arrives anyway is ignored.
+    first_callback.assert_not_called()
+    second_callback.assert_not_called()
+
+    client.get("https://example.com/status")  # Not shared with the aborted transfer.
+    assert len(manager.requests) == 2
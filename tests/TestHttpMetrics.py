@@ -0,0 +1,44 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import pytest
+
+from cura.Network.HttpMetrics import HttpMetrics
+
+
+@pytest.mark.parametrize("method, url, expected", [
+    ("get", "https://api.example.com/clusters?status=active", "GET api.example.com/clusters"),
+    ("GET", "https://api.example.com/clusters/123/status", "GET api.example.com/clusters/{id}/status"),
+    ("PUT", "https://api.example.com/jobs/0f8fad5b-d9cb-469f-a165-70867728950e", "PUT api.example.com/jobs/{id}"),
+    ("POST", "https://api.example.com/clusters/aB3dEfGhIjKlMnOpQrStUv/print", "POST api.example.com/clusters/{id}/print"),
+    ("GET", "http://10.0.0.2/cluster-api/v1/print_jobs", "GET 10.0.0.2/cluster-api/v1/print_jobs"),  # Long names without digits are kept.
+])
+def test_getEndpoint(method, url, expected):
+    assert HttpMetrics.getEndpoint(method, url) == expected
+
+
+def test_addRequest():
+    metrics = HttpMetrics()
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        metrics.addRequest("GET host/path", latency, failed = False)
+    metrics.addRequest("GET host/path", 1.0, failed = True, retries = 2)
+    metrics.addCoalesced("GET host/path")
+    metrics.addNotModified("GET host/path")
+
+    result = metrics.toDict()["GET host/path"]
+    assert result["count"] == 5
+    assert result["errors"] == 1
+    assert result["retries"] == 2
+    assert result["coalesced"] == 1
+    assert result["not_modified"] == 1
+    assert result["mean"] == pytest.approx(0.4)
+    assert result["p50"] == pytest.approx(0.3)
+    assert result["max"] == pytest.approx(1.0)
+
+
+def test_clear():
+    metrics = HttpMetrics()
+    metrics.addRequest("GET host/path", 0.1, failed = False)
+    metrics.clear()
+
+    assert metrics.toDict() == {}
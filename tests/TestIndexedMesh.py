@@ -0,0 +1,32 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import numpy
+
+from cura.Utils.IndexedMesh import createIndexedMeshData
+
+
+def test_sharesVerticesOfFlatSurfaces():
+    # A square of two triangles, as a triangle soup.
+    vertices = numpy.array([[0, 0, 0], [1, 0, 0], [1, 1, 0],
+                            [0, 0, 0], [1, 1, 0], [0, 1, 0]], dtype = numpy.float32)
+    mesh = createIndexedMeshData(vertices)
+
+    assert mesh.getVertexCount() == 4
+    assert mesh.getIndices().shape == (2, 3)
+    # The triangles still have the same corners.
+    assert numpy.array_equal(mesh.getVertices()[mesh.getIndices()].reshape((-1, 3)), vertices)
+    assert numpy.allclose(mesh.getNormals(), [0, 0, 1])
+
+
+def test_keepsVerticesWithDifferentNormalsApart():
+    # Two triangles sharing an edge, at a right angle.
+    vertices = numpy.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype = numpy.float32)
+    indices = numpy.array([[0, 1, 2], [0, 3, 1]], dtype = numpy.int32)
+    mesh = createIndexedMeshData(vertices, indices)
+
+    assert mesh.getVertexCount() == 6  # The shared edge is stored twice, once for each normal.
+    assert numpy.array_equal(mesh.getVertices()[mesh.getIndices()], vertices[indices])
+    normals = mesh.getNormals()[mesh.getIndices()]
+    assert numpy.allclose(normals[0], [0, 0, 1])
+    assert numpy.allclose(normals[1], [0, 1, 0])
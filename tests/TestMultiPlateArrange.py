@@ -0,0 +1,59 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock
+
+from cura.Arranging.MultiPlateArrange import MultiPlateArrange
+
+
+def createBuildVolume(width = 100, depth = 100):
+    build_volume = MagicMock()
+    build_volume.getEdgeDisallowedSize = MagicMock(return_value = 0)
+    build_volume.getWidth = MagicMock(return_value = width)
+    build_volume.getDepth = MagicMock(return_value = depth)
+    build_volume.getShape = MagicMock(return_value = "rectangular")
+    return build_volume
+
+
+def test_distributeFillsToTargetDensity():
+    nodes = [MagicMock() for _ in range(10)]
+    hull_areas = {node: 1000.0 for node in nodes}  # Each node takes a tenth of the build plate.
+    print_times = {node: 1.0 for node in nodes}
+    arranger = MultiPlateArrange(nodes, createBuildVolume(), target_density = 0.5)
+
+    plates = arranger._distribute(10000.0, hull_areas, print_times, {})
+
+    assert len(plates) == 2
+    assert sorted(len(plate) for plate in plates) == [5, 5]
+
+
+def test_distributeBalancesPrintTime():
+    nodes = [MagicMock() for _ in range(4)]
+    hull_areas = {node: 1000.0 for node in nodes}
+    print_times = dict(zip(nodes, [8.0, 5.0, 4.0, 3.0]))
+    arranger = MultiPlateArrange(nodes, createBuildVolume(), target_density = 0.25)
+
+    plates = arranger._distribute(10000.0, hull_areas, print_times, {})
+
+    assert [sum(print_times[node] for node in plate) for plate in plates] == [11.0, 9.0]
+
+
+def test_distributeLeavesRoomForFixedNodes():
+    nodes = [MagicMock() for _ in range(4)]
+    hull_areas = {node: 1000.0 for node in nodes}
+    print_times = {node: 1.0 for node in nodes}
+    arranger = MultiPlateArrange(nodes, createBuildVolume(), target_density = 0.4)
+
+    # The first plate already has a fixed node that fills it up to the target density.
+    plates = arranger._distribute(10000.0, hull_areas, print_times, {0: 4000.0})
+
+    assert plates[0] == []
+    assert len(plates[1]) == 4
+
+
+def test_retryDoesNotSearchInParallel():
+    arranger = MultiPlateArrange([], createBuildVolume(), nest_arguments = {"parallel": True, "time_budget": 10.0})
+
+    assert arranger._createArranger([], [])._parallel
+    retry_arranger = arranger._createArranger([], [], is_retry = True)
+    assert not retry_arranger._parallel
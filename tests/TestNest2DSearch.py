@@ -0,0 +1,65 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import math
+import sys
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cura.Arranging import Nest2DSearch
+from cura.Arranging.Nest2DSearch import ItemPlacement, getPackingScore, searchInParallel
+
+square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+
+
+def test_getPackingScoreTouching():
+    assert getPackingScore([square, square], [(0, 0.0, 0, 0), (0, 0.0, 10, 0)]) == (2, pytest.approx(1.0))
+
+
+def test_getPackingScoreSpreadOut():
+    # Two squares with a gap of one square between them fill two thirds of their bounding box.
+    assert getPackingScore([square, square], [(0, 0.0, 0, 0), (0, 0.0, 20, 0)]) == (2, pytest.approx(2 / 3))
+
+
+def test_getPackingScoreOnlyCountsBuildPlate():
+    assert getPackingScore([square, square], [(0, math.pi / 2, 0, 0), (1, 0.0, 100, 0)]) == (1, pytest.approx(1.0))
+
+
+def test_getPackingScoreNothingPlaced():
+    assert getPackingScore([square], [(-1, 0.0, 0, 0)]) == (0, 0.0)
+
+
+def test_itemPlacement():
+    placement = ItemPlacement((0, 1.5, 20, 30))
+    assert placement.binId() == 0
+    assert placement.rotation() == 1.5
+    assert placement.translation().x() == 20
+    assert placement.translation().y() == 30
+    assert not placement.isFixed()
+
+
+class SlowPool:
+    """Starts every attempt, but never finishes one."""
+
+    def __init__(self):
+        self.main_modules = []
+        self.shutdown = MagicMock()
+
+    def submit(self, *args):
+        self.main_modules.append(sys.modules["__main__"])
+        future = Future()
+        future.set_running_or_notify_cancel()
+        return future
+
+
+def test_searchInParallelTimeout():
+    pool = SlowPool()
+    main_module = sys.modules["__main__"]
+    with patch.object(Nest2DSearch, "_process_pool", pool):
+        assert searchInParallel([square], [], [], (100, 100), 1, [None], time_budget = 0.01) is None
+        assert Nest2DSearch._process_pool is None  # Stopped, since its processes were still busy.
+
+    pool.shutdown.assert_called_once_with(wait = False, cancel_futures = True)
+    assert pool.main_modules and all(module is main_module for module in pool.main_modules)
@@ -0,0 +1,103 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import json
+import os
+
+import pytest
+
+from cura.Slicing.SliceBatch import SliceBatch
+
+
+class FakeSliceService:
+    def __init__(self):
+        self.requests = []
+
+    def submit(self, request, on_finished):
+        self.requests.append((request, on_finished))
+        return len(self.requests) - 1
+
+
+def writeManifest(directory, manifest):
+    path = os.path.join(str(directory), "manifest.json")
+    with open(path, "w", encoding = "utf-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+    return path
+
+
+def test_loadManifest(tmp_path):
+    path = writeManifest(tmp_path, {
+        "output_directory": "gcode",
+        "defaults": {"machine": "Fleet printer", "quality": "normal"},
+        "jobs": [
+            {"id": "bracket", "files": ["models/bracket.3mf"], "quality": "fine"},
+            "housing.3mf"
+        ]
+    })
+
+    bracket, housing = SliceBatch.loadManifest(path)
+
+    assert bracket.files == [os.path.join(str(tmp_path), "models", "bracket.3mf")]  # Relative to the manifest.
+    assert bracket.output == os.path.join(str(tmp_path), "gcode", "bracket.gcode")
+    assert bracket.getConfigurationKey() == ("Fleet printer", "fine", None, None)
+    assert housing.request_id == "housing"
+    assert housing.getConfigurationKey() == ("Fleet printer", "normal", None, None)
+
+
+@pytest.mark.parametrize("manifest", [
+    {},  # No jobs.
+    {"jobs": [3]},
+    {"jobs": [{"id": "a"}]},  # No files.
+    {"jobs": ["a.3mf", "other/a.3mf"]}  # Same ID.
+])
+def test_loadManifestInvalid(tmp_path, manifest):
+    with pytest.raises(ValueError):
+        SliceBatch.loadManifest(writeManifest(tmp_path, manifest))
+
+
+def test_summary(tmp_path):
+    service = FakeSliceService()
+    summary_path = os.path.join(str(tmp_path), "summary.json")
+    batch = SliceBatch(service, SliceBatch.loadManifest(writeManifest(tmp_path, {"jobs": ["a.3mf", "b.3mf"]})), summary_path)
+    finished = []
+    batch.addFinishedCallback(finished.append)
+    batch.start()
+
+    service.requests[1][1]({"id": "b", "status": "error", "error": "Unable to read b.3mf."})
+    assert not finished
+    service.requests[0][1]({"id": "a", "status": "done", "print_time": 60, "material_weights": [2.5, 1.0]})
+
+    assert finished == [False]
+    with open(summary_path, encoding = "utf-8") as summary_file:
+        summary = json.load(summary_file)
+    assert summary["succeeded"] == 1
+    assert summary["failures"] == [{"id": "b", "error": "Unable to read b.3mf."}]
+    assert summary["total_print_time"] == 60
+    assert summary["total_material_weight"] == 3.5
+    assert [result["id"] for result in summary["results"]] == ["a", "b"]  # In the order of the manifest.
+
+
+def test_limitJobsInFlight(tmp_path):
+    service = FakeSliceService()
+    requests = SliceBatch.loadManifest(writeManifest(tmp_path, {"jobs": ["a.3mf", "b.3mf", "c.3mf"]}))
+    batch = SliceBatch(service, requests, os.path.join(str(tmp_path), "summary.json"), max_jobs_in_flight = 2)
+    batch.start()
+
+    assert [request.request_id for request, _ in service.requests] == ["a", "b"]
+    service.requests[1][1]({"id": "b", "status": "done"})
+    assert [request.request_id for request, _ in service.requests] == ["a", "b", "c"]  # Passed on once b is finished.
+
+
+def test_summaryNotWritten(tmp_path, capsys):
+    service = FakeSliceService()
+    summary_path = os.path.join(str(tmp_path), "missing_directory", "summary.json")
+    batch = SliceBatch(service, SliceBatch.loadManifest(writeManifest(tmp_path, {"jobs": ["a.3mf"]})), summary_path)
+    finished = []
+    batch.addFinishedCallback(finished.append)
+    batch.start()
+    service.requests[0][1]({"id": "a", "status": "done"})
+
+    assert finished == [False]
+    output = capsys.readouterr()
+    assert "\"succeeded\": 1" in output.out  # Still printed, so that the results aren't lost.
+    assert "Unable to write the summary" in output.err
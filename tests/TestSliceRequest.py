@@ -0,0 +1,35 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import os
+
+import pytest
+
+from cura.Slicing.SliceRequest import SliceRequest
+
+
+def test_fromDict(tmp_path):
+    request = SliceRequest.fromDict({"id": "job1", "files": ["cube.stl"], "machine": "My printer", "quality": "fine"}, str(tmp_path))
+
+    assert request.files == [os.path.abspath("cube.stl")]
+    assert request.output == os.path.join(str(tmp_path), "job1.gcode")  # Named after the ID if there is no output.
+    assert request.getConfigurationKey() == ("My printer", "fine", None, None)
+
+
+def test_fromDictSingleFile():
+    request = SliceRequest.fromDict({"id": "job1", "files": "cube.stl", "output": "out/cube.gcode"})
+
+    assert request.files == [os.path.abspath("cube.stl")]
+    assert request.output == os.path.abspath("out/cube.gcode")
+
+
+@pytest.mark.parametrize("data", [
+    {"files": ["cube.stl"], "output": "cube.gcode"},  # No ID.
+    {"id": "job1", "output": "cube.gcode"},  # No files.
+    {"id": "job1", "files": [], "output": "cube.gcode"},
+    {"id": "job1", "files": ["cube.stl"]},  # No output and no output directory.
+    {"id": "job1", "files": ["cube.stl"], "output": "cube.gcode", "quality": 3}
+])
+def test_fromDictInvalid(data):
+    with pytest.raises(ValueError):
+        SliceRequest.fromDict(data)
@@ -0,0 +1,31 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+from unittest.mock import MagicMock, patch
+
+from cura.Slicing.SliceServiceServer import SliceServiceServer
+
+
+def start(other_service_running):
+    server = SliceServiceServer(MagicMock(), "test-slice-service")
+    with patch("cura.Slicing.SliceServiceServer.QLocalSocket") as local_socket, \
+            patch("cura.Slicing.SliceServiceServer.QLocalServer") as local_server:
+        local_socket.return_value.waitForConnected.return_value = other_service_running
+        started = server.start()
+    return started, local_server
+
+
+def test_startRemovesStaleServer():
+    started, local_server = start(other_service_running = False)
+
+    assert started
+    local_server.removeServer.assert_called_once_with("test-slice-service")
+    local_server.return_value.listen.assert_called_once_with("test-slice-service")
+
+
+def test_startKeepsRunningServer():
+    started, local_server = start(other_service_running = True)
+
+    assert not started
+    local_server.removeServer.assert_not_called()
+    local_server.return_value.listen.assert_not_called()
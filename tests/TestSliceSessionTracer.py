@@ -0,0 +1,100 @@
+# Copyright (c) 2026 UltiMaker
+# Cura is released under the terms of the LGPLv3 or higher.
+
+import contextvars
+import json
+import os
+import threading
+
+from cura.Utils.SliceSessionTracer import SliceSessionTracer
+
+
+def test_spansGoToCurrentSession():
+    tracer = SliceSessionTracer()
+    tracer.addSpan("engine", 0.0, 1.0)  # No session yet, so this gets dropped.
+
+    session = tracer.startSession(build_plate_number = 0)
+    with tracer.span("start_slice_job.validation"):
+        pass
+    tracer.addSpan("engine", session.start, session.start + 2.0, build_plate_number = 0)
+    tracer.addSpan("engine", session.start + 2.0, session.start + 3.0)
+    tracer.endSession()
+
+    assert [span.name for span in session.spans] == ["start_slice_job.validation", "engine", "engine"]
+    assert session.getPhaseDurations()["engine"] == 3.0
+    assert session.end is not None
+
+
+def test_startSessionEndsPrevious():
+    tracer = SliceSessionTracer(max_sessions = 2)
+    first = tracer.startSession(0)
+    tracer.startSession(1)
+    tracer.startSession(2)
+
+    assert first.end is not None
+    assert [session.build_plate_number for session in tracer.getSessions()] == [1, 2]
+
+
+def test_sessionsAreContextLocal():
+    tracer = SliceSessionTracer()
+    sessions = []
+
+    def traceSlice(build_plate_number: int, started: threading.Barrier) -> None:
+        session = tracer.startSession(build_plate_number)
+        started.wait()  # Both sessions are running now.
+        with tracer.span("start_slice_job"):
+            pass
+        tracer.addSpan("engine", session.start, build_plate_number = build_plate_number)
+        tracer.endSession()
+        sessions.append(session)
+
+    started = threading.Barrier(2)
+    threads = [threading.Thread(target = traceSlice, args = (build_plate_number, started)) for build_plate_number in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for session in sessions:
+        assert session.end is not None  # Starting the other session didn't end this one early.
+        assert [span.name for span in session.spans] == ["start_slice_job", "engine"]
+        assert session.spans[1].args["build_plate_number"] == session.build_plate_number
+
+
+def test_activate():
+    contextvars.Context().run(_activateInNewContext)
+
+
+def _activateInNewContext():
+    tracer = SliceSessionTracer()
+    session = contextvars.Context().run(tracer.startSession, 0)  # Started in a different context, like a job's creator.
+    assert tracer.getCurrentSession() is None
+
+    with tracer.activate(session):
+        with tracer.span("process_sliced_layers_job"):
+            pass
+        assert tracer.getCurrentSession() is session
+    tracer.addSpan("engine", 0.0, 1.0)  # Not active anymore, so this gets dropped.
+    tracer.addSpan("gcode_receive", 0.0, 1.0, session = session)
+    tracer.endSession(session)
+
+    assert [span.name for span in session.spans] == ["process_sliced_layers_job", "gcode_receive"]
+    assert session.end is not None
+
+
+def test_exportChromeTrace(tmp_path):
+    tracer = SliceSessionTracer()
+    session = tracer.startSession(0)
+    tracer.addSpan("engine", session.start + 0.5, session.start + 1.5)
+    tracer.endSession()
+
+    file_path = os.path.join(str(tmp_path), "slice.trace.json")
+    tracer.exportChromeTrace(file_path)
+    with open(file_path, encoding = "utf-8") as f:
+        trace = json.load(f)
+
+    event = trace["traceEvents"][0]
+    assert event["name"] == "engine"
+    assert event["ph"] == "X"
+    assert abs(event["ts"] - 500000) < 1
+    assert abs(event["dur"] - 1000000) < 1